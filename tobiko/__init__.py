@@ -18,8 +18,11 @@ import sys
 
 from tobiko.common import _cached
 from tobiko.common import _case
+from tobiko.common import _coalesce
+from tobiko.common import _concurrent
 from tobiko.common import _config
 from tobiko.common import _detail
+from tobiko.common import _diskcache
 from tobiko.common import _exception
 from tobiko.common import _fixture
 from tobiko.common import _ini
@@ -34,6 +37,7 @@ from tobiko.common import _shelves
 from tobiko.common import _skip
 from tobiko.common import _tabledata
 from tobiko.common import _time
+from tobiko.common import _timing
 from tobiko.common import _utils
 from tobiko.common import _version
 from tobiko.common import _yaml
@@ -66,8 +70,23 @@ retry_test_case = _case.retry_test_case
 run_test = _case.run_test
 sub_test = _case.sub_test
 
+CallCoalescer = _coalesce.CallCoalescer
+coalesced = _coalesce.coalesced
+get_call_coalescer = _coalesce.get_call_coalescer
+
+ConcurrentCall = _concurrent.ConcurrentCall
+ConcurrentCalls = _concurrent.ConcurrentCalls
+ConcurrentCallTimeout = _concurrent.ConcurrentCallTimeout
+run_concurrently = _concurrent.run_concurrently
+
 details_content = _detail.details_content
 
+DiskCache = _diskcache.DiskCache
+disk_cached = _diskcache.disk_cached
+get_cloud_identity = _diskcache.get_cloud_identity
+get_disk_cache = _diskcache.get_disk_cache
+register_cloud_identity = _diskcache.register_cloud_identity
+
 tobiko_config = _config.tobiko_config
 tobiko_config_dir = _config.tobiko_config_dir
 tobiko_config_path = _config.tobiko_config_path
@@ -124,8 +143,15 @@ operation_config = _operation.operation_config
 retry = _retry.retry
 retry_attempt = _retry.retry_attempt
 retry_on_exception = _retry.retry_on_exception
+get_retry_backoff = _retry.get_retry_backoff
+DecorrelatedJitterRetryBackoff = _retry.DecorrelatedJitterRetryBackoff
+ExponentialRetryBackoff = _retry.ExponentialRetryBackoff
+FastFirstRetryBackoff = _retry.FastFirstRetryBackoff
+InvalidRetryBackoff = _retry.InvalidRetryBackoff
 Retry = _retry.Retry
 RetryAttempt = _retry.RetryAttempt
+RetryBackoff = _retry.RetryBackoff
+RetryBackoffType = _retry.RetryBackoffType
 RetryCountLimitError = _retry.RetryCountLimitError
 RetryLimitError = _retry.RetryLimitError
 RetryTimeLimitError = _retry.RetryTimeLimitError
@@ -162,6 +188,15 @@ to_seconds = _time.to_seconds
 to_seconds_float = _time.to_seconds_float
 true_seconds = _time.true_seconds
 
+API_TIMING = _timing.API_TIMING
+SHELL_TIMING = _timing.SHELL_TIMING
+SLEEP_TIMING = _timing.SLEEP_TIMING
+TimingRecorder = _timing.TimingRecorder
+TimingStats = _timing.TimingStats
+get_timing_recorder = _timing.get_timing_recorder
+measure_timing = _timing.measure_timing
+record_timing = _timing.record_timing
+
 get_short_hostname = _utils.get_short_hostname
 is_collection = _utils.is_collection
 
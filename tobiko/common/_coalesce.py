@@ -0,0 +1,224 @@
+# Copyright (c) 2026 Red Hat
+# All Rights Reserved.
+#
+#    Licensed under the Apache License, Version 2.0 (the "License"); you may
+#    not use this file except in compliance with the License. You may obtain
+#    a copy of the License at
+#
+#         http://www.apache.org/licenses/LICENSE-2.0
+#
+#    Unless required by applicable law or agreed to in writing, software
+#    distributed under the License is distributed on an "AS IS" BASIS, WITHOUT
+#    WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied. See the
+#    License for the specific language governing permissions and limitations
+#    under the License.
+from __future__ import absolute_import
+
+import functools
+import inspect
+import threading
+import typing
+
+from oslo_log import log
+
+from tobiko.common import _exception
+from tobiko.common import _time
+
+
+LOG = log.getLogger(__name__)
+
+F = typing.TypeVar('F', bound=typing.Callable)
+
+CoalescingKeyFunction = typing.Callable[..., typing.Optional[typing.Hashable]]
+
+CoalescingTimeoutFunction = typing.Callable[..., _time.Seconds]
+
+
+class CoalescedCall(object):
+    """Single execution of a function whose outcome is shared between all
+    the threads that asked for it while it was running
+    """
+
+    def __init__(self,
+                 key: typing.Hashable,
+                 deadline: typing.Optional[float] = None):
+        self.key = key
+        self.deadline = deadline
+        self.end_time: typing.Optional[float] = None
+        self.waiters = 1
+        self.result: typing.Any = None
+        self.exc_info: typing.Optional[_exception.ExceptionInfo] = None
+        self._done = threading.Event()
+
+    @property
+    def done(self) -> bool:
+        return self._done.is_set()
+
+    def run(self, function: typing.Callable, *args, **kwargs) -> typing.Any:
+        try:
+            self.result = function(*args, **kwargs)
+        except BaseException:
+            self.exc_info = _exception.exc_info(reraise=False)
+            raise
+        return self.result
+
+    def set_done(self):
+        self.end_time = _time.time()
+        self._done.set()
+
+    def expired_before(self, deadline: typing.Optional[float]) -> bool:
+        """Whether this call gave up because it ran out of time while a
+        caller willing to wait until given deadline still has time left
+        """
+        if self.deadline is None or self.end_time is None:
+            return False
+        if self.end_time < self.deadline:
+            return False
+        return deadline is None or _time.time() < deadline
+
+    def wait_done(self):
+        self._done.wait()
+
+    def wait(self) -> typing.Any:
+        self.wait_done()
+        return self.get_result()
+
+    def get_result(self) -> typing.Any:
+        if self.exc_info:
+            self.exc_info.reraise()
+        return self.result
+
+
+class CallCoalescer(object):
+    """It makes concurrent calls with the same key share one execution
+
+    The first thread asking for a key executes the function, while the
+    ones asking for the same key before it returns wait for it and get the
+    same result (or exception). Nothing is cached: once the call is done
+    the next request for the key executes the function again.
+    """
+
+    def __init__(self):
+        self._lock = threading.Lock()
+        self._calls: typing.Dict[typing.Hashable, CoalescedCall] = {}
+
+    def call(self,
+             key: typing.Hashable,
+             function: typing.Callable,
+             *args,
+             deadline: typing.Optional[float] = None,
+             **kwargs) -> typing.Any:
+        """Executes function or waits for a concurrent call with same key
+
+        :param deadline: the time (as returned by tobiko.time) the caller is
+            willing to wait until (None means no limit). When the call
+            shared with it gives up before the caller deadline because it
+            ran out of time, the function is called again, so that the
+            caller doesn't give up earlier than it asked. In such case
+            function is expected to wait until the deadline of the caller
+            executing it.
+        """
+        with self._lock:
+            call = self._calls.get(key)
+            if call is None:
+                call = self._calls[key] = CoalescedCall(key, deadline)
+                leader = True
+            else:
+                call.waiters += 1
+                leader = False
+
+        if not leader:
+            LOG.debug(f"Waiting for concurrent call {key!r} to complete...")
+            call.wait_done()
+            if call.expired_before(deadline):
+                LOG.debug(f"Concurrent call {key!r} ran out of time before "
+                          "caller deadline: calling it again...")
+                return self.call(key, function, *args, deadline=deadline,
+                                 **kwargs)
+            return call.get_result()
+
+        try:
+            return call.run(function, *args, **kwargs)
+        finally:
+            with self._lock:
+                del self._calls[key]
+            call.set_done()
+            if call.waiters > 1:
+                LOG.debug(f"Call {key!r} outcome shared with "
+                          f"{call.waiters - 1} concurrent waiter(s)")
+
+    def list_keys(self) -> typing.List[typing.Hashable]:
+        with self._lock:
+            return list(self._calls)
+
+
+CALL_COALESCER = CallCoalescer()
+
+
+def get_call_coalescer() -> CallCoalescer:
+    return CALL_COALESCER
+
+
+def coalesced(key: CoalescingKeyFunction,
+              coalescer: CallCoalescer = None,
+              timeout: CoalescingTimeoutFunction = None) \
+        -> typing.Callable[[F], F]:
+    """Decorator sharing one execution between identical concurrent calls
+
+    It is intended for wait loops, so that many threads waiting for the same
+    condition on the same resource poll it only once.
+
+    :param key: function receiving the same arguments as the decorated one
+        and returning what identifies the awaited condition (for example
+        resource ID and expected status). When it returns None (or an
+        unhashable value) the call is executed without sharing it.
+    :param timeout: function receiving the same arguments as the decorated
+        one and returning how many seconds the caller is willing to wait
+        (None means no limit). When given, the decorated function must
+        accept a 'timeout' argument, that is replaced with the time left
+        before the deadline of the caller executing it. A caller that joins
+        a call having an earlier deadline than its own calls the function
+        again when that call runs out of time.
+    """
+
+    def decorator(function: F) -> F:
+        name = f"{function.__module__}.{function.__qualname__}"
+        signature = inspect.signature(function)
+
+        @functools.wraps(function)
+        def wrapper(*args, **kwargs):
+            call_key = key(*args, **kwargs)
+            if call_key is not None:
+                call_key = (name, call_key)
+                try:
+                    hash(call_key)
+                except TypeError:
+                    call_key = None
+            if call_key is None:
+                return function(*args, **kwargs)
+            _coalescer = coalescer or get_call_coalescer()
+            if timeout is None:
+                return _coalescer.call(call_key, function, *args, **kwargs)
+
+            deadline = _get_deadline(timeout(*args, **kwargs))
+            arguments = signature.bind(*args, **kwargs)
+
+            def call_until_deadline():
+                if deadline is not None:
+                    arguments.arguments['timeout'] = max(
+                        0., deadline - _time.time())
+                return function(*arguments.args, **arguments.kwargs)
+
+            return _coalescer.call(call_key, call_until_deadline,
+                                   deadline=deadline)
+
+        return typing.cast(F, wrapper)
+
+    return decorator
+
+
+def _get_deadline(timeout: _time.Seconds) -> typing.Optional[float]:
+    timeout = _time.to_seconds(timeout)
+    if timeout is None:
+        return None
+    return _time.time() + timeout
@@ -0,0 +1,151 @@
+# Copyright (c) 2026 Red Hat
+# All Rights Reserved.
+#
+#    Licensed under the Apache License, Version 2.0 (the "License"); you may
+#    not use this file except in compliance with the License. You may obtain
+#    a copy of the License at
+#
+#         http://www.apache.org/licenses/LICENSE-2.0
+#
+#    Unless required by applicable law or agreed to in writing, software
+#    distributed under the License is distributed on an "AS IS" BASIS, WITHOUT
+#    WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied. See the
+#    License for the specific language governing permissions and limitations
+#    under the License.
+from __future__ import absolute_import
+
+from concurrent import futures
+import threading
+import typing
+
+from oslo_log import log
+
+from tobiko.common import _exception
+from tobiko.common import _time
+
+
+LOG = log.getLogger(__name__)
+
+K = typing.TypeVar('K')
+
+
+class ConcurrentCallTimeout(_exception.TobikoException):
+    message = "Call {key!r} not completed after {timeout} seconds"
+
+
+class ConcurrentCall(object):
+    """Outcome of a function executed by run_concurrently
+
+    It records when the function actually started and ended its execution,
+    so that results sampled on many hosts can be compared in time.
+    """
+
+    def __init__(self,
+                 key: typing.Any,
+                 function: typing.Callable[[], typing.Any],
+                 timeout: _time.Seconds = None):
+        self.key = key
+        self.function = function
+        self.timeout = timeout
+        self.start_time: typing.Optional[float] = None
+        self.end_time: typing.Optional[float] = None
+        self.result: typing.Any = None
+        self.exc_info: typing.Optional[_exception.ExceptionInfo] = None
+
+    def __call__(self, barrier: typing.Optional[threading.Barrier] = None):
+        if barrier is not None:
+            barrier.wait()
+        self.start_time = _time.time()
+        try:
+            self.result = self.function()
+        except Exception:
+            self.exc_info = _exception.exc_info(reraise=False)
+            LOG.debug(f"Concurrent call {self.key!r} failed",
+                      exc_info=True)
+        finally:
+            self.end_time = _time.time()
+
+    @property
+    def done(self) -> bool:
+        return self.end_time is not None
+
+    @property
+    def succeeded(self) -> bool:
+        return self.done and not self.exc_info
+
+    @property
+    def elapsed_time(self) -> _time.Seconds:
+        if self.start_time is None or self.end_time is None:
+            return None
+        return self.end_time - self.start_time
+
+    def get(self) -> typing.Any:
+        if not self.done:
+            raise ConcurrentCallTimeout(key=self.key, timeout=self.timeout)
+        if self.exc_info:
+            self.exc_info.reraise()
+        return self.result
+
+    def __repr__(self):
+        return (f"{type(self).__name__}({self.key!r}, "
+                f"start_time={self.start_time}, "
+                f"elapsed_time={self.elapsed_time}, "
+                f"succeeded={self.succeeded})")
+
+
+class ConcurrentCalls(typing.Dict[typing.Any, ConcurrentCall]):
+
+    @property
+    def succeeded(self) -> typing.Dict[typing.Any, ConcurrentCall]:
+        return {key: call for key, call in self.items() if call.succeeded}
+
+    @property
+    def failed(self) -> typing.Dict[typing.Any, ConcurrentCall]:
+        return {key: call for key, call in self.items()
+                if not call.succeeded}
+
+    def results(self) -> typing.Dict[typing.Any, typing.Any]:
+        """Get results of all calls, raising the first failure"""
+        return {key: call.get() for key, call in self.items()}
+
+
+def run_concurrently(
+        functions: typing.Mapping[K, typing.Callable[[], typing.Any]],
+        timeout: _time.Seconds = None,
+        synchronized=True) -> ConcurrentCalls:
+    """Execute functions in parallel threads and wait for them
+
+    :param functions: functions to be called without arguments indexed by
+        a key used to identify their results (like a hostname)
+    :param timeout: maximum time to wait for all functions to end. Calls
+        that are not done are reported as failed with ConcurrentCallTimeout,
+        their threads are left running in background
+    :param synchronized: when true, every function waits for all others
+        threads to be started before running, so that all of them start
+        at (nearly) the same instant
+    :returns: a ConcurrentCalls dictionary indexed by the same keys
+    """
+    timeout = _time.to_seconds(timeout)
+    calls = ConcurrentCalls((key, ConcurrentCall(key, function,
+                                                 timeout=timeout))
+                            for key, function in functions.items())
+    if not calls:
+        return calls
+
+    barrier: typing.Optional[threading.Barrier] = None
+    if synchronized and len(calls) > 1:
+        barrier = threading.Barrier(len(calls), timeout=timeout)
+
+    executor = futures.ThreadPoolExecutor(max_workers=len(calls),
+                                          thread_name_prefix='tobiko')
+    try:
+        jobs = [executor.submit(call, barrier) for call in calls.values()]
+        _, not_done = futures.wait(jobs, timeout=timeout)
+    finally:
+        executor.shutdown(wait=False)
+
+    if not_done:
+        LOG.warning(f"{len(not_done)} concurrent call(s) not completed "
+                    f"after {timeout} seconds: "
+                    f"{[key for key, call in calls.items() if not call.done]}")
+    return calls
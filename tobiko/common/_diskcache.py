@@ -0,0 +1,260 @@
+# Copyright (c) 2026 Red Hat
+# All Rights Reserved.
+#
+#    Licensed under the Apache License, Version 2.0 (the "License"); you may
+#    not use this file except in compliance with the License. You may obtain
+#    a copy of the License at
+#
+#         http://www.apache.org/licenses/LICENSE-2.0
+#
+#    Unless required by applicable law or agreed to in writing, software
+#    distributed under the License is distributed on an "AS IS" BASIS, WITHOUT
+#    WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied. See the
+#    License for the specific language governing permissions and limitations
+#    under the License.
+from __future__ import absolute_import
+
+import functools
+import hashlib
+import os
+import pickle
+import tempfile
+import threading
+import typing
+
+from oslo_log import log
+
+from tobiko.common import _lockutils
+from tobiko.common import _time
+
+
+LOG = log.getLogger(__name__)
+
+# Options and environment variables telling which cloud is being tested
+CLOUD_IDENTITY_OPTIONS = [('keystone', 'auth_url'),
+                          ('keystone', 'cloud_name'),
+                          ('rhosp', 'cloud_name'),
+                          ('tripleo', 'undercloud_ssh_hostname')]
+CLOUD_IDENTITY_ENVIRON = ['OS_AUTH_URL', 'OS_CLOUD', 'KUBECONFIG']
+
+CloudIdentityFunction = typing.Callable[[], str]
+
+# Functions resolving the identity of the tested cloud registered by
+# packages knowing how to get it (like tobiko.openstack.keystone)
+CLOUD_IDENTITY_FUNCTIONS: typing.List[CloudIdentityFunction] = []
+
+
+class DiskCacheEntry(typing.NamedTuple):
+    key: str
+    expires: float
+    value: typing.Any
+
+
+_NOT_FOUND = object()
+
+
+class DiskCache(object):
+    """Key-value store persisted as one pickle file for every entry
+
+    It is shared between all test workers running on the same host: entries
+    are written to a temporary file before being atomically moved to their
+    final place, so readers never see a partially written entry.
+    """
+
+    def __init__(self,
+                 cache_dir: str = None,
+                 ttl: _time.Seconds = None):
+        self._cache_dir = cache_dir
+        self._ttl = ttl
+
+    @property
+    def cache_dir(self) -> str:
+        cache_dir = self._cache_dir
+        if cache_dir is None:
+            from tobiko import config
+            cache_dir = config.CONF.tobiko.common.cache_dir
+        return os.path.realpath(os.path.expanduser(cache_dir))
+
+    @property
+    def ttl(self) -> float:
+        ttl = self._ttl
+        if ttl is None:
+            from tobiko import config
+            ttl = config.CONF.tobiko.common.cache_ttl
+        return _time.to_seconds_float(ttl)
+
+    @property
+    def enabled(self) -> bool:
+        return self.ttl > 0.
+
+    def get_path(self, key: str) -> str:
+        digest = hashlib.sha256(key.encode()).hexdigest()
+        return os.path.join(self.cache_dir, digest)
+
+    def get(self, key: str, default: typing.Any = None) -> typing.Any:
+        path = self.get_path(key)
+        try:
+            with open(path, 'rb') as fd:
+                entry = pickle.load(fd)
+        except FileNotFoundError:
+            return default
+        except Exception:
+            LOG.exception(f"Unable to load disk cache entry from '{path}'")
+            return default
+        if not isinstance(entry, DiskCacheEntry) or entry.key != key:
+            return default
+        if entry.expires <= _time.time():
+            LOG.debug(f"Disk cache entry expired: {key}")
+            return default
+        return entry.value
+
+    def set(self, key: str, value: typing.Any, ttl: _time.Seconds = None):
+        if ttl is None:
+            ttl = self.ttl
+        expires = _time.time() + _time.to_seconds_float(ttl)
+        entry = DiskCacheEntry(key=key, expires=expires, value=value)
+        try:
+            data = pickle.dumps(entry)
+        except Exception:
+            LOG.exception(f"Unable to pickle disk cache entry: {key}")
+            return
+        path = self.get_path(key)
+        os.makedirs(os.path.dirname(path), exist_ok=True)
+        fd, temp_path = tempfile.mkstemp(dir=os.path.dirname(path),
+                                         prefix='.tmp-')
+        try:
+            with os.fdopen(fd, 'wb') as temp_file:
+                temp_file.write(data)
+            os.replace(temp_path, path)
+        except Exception:
+            if os.path.exists(temp_path):
+                os.unlink(temp_path)
+            raise
+
+    def lock(self, key: str):
+        """Lock given entry for all test workers"""
+        return _lockutils.lock(
+            'disk-cache-' + os.path.basename(self.get_path(key)))
+
+    def delete(self, key: str):
+        try:
+            os.unlink(self.get_path(key))
+        except FileNotFoundError:
+            pass
+
+    def clear(self):
+        cache_dir = self.cache_dir
+        if os.path.isdir(cache_dir):
+            for filename in os.listdir(cache_dir):
+                os.unlink(os.path.join(cache_dir, filename))
+
+
+DISK_CACHE = DiskCache()
+
+
+def get_disk_cache() -> DiskCache:
+    return DISK_CACHE
+
+
+def register_cloud_identity(function: CloudIdentityFunction) \
+        -> CloudIdentityFunction:
+    """Register a function returning a string identifying the tested cloud
+
+    Disk cached results are shared only by calls for which all registered
+    functions return the same values.
+    """
+    if function not in CLOUD_IDENTITY_FUNCTIONS:
+        CLOUD_IDENTITY_FUNCTIONS.append(function)
+    return function
+
+
+_RESOLVING_IDENTITY = threading.local()
+
+
+def get_cloud_identity() -> typing.Optional[str]:
+    """Get a string identifying the cloud being tested
+
+    It is made of configuration options and environment variables pointing
+    to the tested cloud, and of values returned by registered cloud
+    identity functions, so that facts discovered on a cloud are never used
+    for another one. It returns None when the identity can't be resolved.
+    """
+    if getattr(_RESOLVING_IDENTITY, 'value', False):
+        # a cached function has been called while resolving the identity
+        return None
+    from tobiko import config
+    values: typing.List[str] = []
+    for group_name, option_name in CLOUD_IDENTITY_OPTIONS:
+        try:
+            value = getattr(getattr(config.CONF.tobiko, group_name),
+                            option_name)
+        except Exception:
+            value = None
+        values.append(f"{group_name}.{option_name}={value}")
+    for name in CLOUD_IDENTITY_ENVIRON:
+        values.append(f"{name}={os.environ.get(name)}")
+    _RESOLVING_IDENTITY.value = True
+    try:
+        for function in CLOUD_IDENTITY_FUNCTIONS:
+            try:
+                values.append(function())
+            except Exception as ex:
+                LOG.debug(f"Unable to resolve cloud identity: {ex}")
+                return None
+    finally:
+        _RESOLVING_IDENTITY.value = False
+    return ';'.join(values)
+
+
+KeyFunction = typing.Callable[..., typing.Any]
+
+
+F = typing.TypeVar('F', bound=typing.Callable)
+
+
+def disk_cached(ttl: _time.Seconds = None,
+                key: KeyFunction = None,
+                cache: DiskCache = None) -> typing.Callable[[F], F]:
+    """Cache function results on disk for all test workers and executions
+
+    The result is stored together with the cloud identity, the function name
+    and a key made of its arguments (or returned by given key function).
+    When the cloud identity can't be resolved the disk cache is not used.
+    Results are kept until their time to live expires. Only one worker at a
+    time computes a missing result: the others wait for it and then read it
+    from the cache. Raised exceptions and None results are not cached.
+    """
+
+    def decorator(func: F) -> F:
+        name = f"{func.__module__}.{func.__qualname__}"
+
+        @functools.wraps(func)
+        def wrapper(*args, **kwargs):
+            disk_cache = cache or get_disk_cache()
+            if not disk_cache.enabled:
+                return func(*args, **kwargs)
+            cloud_identity = get_cloud_identity()
+            if cloud_identity is None:
+                # results could be reused for another cloud
+                return func(*args, **kwargs)
+            if key is None:
+                args_key = repr((args, sorted(kwargs.items())))
+            else:
+                args_key = repr(key(*args, **kwargs))
+            entry_key = f"{cloud_identity}|{name}|{args_key}"
+            value = disk_cache.get(entry_key, _NOT_FOUND)
+            if value is not _NOT_FOUND:
+                return value
+            with disk_cache.lock(entry_key):
+                # Another worker could have computed it in the meanwhile
+                value = disk_cache.get(entry_key, _NOT_FOUND)
+                if value is not _NOT_FOUND:
+                    return value
+                value = func(*args, **kwargs)
+                if value is not None:
+                    disk_cache.set(entry_key, value, ttl=ttl)
+            return value
+
+        return typing.cast(F, wrapper)
+
+    return decorator
@@ -13,7 +13,14 @@
 #    under the License.
 from __future__ import absolute_import
 
+import collections
+import io
 import logging
+import os
+import tempfile
+import typing
+import weakref
+import zlib
 
 from oslo_log import log
 from testtools import content
@@ -64,21 +71,92 @@ class CaptureLogFixture(_fixture.SharedFixture):
 
 
 class CaptureLogHandler(logging.Handler):
+    """Log handler that keeps captured records for test case details
 
-    def __init__(self, level=None):
+    Only the latest records are kept in memory. When they are more than
+    max_records the oldest half of them are formatted and appended to a
+    temporary file as a new gzip member, so that memory usage doesn't grow
+    with the test case duration.
+    """
+
+    spill_file: typing.Optional[str] = None
+
+    def __init__(self, level=None, max_records: int = None):
+        from tobiko import config
+        CONF = config.CONF
         if level is None:
-            from tobiko import config
-            CONF = config.CONF
             if CONF.tobiko.debug:
                 level = logging.DEBUG
             else:
                 level = logging.INFO
+        if max_records is None:
+            max_records = CONF.tobiko.logging.capture_log_memory_records
         super(CaptureLogHandler, self).__init__(level)
-        self.records = []
+        self.max_records = max(0, max_records or 0)
+        self.records: typing.Deque[logging.LogRecord] = collections.deque()
+        self.spilled_records = 0
+        self._spill_fd: typing.Optional[typing.IO[bytes]] = None
 
     def emit(self, record):
         self.records.append(record)
+        if self.max_records and len(self.records) > self.max_records:
+            self.spill(len(self.records) - self.max_records // 2)
+
+    def spill(self, count: int):
+        """Move the oldest records from memory to the spill file"""
+        lines = []
+        for _ in range(min(count, len(self.records))):
+            lines.append(self.format(self.records.popleft()) + '\n')
+        if not lines:
+            return
+        if self._spill_fd is None:
+            fd, self.spill_file = tempfile.mkstemp(prefix='tobiko-log-',
+                                                   suffix='.gz')
+            self._spill_fd = os.fdopen(fd, 'wb')
+            weakref.finalize(self, _remove_spill_file, self._spill_fd,
+                             self.spill_file)
+        compressor = zlib.compressobj(wbits=31)  # gzip member
+        self._spill_fd.write(compressor.compress(
+            ''.join(lines).encode(errors='ignore')) + compressor.flush())
+        self.spilled_records += len(lines)
 
     def format_all(self):
-        for record in self.records:
+        with self.lock:
+            records = list(self.records)
+            spill_size = 0
+            if self._spill_fd is not None:
+                self._spill_fd.flush()
+                spill_size = self._spill_fd.tell()
+        if spill_size:
+            yield from _read_spill_file(self.spill_file, spill_size)
+        for record in records:
             yield self.format(record) + '\n'
+
+
+def _read_spill_file(filename: str, size: int) -> typing.Iterator[str]:
+    decompressor = zlib.decompressobj(wbits=31)
+    pending = b''
+    with io.open(filename, 'rb') as fd:
+        while size > 0:
+            chunk = fd.read(min(size, io.DEFAULT_BUFFER_SIZE))
+            if not chunk:
+                break
+            size -= len(chunk)
+            while chunk:
+                pending += decompressor.decompress(chunk)
+                chunk = decompressor.unused_data
+                if decompressor.eof:
+                    decompressor = zlib.decompressobj(wbits=31)
+            lines, _, pending = pending.rpartition(b'\n')
+            if lines:
+                yield (lines + b'\n').decode(errors='ignore')
+    if pending:
+        yield pending.decode(errors='ignore')
+
+
+def _remove_spill_file(fd: typing.IO[bytes], filename: str):
+    fd.close()
+    try:
+        os.remove(filename)
+    except FileNotFoundError:
+        pass
@@ -15,12 +15,16 @@ from __future__ import absolute_import
 
 import functools
 import itertools
+import random
+import sys
 import typing
 
 from oslo_log import log
 
+from tobiko.common import _config
 from tobiko.common import _exception
 from tobiko.common import _time
+from tobiko.common import _timing
 
 
 LOG = log.getLogger(__name__)
@@ -42,6 +46,11 @@ class RetryTimeLimitError(RetryLimitError):
     message = ("Retry time limit exceeded ({attempt.details})")
 
 
+class InvalidRetryBackoff(RetryException):
+    message = ("Invalid retry backoff: {backoff!r} (valid values are "
+               "{valid_backoffs})")
+
+
 class RetryAttempt(object):
 
     def __init__(self,
@@ -145,28 +154,207 @@ def retry_attempt(number: int = 0,
                         interval=interval)
 
 
+class RetryBackoff(object):
+    """Strategy computing how long to wait before every new retry attempt
+
+    :param interval: base sleep time used for computing the others
+    :param max_sleep_time: upper limit for sleep times (it is never lower
+        than interval)
+    """
+
+    name = 'fixed'
+
+    def __init__(self,
+                 interval: _time.Seconds = None,
+                 max_sleep_time: _time.Seconds = None):
+        if interval is None:
+            interval = 1.
+        if max_sleep_time is None:
+            max_sleep_time = (
+                _config.tobiko_config().common.retry_max_sleep_time)
+        self.interval = max(0., _time.to_seconds_float(interval))
+        self.max_sleep_time = max(self.interval,
+                                  _time.to_seconds_float(max_sleep_time))
+
+    def get_sleep_time(self,
+                       attempt: RetryAttempt,
+                       last_sleep_time: typing.Optional[float] = None) \
+            -> float:
+        # pylint: disable=unused-argument
+        return self.interval
+
+    def __eq__(self, other):
+        return (type(other) is type(self) and
+                other.__dict__ == self.__dict__)
+
+    def __hash__(self):
+        raise NotImplementedError
+
+    def __repr__(self):
+        params = ', '.join(f"{name}={value!r}"
+                           for name, value in sorted(self.__dict__.items()))
+        return f"{type(self).__name__}({params})"
+
+
+class ExponentialRetryBackoff(RetryBackoff):
+    """Sleep time is multiplied by factor after every attempt
+
+    Sleep times are randomly spread by up to jitter (a fraction of the
+    sleep time) so that many loops started together stop polling in lockstep
+    """
+
+    name = 'exponential'
+
+    def __init__(self,
+                 interval: _time.Seconds = None,
+                 max_sleep_time: _time.Seconds = None,
+                 factor: float = 2.,
+                 jitter: float = 0.1):
+        super().__init__(interval=interval, max_sleep_time=max_sleep_time)
+        self.factor = factor
+        self.jitter = jitter
+
+    def get_sleep_time(self,
+                       attempt: RetryAttempt,
+                       last_sleep_time: typing.Optional[float] = None) \
+            -> float:
+        sleep_time = min(self.max_sleep_time,
+                         self.interval * self.factor ** (attempt.number - 1))
+        return apply_jitter(sleep_time, jitter=self.jitter,
+                            max_sleep_time=self.max_sleep_time)
+
+
+class DecorrelatedJitterRetryBackoff(RetryBackoff):
+    """Sleep time is randomly chosen between interval and three times the
+    previous sleep time
+    """
+
+    name = 'decorrelated_jitter'
+
+    def get_sleep_time(self,
+                       attempt: RetryAttempt,
+                       last_sleep_time: typing.Optional[float] = None) \
+            -> float:
+        if last_sleep_time is None:
+            last_sleep_time = self.interval
+        upper = max(self.interval, 3. * last_sleep_time)
+        return min(self.max_sleep_time, random.uniform(self.interval, upper))
+
+
+class FastFirstRetryBackoff(RetryBackoff):
+    """The first fast_count attempts wait for fast_sleep_time only, the
+    others for interval
+
+    It fits wait loops that usually terminate after a very few polls.
+    """
+
+    name = 'fast_first'
+
+    def __init__(self,
+                 interval: _time.Seconds = None,
+                 max_sleep_time: _time.Seconds = None,
+                 fast_sleep_time: _time.Seconds = None,
+                 fast_count: int = 3,
+                 jitter: float = 0.1):
+        super().__init__(interval=interval, max_sleep_time=max_sleep_time)
+        if fast_sleep_time is None:
+            fast_sleep_time = 0.5
+        self.fast_sleep_time = min(self.interval,
+                                   _time.to_seconds_float(fast_sleep_time))
+        self.fast_count = fast_count
+        self.jitter = jitter
+
+    def get_sleep_time(self,
+                       attempt: RetryAttempt,
+                       last_sleep_time: typing.Optional[float] = None) \
+            -> float:
+        if attempt.number <= self.fast_count:
+            sleep_time = self.fast_sleep_time
+        else:
+            sleep_time = self.interval
+        return apply_jitter(sleep_time, jitter=self.jitter,
+                            max_sleep_time=self.max_sleep_time)
+
+
+def apply_jitter(sleep_time: float,
+                 jitter: float,
+                 max_sleep_time: float) -> float:
+    if jitter > 0.:
+        sleep_time *= random.uniform(1. - jitter, 1. + jitter)
+    return max(0., min(max_sleep_time, sleep_time))
+
+
+RETRY_BACKOFF_CLASSES: typing.List[typing.Type[RetryBackoff]] = [
+    RetryBackoff,
+    ExponentialRetryBackoff,
+    DecorrelatedJitterRetryBackoff,
+    FastFirstRetryBackoff]
+
+RETRY_BACKOFFS: typing.Dict[str, typing.Type[RetryBackoff]] = {
+    cls.name: cls for cls in RETRY_BACKOFF_CLASSES}
+
+RetryBackoffType = typing.Union[RetryBackoff, str, None]
+
+
+def get_retry_backoff(backoff: RetryBackoffType = None,
+                      interval: _time.Seconds = None) \
+        -> typing.Optional[RetryBackoff]:
+    """Get a retry backoff strategy from its name
+
+    Returns None for the 'fixed' strategy, that is implemented by Retry
+    itself by sleeping the time left before the next scheduled attempt
+    """
+    if backoff is None or isinstance(backoff, RetryBackoff):
+        return backoff
+    try:
+        backoff_class = RETRY_BACKOFFS[backoff]
+    except KeyError:
+        raise InvalidRetryBackoff(
+            backoff=backoff,
+            valid_backoffs=', '.join(sorted(RETRY_BACKOFFS))) from None
+    if backoff_class is RetryBackoff:
+        return None
+    return backoff_class(interval=interval)
+
+
+def get_default_retry_backoff() -> typing.Optional[str]:
+    return _config.tobiko_config().common.retry_backoff
+
+
 class Retry(object):
 
     def __init__(self,
                  count: typing.Optional[int] = None,
                  timeout: _time.Seconds = None,
                  sleep_time: _time.Seconds = None,
-                 interval: _time.Seconds = None):
+                 interval: _time.Seconds = None,
+                 backoff: RetryBackoffType = None,
+                 default_backoff: RetryBackoffType = None):
         self.count = count
         self.timeout = _time.to_seconds(timeout)
         self.sleep_time = _time.to_seconds(sleep_time)
         self.interval = _time.to_seconds(interval)
+        self.backoff = backoff
+        self.default_backoff = default_backoff
 
     def __eq__(self, other):
         return (other.count == self.count and
                 other.timeout == self.timeout and
                 other.sleep_time == self.sleep_time and
-                other.interval == self.interval)
+                other.interval == self.interval and
+                other.backoff == self.backoff and
+                other.default_backoff == self.default_backoff)
 
     def __hash__(self):
         raise NotImplementedError
 
     def __iter__(self) -> typing.Iterator[RetryAttempt]:
+        # sleeps are accounted to the function iterating over attempts
+        caller = sys._getframe(1)  # pylint: disable=protected-access
+        caller_name = (f"{caller.f_globals.get('__name__')}."
+                       f"{caller.f_code.co_name}")
+        backoff = self.get_backoff()
+        last_sleep_time: typing.Optional[float] = None
         start_time = _time.time()
         elapsed_time = 0.
         for number in itertools.count(1):
@@ -184,22 +372,52 @@ class Retry(object):
 
             elapsed_time = _time.time() - start_time
             sleep_time = self.sleep_time
-            if sleep_time is None and self.interval is not None:
+            if backoff is not None:
+                sleep_time = backoff.get_sleep_time(
+                    attempt=attempt, last_sleep_time=last_sleep_time)
+                last_sleep_time = sleep_time
+                # never sleep beyond the timeout: one last attempt is made
+                # right after it
+                if attempt.timeout is not None:
+                    sleep_time = min(sleep_time,
+                                     attempt.timeout - elapsed_time)
+            elif sleep_time is None and self.interval is not None:
                 sleep_time = attempt.number * self.interval - elapsed_time
 
             if sleep_time is not None:
                 sleep_time = max(0., sleep_time)
                 time_left = attempt.time_left
                 if sleep_time > 0.:
-                    if time_left is None or time_left > sleep_time:
+                    if (backoff is not None or time_left is None or
+                            time_left > sleep_time):
                         LOG.debug(f"Wait for {sleep_time} seconds before "
                                   f"retrying... ({attempt.details})")
                         _time.sleep(sleep_time)
+                        _timing.record_timing(_timing.SLEEP_TIMING,
+                                              caller_name, sleep_time)
                         elapsed_time = _time.time() - start_time
 
             if not sleep_time:  # sleep_time is None or 0.
                 LOG.debug(f"retrying without waiting... ({attempt.details})")
 
+    def get_backoff(self) -> typing.Optional[RetryBackoff]:
+        """Get the backoff strategy used for computing sleep times
+
+        A backoff given explicitly is always used. Otherwise the one chosen
+        by configuration, or else the default one, is applied only to loops
+        polling with a given interval (the ones with a fixed sleep_time are
+        left untouched)
+        """
+        backoff = self.backoff
+        if backoff is None:
+            if self.sleep_time is not None or not self.interval:
+                return None
+            backoff = get_default_retry_backoff() or self.default_backoff
+        interval = self.interval
+        if interval is None:
+            interval = self.sleep_time
+        return get_retry_backoff(backoff, interval=interval)
+
     @property
     def details(self) -> str:
         details = []
@@ -211,6 +429,10 @@ class Retry(object):
             details.append(f"sleep_time={self.sleep_time}")
         if self.interval is not None:
             details.append(f"interval={self.interval}")
+        if self.backoff is not None:
+            details.append(f"backoff={self.backoff}")
+        if self.default_backoff is not None:
+            details.append(f"default_backoff={self.default_backoff}")
         return ', '.join(details)
 
     def __repr__(self):
@@ -222,10 +444,12 @@ def retry(other_retry: typing.Optional[Retry] = None,
           timeout: _time.Seconds = None,
           sleep_time: _time.Seconds = None,
           interval: _time.Seconds = None,
+          backoff: RetryBackoffType = None,
           default_count: typing.Optional[int] = None,
           default_timeout: _time.Seconds = None,
           default_sleep_time: _time.Seconds = None,
-          default_interval: _time.Seconds = None) -> Retry:
+          default_interval: _time.Seconds = None,
+          default_backoff: RetryBackoffType = None) -> Retry:
 
     if other_retry is not None:
         # Apply default values from the other Retry object
@@ -234,6 +458,8 @@ def retry(other_retry: typing.Optional[Retry] = None,
         timeout = timeout or other_retry.timeout
         sleep_time = sleep_time or other_retry.sleep_time
         interval = interval or other_retry.interval
+        backoff = backoff or other_retry.backoff
+        default_backoff = default_backoff or other_retry.default_backoff
 
     # Apply default values
     count = count or default_count
@@ -244,7 +470,9 @@ def retry(other_retry: typing.Optional[Retry] = None,
     return Retry(count=count,
                  timeout=timeout,
                  sleep_time=sleep_time,
-                 interval=interval)
+                 interval=interval,
+                 backoff=backoff,
+                 default_backoff=default_backoff)
 
 
 def retry_on_exception(
@@ -255,10 +483,12 @@ def retry_on_exception(
         timeout: _time.Seconds = None,
         sleep_time: _time.Seconds = None,
         interval: _time.Seconds = None,
+        backoff: RetryBackoffType = None,
         default_count: typing.Optional[int] = None,
         default_timeout: _time.Seconds = None,
         default_sleep_time: _time.Seconds = None,
         default_interval: _time.Seconds = None,
+        default_backoff: RetryBackoffType = None,
         on_exception: typing.Optional[typing.Callable] = None) -> \
         typing.Callable[[typing.Callable], typing.Callable]:
 
@@ -267,10 +497,12 @@ def retry_on_exception(
                          timeout=timeout,
                          sleep_time=sleep_time,
                          interval=interval,
+                         backoff=backoff,
                          default_count=default_count,
                          default_timeout=default_timeout,
                          default_sleep_time=default_sleep_time,
-                         default_interval=default_interval)
+                         default_interval=default_interval,
+                         default_backoff=default_backoff)
     exceptions = (exception,) + exceptions
 
     def decorator(func):
@@ -120,6 +120,35 @@ class TableData(collections.UserList):
 
         return cls(rows)
 
+    @classmethod
+    def from_columns(cls,
+                     columns: typing.List[str],
+                     values: typing.List[typing.List[typing.Any]]):
+        """
+        Create a TableData object from a list of values per column.
+
+        Unlike from_dict, rows are not validated one by one, as all of them
+        are known to have the same keys. This is meant to build big tables
+        from parsed command output.
+
+        Args:
+            columns: List of column names.
+            values: List of columns values, in the same order as columns.
+                    All of them must have the same length.
+
+        Returns:
+            TableData object
+        """
+        if len(columns) != len(values):
+            raise ValueError("Columns names and values must have the same "
+                             "length")
+        if len({len(column_values) for column_values in values}) > 1:
+            raise ValueError("All columns must have the same number of rows")
+        table = cls()
+        table._schema = list(columns)
+        table.data = [dict(zip(columns, row)) for row in zip(*values)]
+        return table
+
     @classmethod
     def read_csv(cls, stream_or_string, header=None, skiprows=0,
                  columns=None, sep=',', delim_whitespace=False):
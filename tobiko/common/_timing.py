@@ -0,0 +1,213 @@
+# Copyright (c) 2026 Red Hat
+# All Rights Reserved.
+#
+#    Licensed under the Apache License, Version 2.0 (the "License"); you may
+#    not use this file except in compliance with the License. You may obtain
+#    a copy of the License at
+#
+#         http://www.apache.org/licenses/LICENSE-2.0
+#
+#    Unless required by applicable law or agreed to in writing, software
+#    distributed under the License is distributed on an "AS IS" BASIS, WITHOUT
+#    WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied. See the
+#    License for the specific language governing permissions and limitations
+#    under the License.
+from __future__ import absolute_import
+
+import collections
+import contextlib
+import json
+import threading
+import typing
+
+from oslo_log import log
+
+from tobiko.common import _time
+
+
+LOG = log.getLogger(__name__)
+
+API_TIMING = 'api'
+SHELL_TIMING = 'shell'
+SLEEP_TIMING = 'sleep'
+TIMING_KINDS = API_TIMING, SHELL_TIMING, SLEEP_TIMING
+
+# Upper bounds (in seconds) of histogram buckets
+HISTOGRAM_BUCKETS = (.01, .05, .1, .5, 1., 5., 10., 30., 60., 300.)
+
+
+class TimingKey(typing.NamedTuple):
+    kind: str
+    name: str
+    host: typing.Optional[str] = None
+
+
+class TimingStats(object):
+    """Count, total time and histogram of timing samples"""
+
+    def __init__(self):
+        self.count = 0
+        self.total = 0.
+        self.min: typing.Optional[float] = None
+        self.max: typing.Optional[float] = None
+        self.histogram = [0] * (len(HISTOGRAM_BUCKETS) + 1)
+
+    def add(self, elapsed_time: float):
+        self.count += 1
+        self.total += elapsed_time
+        if self.min is None or elapsed_time < self.min:
+            self.min = elapsed_time
+        if self.max is None or elapsed_time > self.max:
+            self.max = elapsed_time
+        for i, bound in enumerate(HISTOGRAM_BUCKETS):
+            if elapsed_time <= bound:
+                self.histogram[i] += 1
+                break
+        else:
+            self.histogram[-1] += 1
+
+    def merge(self, other: 'TimingStats'):
+        self.count += other.count
+        self.total += other.total
+        for value in [other.min, other.max]:
+            if value is not None:
+                if self.min is None or value < self.min:
+                    self.min = value
+                if self.max is None or value > self.max:
+                    self.max = value
+        self.histogram = [a + b for a, b in zip(self.histogram,
+                                                other.histogram)]
+
+    @property
+    def mean(self) -> typing.Optional[float]:
+        return self.total / self.count if self.count else None
+
+    def to_dict(self) -> typing.Dict[str, typing.Any]:
+        bounds = [str(bound) for bound in HISTOGRAM_BUCKETS] + ['+inf']
+        return {'count': self.count,
+                'total': self.total,
+                'min': self.min,
+                'max': self.max,
+                'mean': self.mean,
+                'histogram': dict(zip(bounds, self.histogram))}
+
+    def __repr__(self):
+        return (f"{type(self).__name__}(count={self.count}, "
+                f"total={self.total})")
+
+
+TimingStatsDict = typing.Dict[TimingKey, TimingStats]
+
+
+class TimingRecorder(object):
+    """Time spent in API calls, shell commands and retry sleeps
+
+    Samples are aggregated by test case ID, kind, name and host, so that
+    memory usage doesn't grow with the number of samples.
+    """
+
+    def __init__(self):
+        # ID of the test case being executed (set by the test runner)
+        self.test_id: typing.Optional[str] = None
+        self._stats: typing.Dict[typing.Optional[str], TimingStatsDict] = (
+            collections.defaultdict(dict))
+        self._lock = threading.Lock()
+
+    def get_test_id(self) -> typing.Optional[str]:
+        if self.test_id is None:
+            from tobiko.common import _case
+            case = _case.get_test_case()
+            if not isinstance(case, _case.DummyTestCase):
+                return case.id()
+        return self.test_id
+
+    def record(self,
+               kind: str,
+               name: str,
+               elapsed_time: float,
+               host: str = None,
+               test_id: str = None):
+        if test_id is None:
+            test_id = self.get_test_id()
+        key = TimingKey(kind=kind, name=name, host=host)
+        with self._lock:
+            stats = self._stats[test_id].get(key)
+            if stats is None:
+                stats = self._stats[test_id][key] = TimingStats()
+            stats.add(elapsed_time)
+
+    @contextlib.contextmanager
+    def measure(self, kind: str, name: str, host: str = None):
+        start_time = _time.time()
+        try:
+            yield
+        finally:
+            self.record(kind=kind, name=name, host=host,
+                        elapsed_time=_time.time() - start_time)
+
+    def list_test_ids(self) -> typing.List[typing.Optional[str]]:
+        with self._lock:
+            return list(self._stats)
+
+    def get_stats(self, test_id: str = None) -> TimingStatsDict:
+        """Get timing stats of a test case (or of the whole session)"""
+        with self._lock:
+            if test_id is not None:
+                stats_dicts = [self._stats.get(test_id, {})]
+            else:
+                stats_dicts = list(self._stats.values())
+            result: TimingStatsDict = {}
+            for stats_dict in stats_dicts:
+                for key, stats in stats_dict.items():
+                    result.setdefault(key, TimingStats()).merge(stats)
+        return result
+
+    def get_totals(self, test_id: str = None) -> typing.Dict[str, float]:
+        """Get total time spent by kind"""
+        totals = {kind: 0. for kind in TIMING_KINDS}
+        for key, stats in self.get_stats(test_id=test_id).items():
+            totals[key.kind] = totals.get(key.kind, 0.) + stats.total
+        return totals
+
+    def to_dict(self) -> typing.Dict[str, typing.Any]:
+        return {'session': _stats_to_list(self.get_stats()),
+                'tests': {test_id: _stats_to_list(self.get_stats(test_id))
+                          for test_id in self.list_test_ids()
+                          if test_id is not None}}
+
+    def dump_json(self, path: str):
+        with open(path, 'w') as fd:
+            json.dump(self.to_dict(), fd, indent=2)
+        LOG.info(f"Timing stats written to '{path}'")
+
+    def clear(self):
+        with self._lock:
+            self._stats.clear()
+
+
+def _stats_to_list(stats_dict: TimingStatsDict) \
+        -> typing.List[typing.Dict[str, typing.Any]]:
+    return [dict(key._asdict(), **stats.to_dict())
+            for key, stats in sorted(stats_dict.items(),
+                                     key=lambda item: -item[1].total)]
+
+
+TIMING_RECORDER = TimingRecorder()
+
+
+def get_timing_recorder() -> TimingRecorder:
+    return TIMING_RECORDER
+
+
+def record_timing(kind: str,
+                  name: str,
+                  elapsed_time: float,
+                  host: str = None):
+    get_timing_recorder().record(kind=kind,
+                                 name=name,
+                                 elapsed_time=elapsed_time,
+                                 host=host)
+
+
+def measure_timing(kind: str, name: str, host: str = None):
+    return get_timing_recorder().measure(kind=kind, name=name, host=host)
@@ -29,6 +29,7 @@ LOG = log.getLogger(__name__)
 
 
 CONFIG_MODULES = ['tobiko.common._case',
+                  'tobiko.openstack.config',
                   'tobiko.openstack.glance.config',
                   'tobiko.openstack.heat.config',
                   'tobiko.openstack.manila.config',
@@ -54,6 +55,11 @@ LOGGING_OPTIONS = [
     cfg.BoolOpt('capture_log',
                 default=True,
                 help="Whenever to report debugging log lines"),
+    cfg.IntOpt('capture_log_memory_records',
+               default=10000,
+               help=("Maximum number of log records captured for a test case "
+                     "that are kept in memory. Older records are compressed "
+                     "and moved to a temporary file. Zero means unlimited")),
     cfg.StrOpt('line_format',
                default=('%(asctime)s.%(msecs)03d %(process)d %(levelname)s '
                         '%(name)s - %(message)s'),
@@ -94,6 +100,28 @@ COMMON_OPTIONS = [
     cfg.StrOpt('lock_dir',
                default='~/.tobiko/cache/lock',
                help="Directory where lock persistent files will be saved"),
+    cfg.StrOpt('cache_dir',
+               default='~/.tobiko/cache/facts',
+               help=("Directory where facts discovered on the tested cloud "
+                     "are cached, so they can be shared between test workers "
+                     "and executions")),
+    cfg.FloatOpt('cache_ttl',
+                 default=3600.,
+                 help=("Default time (in seconds) discovered facts are kept "
+                       "in the cache. A non positive value disables it")),
+    cfg.StrOpt('retry_backoff',
+               default=None,
+               choices=['fixed', 'exponential', 'decorrelated_jitter',
+                        'fast_first'],
+               help=("Strategy used for computing the time to wait between "
+                     "attempts of retry loops polling with a given interval. "
+                     "When unset, every loop uses its own default strategy "
+                     "('fixed' unless it chooses another one)")),
+    cfg.FloatOpt('retry_max_sleep_time',
+                 default=10.,
+                 help=("Maximum time (in seconds) waited between two "
+                       "attempts of a retry loop by backoff strategies "
+                       "(it is never lower than the loop interval)")),
 ]
 
 
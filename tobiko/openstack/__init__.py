@@ -0,0 +1,24 @@
+# Copyright (c) 2026 Red Hat
+# All Rights Reserved.
+#
+#    Licensed under the Apache License, Version 2.0 (the "License"); you may
+#    not use this file except in compliance with the License. You may obtain
+#    a copy of the License at
+#
+#         http://www.apache.org/licenses/LICENSE-2.0
+#
+#    Unless required by applicable law or agreed to in writing, software
+#    distributed under the License is distributed on an "AS IS" BASIS, WITHOUT
+#    WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied. See the
+#    License for the specific language governing permissions and limitations
+#    under the License.
+from __future__ import absolute_import
+
+from tobiko.openstack import _cache
+
+
+OpenstackApiCache = _cache.OpenstackApiCache
+cached_api_call = _cache.cached_api_call
+get_api_cache = _cache.get_api_cache
+invalidate_api_cache = _cache.invalidate_api_cache
+invalidates_api_cache = _cache.invalidates_api_cache
@@ -0,0 +1,158 @@
+# Copyright (c) 2026 Red Hat
+# All Rights Reserved.
+#
+#    Licensed under the Apache License, Version 2.0 (the "License"); you may
+#    not use this file except in compliance with the License. You may obtain
+#    a copy of the License at
+#
+#         http://www.apache.org/licenses/LICENSE-2.0
+#
+#    Unless required by applicable law or agreed to in writing, software
+#    distributed under the License is distributed on an "AS IS" BASIS, WITHOUT
+#    WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied. See the
+#    License for the specific language governing permissions and limitations
+#    under the License.
+from __future__ import absolute_import
+
+import copy
+import functools
+import threading
+import typing
+
+from oslo_log import log
+
+import tobiko
+
+
+LOG = log.getLogger(__name__)
+
+_NOT_FOUND = object()
+
+
+class OpenstackApiCache(object):
+    """Results of read-only OpenStack API calls cached for a short time
+
+    Entries are grouped by resource type (like 'servers' or 'ports'), each
+    having its own time to live, so that all entries of a type can be
+    invalidated after a call changing resources of that type.
+    """
+
+    def __init__(self,
+                 enabled: bool = None,
+                 ttl: tobiko.Seconds = None,
+                 ttls: typing.Dict[str, tobiko.Seconds] = None):
+        self._enabled = enabled
+        self._ttl = ttl
+        self._ttls = ttls
+        self._lock = threading.Lock()
+        self._entries: typing.Dict[
+            str, typing.Dict[str, typing.Tuple[float, typing.Any]]] = {}
+
+    @property
+    def enabled(self) -> bool:
+        if self._enabled is None:
+            return bool(tobiko.tobiko_config().openstack.api_cache)
+        return self._enabled
+
+    @enabled.setter
+    def enabled(self, value: bool):
+        self._enabled = value
+        if not value:
+            self.invalidate()
+
+    def get_ttl(self, resource: str, default: tobiko.Seconds = None) \
+            -> float:
+        ttls = self._ttls
+        if ttls is None:
+            ttls = tobiko.tobiko_config().openstack.api_cache_ttls
+        ttl = ttls.get(resource, default)
+        if ttl is None:
+            ttl = self._ttl
+            if ttl is None:
+                ttl = tobiko.tobiko_config().openstack.api_cache_ttl
+        return tobiko.to_seconds_float(ttl)
+
+    def get(self, resource: str, key: str, default: typing.Any = None) \
+            -> typing.Any:
+        with self._lock:
+            expires, value = self._entries.get(resource, {}).get(
+                key, (0., _NOT_FOUND))
+        if value is _NOT_FOUND or expires <= tobiko.time():
+            return default
+        return value
+
+    def set(self,
+            resource: str,
+            key: str,
+            value: typing.Any,
+            ttl: tobiko.Seconds = None):
+        expires = tobiko.time() + self.get_ttl(resource, default=ttl)
+        with self._lock:
+            self._entries.setdefault(resource, {})[key] = expires, value
+
+    def invalidate(self, *resources: str):
+        """Forget cached entries of given resource types (or all of them)"""
+        with self._lock:
+            if resources:
+                for resource in resources:
+                    self._entries.pop(resource, None)
+            else:
+                self._entries.clear()
+
+
+API_CACHE = OpenstackApiCache()
+
+
+def get_api_cache() -> OpenstackApiCache:
+    return API_CACHE
+
+
+def invalidate_api_cache(*resources: str):
+    get_api_cache().invalidate(*resources)
+
+
+def cached_api_call(resource: str, ttl: tobiko.Seconds = None):
+    """Cache results of a read-only API call when the API cache is enabled
+
+    Results are cached by resource type and call arguments. A shallow copy
+    of the cached result is returned, so callers can't change cached lists.
+    """
+
+    def decorator(func):
+        name = f"{func.__module__}.{func.__qualname__}"
+
+        @functools.wraps(func)
+        def wrapper(*args, **kwargs):
+            cache = get_api_cache()
+            if not cache.enabled:
+                return func(*args, **kwargs)
+            key = f"{name}{(args, sorted(kwargs.items()))!r}"
+            value = cache.get(resource, key, _NOT_FOUND)
+            if value is _NOT_FOUND:
+                value = func(*args, **kwargs)
+                cache.set(resource, key, value, ttl=ttl)
+            else:
+                LOG.debug(f"Got {resource} from API cache: {key}")
+            return copy.copy(value)
+
+        return wrapper
+
+    return decorator
+
+
+def invalidates_api_cache(*resources: str):
+    """Invalidate cached resources after calling a function changing them
+    """
+
+    def decorator(func):
+
+        @functools.wraps(func)
+        def wrapper(*args, **kwargs):
+            try:
+                return func(*args, **kwargs)
+            finally:
+                invalidate_api_cache(*resources)
+
+        return wrapper
+
+    return decorator
@@ -0,0 +1,44 @@
+# Copyright (c) 2026 Red Hat
+# All Rights Reserved.
+#
+#    Licensed under the Apache License, Version 2.0 (the "License"); you may
+#    not use this file except in compliance with the License. You may obtain
+#    a copy of the License at
+#
+#         http://www.apache.org/licenses/LICENSE-2.0
+#
+#    Unless required by applicable law or agreed to in writing, software
+#    distributed under the License is distributed on an "AS IS" BASIS, WITHOUT
+#    WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied. See the
+#    License for the specific language governing permissions and limitations
+#    under the License.
+from __future__ import absolute_import
+
+import itertools
+
+from oslo_config import cfg
+
+GROUP_NAME = 'openstack'
+OPTIONS = [
+    cfg.BoolOpt('api_cache',
+                default=False,
+                help=("Cache results of read-only OpenStack API calls (like "
+                      "listing servers, ports or agents) for a short time")),
+    cfg.FloatOpt('api_cache_ttl',
+                 default=5.,
+                 help=("Default time (in seconds) results of OpenStack API "
+                       "calls are cached")),
+    cfg.DictOpt('api_cache_ttls',
+                default={},
+                help=("Time (in seconds) results of OpenStack API calls are "
+                      "cached by resource type (for example "
+                      "'agents:10,servers:2')")),
+]
+
+
+def register_tobiko_options(conf):
+    conf.register_opts(group=cfg.OptGroup(GROUP_NAME), opts=OPTIONS)
+
+
+def list_options():
+    return [(GROUP_NAME, itertools.chain(OPTIONS))]
@@ -24,6 +24,7 @@ from oslo_log import log
 
 import tobiko
 from tobiko import config
+from tobiko.openstack import _cache
 from tobiko.openstack.heat import _client
 from tobiko.openstack.heat import _template
 from tobiko.openstack import keystone
@@ -182,6 +183,7 @@ class HeatStackFixture(base_fixture.BaseResourceFixture):
     def get_stack_parameters(self):
         return tobiko.reset_fixture(self.parameters).values
 
+    @_cache.invalidates_api_cache()
     def create_stack(self, retry: tobiko.Retry = None) -> stacks.Stack:
         if config.get_bool_env('TOBIKO_PREVENT_CREATE'):
             stack = self.validate_created_stack()
@@ -318,6 +320,7 @@ class HeatStackFixture(base_fixture.BaseResourceFixture):
             LOG.info('Stack %r not deleted because %d tests are using it',
                      self.stack_name, n_tests_using_stack)
 
+    @_cache.invalidates_api_cache()
     def cleanup_stack(self):
         self.delete_stack()
         self.wait_until_stack_deleted()
@@ -427,11 +430,58 @@ class HeatStackFixture(base_fixture.BaseResourceFixture):
             interval: tobiko.Seconds = None) \
             -> typing.Optional[stacks.Stack]:
         """Waits for the stack to reach the given status."""
+        stack = self._poll_stack_status(expected_status=expected_status,
+                                        cached=cached,
+                                        timeout=timeout,
+                                        interval=interval)
+
+        if stack is not None:
+            self._log_stack_status(stack)
+
+        if check:
+            if stack is None:
+                if DELETE_COMPLETE not in expected_status:
+                    raise HeatStackNotFound(name=self.stack_name)
+            else:
+                check_stack_status(stack, expected_status)
+
+        return stack
+
+    def _poll_stack_status_key(self,
+                               expected_status: typing.Iterable[str],
+                               cached=True,
+                               timeout: tobiko.Seconds = None,
+                               interval: tobiko.Seconds = None):
+        # pylint: disable=unused-argument
+        if isinstance(expected_status, str):
+            expected_status = [expected_status]
+        return self, frozenset(expected_status), cached
+
+    def _poll_stack_status_timeout(self,
+                                   expected_status: typing.Iterable[str],
+                                   cached=True,
+                                   timeout: tobiko.Seconds = None,
+                                   interval: tobiko.Seconds = None) \
+            -> tobiko.Seconds:
+        # pylint: disable=unused-argument
+        if timeout is None:
+            return self.wait_timeout
+        return timeout
+
+    @tobiko.coalesced(key=_poll_stack_status_key,
+                      timeout=_poll_stack_status_timeout)
+    def _poll_stack_status(self,
+                           expected_status: typing.Container[str],
+                           cached=True,
+                           timeout: tobiko.Seconds = None,
+                           interval: tobiko.Seconds = None) \
+            -> typing.Optional[stacks.Stack]:
         for attempt in tobiko.retry(
                 timeout=timeout,
                 interval=interval,
                 default_timeout=self.wait_timeout,
-                default_interval=self.wait_interval):
+                default_interval=self.wait_interval,
+                default_backoff='fast_first'):
             if cached:
                 cached = False
                 stack = self.stack or self.get_stack()
@@ -460,16 +510,6 @@ class HeatStackFixture(base_fixture.BaseResourceFixture):
         else:
             raise RuntimeError('Retry loop broken')
 
-        if stack is not None:
-            self._log_stack_status(stack)
-
-        if check:
-            if stack is None:
-                if DELETE_COMPLETE not in expected_status:
-                    raise HeatStackNotFound(name=self.stack_name)
-            else:
-                check_stack_status(stack, expected_status)
-
         return stack
 
     _outputs = None
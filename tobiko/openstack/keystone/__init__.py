@@ -19,6 +19,7 @@ from tobiko.openstack.keystone import _credentials
 from tobiko.openstack.keystone import _resource
 from tobiko.openstack.keystone import _services
 from tobiko.openstack.keystone import _session
+from tobiko.openstack.keystone import _token_cache
 
 KeystoneClient = _client.KeystoneClient
 KeystoneClientFixture = _client.KeystoneClientFixture
@@ -34,6 +35,7 @@ CloudsFileKeystoneCredentialsFixture = (
     _clouds_file.CloudsFileKeystoneCredentialsFixture)
 
 default_keystone_credentials = _credentials.default_keystone_credentials
+get_keystone_cloud_identity = _credentials.get_keystone_cloud_identity
 has_keystone_credentials = _credentials.has_keystone_credentials
 keystone_credentials = _credentials.keystone_credentials
 register_default_keystone_credentials = (
@@ -71,3 +73,6 @@ KeystoneSessionManager = _session.KeystoneSessionManager
 get_keystone_endpoint = _session.get_keystone_endpoint
 get_keystone_session = _session.get_keystone_session
 get_keystone_token = _session.get_keystone_token
+
+KeystoneTokenCache = _token_cache.KeystoneTokenCache
+get_keystone_token_cache = _token_cache.get_keystone_token_cache
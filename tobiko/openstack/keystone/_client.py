@@ -24,6 +24,7 @@ from keystoneclient.v3 import endpoints as v3_endpoints
 from oslo_log import log
 
 import tobiko
+from tobiko.openstack import _cache
 from tobiko.openstack import _client
 
 
@@ -106,6 +107,7 @@ def find_service(client=None, unique=False, default=_RAISE_ERROR, **attribute):
         return default
 
 
+@_cache.cached_api_call('endpoints')
 def list_endpoints(client=None, service=None, interface=None, region=None,
                    translate=True, **attributes):
     client = keystone_client(client)
@@ -384,6 +384,19 @@ def register_default_keystone_credentials(
         delegate.delegates.insert(position, credentials)
 
 
+@tobiko.register_cloud_identity
+def get_keystone_cloud_identity() -> str:
+    """Identify the tested cloud by default credentials auth URL and
+    project
+    """
+    credentials = default_keystone_credentials()
+    return (f"keystone.auth_url={credentials.auth_url};"
+            f"keystone.project_name={credentials.project_name};"
+            f"keystone.project_domain_name="
+            f"{credentials.project_domain_name};"
+            f"keystone.project_domain_id={credentials.project_domain_id}")
+
+
 def api_version_from_url(auth_url) -> typing.Optional[int]:
     if auth_url.endswith('/v2.0'):
         LOG.debug('Got Keystone API version 2 from auth_url: %r', auth_url)
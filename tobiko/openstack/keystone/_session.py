@@ -13,7 +13,10 @@
 #    under the License.
 from __future__ import absolute_import
 
+import functools
+import re
 import typing
+from urllib import parse
 
 from keystoneauth1 import loading
 from keystoneauth1 import session as _session
@@ -22,6 +25,7 @@ from oslo_log import log
 
 import tobiko
 from tobiko.openstack.keystone import _credentials
+from tobiko.openstack.keystone import _token_cache
 from tobiko import http
 
 
@@ -74,8 +78,11 @@ class KeystoneSessionFixture(tobiko.SharedFixture):
         params.pop('api_version', None)
         params.pop('cacert', None)
         auth = loader.load_from_options(**params)
+        _token_cache.get_keystone_token_cache().setup_auth(credentials, auth)
         session = _session.Session(auth=auth, verify=False)
         http.setup_http_session(session)
+        session.session.hooks['response'].append(
+            functools.partial(record_api_timing, auth))
         return session
 
     @staticmethod
@@ -188,3 +195,48 @@ def get_keystone_token(
         auth: typing.Optional[_plugin.BaseAuthPlugin] = None) -> \
         typing.Optional[str]:
     return keystone_session(session).get_token(auth=auth)
+
+
+# Path segments looking like resource IDs
+_RESOURCE_ID_RE = re.compile(r'^([0-9a-fA-F-]{16,}|[0-9]+)$')
+
+
+def record_api_timing(auth: _plugin.BaseAuthPlugin, response, **_kwargs):
+    """Record the time an API request took by service and endpoint"""
+    try:
+        request = response.request
+        service, path = get_api_endpoint(auth, request.url)
+        tobiko.record_timing(tobiko.API_TIMING,
+                             name=f"{service} {request.method} {path}",
+                             elapsed_time=response.elapsed.total_seconds(),
+                             host=parse.urlsplit(request.url).hostname)
+    except Exception:
+        LOG.debug('Unable to record API request timing', exc_info=True)
+
+
+def get_api_endpoint(auth: _plugin.BaseAuthPlugin, url: str) \
+        -> typing.Tuple[str, str]:
+    """Get the service type and the path (without resource IDs) of an URL
+    """
+    service = None
+    base_url = ''
+    auth_ref = getattr(auth, 'auth_ref', None)
+    if auth_ref is not None:
+        for service_type, endpoints in (
+                auth_ref.service_catalog.get_endpoints().items()):
+            for endpoint in endpoints:
+                for key, endpoint_url in endpoint.items():
+                    if (key.lower().endswith('url') and
+                            isinstance(endpoint_url, str) and
+                            url.startswith(endpoint_url) and
+                            len(endpoint_url) > len(base_url)):
+                        service, base_url = service_type, endpoint_url
+    split_url = parse.urlsplit(url)
+    if service is None:
+        service = split_url.netloc
+        path = split_url.path
+    else:
+        path = parse.urlsplit(url[len(base_url):]).path
+    path = '/'.join('{id}' if _RESOURCE_ID_RE.match(segment) else segment
+                    for segment in path.split('/'))
+    return service, path or '/'
@@ -0,0 +1,169 @@
+# Copyright (c) 2026 Red Hat
+# All Rights Reserved.
+#
+#    Licensed under the Apache License, Version 2.0 (the "License"); you may
+#    not use this file except in compliance with the License. You may obtain
+#    a copy of the License at
+#
+#         http://www.apache.org/licenses/LICENSE-2.0
+#
+#    Unless required by applicable law or agreed to in writing, software
+#    distributed under the License is distributed on an "AS IS" BASIS, WITHOUT
+#    WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied. See the
+#    License for the specific language governing permissions and limitations
+#    under the License.
+from __future__ import absolute_import
+
+import hashlib
+import json
+import typing
+
+from keystoneauth1 import access as _access
+from keystoneauth1.identity import base as _base
+from oslo_log import log
+
+import tobiko
+from tobiko.openstack.keystone import _credentials
+
+
+LOG = log.getLogger(__name__)
+
+
+class KeystoneTokenCache(object):
+    """Keystone tokens shared between test workers and executions
+
+    Authentication state (token and service catalog) is stored on disk for
+    every set of credentials, and it is reused until shortly before the
+    token expires. Only one worker at a time authenticates with the same
+    credentials, the others wait for it and then pick its token.
+    """
+
+    def __init__(self,
+                 cache: tobiko.DiskCache = None,
+                 expiry_margin: tobiko.Seconds = None,
+                 enabled: bool = None):
+        self._cache = cache
+        self._expiry_margin = expiry_margin
+        self._enabled = enabled
+
+    @property
+    def enabled(self) -> bool:
+        if self._enabled is None:
+            self._enabled = bool(tobiko.tobiko_config().keystone.token_cache)
+        return self._enabled
+
+    @property
+    def cache(self) -> tobiko.DiskCache:
+        if self._cache is None:
+            cache_dir = tobiko.tobiko_config().keystone.token_cache_dir
+            self._cache = tobiko.DiskCache(cache_dir=cache_dir)
+        return self._cache
+
+    @property
+    def expiry_margin(self) -> float:
+        if self._expiry_margin is None:
+            self._expiry_margin = (
+                tobiko.tobiko_config().keystone.token_expiry_margin)
+        return tobiko.to_seconds_float(self._expiry_margin)
+
+    @staticmethod
+    def get_key(credentials: _credentials.KeystoneCredentials) -> str:
+        # credentials contain a password: they never get written to disk
+        return hashlib.sha256(credentials.to_json().encode()).hexdigest()
+
+    def is_valid(self, auth_ref: typing.Optional[_access.AccessInfo]) \
+            -> bool:
+        return (auth_ref is not None and
+                not auth_ref.will_expire_soon(
+                    stale_duration=int(self.expiry_margin)))
+
+    def setup_auth(self,
+                   credentials: _credentials.KeystoneCredentials,
+                   auth: _base.BaseIdentityPlugin):
+        """Make given authentication plugin to use the token cache
+
+        A cached token is installed immediately (when valid), while new
+        tokens are got and stored only when the plugin needs them. When
+        the plugin is invalidated (for example because the token has been
+        rejected) its token is removed from the cache too.
+        """
+        if not self.enabled:
+            return
+        key = self.get_key(credentials)
+        self.load_auth_state(key, auth)
+        get_access = auth.get_access
+        invalidate = auth.invalidate
+
+        def cached_get_access(session, **kwargs):
+            if not self.is_valid(auth.auth_ref):
+                with self.cache.lock(key):
+                    # Another worker could have authenticated meanwhile
+                    if not self.load_auth_state(key, auth):
+                        invalidate()
+                        access = get_access(session, **kwargs)
+                        self.save_auth_state(key, auth)
+                        return access
+            return get_access(session, **kwargs)
+
+        def cached_invalidate():
+            auth_ref = auth.auth_ref
+            if auth_ref is not None:
+                self.discard_auth_state(key, auth_ref.auth_token)
+            return invalidate()
+
+        setattr(auth, 'get_access', cached_get_access)
+        setattr(auth, 'invalidate', cached_invalidate)
+
+    def load_auth_state(self, key: str, auth: _base.BaseIdentityPlugin) \
+            -> bool:
+        state = self.cache.get(key)
+        if state is None:
+            return False
+        try:
+            auth.set_auth_state(state)
+        except Exception:
+            LOG.exception('Invalid cached Keystone authentication state')
+            self.cache.delete(key)
+            return False
+        auth_ref = auth.auth_ref
+        if auth_ref is None or not self.is_valid(auth_ref):
+            return False
+        LOG.debug('Cached Keystone token loaded (expires at '
+                  f'{auth_ref.expires})')
+        return True
+
+    def discard_auth_state(self, key: str, token: typing.Optional[str]):
+        """Remove cached authentication state if it has given token
+
+        A newer token could have been cached by another worker meanwhile,
+        and it is kept.
+        """
+        with self.cache.lock(key):
+            state = self.cache.get(key)
+            if state is None:
+                return
+            try:
+                cached_token = json.loads(state).get('auth_token')
+            except (TypeError, ValueError, AttributeError):
+                cached_token = None
+            if cached_token is None or cached_token == token:
+                self.cache.delete(key)
+                LOG.debug('Invalidated Keystone token removed from cache')
+
+    def save_auth_state(self, key: str, auth: _base.BaseIdentityPlugin):
+        auth_ref = auth.auth_ref
+        if auth_ref is None or auth_ref.expires is None:
+            return
+        ttl = (auth_ref.expires.timestamp() - tobiko.time() -
+               self.expiry_margin)
+        if ttl > 0.:
+            self.cache.set(key, auth.get_auth_state(), ttl=ttl)
+            LOG.debug('Keystone token cached (expires at '
+                      f'{auth_ref.expires})')
+
+
+KEYSTONE_TOKEN_CACHE = KeystoneTokenCache()
+
+
+def get_keystone_token_cache() -> KeystoneTokenCache:
+    return KEYSTONE_TOKEN_CACHE
@@ -69,7 +69,18 @@ OPTIONS = [
                      "files to provide passwords and other secrets)"),
     cfg.StrOpt('interface',
                default=None,
-               help="default value in case keystone interface is needed")]
+               help="default value in case keystone interface is needed"),
+    cfg.BoolOpt('token_cache',
+                default=True,
+                help=("Share Keystone tokens between test workers and "
+                      "executions by storing them on disk")),
+    cfg.StrOpt('token_cache_dir',
+               default='~/.tobiko/cache/keystone',
+               help="Directory where Keystone tokens are cached"),
+    cfg.FloatOpt('token_expiry_margin',
+                 default=300.,
+                 help=("Time (in seconds) before expiration when a cached "
+                       "Keystone token is not used any more"))]
 
 
 def register_tobiko_options(conf):
@@ -26,7 +26,36 @@ from tobiko.openstack.manila import _exceptions
 
 LOG = log.getLogger(__name__)
 
-
+WAIT_FOR_STATUS_TIMEOUT = 300.
+
+
+def _wait_for_status_key(object_id: str,
+                         status_key: str = _constants.RESOURCE_STATUS,
+                         status: str = _constants.STATUS_AVAILABLE,
+                         get_client: typing.Callable = None,
+                         interval: tobiko.Seconds = None,
+                         timeout: tobiko.Seconds = None,
+                         **kwargs):
+    # pylint: disable=unused-argument
+    return (object_id, status_key, status, get_client,
+            tuple(sorted(kwargs.items())))
+
+
+def _wait_for_status_timeout(object_id: str,
+                             status_key: str = _constants.RESOURCE_STATUS,
+                             status: str = _constants.STATUS_AVAILABLE,
+                             get_client: typing.Callable = None,
+                             interval: tobiko.Seconds = None,
+                             timeout: tobiko.Seconds = None,
+                             **kwargs) -> tobiko.Seconds:
+    # pylint: disable=unused-argument
+    if timeout is None:
+        return WAIT_FOR_STATUS_TIMEOUT
+    return timeout
+
+
+@tobiko.coalesced(key=_wait_for_status_key,
+                  timeout=_wait_for_status_timeout)
 def wait_for_status(object_id: str,
                     status_key: str = _constants.RESOURCE_STATUS,
                     status: str = _constants.STATUS_AVAILABLE,
@@ -54,8 +83,9 @@ def wait_for_status(object_id: str,
 
     for attempt in tobiko.retry(timeout=timeout,
                                 interval=interval,
-                                default_timeout=300.,
-                                default_interval=3.):
+                                default_timeout=WAIT_FOR_STATUS_TIMEOUT,
+                                default_interval=3.,
+                                default_backoff='fast_first'):
         response = get_client(object_id, **kwargs)
         if response[status_key] == status:
             return response
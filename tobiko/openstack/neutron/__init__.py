@@ -24,6 +24,7 @@ from tobiko.openstack.neutron import _router
 from tobiko.openstack.neutron import _security_group
 from tobiko.openstack.neutron import _subnet
 from tobiko.openstack.neutron import _ovn
+from tobiko.openstack.neutron import _ovsdb
 from tobiko.openstack.neutron import _subnet_pool
 
 
@@ -68,8 +69,16 @@ get_raft_ports = _ovn.get_raft_ports
 is_ovn_using_ha = _ovn.is_ovn_using_ha
 is_ovn_using_raft = _ovn.is_ovn_using_raft
 parse_ips_from_db_connections = _ovn.parse_ips_from_db_connections
+sample_ovn_db_hosts = _ovn.sample_ovn_db_hosts
 transfer_leadership_ovsdb = _ovn.transfer_leadership_ovsdb
 
+OvsdbClient = _ovsdb.OvsdbClient
+OvsdbConnectionError = _ovsdb.OvsdbConnectionError
+OvsdbError = _ovsdb.OvsdbError
+UnsupportedOvsdbConnection = _ovsdb.UnsupportedOvsdbConnection
+get_ovsdb_client = _ovsdb.get_ovsdb_client
+list_ovndb_rows = _ovsdb.list_ovndb_rows
+
 AgentNotFoundOnHost = _agent.AgentNotFoundOnHost
 NotFound = _client.NotFound
 NeutronAgentType = _agent.NeutronAgentType
@@ -20,6 +20,7 @@ import typing
 from oslo_log import log
 
 import tobiko
+from tobiko.openstack import _cache
 from tobiko.openstack.neutron import _client
 from tobiko.shell import sh
 
@@ -51,6 +52,7 @@ class AgentNotFoundOnHost(tobiko.TobikoException):
 NeutronAgentType = typing.Dict[str, typing.Any]
 
 
+@_cache.cached_api_call('agents')
 def list_agents(client=None, **params) \
         -> tobiko.Selection[NeutronAgentType]:
     agents = _client.neutron_client(client).list_agents(**params)
@@ -24,6 +24,7 @@ from oslo_log import log
 import tobiko
 from tobiko.openstack.neutron import _agent as agent_mod
 from tobiko.shell import sh
+from tobiko.shell import ssh
 
 # NOTE: tobiko.openstack.topology cannot be imported at module level
 # because topology._topology references neutron.DHCP_AGENT at
@@ -116,7 +117,8 @@ def _get_ovn_controller_container_prefix() -> str:
 
 def _run_on_ovn_db_hosts(
         db: str,
-        command: str
+        command: str,
+        timeout: tobiko.Seconds = None
 ) -> typing.List[typing.Tuple[str, str]]:
     """Run a command on all OVN DB hosts for the given database.
 
@@ -125,29 +127,58 @@ def _run_on_ovn_db_hosts(
 
     :param db: Database short name ('nb' or 'sb').
     :param command: Shell command to execute.
+    :param timeout: Maximum time to wait for all hosts.
     :returns: List of (host_identifier, stdout) tuples.
     """
+    calls = sample_ovn_db_hosts(db, command, timeout=timeout)
+    return [(host_id, call.get()) for host_id, call in calls.items()]
+
+
+def sample_ovn_db_hosts(
+        db: str,
+        command: str,
+        timeout: tobiko.Seconds = None) -> tobiko.ConcurrentCalls:
+    """Run a command on all OVN DB hosts at (nearly) the same instant.
+
+    Commands are executed in parallel threads, all of them waiting on a
+    shared start barrier, so that RAFT members are sampled together.
+
+    :param db: Database short name ('nb' or 'sb').
+    :param command: Shell command to execute.
+    :param timeout: Maximum time to wait for all hosts.
+    :returns: ConcurrentCalls keyed by host identifier. Every call
+        records its start_time and elapsed_time, and returns stdout.
+    """
     from tobiko import podified
+    functions: typing.Dict[str, typing.Callable[[], str]] = {}
     if podified.has_podified_cp():
         label = _PODIFIED_POD_LABEL[db]
         pod_names = podified.get_pod_names(
             labels={'service': label})
-        results = []
         for pod_qname in pod_names:
             pod_name = pod_qname.split('/')[-1]
-            result = podified.execute_in_pod(
-                pod_name, command)
-            results.append((pod_name, result.out()))
-        return results
-    from tobiko.openstack import topology
-    results = []
-    for node in topology.list_openstack_nodes(
-            group='controller'):
-        output = sh.execute(
-            command, ssh_client=node.ssh_client,
-            sudo=True)
-        results.append((node.hostname, output.stdout))
-    return results
+            functions[pod_name] = functools.partial(
+                _execute_in_pod, pod_name, command)
+    else:
+        from tobiko.openstack import topology
+        for node in topology.list_openstack_nodes(
+                group='controller'):
+            functions[node.hostname] = functools.partial(
+                _execute_on_node, node.ssh_client, command)
+    calls = tobiko.run_concurrently(functions, timeout=timeout)
+    for host_id, call in calls.items():
+        LOG.debug('OVN %s DB host %s sampled at %s in %s seconds',
+                  db, host_id, call.start_time, call.elapsed_time)
+    return calls
+
+
+def _execute_in_pod(pod_name: str, command: str) -> str:
+    from tobiko import podified
+    return podified.execute_in_pod(pod_name, command).out()
+
+
+def _execute_on_node(ssh_client: ssh.SSHClientType, command: str) -> str:
+    return sh.execute(command, ssh_client=ssh_client, sudo=True).stdout
 
 
 def _run_on_ovn_db_host(
@@ -307,6 +338,7 @@ def dump_ovn_databases() -> typing.Dict[str, typing.Any]:
 
 
 @functools.lru_cache()
+@tobiko.disk_cached()
 def get_ovn_db_service_model() -> str:
     """Detect the OVN DB service model (RAFT or HA).
 
@@ -564,6 +596,8 @@ def collect_raft_cluster_details(
         database: str) -> typing.List[typing.Dict]:
     """Collect RAFT cluster details from all OVN DB hosts.
 
+    All hosts are sampled concurrently. Every returned details dictionary
+    also has the 'host', 'sample_time' and 'latency' of its sample.
     Restarts collection if any host has 'candidate' role
     (leader election in progress).
     """
@@ -574,10 +608,12 @@ def collect_raft_cluster_details(
     for _ in tobiko.retry(timeout=30, interval=1):
         restart_collection = False
         cluster_details = []
-        for host_id, stdout in _run_on_ovn_db_hosts(
-                database, cmd):
-            details = _parse_cluster_status(stdout)
+        calls = sample_ovn_db_hosts(database, cmd)
+        for host_id, call in calls.items():
+            details = _parse_cluster_status(call.get())
             details['host'] = host_id
+            details['sample_time'] = call.start_time
+            details['latency'] = call.elapsed_time
             if details['Role'].lower() == 'candidate':
                 LOG.warning(
                     'Cluster not stable. '
@@ -0,0 +1,374 @@
+# Copyright (c) 2026 Red Hat
+# All Rights Reserved.
+#
+#    Licensed under the Apache License, Version 2.0 (the "License"); you may
+#    not use this file except in compliance with the License. You may obtain
+#    a copy of the License at
+#
+#         http://www.apache.org/licenses/LICENSE-2.0
+#
+#    Unless required by applicable law or agreed to in writing, software
+#    distributed under the License is distributed on an "AS IS" BASIS, WITHOUT
+#    WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied. See the
+#    License for the specific language governing permissions and limitations
+#    under the License.
+from __future__ import absolute_import
+
+import codecs
+import collections
+import itertools
+import json
+import re
+import socket
+import typing
+
+from oslo_log import log
+
+import tobiko
+from tobiko.openstack.neutron import _ovn
+from tobiko.shell import ssh
+
+
+LOG = log.getLogger(__name__)
+
+OvsdbAddress = typing.Union[str, typing.Tuple[str, int]]
+OvsdbRow = typing.Dict[str, typing.Any]
+OvsdbTable = typing.Dict[str, OvsdbRow]
+OvsdbTableUpdates = typing.Dict[str, typing.Dict[str, typing.Dict]]
+
+_OVNDB_NAMES = {
+    _ovn.NBDB: _ovn.DBNAMES['nb'],
+    _ovn.SBDB: _ovn.DBNAMES['sb'],
+}
+
+_ovsdb_clients: typing.Dict[typing.Tuple, 'OvsdbClient'] = {}
+
+
+class OvsdbError(tobiko.TobikoException):
+    message = "OVSDB {method} request failed: {error}"
+
+
+class OvsdbConnectionError(tobiko.TobikoException):
+    message = "OVSDB connection to {address} failed: {reason}"
+
+
+class UnsupportedOvsdbConnection(tobiko.TobikoException):
+    message = "Unsupported OVSDB connection string: {connection}"
+
+
+_JSON_TOKENS = re.compile(r'[{}\[\]"\\]')
+
+
+class JsonStreamReader(object):
+    """Split a stream of concatenated JSON texts into parsed objects
+
+    Only brackets, quotes and escapes are scanned, so large messages (like
+    the initial monitor reply of a big NB database) are parsed only once
+    they are complete.
+    """
+
+    def __init__(self):
+        self._decoder = codecs.getincrementaldecoder('utf-8')()
+        self._chunks: typing.List[str] = []
+        self._depth = 0
+        self._in_string = False
+        self._escape = False
+        self._start = 0
+        self.messages: typing.Deque[typing.Any] = collections.deque()
+
+    def feed(self, data: bytes):
+        text = self._decoder.decode(data)
+        self._start = 0
+        skip = -1
+        if self._escape:
+            self._escape = False
+            skip = 0
+        for match in _JSON_TOKENS.finditer(text):
+            index = match.start()
+            if index == skip:
+                continue
+            if self._in_string:
+                skip = self._scan_string_token(match.group(), index, text)
+            else:
+                self._scan_token(match.group(), index, text)
+        if self._depth > 0:
+            self._chunks.append(text[self._start:])
+
+    def _scan_string_token(self, token: str, index: int, text: str) -> int:
+        if token == '\\':
+            # skip next (escaped) character
+            if index + 1 == len(text):
+                self._escape = True
+            return index + 1
+        if token == '"':
+            self._in_string = False
+        return -1
+
+    def _scan_token(self, token: str, index: int, text: str):
+        if token == '"':
+            self._in_string = True
+        elif token in '{[':
+            if self._depth == 0:
+                self._start = index
+            self._depth += 1
+        elif token in '}]':
+            self._depth -= 1
+            if self._depth == 0:
+                self._chunks.append(text[self._start:index + 1])
+                self.messages.append(json.loads(''.join(self._chunks)))
+                self._chunks = []
+                self._start = index + 1
+
+
+def ovsdb_value(datum: typing.Any) -> typing.Any:
+    """Convert an OVSDB JSON datum to its Python equivalent
+
+    Sets are converted to lists, maps to dictionaries and UUIDs to strings.
+    """
+    if isinstance(datum, list) and len(datum) == 2:
+        kind, value = datum
+        if kind == 'set':
+            return [ovsdb_value(item) for item in value]
+        if kind == 'map':
+            return {ovsdb_value(key): ovsdb_value(item)
+                    for key, item in value}
+        if kind in ('uuid', 'named-uuid'):
+            return value
+    return datum
+
+
+class OvsdbClient(object):
+    """Minimal OVSDB JSON-RPC client (RFC 7047)
+
+    Tables can be monitored so that the client keeps a local replica of
+    their rows that is updated incrementally from 'update' notifications,
+    instead of dumping the whole database every time it has to be checked.
+    """
+
+    buffer_size = 65536
+
+    def __init__(self,
+                 address: OvsdbAddress,
+                 db_name: str,
+                 timeout: tobiko.Seconds = 60.):
+        self.address = address
+        self.db_name = db_name
+        self.timeout = tobiko.to_seconds(timeout)
+        self.socket: typing.Optional[socket.socket] = None
+        self.tables: typing.Dict[str, OvsdbTable] = {}
+        self._reader = JsonStreamReader()
+        self._ids = itertools.count(1)
+        self._updates: typing.List[OvsdbTableUpdates] = []
+
+    def connect(self) -> socket.socket:
+        sock = self.socket
+        if sock is None:
+            LOG.debug(f"Connecting to OVSDB server at {self.address}...")
+            try:
+                if isinstance(self.address, str):
+                    sock = socket.socket(socket.AF_UNIX, socket.SOCK_STREAM)
+                else:
+                    sock = socket.socket(socket.AF_INET, socket.SOCK_STREAM)
+                sock.settimeout(self.timeout)
+                sock.connect(self.address)
+            except OSError as ex:
+                raise OvsdbConnectionError(address=self.address,
+                                           reason=ex) from ex
+            self.socket = sock
+            self._reader = JsonStreamReader()
+            self.tables = {}
+        return sock
+
+    def close(self):
+        sock = self.socket
+        if sock is not None:
+            self.socket = None
+            sock.close()
+
+    def _send(self, message: typing.Dict):
+        sock = self.connect()
+        sock.sendall(json.dumps(message).encode())
+
+    def _receive(self, timeout: tobiko.Seconds = None) -> \
+            typing.Optional[typing.Dict]:
+        while not self._reader.messages:
+            sock = self.connect()
+            sock.settimeout(tobiko.to_seconds(timeout) or self.timeout)
+            try:
+                data = sock.recv(self.buffer_size)
+            except socket.timeout:
+                return None
+            if not data:
+                self.close()
+                raise OvsdbConnectionError(address=self.address,
+                                           reason='connection closed')
+            self._reader.feed(data)
+        return self._reader.messages.popleft()
+
+    def _handle_request(self, message: typing.Dict):
+        method = message.get('method')
+        if method == 'echo':
+            self._send({'id': message['id'],
+                        'result': message.get('params', []),
+                        'error': None})
+        elif method == 'update':
+            _, table_updates = message['params']
+            self._apply_updates(table_updates)
+            self._updates.append(table_updates)
+        else:
+            LOG.debug(f"Ignoring OVSDB request '{method}'")
+
+    def call(self, method: str, *params) -> typing.Any:
+        request_id = next(self._ids)
+        self._send({'method': method,
+                    'params': list(params),
+                    'id': request_id})
+        while True:
+            message = self._receive()
+            if message is None:
+                raise OvsdbError(method=method, error='request timed out')
+            if 'method' in message:
+                self._handle_request(message)
+            elif message.get('id') == request_id:
+                if message.get('error') is not None:
+                    raise OvsdbError(method=method, error=message['error'])
+                return message.get('result')
+
+    def list_dbs(self) -> typing.List[str]:
+        return self.call('list_dbs')
+
+    def get_schema(self) -> typing.Dict[str, typing.Any]:
+        return self.call('get_schema', self.db_name)
+
+    def transact(self, *operations: typing.Dict) -> typing.List[typing.Dict]:
+        results = self.call('transact', self.db_name, *operations)
+        for operation, result in zip(operations, results):
+            if result and 'error' in result:
+                raise OvsdbError(method=f"transact {operation.get('op')}",
+                                 error=result)
+        return results
+
+    def select(self,
+               table: str,
+               where: typing.Optional[typing.List] = None,
+               columns: typing.Optional[typing.List[str]] = None) -> \
+            typing.List[OvsdbRow]:
+        operation: typing.Dict[str, typing.Any] = {
+            'op': 'select', 'table': table, 'where': where or []}
+        if columns is not None:
+            operation['columns'] = columns
+        result, = self.transact(operation)
+        return [{column: ovsdb_value(value)
+                 for column, value in row.items()}
+                for row in result['rows']]
+
+    def monitor(self,
+                table: str,
+                columns: typing.Optional[typing.List[str]] = None) -> \
+            OvsdbTable:
+        """Start monitoring a table and return its initial snapshot"""
+        request: typing.Dict[str, typing.Any] = {}
+        if columns is not None:
+            request['columns'] = columns
+        # connecting resets tables, therefore it has to be done before
+        # initializing the monitored one
+        self.connect()
+        if table in self.tables:
+            self.call('monitor_cancel', table)
+        self.tables[table] = {}
+        table_updates = self.call('monitor', self.db_name, table,
+                                  {table: request})
+        self._apply_updates(table_updates)
+        return self.tables[table]
+
+    def poll_updates(self, timeout: tobiko.Seconds = 0.) -> \
+            typing.List[OvsdbTableUpdates]:
+        """Apply pending monitor notifications and return them
+
+        :param timeout: how long to wait for the first notification to
+            arrive when there is none already received
+        """
+        timeout = tobiko.to_seconds(timeout) or 0.001
+        while True:
+            message = self._receive(timeout=timeout)
+            if message is None:
+                break
+            if 'method' in message:
+                self._handle_request(message)
+            timeout = 0.001
+        updates, self._updates = self._updates, []
+        return updates
+
+    def get_table(self,
+                  table: str,
+                  columns: typing.Optional[typing.List[str]] = None) -> \
+            OvsdbTable:
+        if table in self.tables:
+            self.poll_updates()
+            return self.tables[table]
+        return self.monitor(table, columns=columns)
+
+    def _apply_updates(self, table_updates: OvsdbTableUpdates):
+        for table, row_updates in (table_updates or {}).items():
+            rows = self.tables.setdefault(table, {})
+            for uuid, row_update in row_updates.items():
+                new = row_update.get('new')
+                if new is None:
+                    rows.pop(uuid, None)
+                    continue
+                row = rows.setdefault(uuid, {'_uuid': uuid})
+                row.update((column, ovsdb_value(value))
+                           for column, value in new.items())
+
+
+def parse_ovsdb_connection(connection: str) -> typing.Tuple[str, int]:
+    """Get the first TCP remote from an OVN DB connection string"""
+    remote = connection.split()[0].split(',')[0]
+    try:
+        protocol, address = remote.split(':', 1)
+        host, port = address.rsplit(':', 1)
+        if protocol != 'tcp':
+            raise ValueError(f"unsupported protocol: '{protocol}'")
+        return host.strip(']['), int(port)
+    except ValueError as ex:
+        raise UnsupportedOvsdbConnection(connection=connection) from ex
+
+
+def get_ovsdb_client(ovndb: str,
+                     address: typing.Optional[OvsdbAddress] = None,
+                     ssh_client: ssh.SSHClientType = None) -> OvsdbClient:
+    """Get a shared OVSDB client for OVN NB or SB database
+
+    By default it connects to the same TCP remote used by ovn-controller.
+    A unix socket path (like '/var/run/ovn/ovnnb_db.sock') can be given
+    as address together with the SSH client of the host exposing it.
+    Remote addresses are reached by forwarding them through SSH.
+    """
+    key = ovndb, address, ssh_client
+    client = _ovsdb_clients.get(key)
+    if client is None:
+        db_name = _OVNDB_NAMES[ovndb]
+        if address is None:
+            # pylint: disable=protected-access
+            address = parse_ovsdb_connection(
+                _ovn._get_ovndb_connection(ovndb))
+        if ssh_client is None:
+            ssh_client = _ovn.get_ovndb_ssh_client()
+        connect_address: OvsdbAddress = address
+        if ssh_client is not None:
+            connect_address = ssh.get_forward_port_address(
+                address, ssh_client=ssh_client)
+        client = OvsdbClient(address=connect_address, db_name=db_name)
+        _ovsdb_clients[key] = client
+    return client
+
+
+def list_ovndb_rows(ovndb: str,
+                    table: str,
+                    client: typing.Optional[OvsdbClient] = None,
+                    **items) -> tobiko.Selection[OvsdbRow]:
+    """List rows of an OVN DB table from an incrementally updated replica"""
+    if client is None:
+        client = get_ovsdb_client(ovndb)
+    rows = client.get_table(table).values()
+    return tobiko.select(rows).with_items(**items)
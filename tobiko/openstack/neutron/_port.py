@@ -19,6 +19,7 @@ import typing
 import netaddr
 
 import tobiko
+from tobiko.openstack import _cache
 from tobiko.openstack.neutron import _client
 from tobiko.openstack.neutron import _network
 from tobiko.openstack.neutron import _subnet
@@ -48,6 +49,7 @@ def get_port(port: PortIdType,
         raise NoSuchPort(id=port_id) from ex
 
 
+@_cache.invalidates_api_cache('ports')
 def create_port(client: _client.NeutronClientType = None,
                 network: _network.NetworkIdType = None,
                 add_cleanup=True,
@@ -75,6 +77,7 @@ def cleanup_port(port: PortIdType,
         pass
 
 
+@_cache.invalidates_api_cache('ports')
 def update_port(port: PortIdType,
                 client: _client.NeutronClientType = None,
                 **params) -> PortType:
@@ -84,6 +87,7 @@ def update_port(port: PortIdType,
     return reply['port']
 
 
+@_cache.invalidates_api_cache('ports')
 def delete_port(port: PortIdType,
                 client: _client.NeutronClientType = None):
     port_id = get_port_id(port)
@@ -107,6 +111,7 @@ def get_device_id(device: DeviceIdType) -> str:
         raise TypeError(f'{device!r} is not a valid device type')
 
 
+@_cache.cached_api_call('ports')
 def list_ports(client: _client.NeutronClientType = None,
                device: DeviceIdType = None,
                network: _network.NetworkIdType = None,
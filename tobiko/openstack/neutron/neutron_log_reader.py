@@ -52,17 +52,42 @@ class NeutronNovaCommonReader(tobiko.SharedFixture):
     datetime_pattern: typing.Pattern
     config = tobiko.required_fixture(topology.OpenStackTopologyConfig)
     service_name = neutron.SERVER
+    # time lines are looked for before the newest line already read, to
+    # tolerate clock differences between hosts
+    read_window_margin: float = 60.
+    last_timestamp: typing.Optional[float] = None
 
     def setup_fixture(self):
         self.datetime_pattern = re.compile(
             self.config.conf.log_datetime_pattern)
+        self.last_timestamp = None
         self.log_digger = self.useFixture(
             topology.get_log_file_digger(
                 service_name=self.service_name,
                 groups=self.groups,
-                pattern=self.message_pattern))
+                pattern=self.message_pattern,
+                datetime_pattern=self.config.conf.log_datetime_pattern))
         self.read_responses()
 
+    def find_log_lines(self) -> typing.List[typing.Tuple[str, str]]:
+        """Find lines matching message pattern not read yet
+
+        Once some line has been read, only the time window following it is
+        looked for in log files.
+        """
+        if not hasattr(self, 'responses'):
+            return self.log_digger.find_lines()
+        since = None
+        if self.last_timestamp:
+            since = self.last_timestamp - self.read_window_margin
+        return self.log_digger.find_lines(new_lines=True, since=since)
+
+    def _update_last_timestamp(self, timestamps: typing.Iterable[float]):
+        timestamps = [timestamp for timestamp in timestamps if timestamp]
+        if timestamps:
+            self.last_timestamp = max([self.last_timestamp or 0.] +
+                                      timestamps)
+
     def _get_log_timestamp(self,
                            log_line: str) -> float:
         found = self.datetime_pattern.match(log_line)
@@ -84,8 +109,7 @@ class NeutronNovaResponseReader(NeutronNovaCommonReader):
         # pylint: disable=no-member
         responses = tobiko.Selection[NeutronNovaResponse]()
         message_pattern = re.compile(self.message_pattern)
-        for hostname, line in self.log_digger.find_lines(
-                new_lines=hasattr(self, 'responses')):
+        for hostname, line in self.find_log_lines():
             found = message_pattern.search(line)
             assert found is not None
             response_text = line[found.end():].strip()
@@ -98,6 +122,8 @@ class NeutronNovaResponseReader(NeutronNovaCommonReader):
                 **response_data)
             responses.append(response)
         responses.sort()
+        self._update_last_timestamp(response.timestamp
+                                    for response in responses)
         if hasattr(self, 'responses'):
             self.responses.extend(responses)
         else:
@@ -158,8 +184,7 @@ class OvnUnsupportedDhcpOptionReader(NeutronNovaCommonReader):
 
         responses = tobiko.Selection[UnsupportedDhcpOptionMessage]()
         message_pattern = re.compile(self.message_pattern)
-        for _, line in self.log_digger.find_lines(
-                new_lines=hasattr(self, 'responses')):
+        for _, line in self.find_log_lines():
             found = message_pattern.search(line)
             assert found is not None
             response = UnsupportedDhcpOptionMessage(
@@ -169,6 +194,8 @@ class OvnUnsupportedDhcpOptionReader(NeutronNovaCommonReader):
                 unsupported_dhcp_option=_get_dhcp_option(line))
             responses.append(response)
         responses.sort()
+        self._update_last_timestamp(response.timestamp
+                                    for response in responses)
         if hasattr(self, 'responses'):
             self.responses.extend(responses)
         else:
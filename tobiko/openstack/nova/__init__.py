@@ -17,6 +17,7 @@ from tobiko.openstack.nova import _agent
 from tobiko.openstack.nova import _checks
 from tobiko.openstack.nova import _client
 from tobiko.openstack.nova import _cloud_init
+from tobiko.openstack.nova import _console
 from tobiko.openstack.nova import _hypervisor
 from tobiko.openstack.nova import _key_file
 from tobiko.openstack.nova import _quota_set
@@ -40,9 +41,10 @@ list_services = _client.list_services
 nova_client = _client.nova_client
 NovaClientFixture = _client.NovaClientFixture
 wait_for_server_status = _client.wait_for_server_status
-wait_for_guest_os_ready = _client.wait_for_guest_os_ready
+wait_for_servers_status = _client.wait_for_servers_status
 WaitForServerStatusError = _client.WaitForServerStatusError
 WaitForServerStatusTimeout = _client.WaitForServerStatusTimeout
+WaitForServersStatusTimeout = _client.WaitForServersStatusTimeout
 shutoff_server = _client.shutoff_server
 activate_server = _client.activate_server
 delete_server = _client.delete_server
@@ -65,7 +67,15 @@ NotInLocalStorageMigrateServerError = (
 NotInSharedStorageMigrateServerError = (
     _client.NotInSharedStorageMigrateServerError)
 
+ConsoleLineMatcher = _console.ConsoleLineMatcher
+ConsoleOutputReader = _console.ConsoleOutputReader
+GuestOsBootMonitor = _console.GuestOsBootMonitor
+read_console_output = _console.read_console_output
+wait_for_guest_os_ready = _console.wait_for_guest_os_ready
+wait_for_guests_os_ready = _console.wait_for_guests_os_ready
+
 WaitForCloudInitTimeoutError = _cloud_init.WaitForCloudInitTimeoutError
+CloudInitLogMonitor = _cloud_init.CloudInitLogMonitor
 cloud_config = _cloud_init.cloud_config
 get_cloud_init_status = _cloud_init.get_cloud_init_status
 user_data = _cloud_init.user_data
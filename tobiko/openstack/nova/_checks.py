@@ -134,9 +134,10 @@ def get_vm_uuid_list_running_via_virsh(topology_compute):
 
 def wait_for_all_instances_status(status, timeout=None):
     """wait for all instances for a certain status or raise an exception"""
-    for instance in _client.list_servers():
-        _client.wait_for_server_status(server=instance.id, status=status,
-                                       timeout=timeout)
+    instances = _client.list_servers()
+    _client.wait_for_servers_status(servers=instances, status=status,
+                                    timeout=timeout)
+    for instance in instances:
         instance_info = 'instance {nova_instance} is {state} on {host}'.format(
             nova_instance=instance.name,
             state=status,
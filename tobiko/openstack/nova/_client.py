@@ -24,6 +24,7 @@ import novaclient.v2.hypervisors
 from oslo_log import log
 
 import tobiko
+from tobiko.openstack import _cache
 from tobiko.openstack import _client
 
 
@@ -83,6 +84,7 @@ def get_nova_client(session=None, shared=True, init_client=None,
     return client.client
 
 
+@_cache.cached_api_call('hypervisors')
 def list_hypervisors(client: NovaClientType = None, detailed=True, **params) \
         -> tobiko.Selection[NovaHypervisor]:
     client = nova_client(client)
@@ -99,6 +101,7 @@ def find_hypervisor(client: NovaClientType = None, unique=False, **params) \
         return hypervisors.first
 
 
+@_cache.cached_api_call('servers')
 def list_servers(client: NovaClientType = None, **params) -> \
         tobiko.Selection[NovaServer]:
     servers = nova_client(client).servers.list()
@@ -170,6 +173,7 @@ def get_server(server: ServerType = None,
                                   reason=str(ex)) from ex
 
 
+@_cache.invalidates_api_cache('servers', 'ports')
 def delete_server(server: ServerType = None,
                   server_id: str = None,
                   client: NovaClientType = None,
@@ -183,6 +187,7 @@ def delete_server(server: ServerType = None,
                                   reason=str(ex)) from ex
 
 
+@_cache.invalidates_api_cache('servers', 'hypervisors')
 def migrate_server(server: ServerType = None,
                    server_id: str = None,
                    host: str = None,
@@ -199,6 +204,7 @@ def migrate_server(server: ServerType = None,
             'migrate', server_id, info=params)
 
 
+@_cache.invalidates_api_cache('servers', 'hypervisors')
 def live_migrate_server(server: ServerType = None,
                         server_id: str = None,
                         host: str = None,
@@ -322,7 +328,7 @@ def get_console_output(server: typing.Optional[ServerType] = None,
     return None
 
 
-_BOOT_STUCK_INDICATORS = [
+BOOT_STUCK_INDICATORS = [
     'I/O error, dev vda',
     'forced readonly',
 ]
@@ -330,26 +336,7 @@ _BOOT_STUCK_INDICATORS = [
 
 def is_boot_stuck(console_output: str) -> bool:
     return all(indicator in console_output
-               for indicator in _BOOT_STUCK_INDICATORS)
-
-
-def wait_for_guest_os_ready(server: typing.Optional[ServerType] = None,
-                            server_id: typing.Optional[str] = None,
-                            timeout: tobiko.Seconds = 120.,
-                            interval: tobiko.Seconds = 5.,
-                            client: NovaClientType = None) -> None:
-    server_id = get_server_id(server=server, server_id=server_id)
-
-    for _ in tobiko.retry(timeout=timeout, interval=interval):
-        console_output = get_console_output(
-            server_id=server_id, client=client) or ''
-        if any('login:' in line.lower()
-               for line in console_output.splitlines()):
-            LOG.debug('VM boot completed successfully')
-            return
-        if is_boot_stuck(console_output):
-            raise BootStuckError(server_id=server_id)
-        LOG.debug('VM boot not completed yet')
+               for indicator in BOOT_STUCK_INDICATORS)
 
 
 class HasNovaClientMixin(object):
@@ -375,6 +362,9 @@ class WaitForServerStatusTimeout(WaitForServerStatusError):
                "{server_status} to {status} status after {timeout} seconds")
 
 
+WAIT_FOR_SERVER_STATUS_TIMEOUT = 300.
+
+
 NOVA_SERVER_TRANSIENT_STATUS: typing.Dict[str, typing.Set[str]] = {
     'ACTIVE': {'BUILD', 'SHUTOFF', 'REBOOT'},
     'SHUTOFF': {'ACTIVE'},
@@ -382,6 +372,35 @@ NOVA_SERVER_TRANSIENT_STATUS: typing.Dict[str, typing.Set[str]] = {
 }
 
 
+def _wait_for_server_status_key(
+        server: ServerType,
+        status: str,
+        client: NovaClientType = None,
+        timeout: tobiko.Seconds = None,
+        sleep_time: tobiko.Seconds = None,
+        transient_status: typing.Optional[typing.Iterable[str]] = None):
+    # pylint: disable=unused-argument
+    if transient_status is not None:
+        transient_status = frozenset(transient_status)
+    return get_server_id(server), status, client, transient_status
+
+
+def _wait_for_server_status_timeout(
+        server: ServerType,
+        status: str,
+        client: NovaClientType = None,
+        timeout: tobiko.Seconds = None,
+        sleep_time: tobiko.Seconds = None,
+        transient_status: typing.Optional[typing.Iterable[str]] = None) \
+        -> tobiko.Seconds:
+    # pylint: disable=unused-argument
+    if timeout is None:
+        return WAIT_FOR_SERVER_STATUS_TIMEOUT
+    return timeout
+
+
+@tobiko.coalesced(key=_wait_for_server_status_key,
+                  timeout=_wait_for_server_status_timeout)
 def wait_for_server_status(
         server: ServerType,
         status: str,
@@ -395,8 +414,9 @@ def wait_for_server_status(
     server_id = get_server_id(server)
     for attempt in tobiko.retry(timeout=timeout,
                                 interval=sleep_time,
-                                default_timeout=300.,
-                                default_interval=3.):
+                                default_timeout=WAIT_FOR_SERVER_STATUS_TIMEOUT,
+                                default_interval=3.,
+                                default_backoff='fast_first'):
         _server = get_server(server_id=server_id, client=client)
         if _server.status == status:
             break
@@ -423,6 +443,106 @@ def wait_for_server_status(
     return _server
 
 
+class WaitForServersStatusTimeout(WaitForServerStatusError):
+    message = ("Servers {server_ids} didn't change their status from "
+               "{servers_status} to {status} status after {timeout} seconds")
+
+
+def wait_for_servers_status(
+        servers: typing.Iterable[ServerType],
+        status: str,
+        client: NovaClientType = None,
+        timeout: tobiko.Seconds = None,
+        sleep_time: tobiko.Seconds = None,
+        transient_status: typing.Optional[typing.Container[str]] = None) -> \
+            typing.Dict[str, NovaServer]:
+    """Wait for many servers to get the same status
+
+    It lists servers once for every poll interval instead of getting them
+    one by one, so that waiting time is bounded by the slowest server.
+    After the first poll it only asks for servers that changed since the
+    most recent 'updated' time seen.
+
+    :returns: a dictionary with final servers details indexed by server ID
+    """
+    if transient_status is None:
+        transient_status = NOVA_SERVER_TRANSIENT_STATUS.get(status) or []
+    client = nova_client(client)
+    server_ids = [get_server_id(server) for server in servers]
+    pending: typing.Dict[str, typing.Optional[NovaServer]] = {
+        server_id: None for server_id in server_ids}
+    done: typing.Dict[str, NovaServer] = {}
+    changes_since: typing.Optional[str] = None
+    for attempt in tobiko.retry(timeout=timeout,
+                                interval=sleep_time,
+                                default_timeout=300.,
+                                default_interval=3.,
+                                default_backoff='fast_first'):
+        changes_since = _update_pending_servers(
+            pending=pending, client=client, changes_since=changes_since)
+        _check_pending_servers_status(pending=pending,
+                                      done=done,
+                                      status=status,
+                                      transient_status=transient_status)
+        if not pending:
+            break
+
+        try:
+            attempt.check_time_left()
+        except tobiko.RetryTimeLimitError as ex:
+            raise WaitForServersStatusTimeout(
+                server_ids=list(pending),
+                servers_status=sorted({_server.status
+                                       for _server in pending.values()
+                                       if _server is not None}),
+                status=status,
+                timeout=timeout) from ex
+
+        LOG.debug(f"Waiting for {len(pending)}/{len(server_ids)} servers "
+                  f"status to get to {status}: {list(pending)}")
+    else:
+        raise RuntimeError("Broken retry loop")
+
+    return {server_id: done[server_id] for server_id in server_ids}
+
+
+def _update_pending_servers(
+        pending: typing.Dict[str, typing.Optional[NovaServer]],
+        client: NovaClient,
+        changes_since: typing.Optional[str] = None) -> typing.Optional[str]:
+    search_opts = {}
+    if changes_since is not None:
+        search_opts['changes-since'] = changes_since
+    for _server in client.servers.list(search_opts=search_opts):
+        updated = getattr(_server, 'updated', None)
+        if updated and (changes_since is None or updated > changes_since):
+            changes_since = updated
+        if _server.id in pending:
+            pending[_server.id] = _server
+    return changes_since
+
+
+def _check_pending_servers_status(
+        pending: typing.Dict[str, typing.Optional[NovaServer]],
+        done: typing.Dict[str, NovaServer],
+        status: str,
+        transient_status: typing.Container[str]):
+    for server_id, _server in list(pending.items()):
+        if _server is None:
+            # changes-since is only used after every server has been
+            # seen, therefore it has to be missing from the listing
+            raise ServerNotFoundError(server_id=server_id,
+                                      params={},
+                                      reason='server not listed')
+        if _server.status == status:
+            done[server_id] = _server
+            del pending[server_id]
+        elif _server.status not in transient_status:
+            raise WaitForServerStatusError(server_id=server_id,
+                                           server_status=_server.status,
+                                           status=status)
+
+
 def shutoff_server(server: ServerType = None,
                    client: NovaClientType = None,
                    timeout: tobiko.Seconds = None,
@@ -14,14 +14,19 @@
 from __future__ import absolute_import
 
 from collections import abc
+import collections
+import re
+import threading
 import typing
 
 from oslo_log import log
 
 import tobiko
+from tobiko import config
 from tobiko.shell import sh
 from tobiko.shell import ssh
 
+CONF = config.CONF
 LOG = log.getLogger(__name__)
 
 
@@ -32,6 +37,11 @@ CLOUD_INIT_TRANSIENT_STATES = {
 CLOUD_INIT_OUTPUT_FILE = '/var/log/cloud-init-output.log'
 CLOUD_INIT_LOG_FILE = '/var/log/cloud-init.log'
 
+# Lines written to cloud-init log file when its last stage terminates
+CLOUD_INIT_FINISHED_PATTERN = re.compile(
+    r'(finish: modules-final: (?P<result>SUCCESS|FAIL))|'
+    r'(Cloud-init v\. \S+ finished at)')
+
 
 def user_data(*args, **kwargs):
     config = cloud_config(*args, **kwargs)
@@ -171,12 +181,14 @@ def get_cloud_init_status(
 def wait_for_cloud_init_done(
         ssh_client: typing.Optional[ssh.SSHClientFixture] = None,
         timeout: tobiko.Seconds = None,
-        sleep_interval: tobiko.Seconds = None) \
+        sleep_interval: tobiko.Seconds = None,
+        follow_log: typing.Optional[bool] = None) \
         -> str:
     return wait_for_cloud_init_status('done',
                                       ssh_client=ssh_client,
                                       timeout=timeout,
-                                      sleep_interval=sleep_interval)
+                                      sleep_interval=sleep_interval,
+                                      follow_log=follow_log)
 
 
 def wait_for_cloud_init_status(
@@ -184,14 +196,53 @@ def wait_for_cloud_init_status(
         transient_states: typing.Optional[typing.Container[str]] = None,
         ssh_client: typing.Optional[ssh.SSHClientFixture] = None,
         timeout: tobiko.Seconds = None,
-        sleep_interval: tobiko.Seconds = None) \
+        sleep_interval: tobiko.Seconds = None,
+        follow_log: typing.Optional[bool] = None) \
         -> str:
+    """Wait for cloud-init to reach any of expected states
+
+    While cloud-init is running its log file is followed (unless follow_log
+    is false) and its status is checked again as soon as it reports cloud-init
+    has finished, or anyway after cloud_init_poll_interval seconds. Without
+    following it, or until any line is read from it, the status is checked
+    every sleep_interval seconds.
+    """
     hostname = sh.get_hostname(ssh_client=ssh_client,
                                timeout=timeout)
     if transient_states is None:
         transient_states = list()
         for status in expected_states:
             transient_states += CLOUD_INIT_TRANSIENT_STATES.get(status, [])
+    if follow_log is None:
+        follow_log = CONF.tobiko.nova.cloud_init_follow_log
+
+    monitor: typing.Optional[CloudInitLogMonitor] = None
+    if follow_log:
+        # it is started before checking the status for the first time, so
+        # that no line is lost
+        monitor = CloudInitLogMonitor(ssh_client=ssh_client).start()
+    try:
+        return _wait_for_cloud_init_status(
+            expected_states=expected_states,
+            transient_states=transient_states,
+            hostname=hostname,
+            monitor=monitor,
+            ssh_client=ssh_client,
+            timeout=timeout,
+            sleep_interval=sleep_interval)
+    finally:
+        if monitor is not None:
+            monitor.stop()
+
+
+def _wait_for_cloud_init_status(
+        expected_states: typing.Collection[str],
+        transient_states: typing.Container[str],
+        hostname: str,
+        monitor: typing.Optional['CloudInitLogMonitor'],
+        ssh_client: typing.Optional[ssh.SSHClientFixture],
+        timeout: tobiko.Seconds,
+        sleep_interval: tobiko.Seconds) -> str:
 
     def _read_file(filename: str, tail=False) -> str:
         return read_file(filename=filename,
@@ -202,9 +253,7 @@ def wait_for_cloud_init_status(
     actual_status: typing.Optional[str]
 
     for attempt in tobiko.retry(timeout=timeout,
-                                interval=sleep_interval,
-                                default_timeout=1200.,
-                                default_interval=5.):
+                                default_timeout=1200.):
         try:
             actual_status = get_cloud_init_status(ssh_client=ssh_client,
                                                   timeout=attempt.time_left)
@@ -225,12 +274,20 @@ def wait_for_cloud_init_status(
                 output_file=_read_file(CLOUD_INIT_OUTPUT_FILE))
 
         elif actual_status in transient_states:
-            last_log_lines = _read_file(CLOUD_INIT_LOG_FILE, tail=True)
+            if (monitor is not None and monitor.is_running and
+                    not monitor.finished):
+                last_log_lines = '\n'.join(monitor.last_lines)
+            else:
+                monitor = None
+                last_log_lines = _read_file(CLOUD_INIT_LOG_FILE, tail=True)
             LOG.debug(f"Waiting cloud-init status on host '{hostname}' to "
                       f"switch from '{actual_status}' to any of expected "
                       f"states ({', '.join(expected_states)}):\n\n"
                       f"--- {CLOUD_INIT_LOG_FILE} ---\n"
                       f"{last_log_lines}\n\n")
+            _wait_for_next_status_check(monitor=monitor,
+                                        attempt=attempt,
+                                        sleep_interval=sleep_interval)
         else:
             raise InvalidCloudInitStatusError(
                 hostname=hostname,
@@ -244,6 +301,129 @@ def wait_for_cloud_init_status(
     return actual_status
 
 
+def _wait_for_next_status_check(
+        monitor: typing.Optional['CloudInitLogMonitor'],
+        attempt: tobiko.RetryAttempt,
+        sleep_interval: tobiko.Seconds = None):
+    # 'tail -F' silently retries when it can't read the log file: wait for
+    # the longer poll interval only after any line has been read
+    if monitor is not None and monitor.is_running and monitor.last_lines:
+        sleep_time = tobiko.to_seconds_float(
+            CONF.tobiko.nova.cloud_init_poll_interval)
+    elif sleep_interval is None:
+        sleep_time = 5.
+    else:
+        sleep_time = tobiko.to_seconds_float(sleep_interval)
+    time_left = attempt.time_left
+    if time_left is not None:
+        sleep_time = min(time_left, sleep_time)
+    with tobiko.measure_timing(tobiko.SLEEP_TIMING,
+                               f'{__name__}.wait_for_cloud_init_status'):
+        if monitor is not None:
+            # check the status again as soon as cloud-init log file reports
+            # it has finished
+            monitor.wait_for_finished(timeout=sleep_time)
+        else:
+            tobiko.sleep(sleep_time)
+
+
+class CloudInitLogMonitor(object):
+    """Follows cloud-init log file while cloud-init is running
+
+    Lines appended to the log file are streamed by a single long-lived
+    'tail -F' process and consumed by a reader thread, that keeps the last
+    ones and detects when cloud-init terminates its final stage. A final
+    stage line left by a previous boot could be detected too: callers are
+    expected to confirm it by checking cloud-init status.
+    """
+
+    def __init__(self,
+                 ssh_client: ssh.SSHClientType = None,
+                 filename: str = CLOUD_INIT_LOG_FILE,
+                 max_lines: int = 10):
+        # the last lines are replayed to not miss the ones written while
+        # tail is starting
+        self.command = sh.shell_command(
+            ['exec', 'tail', '-n', str(max_lines), '-F', filename])
+        self.ssh_client = ssh_client
+        self.process: typing.Optional[sh.ShellProcessFixture] = None
+        self.result: typing.Optional[str] = None
+        self._last_lines: typing.Deque[str] = collections.deque(
+            maxlen=max_lines)
+        self._finished = threading.Event()
+        self._lock = threading.Lock()
+        self._thread: typing.Optional[threading.Thread] = None
+
+    @property
+    def last_lines(self) -> typing.List[str]:
+        with self._lock:
+            return list(self._last_lines)
+
+    @property
+    def finished(self) -> bool:
+        return self._finished.is_set()
+
+    @property
+    def is_running(self) -> bool:
+        return self._thread is not None and self._thread.is_alive()
+
+    def start(self) -> 'CloudInitLogMonitor':
+        if self.process is None:
+            process = sh.process(self.command,
+                                 ssh_client=self.ssh_client,
+                                 stdin=False,
+                                 stderr=False)
+            try:
+                process.execute()
+            except Exception:
+                LOG.exception(f'Unable to follow {self.command}')
+                return self
+            self.process = process
+            self._thread = threading.Thread(target=self._read_lines,
+                                            name='tobiko-cloud-init-monitor',
+                                            daemon=True)
+            self._thread.start()
+        return self
+
+    def _read_lines(self):
+        # Lines are read from the underlying stream to avoid the process
+        # fixture keeping a copy of the whole output
+        stdout = self.process.stdout
+        stream = getattr(stdout, 'delegate', stdout)
+        try:
+            for line in iter(stream.readline, b''):
+                if not line:
+                    break
+                self.add_line(line)
+        except Exception:
+            if self.process is not None:
+                LOG.exception(f'Error reading output of {self.command}')
+        LOG.debug(f'Stopped reading output of {self.command}')
+
+    def add_line(self, line: typing.Union[str, bytes]):
+        if isinstance(line, bytes):
+            line = line.decode(errors='replace')
+        line = line.rstrip()
+        with self._lock:
+            self._last_lines.append(line)
+        match = CLOUD_INIT_FINISHED_PATTERN.search(line)
+        if match is not None:
+            self.result = match.group('result') or self.result
+            LOG.debug(f"cloud-init finished (result={self.result}): "
+                      f"{line}")
+            self._finished.set()
+
+    def wait_for_finished(self, timeout: tobiko.Seconds = None) -> bool:
+        return self._finished.wait(timeout=tobiko.to_seconds(timeout))
+
+    def stop(self, timeout: tobiko.Seconds = 5.):
+        process, self.process = self.process, None
+        if process is not None:
+            process.kill()
+        if self._thread is not None:
+            self._thread.join(timeout=tobiko.to_seconds_float(timeout))
+
+
 def read_file(filename: str,
               tail=False,
               ssh_client: ssh.SSHClientType = None,
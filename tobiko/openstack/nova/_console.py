@@ -0,0 +1,264 @@
+# Copyright (c) 2026 Red Hat
+# All Rights Reserved.
+#
+#    Licensed under the Apache License, Version 2.0 (the "License"); you may
+#    not use this file except in compliance with the License. You may obtain
+#    a copy of the License at
+#
+#         http://www.apache.org/licenses/LICENSE-2.0
+#
+#    Unless required by applicable law or agreed to in writing, software
+#    distributed under the License is distributed on an "AS IS" BASIS, WITHOUT
+#    WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied. See the
+#    License for the specific language governing permissions and limitations
+#    under the License.
+from __future__ import absolute_import
+
+import typing
+
+import novaclient.exceptions
+from oslo_log import log
+
+import tobiko
+from tobiko.openstack.nova import _client
+
+
+LOG = log.getLogger(__name__)
+
+#: number of lines requested to Nova when reading a console incrementally
+CONSOLE_OUTPUT_MIN_LENGTH = 32
+
+#: number of last read lines looked for in the next output to find where
+#: new lines start
+CONSOLE_OUTPUT_ANCHOR_LENGTH = 5
+
+
+def read_console_output(server_id: str,
+                        length: typing.Optional[int] = None,
+                        client: _client.NovaClientType = None) \
+        -> typing.Optional[str]:
+    """Get the last length lines of server console output without waiting
+
+    :returns: None when the server has no console output (yet)
+    """
+    if length is None:
+        length = _client.MAX_SERVER_CONSOLE_OUTPUT_LENGTH
+    try:
+        return _client.nova_client(client).servers.get_console_output(
+            server=server_id,
+            length=min(length, _client.MAX_SERVER_CONSOLE_OUTPUT_LENGTH))
+    except (TypeError, novaclient.exceptions.NotFound):
+        # Only active servers have console output, and for some reason it
+        # could happen resulting body cannot be translated to json object
+        LOG.debug(f"Server '{server_id}' has no console output",
+                  exc_info=True)
+        return None
+
+
+class ConsoleOutputReader(object):
+    """Reads only lines appended to a server console output since last read
+
+    Nova API can only return the last lines of a console output, so the
+    whole output is read only the first time. Then only its tail is
+    requested, and new lines are found after the last lines that had been
+    read before. The number of requested lines is doubled when new lines
+    don't fit into it, and reduced when far fewer lines are produced.
+    """
+
+    def __init__(self,
+                 server_id: str,
+                 client: _client.NovaClientType = None,
+                 min_length: int = CONSOLE_OUTPUT_MIN_LENGTH,
+                 max_length: int = _client.MAX_SERVER_CONSOLE_OUTPUT_LENGTH):
+        self.server_id = server_id
+        self.client = client
+        self.min_length = min_length
+        self.max_length = max_length
+        self.length: typing.Optional[int] = None
+        #: number of complete lines read so far
+        self.lines_count = 0
+        #: last line when it is not terminated yet (like a login prompt)
+        self.partial_line = ''
+        self._anchor: typing.List[str] = []
+
+    def read_lines(self) -> typing.List[str]:
+        """Get complete lines appended since last call"""
+        length = self.length or self.max_length
+        while True:
+            output = read_console_output(server_id=self.server_id,
+                                         length=length,
+                                         client=self.client)
+            if output is None:
+                return []
+            lines, partial_line = split_console_output(output)
+            new_lines = self._get_new_lines(lines)
+            if new_lines is not None or length >= self.max_length:
+                break
+            # there are more new lines than requested ones
+            length = min(self.max_length, length * 2)
+
+        if new_lines is None:
+            LOG.debug(f"Server '{self.server_id}' console output doesn't "
+                      "contain last read lines anymore")
+            new_lines = lines
+
+        self.partial_line = partial_line
+        self.lines_count += len(new_lines)
+        if lines:
+            self._anchor = lines[-CONSOLE_OUTPUT_ANCHOR_LENGTH:]
+        self.length = self._adapt_length(length, len(new_lines))
+        return new_lines
+
+    def _get_new_lines(self, lines: typing.List[str]) \
+            -> typing.Optional[typing.List[str]]:
+        anchor = self._anchor
+        if not anchor:
+            return lines
+        size = len(anchor)
+        for index in range(len(lines) - size, -1, -1):
+            if lines[index:index + size] == anchor:
+                return lines[index + size:]
+        return None
+
+    def _adapt_length(self, length: int, new_lines_count: int) -> int:
+        if new_lines_count > length // 2:
+            length *= 2
+        elif new_lines_count < length // 8:
+            length = new_lines_count * 2
+        return max(self.min_length, min(self.max_length, length))
+
+
+def split_console_output(output: str) \
+        -> typing.Tuple[typing.List[str], str]:
+    """Split console output into complete lines and the unterminated one"""
+    lines = output.split('\n')
+    return lines[:-1], lines[-1]
+
+
+class ConsoleLineMatcher(object):
+    """Looks for given patterns in console lines as they are read
+
+    :param match_all: when true all patterns have to be found (in any line)
+        for the matcher to match, otherwise any of them is enough
+    """
+
+    def __init__(self,
+                 *patterns: str,
+                 match_all=False,
+                 ignore_case=False):
+        self.ignore_case = ignore_case
+        if ignore_case:
+            patterns = tuple(pattern.lower() for pattern in patterns)
+        self.patterns = patterns
+        self.match_all = match_all
+        self.found: typing.Set[str] = set()
+
+    def add_line(self, line: str):
+        if self.ignore_case:
+            line = line.lower()
+        for pattern in self.patterns:
+            if pattern in line:
+                self.found.add(pattern)
+
+    def match_line(self, line: str) -> bool:
+        """Tell if the matcher would match after adding given line
+
+        It is intended for lines that are still growing.
+        """
+        if self.ignore_case:
+            line = line.lower()
+        found = self.found.union(pattern for pattern in self.patterns
+                                 if pattern in line)
+        return self._match(found)
+
+    @property
+    def matched(self) -> bool:
+        return self._match(self.found)
+
+    def _match(self, found: typing.Set[str]) -> bool:
+        if self.match_all:
+            return len(found) == len(self.patterns)
+        return bool(found)
+
+
+class GuestOsBootMonitor(object):
+    """Detects guest OS boot completion and failures from console output
+    """
+
+    def __init__(self,
+                 server_id: str,
+                 client: _client.NovaClientType = None):
+        self.server_id = server_id
+        self.reader = ConsoleOutputReader(server_id=server_id, client=client)
+        self.boot_completed = ConsoleLineMatcher('login:', ignore_case=True)
+        self.boot_stuck = ConsoleLineMatcher(
+            *_client.BOOT_STUCK_INDICATORS, match_all=True)
+
+    def check(self) -> bool:
+        """Read new console lines and tell if the boot has completed
+
+        :raises BootStuckError: if disk I/O errors made the boot stuck
+        """
+        for line in self.reader.read_lines():
+            self.boot_completed.add_line(line)
+            self.boot_stuck.add_line(line)
+        partial_line = self.reader.partial_line
+        if (self.boot_completed.matched or
+                self.boot_completed.match_line(partial_line)):
+            return True
+        if (self.boot_stuck.matched or
+                self.boot_stuck.match_line(partial_line)):
+            raise _client.BootStuckError(server_id=self.server_id)
+        return False
+
+
+def wait_for_guests_os_ready(
+        servers: typing.Iterable[_client.ServerType],
+        timeout: tobiko.Seconds = 120.,
+        interval: tobiko.Seconds = 5.,
+        client: _client.NovaClientType = None) -> typing.Dict[str, float]:
+    """Wait for guest OS of many servers to complete their boot
+
+    Console outputs are read incrementally, for all servers that are still
+    booting at every attempt.
+
+    :returns: seconds waited for every server indexed by server ID
+    :raises BootStuckError: if any server boot is stuck
+    """
+    monitors = {server_id: GuestOsBootMonitor(server_id=server_id,
+                                              client=client)
+                for server_id in (_client.get_server_id(server)
+                                  for server in servers)}
+    ready_times: typing.Dict[str, float] = {}
+    for attempt in tobiko.retry(timeout=timeout, interval=interval):
+        pending = {server_id: monitor.check
+                   for server_id, monitor in monitors.items()
+                   if server_id not in ready_times}
+        if len(pending) == 1:
+            completed = {server_id: check()
+                         for server_id, check in pending.items()}
+        else:
+            completed = tobiko.run_concurrently(
+                pending, timeout=attempt.time_left,
+                synchronized=False).results()
+        for server_id, boot_completed in completed.items():
+            if boot_completed:
+                LOG.debug(f"Server '{server_id}' VM boot completed "
+                          "successfully")
+                ready_times[server_id] = attempt.elapsed_time
+        if len(ready_times) == len(monitors):
+            return ready_times
+        LOG.debug(f"VM boot not completed yet: {sorted(pending)}")
+    raise RuntimeError('Broken retry loop')
+
+
+def wait_for_guest_os_ready(server: typing.Optional[_client.ServerType] = None,
+                            server_id: typing.Optional[str] = None,
+                            timeout: tobiko.Seconds = 120.,
+                            interval: tobiko.Seconds = 5.,
+                            client: _client.NovaClientType = None) -> None:
+    server_id = _client.get_server_id(server=server, server_id=server_id)
+    wait_for_guests_os_ready([server_id],
+                             timeout=timeout,
+                             interval=interval,
+                             client=client)
@@ -38,7 +38,16 @@ OPTIONS = [
     cfg.FloatOpt('cloudinit_is_reachable_timeout',
                  default=600.,
                  help="Timeout (in seconds) till cloud-init based server is "
-                      "reachable")
+                      "reachable"),
+    cfg.BoolOpt('cloud_init_follow_log',
+                default=True,
+                help="Follow cloud-init log file while waiting for cloud-init "
+                     "to finish, instead of polling its status at a fixed "
+                     "interval"),
+    cfg.FloatOpt('cloud_init_poll_interval',
+                 default=10.,
+                 help="Maximum time (in seconds) between two cloud-init "
+                      "status checks while its log file is being followed")
 ]
 
 
@@ -18,6 +18,7 @@ import typing
 from octaviaclient.api.v2 import octavia
 
 import tobiko
+from tobiko.openstack import _cache
 from tobiko.openstack import _client, openstacksdkclient
 from tobiko.openstack import keystone
 
@@ -76,9 +77,10 @@ def get_octavia_client(session=None, shared=True, init_client=None,
     return client.client
 
 
+@_cache.cached_api_call('members')
 def list_members(pool_id: str):
     os_sdk_client = openstacksdkclient.openstacksdk_client()
-    return os_sdk_client.load_balancer.members(pool=pool_id)
+    return list(os_sdk_client.load_balancer.members(pool=pool_id))
 
 
 def list_load_balancers(**lb_kwargs):
@@ -122,6 +124,7 @@ def find_member(member_name: str, pool: str):
     return os_sdk_client.load_balancer.find_member(member_name, pool)
 
 
+@_cache.invalidates_api_cache('members')
 def create_member(member_kwargs):
     os_sdk_client = openstacksdkclient.openstacksdk_client()
     return os_sdk_client.load_balancer.create_member(**member_kwargs)
@@ -41,7 +41,11 @@ def check_members_balanced(ip_address: str,
                            ssh_client: ssh.SSHClientFixture = None) -> (
         typing.Dict[str, int]):
 
-    """Check if traffic is properly balanced between members."""
+    """Check if traffic is properly balanced between members.
+
+    When interval is None all requests are sent in a single burst by one
+    curl process, without waiting between them.
+    """
 
     # Getting the members count
     if members_count is None:
@@ -52,25 +56,28 @@ def check_members_balanced(ip_address: str,
         else:  # members_count is None and pool_id is not None
             members_count = len(list(octavia.list_members(pool_id=pool_id)))
 
+    contents: typing.Iterable[str]
+    if interval is None:
+        contents = _send_traffic_burst(
+            ip_address=ip_address,
+            protocol=protocol,
+            port=port,
+            requests_count=members_count * requests_count,
+            connect_timeout=connect_timeout,
+            ssh_client=ssh_client)
+    else:
+        contents = _send_traffic(
+            ip_address=ip_address,
+            protocol=protocol,
+            port=port,
+            requests_count=members_count * requests_count,
+            connect_timeout=connect_timeout,
+            interval=interval,
+            ssh_client=ssh_client)
+
     last_content = None
     replies: typing.Dict[str, int] = collections.defaultdict(lambda: 0)
-    for attempt in tobiko.retry(count=members_count * requests_count,
-                                interval=interval):
-        try:
-            content = curl.execute_curl(
-                hostname=ip_address,
-                scheme='HTTP' if protocol == 'TCP' else protocol,
-                port=port,
-                path='id',
-                connect_timeout=connect_timeout,
-                ssh_client=ssh_client).strip()
-        except sh.ShellCommandFailed as ex:
-            if ex.exit_status == 28:
-                raise octavia.TrafficTimeoutError(
-                    reason=str(ex.stderr)) from ex
-            else:
-                raise ex
-
+    for content in contents:
         replies[content] += 1
 
         if last_content is not None and lb_algorithm == 'ROUND_ROBIN':
@@ -83,11 +90,6 @@ def check_members_balanced(ip_address: str,
 
         last_content = content
 
-        if attempt.is_last:
-            break
-    else:
-        raise RuntimeError('Broken retry loop')
-
     LOG.debug(f"Replies counts from load balancer: {replies}")
 
     # assert that 'members_count' servers replied
@@ -102,6 +104,73 @@ def check_members_balanced(ip_address: str,
     return replies
 
 
+def _send_traffic(ip_address: str,
+                  protocol: str,
+                  port: int,
+                  requests_count: int,
+                  connect_timeout: tobiko.Seconds,
+                  interval: tobiko.Seconds,
+                  ssh_client: ssh.SSHClientFixture = None) -> \
+        typing.Iterator[str]:
+    for attempt in tobiko.retry(count=requests_count,
+                                interval=interval):
+        try:
+            content = curl.execute_curl(
+                hostname=ip_address,
+                scheme='HTTP' if protocol == 'TCP' else protocol,
+                port=port,
+                path='id',
+                connect_timeout=connect_timeout,
+                ssh_client=ssh_client).strip()
+        except sh.ShellCommandFailed as ex:
+            if ex.exit_status == 28:
+                raise octavia.TrafficTimeoutError(
+                    reason=str(ex.stderr)) from ex
+            else:
+                raise ex
+
+        yield content
+
+        if attempt.is_last:
+            break
+    else:
+        raise RuntimeError('Broken retry loop')
+
+
+def _send_traffic_burst(ip_address: str,
+                        protocol: str,
+                        port: int,
+                        requests_count: int,
+                        connect_timeout: tobiko.Seconds,
+                        ssh_client: ssh.SSHClientFixture = None) -> \
+        typing.List[str]:
+    traffic = curl.generate_curl_traffic(
+        hostname=ip_address,
+        scheme='HTTP' if protocol == 'TCP' else protocol,
+        port=port,
+        path='id',
+        requests_count=requests_count,
+        connect_timeout=connect_timeout,
+        ssh_client=ssh_client)
+    for response in traffic.failed:
+        if response.exit_status == 28:
+            raise octavia.TrafficTimeoutError(
+                reason=f'{len(traffic.failed)} out of '
+                       f'{len(traffic.responses)} requests failed')
+        raise octavia.RequestException(
+            command='curl',
+            error=f'{len(traffic.failed)} out of {len(traffic.responses)} '
+                  f'requests failed (first failure: {response})')
+    if len(traffic.responses) < requests_count:
+        raise octavia.RequestException(
+            command='curl',
+            error=f'only {len(traffic.responses)} out of {requests_count} '
+                  'requests got a response')
+    LOG.debug("Load balancer latency percentiles by member: "
+              f"{traffic.latency_percentiles()}")
+    return [response.content for response in traffic.responses]
+
+
 def verify_lb_traffic(pool_id: str,
                       ip_address: str,
                       lb_algorithm: str,
@@ -111,14 +180,15 @@ def verify_lb_traffic(pool_id: str,
                       members_count: int = None,
                       requests_count: int = 10,
                       connect_timeout: tobiko.Seconds = 10.,
-                      interval: tobiko.Seconds = 1,
+                      interval: tobiko.Seconds = None,
                       ssh_client: ssh.SSHClientFixture = None,
                       exceptions: tuple = None):
     """Verify load balancer traffic with retries.
 
     This function attempts to verify that traffic is properly balanced to
     all members of a load balancer pool, retrying on expected exceptions
-    during resource provisioning or service disruption.
+    during resource provisioning or service disruption. By default all
+    requests are sent in a single burst (see check_members_balanced).
 
     Raises:
         The last exception caught if all retries are exhausted
@@ -130,6 +200,7 @@ def verify_lb_traffic(pool_id: str,
         exceptions = (octavia.RoundRobinException,
                       octavia.TrafficTimeoutError,
                       sh.ShellCommandFailed,
+                      octavia.RequestException,
                       octavia.OctaviaClientException)
 
     for attempt in tobiko.retry(timeout=timeout):
@@ -37,6 +37,33 @@ def _has_ipv6_vip(lb: typing.Any) -> bool:
     return _client.find_ipv6_vip_on_load_balancer(lb) is not None
 
 
+def _wait_for_status_key(object_id: str,
+                         status_key: str = _constants.PROVISIONING_STATUS,
+                         status: str = _constants.ACTIVE,
+                         get_client: typing.Callable = None,
+                         interval: tobiko.Seconds = None,
+                         timeout: tobiko.Seconds = None,
+                         **kwargs):
+    # pylint: disable=unused-argument
+    return (object_id, status_key, status, get_client,
+            tuple(sorted(kwargs.items())))
+
+
+def _wait_for_status_timeout(object_id: str,
+                             status_key: str = _constants.PROVISIONING_STATUS,
+                             status: str = _constants.ACTIVE,
+                             get_client: typing.Callable = None,
+                             interval: tobiko.Seconds = None,
+                             timeout: tobiko.Seconds = None,
+                             **kwargs) -> tobiko.Seconds:
+    # pylint: disable=unused-argument
+    if timeout is None:
+        return CONF.tobiko.octavia.check_timeout
+    return timeout
+
+
+@tobiko.coalesced(key=_wait_for_status_key,
+                  timeout=_wait_for_status_timeout)
 def wait_for_status(object_id: str,
                     status_key: str = _constants.PROVISIONING_STATUS,
                     status: str = _constants.ACTIVE,
@@ -68,7 +95,8 @@ def wait_for_status(object_id: str,
                                 default_timeout=(
                                         CONF.tobiko.octavia.check_timeout),
                                 default_interval=(
-                                        CONF.tobiko.octavia.check_interval)):
+                                        CONF.tobiko.octavia.check_interval),
+                                default_backoff='fast_first'):
         response = get_client(object_id, **kwargs)
         if response[status_key] == status:
             return response
@@ -23,6 +23,7 @@ from tobiko.openstack.stacks import _neutron
 from tobiko.openstack.stacks import _nova
 from tobiko.openstack.stacks import _octavia
 from tobiko.openstack.stacks import _qos
+from tobiko.openstack.stacks import _readiness
 from tobiko.openstack.stacks import _advanced_vm
 from tobiko.openstack.stacks import _vlan
 
@@ -85,6 +86,11 @@ AffinityServerGroupStackFixture = _nova.AffinityServerGroupStackFixture
 AntiAffinityServerGroupStackFixture = _nova.AntiAffinityServerGroupStackFixture
 CloudInitServerStackFixture = _nova.CloudInitServerStackFixture
 
+ServerReadiness = _readiness.ServerReadiness
+ServersReadiness = _readiness.ServersReadiness
+defer_servers_readiness = _readiness.defer_servers_readiness
+wait_for_servers_ready = _readiness.wait_for_servers_ready
+
 # Octavia resources: backend servers
 OctaviaServerStackFixture = _octavia.OctaviaServerStackFixture
 OctaviaOtherServerStackFixture = _octavia.OctaviaOtherServerStackFixture
@@ -96,6 +96,8 @@ class CirrosServerWithDefaultSecurityGroupStackFixture(
 
 class CirrosShellConnection(sh.SSHShellConnection):
 
+    put_archive = False
+
     @property
     def is_cirros(self) -> bool:
         return True
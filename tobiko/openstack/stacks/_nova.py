@@ -30,6 +30,7 @@ from tobiko.openstack import nova
 from tobiko.openstack.base import _fixture as base_fixture
 from tobiko.openstack.stacks import _hot
 from tobiko.openstack.stacks import _neutron
+from tobiko.openstack.stacks import _readiness
 from tobiko.shell import curl
 from tobiko.shell import ping
 from tobiko.shell import sh
@@ -292,6 +293,20 @@ class ServerStackFixture(heat.HeatStackFixture, ABC):
         nova.wait_for_guest_os_ready(server_id=self.server_id,
                                      timeout=timeout)
 
+    def wait_for_ready(self, readiness: _readiness.ServerReadiness = None):
+        """Wait for the guest OS to boot and the server to be reachable
+
+        :param readiness: if given, time spent by every check is recorded
+            on it
+        """
+        if readiness is None:
+            readiness = _readiness.ServerReadiness(self.fixture_name)
+        with readiness.step('guest_os'):
+            self.wait_for_guest_os_ready()
+        if self.has_floating_ip:
+            with readiness.step('ping'):
+                self.assert_is_reachable()
+
     def migrate_server(self,
                        live=False,
                        host: str = None,
@@ -436,33 +451,45 @@ class CloudInitServerStackFixture(ServerStackFixture, ABC):
     @tobiko.interworker_synched('cloudinit_server_setup_fixture')
     def setup_fixture(self):
         super(CloudInitServerStackFixture, self).setup_fixture()
+        if _readiness.is_server_readiness_deferred(self):
+            LOG.debug(f"Stack '{self.stack_name}' readiness is going to be "
+                      "checked together with other servers")
+        else:
+            self.wait_for_ready()
+
+    def wait_for_ready(self, readiness: _readiness.ServerReadiness = None):
+        if readiness is None:
+            readiness = _readiness.ServerReadiness(self.fixture_name)
 
         if config.get_bool_env('TOBIKO_PREVENT_CREATE'):
             LOG.debug("skip wait_for_guest_os_ready during check-resources "
                       "steps because the console output may be empty in some "
                       "cases, such as hypervisor reboot")
         else:
-            for attempt in tobiko.retry(count=2, sleep_time=5.):
-                try:
-                    self.wait_for_guest_os_ready()
-                    break
-                except nova.BootStuckError:
-                    if attempt.is_last:
-                        raise
-                    LOG.warning(f"Stack '{self.stack_name}' VM boot stuck "
-                                f"on disk I/O errors, recreating the "
-                                f"stack...")
-                    self.cleanup_stack()
-                    self.create_stack()
+            with readiness.step('guest_os'):
+                for attempt in tobiko.retry(count=2, sleep_time=5.):
+                    try:
+                        self.wait_for_guest_os_ready()
+                        break
+                    except nova.BootStuckError:
+                        if attempt.is_last:
+                            raise
+                        LOG.warning(f"Stack '{self.stack_name}' VM boot "
+                                    f"stuck on disk I/O errors, recreating "
+                                    f"the stack...")
+                        self.cleanup_stack()
+                        self.create_stack()
 
         if self.has_floating_ip:
-            self.assert_is_reachable()
+            with readiness.step('ping'):
+                self.assert_is_reachable()
             if not config.get_bool_env('TOBIKO_PREVENT_CREATE'):
                 # Skip cloud-init check during verify_resources:
                 # cloud-init may be in a failed state after server
                 # reboots due to race conditions (e.g. cloud-init
                 # v25.2 cc_users_groups /etc/shadow.lock contention)
-                self.wait_for_cloud_init_done()
+                with readiness.step('cloud_init'):
+                    self.wait_for_cloud_init_done()
 
     def wait_for_guest_os_ready(self, timeout=900.):
         super(CloudInitServerStackFixture, self).wait_for_guest_os_ready(
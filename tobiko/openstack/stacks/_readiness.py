@@ -0,0 +1,169 @@
+# Copyright (c) 2026 Red Hat
+# All Rights Reserved.
+#
+#    Licensed under the Apache License, Version 2.0 (the "License"); you may
+#    not use this file except in compliance with the License. You may obtain
+#    a copy of the License at
+#
+#         http://www.apache.org/licenses/LICENSE-2.0
+#
+#    Unless required by applicable law or agreed to in writing, software
+#    distributed under the License is distributed on an "AS IS" BASIS, WITHOUT
+#    WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied. See the
+#    License for the specific language governing permissions and limitations
+#    under the License.
+from __future__ import absolute_import
+
+import contextlib
+import functools
+import threading
+import typing
+
+from oslo_log import log
+
+import tobiko
+
+
+LOG = log.getLogger(__name__)
+
+if typing.TYPE_CHECKING:
+    from tobiko.openstack.stacks import _nova  # noqa
+
+
+class ServerReadiness(object):
+    """Times spent by a Nova server to get ready for being used by tests
+    """
+
+    def __init__(self, name: str):
+        self.name = name
+        self.start_time: typing.Optional[float] = None
+        self.end_time: typing.Optional[float] = None
+        self.steps: typing.Dict[str, float] = {}
+        self.exc_info: typing.Optional[tobiko.ExceptionInfo] = None
+
+    @contextlib.contextmanager
+    def step(self, name: str):
+        """Measure the time spent by a readiness check"""
+        start_time = tobiko.time()
+        try:
+            yield
+        finally:
+            self.steps[name] = tobiko.time() - start_time
+
+    @property
+    def ready(self) -> bool:
+        return self.end_time is not None and not self.exc_info
+
+    @property
+    def ready_time(self) -> tobiko.Seconds:
+        """Seconds spent waiting for the server to get ready"""
+        if self.start_time is None or self.end_time is None:
+            return None
+        return self.end_time - self.start_time
+
+    def __repr__(self):
+        steps = ', '.join(f"{name}={elapsed:.1f}"
+                          for name, elapsed in self.steps.items())
+        return (f"{type(self).__name__}({self.name!r}, "
+                f"ready={self.ready}, ready_time={self.ready_time}, "
+                f"steps=({steps}))")
+
+
+class ServersReadiness(typing.Dict[str, ServerReadiness]):
+
+    @property
+    def ready(self) -> typing.Dict[str, ServerReadiness]:
+        return {name: readiness for name, readiness in self.items()
+                if readiness.ready}
+
+    @property
+    def not_ready(self) -> typing.Dict[str, ServerReadiness]:
+        return {name: readiness for name, readiness in self.items()
+                if not readiness.ready}
+
+    @property
+    def ready_times(self) -> typing.Dict[str, tobiko.Seconds]:
+        return {name: readiness.ready_time
+                for name, readiness in self.items()}
+
+    def check(self):
+        """Raise the error of the first server that is not ready"""
+        not_ready = list(self.not_ready.values())
+        for readiness in not_ready[1:]:
+            LOG.error(f"Server {readiness.name} is not ready",
+                      exc_info=tuple(readiness.exc_info))
+        if not_ready:
+            not_ready[0].exc_info.reraise()
+
+
+_DEFERRED_LOCK = threading.Lock()
+_DEFERRED_SERVERS: typing.Set['_nova.ServerStackFixture'] = set()
+
+
+@contextlib.contextmanager
+def defer_servers_readiness(
+        servers: typing.Iterable['_nova.ServerStackFixture']):
+    """Make given servers skip waiting to be ready while they are set up"""
+    with _DEFERRED_LOCK:
+        servers = set(servers) - _DEFERRED_SERVERS
+        _DEFERRED_SERVERS.update(servers)
+    try:
+        yield
+    finally:
+        with _DEFERRED_LOCK:
+            _DEFERRED_SERVERS.difference_update(servers)
+
+
+def is_server_readiness_deferred(server: '_nova.ServerStackFixture') -> bool:
+    with _DEFERRED_LOCK:
+        return server in _DEFERRED_SERVERS
+
+
+def wait_for_servers_ready(
+        servers: typing.Iterable['_nova.ServerStackFixture'],
+        timeout: tobiko.Seconds = None,
+        check=True) -> ServersReadiness:
+    """Set up Nova server stacks and wait for all of them to get ready
+
+    Stacks are created one after the other, then the checks every server
+    has to pass before being used (console output, ping, cloud-init) are
+    executed for all of them concurrently, so that waiting for many
+    servers takes about as long as waiting for the slowest one.
+
+    :param timeout: maximum time to wait for all servers to get ready
+    :param check: if true, the error of the first server that is not ready
+        is raised
+    :returns: readiness times indexed by fixture name
+    """
+    servers = list({
+        tobiko.get_fixture_name(server): typing.cast(
+            '_nova.ServerStackFixture', tobiko.get_fixture(server))
+        for server in servers}.values())
+    with defer_servers_readiness(servers):
+        for server in servers:
+            tobiko.setup_fixture(server)
+
+    readiness = ServersReadiness(
+        (tobiko.get_fixture_name(server),
+         ServerReadiness(tobiko.get_fixture_name(server)))
+        for server in servers)
+    calls = tobiko.run_concurrently(
+        {tobiko.get_fixture_name(server): functools.partial(
+            server.wait_for_ready,
+            readiness=readiness[tobiko.get_fixture_name(server)])
+         for server in servers},
+        timeout=timeout,
+        synchronized=False)
+    for name, call in calls.items():
+        readiness[name].start_time = call.start_time
+        readiness[name].end_time = call.end_time
+        try:
+            call.get()
+        except Exception:
+            readiness[name].exc_info = tobiko.exc_info(reraise=False)
+
+    LOG.info("Servers readiness:\n" +
+             '\n'.join(f"  - {server!r}" for server in readiness.values()))
+    if check:
+        readiness.check()
+    return readiness
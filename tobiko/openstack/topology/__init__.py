@@ -15,6 +15,7 @@ from __future__ import absolute_import
 
 from tobiko.openstack.topology import _assert
 from tobiko.openstack.topology import _config
+from tobiko.openstack.topology import _disrupt
 from tobiko.openstack.topology import _exception
 from tobiko.openstack.topology import _namespace
 from tobiko.openstack.topology import _topology
@@ -23,6 +24,11 @@ from tobiko.openstack.topology import _sh
 assert_reachable_nodes = _assert.assert_reachable_nodes
 assert_unreachable_nodes = _assert.assert_unreachable_nodes
 
+NodesDisruption = _disrupt.NodesDisruption
+NodesDisruptionError = _disrupt.NodesDisruptionError
+disrupt_nodes = _disrupt.disrupt_nodes
+wait_for_nodes_recovery = _disrupt.wait_for_nodes_recovery
+
 NoSuchOpenStackTopologyNodeGroup = _exception.NoSuchOpenStackTopologyNodeGroup
 NoSuchOpenStackTopologyNode = _exception.NoSuchOpenStackTopologyNode
 
@@ -0,0 +1,155 @@
+# Copyright (c) 2026 Red Hat
+# All Rights Reserved.
+#
+#    Licensed under the Apache License, Version 2.0 (the "License"); you may
+#    not use this file except in compliance with the License. You may obtain
+#    a copy of the License at
+#
+#         http://www.apache.org/licenses/LICENSE-2.0
+#
+#    Unless required by applicable law or agreed to in writing, software
+#    distributed under the License is distributed on an "AS IS" BASIS, WITHOUT
+#    WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied. See the
+#    License for the specific language governing permissions and limitations
+#    under the License.
+from __future__ import absolute_import
+
+import typing
+
+from oslo_log import log
+
+import tobiko
+from tobiko.openstack.topology import _topology
+
+
+LOG = log.getLogger(__name__)
+
+NodeType = _topology.OpenStackTopologyNode
+NodeAction = typing.Callable[[NodeType], typing.Any]
+NodeRecoveryCheck = typing.Callable[[NodeType, tobiko.ConcurrentCall],
+                                    typing.Any]
+
+
+class NodesDisruptionError(tobiko.TobikoException):
+    message = "Action {action!r} failed on nodes {nodes!r}"
+
+
+class NodesDisruption(object):
+    """Outcome of an action executed at the same time on many nodes
+
+    Per-node start and end times are recorded when every action actually
+    starts and ends, so that recovery checks can be timed against them.
+    """
+
+    def __init__(self,
+                 action: str,
+                 nodes: typing.Iterable[NodeType],
+                 calls: tobiko.ConcurrentCalls):
+        self.action = action
+        self.nodes = {node.name: node for node in nodes}
+        self.calls = calls
+
+    @property
+    def start_times(self) -> typing.Dict[str, typing.Optional[float]]:
+        return {name: call.start_time for name, call in self.calls.items()}
+
+    @property
+    def end_times(self) -> typing.Dict[str, typing.Optional[float]]:
+        return {name: call.end_time for name, call in self.calls.items()}
+
+    @property
+    def start_time(self) -> typing.Optional[float]:
+        start_times = [t for t in self.start_times.values() if t is not None]
+        return min(start_times) if start_times else None
+
+    @property
+    def end_time(self) -> typing.Optional[float]:
+        end_times = [t for t in self.end_times.values() if t is not None]
+        if not end_times or len(end_times) < len(self.calls):
+            return None
+        return max(end_times)
+
+    @property
+    def start_skew(self) -> typing.Optional[float]:
+        """Time elapsed between the first and the last action start"""
+        start_times = [t for t in self.start_times.values()
+                       if t is not None]
+        if not start_times or len(start_times) < len(self.calls):
+            return None
+        return max(start_times) - min(start_times)
+
+    @property
+    def failed(self) -> typing.List[str]:
+        return list(self.calls.failed)
+
+    def check(self):
+        if self.failed:
+            for name in self.failed:
+                LOG.error(f"Action {self.action!r} failed on node {name!r}: "
+                          f"{self.calls[name].exc_info}")
+            raise NodesDisruptionError(action=self.action,
+                                       nodes=self.failed)
+
+    def __repr__(self):
+        return (f"{type(self).__name__}({self.action!r}, "
+                f"nodes={list(self.nodes)}, "
+                f"start_skew={self.start_skew}, "
+                f"failed={self.failed})")
+
+
+def disrupt_nodes(nodes: typing.Iterable[NodeType],
+                  action: NodeAction,
+                  timeout: tobiko.Seconds = None,
+                  check=True) -> NodesDisruption:
+    """Execute an action on all given nodes at the same time
+
+    Every action waits for all the others to be ready before starting, so
+    that faults are injected simultaneously on every node.
+
+    :param action: function called with the node as its only argument
+    :param check: when true raise NodesDisruptionError if any action failed
+    """
+    nodes = list(nodes)
+    action_name = tobiko.get_object_name(action)
+    LOG.info(f"Executing {action_name!r} on nodes "
+             f"{[node.name for node in nodes]}...")
+    calls = tobiko.run_concurrently(
+        {node.name: _bind_node(action, node) for node in nodes},
+        timeout=timeout)
+    disruption = NodesDisruption(action=action_name, nodes=nodes,
+                                 calls=calls)
+    LOG.info(f"Executed {action_name!r} on nodes: {disruption}")
+    if check:
+        disruption.check()
+    return disruption
+
+
+def wait_for_nodes_recovery(disruption: NodesDisruption,
+                            check: NodeRecoveryCheck,
+                            timeout: tobiko.Seconds = None) -> \
+        NodesDisruption:
+    """Check in parallel every node has recovered from a disruption
+
+    :param check: function called with the node and the concurrent call
+        of the action executed on it by disrupt_nodes (holding its
+        start_time and result). It should raise when the node has not
+        recovered
+    :raises NodesDisruptionError: if any check failed
+    """
+    nodes = [disruption.nodes[name] for name in disruption.calls]
+    recovery = tobiko.run_concurrently(
+        {node.name: _bind_node(check, node, disruption.calls[node.name])
+         for node in nodes},
+        timeout=timeout,
+        synchronized=False)
+    recovery_disruption = NodesDisruption(
+        action=tobiko.get_object_name(check), nodes=nodes, calls=recovery)
+    recovery_disruption.check()
+    return recovery_disruption
+
+
+def _bind_node(function: typing.Callable, node: NodeType, *args) -> \
+        typing.Callable[[], typing.Any]:
+    def call():
+        return function(node, *args)
+    return call
@@ -377,11 +377,13 @@ class OpenStackTopology(tobiko.SharedFixture):
                             pattern: typing.Optional[str] = None,
                             groups: typing.Optional[typing.List[str]] = None,
                             sudo=True,
+                            patterns: typing.Mapping[str, str] = None,
                             **execute_params) -> \
             files.MultihostLogFileDigger:
         digger = files.MultihostLogFileDigger(
             filename=self.log_names_mappings[service_name],
             pattern=pattern,
+            patterns=patterns,
             file_digger_class=self.file_digger_class,
             sudo=sudo,
             **execute_params)
@@ -782,12 +784,14 @@ def get_log_file_digger(
         groups: typing.List[str] = None,
         topology: OpenStackTopology = None,
         sudo=True,
+        patterns: typing.Mapping[str, str] = None,
         **execute_params) \
         -> files.MultihostLogFileDigger:
     if topology is None:
         topology = get_openstack_topology()
     return topology.get_log_file_digger(service_name=service_name,
                                         pattern=pattern,
+                                        patterns=patterns,
                                         groups=groups,
                                         sudo=sudo,
                                         **execute_params)
@@ -825,6 +829,7 @@ def get_rhosp_version():
     return rhosp_version
 
 
+@tobiko.disk_cached()
 def get_nova_version_from_container():
     ssh_client = list_openstack_nodes(group='controller')[0].ssh_client
     container_runtime_cmd = 'podman'
@@ -839,8 +844,9 @@ def get_nova_version_from_container():
 
 
 # During a execution of tobiko, openstack version does not change, so let's
-# cache the output of this function
+# cache the output of this function (also on disk for other workers)
 @functools.lru_cache()
+@tobiko.disk_cached()
 def get_openstack_version():
     try:
         return get_rhosp_version()
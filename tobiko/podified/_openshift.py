@@ -50,7 +50,7 @@ EDPM_OTHER_GROUP = 'edpm-other'
 
 
 _IS_OC_CLIENT_AVAILABLE = None
-_IS_BM_CRD_AVAILABLE = None
+_IS_BM_CRD_AVAILABLE: typing.Optional[bool] = None
 _TOBIKO_PROJECT_EXISTS = None
 
 try:
@@ -91,15 +91,19 @@ def _is_baremetal_crd_available() -> bool:
     if not _is_oc_client_available():
         return False
     if _IS_BM_CRD_AVAILABLE is None:
-        try:
-            # oc.selector("crd") does not need to run on a specific OCP project
-            _IS_BM_CRD_AVAILABLE = any(
-                [OSP_BM_CRD in n for n in oc.selector("crd").qnames()])
-        except oc.OpenShiftPythonException:
-            _IS_BM_CRD_AVAILABLE = False
+        _IS_BM_CRD_AVAILABLE = _get_baremetal_crd_available()
     return _IS_BM_CRD_AVAILABLE
 
 
+@tobiko.disk_cached()
+def _get_baremetal_crd_available() -> bool:
+    try:
+        # oc.selector("crd") does not need to run on a specific OCP project
+        return any([OSP_BM_CRD in n for n in oc.selector("crd").qnames()])
+    except oc.OpenShiftPythonException:
+        return False
+
+
 def _get_group(services):
     for compute_dp_service in CONF.tobiko.podified.compute_dp_service_names:
         if compute_dp_service in services:
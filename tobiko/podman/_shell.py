@@ -15,10 +15,17 @@
 #    under the License.
 from __future__ import absolute_import
 
+import tobiko
 from tobiko.podman import _exception
 from tobiko.shell import sh
 
 
+def _ssh_client_key(ssh_client=None, **execute_params):
+    hostname = getattr(ssh_client, 'hostname', ssh_client)
+    return hostname, sorted(execute_params.items())
+
+
+@tobiko.disk_cached(key=_ssh_client_key)
 def discover_podman_socket(ssh_client=None, **execute_params):
     cmd = "systemctl list-sockets | grep podman | awk '{print $1}'"
     result = sh.execute(cmd, stdin=False, stdout=True, stderr=True,
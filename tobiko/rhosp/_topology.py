@@ -129,9 +129,9 @@ class RhospNode(topology.OpenStackTopologyNode):
         if running_servers:
             LOG.info(f'Restart servers after rebooting compute node '
                      f'{self.name}...')
+            nova.wait_for_servers_status(servers=running_servers,
+                                         status='SHUTOFF')
             for server in running_servers:
-                nova.wait_for_server_status(server=server.id,
-                                            status='SHUTOFF')
                 LOG.debug(f'Re-activate server {server.name} with ID '
                           f'{server.id}')
                 nova.activate_server(server=server)
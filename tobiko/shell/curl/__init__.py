@@ -17,6 +17,7 @@ from __future__ import absolute_import
 
 from tobiko.shell.curl import _execute
 from tobiko.shell.curl import _process
+from tobiko.shell.curl import _traffic
 
 
 execute_curl = _execute.execute_curl
@@ -27,3 +28,8 @@ assert_downloaded_file = _process.assert_downloaded_file
 download_file = _process.download_file
 default_download_dir = _process.default_download_dir
 get_url_header = _process.get_url_header
+
+CurlResponse = _traffic.CurlResponse
+CurlTraffic = _traffic.CurlTraffic
+generate_curl_traffic = _traffic.generate_curl_traffic
+parse_curl_traffic = _traffic.parse_curl_traffic
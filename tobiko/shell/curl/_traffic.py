@@ -0,0 +1,167 @@
+# Copyright (c) 2026 Red Hat
+# All Rights Reserved.
+#
+#    Licensed under the Apache License, Version 2.0 (the "License"); you may
+#    not use this file except in compliance with the License. You may obtain
+#    a copy of the License at
+#
+#         http://www.apache.org/licenses/LICENSE-2.0
+#
+#    Unless required by applicable law or agreed to in writing, software
+#    distributed under the License is distributed on an "AS IS" BASIS, WITHOUT
+#    WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied. See the
+#    License for the specific language governing permissions and limitations
+#    under the License.
+from __future__ import absolute_import
+
+import collections
+import math
+import typing
+
+import netaddr
+from oslo_log import log
+
+import tobiko
+from tobiko.shell.curl import _execute
+from tobiko.shell import sh
+from tobiko.shell import ssh
+
+
+LOG = log.getLogger(__name__)
+
+# Marks the end of every response body in curl output
+CURL_WRITE_OUT_MARKER = '--tobiko-curl--'
+CURL_WRITE_OUT = (f'\\n{CURL_WRITE_OUT_MARKER} '
+                  '%{http_code} %{exitcode} %{time_total}\\n')
+
+
+class CurlResponse(typing.NamedTuple):
+    content: str
+    http_code: int
+    exit_status: typing.Optional[int]
+    time_total: float
+
+    @property
+    def succeeded(self) -> bool:
+        if self.exit_status is not None:
+            return self.exit_status == 0
+        return 200 <= self.http_code < 400
+
+
+class CurlTraffic(object):
+    """Responses got from many HTTP requests sent by a single curl process
+    """
+
+    def __init__(self, responses: typing.Iterable[CurlResponse]):
+        self.responses = list(responses)
+
+    @property
+    def succeeded(self) -> typing.List[CurlResponse]:
+        return [response for response in self.responses
+                if response.succeeded]
+
+    @property
+    def failed(self) -> typing.List[CurlResponse]:
+        return [response for response in self.responses
+                if not response.succeeded]
+
+    @property
+    def replies(self) -> typing.Dict[str, int]:
+        """Histogram of successful responses counted by content"""
+        return dict(collections.Counter(response.content
+                                        for response in self.succeeded))
+
+    def latency_percentile(self,
+                           percentile: float,
+                           content: typing.Optional[str] = None) -> \
+            typing.Optional[float]:
+        """Get nearest-rank percentile of successful requests time
+
+        :param content: if given, only responses with this content
+            (for example a load balancer member ID) are considered
+        """
+        latencies = sorted(response.time_total
+                           for response in self.succeeded
+                           if content is None or response.content == content)
+        if not latencies:
+            return None
+        rank = math.ceil(percentile / 100. * len(latencies))
+        return latencies[max(0, rank - 1)]
+
+    def latency_percentiles(self,
+                            percentiles: typing.Iterable[float] = (50, 90,
+                                                                   99)) -> \
+            typing.Dict[str, typing.Dict[float, typing.Optional[float]]]:
+        """Get latency percentiles for every replied content"""
+        percentiles = list(percentiles)
+        return {content: {percentile: self.latency_percentile(percentile,
+                                                              content)
+                          for percentile in percentiles}
+                for content in self.replies}
+
+    def __repr__(self):
+        return (f"{type(self).__name__}(requests={len(self.responses)}, "
+                f"failed={len(self.failed)}, replies={self.replies})")
+
+
+def parse_curl_traffic(output: str) -> CurlTraffic:
+    responses = []
+    body: typing.List[str] = []
+    for line in output.splitlines():
+        if line.startswith(CURL_WRITE_OUT_MARKER):
+            fields = line[len(CURL_WRITE_OUT_MARKER):].split()
+            http_code = int(fields[0])
+            if len(fields) > 2:
+                exit_status: typing.Optional[int] = int(fields[1])
+                time_total = float(fields[2])
+            else:
+                # old curl versions don't know about %{exitcode}
+                exit_status = None
+                time_total = float(fields[-1])
+            responses.append(CurlResponse(content='\n'.join(body).strip(),
+                                          http_code=http_code,
+                                          exit_status=exit_status,
+                                          time_total=time_total))
+            body = []
+        else:
+            body.append(line)
+    return CurlTraffic(responses)
+
+
+def generate_curl_traffic(
+        hostname: typing.Union[str, netaddr.IPAddress],
+        requests_count: int,
+        port: int = None,
+        path: str = None,
+        scheme: str = None,
+        keep_alive: bool = False,
+        connect_timeout: tobiko.Seconds = None,
+        max_time: tobiko.Seconds = None,
+        ssh_client: ssh.SSHClientType = None,
+        **execute_params) -> CurlTraffic:
+    """Send many HTTP requests from a single curl process
+
+    Requests are sent one after the other without spawning a new process
+    for each of them, and the status and total time of every request are
+    reported together with its response content.
+
+    :param keep_alive: when false every request asks the server to close
+        the connection, so that each one is sent through a new connection
+        (and is therefore balanced again by a L4 load balancer)
+    """
+    netloc = _execute.make_netloc(hostname=hostname, port=port)
+    url = _execute.make_url(scheme=scheme, netloc=netloc, path=path)
+    command = sh.shell_command('curl -g -s -f') + ['-w', CURL_WRITE_OUT]
+    if not keep_alive:
+        command += ['-H', 'Connection: close']
+    if connect_timeout is not None:
+        command += f'--connect-timeout {int(connect_timeout)}'
+    if max_time is not None:
+        command += f'--max-time {int(max_time)}'
+    command += [url] * requests_count
+    execute_params.setdefault('expect_exit_status', None)
+    output = sh.execute(command, ssh_client=ssh_client,
+                        **execute_params).stdout
+    traffic = parse_curl_traffic(output)
+    LOG.debug(f"Traffic sent to {url}: {traffic}")
+    return traffic
@@ -89,7 +89,8 @@ def get_process_pid(
         ) -> typing.Union[int, None]:
     processes = sh.list_processes(
         command_line=command_line,
-        ssh_client=ssh_client)
+        ssh_client=ssh_client,
+        remote_filter=True)
     if processes:
         return processes.first.pid
     return None
@@ -101,7 +102,8 @@ def get_process_pids(
         ) -> list:
     processes = sh.list_processes(
         command_line=command_line,
-        ssh_client=ssh_client)
+        ssh_client=ssh_client,
+        remote_filter=True)
     pids = []
     if processes:
         pids = [p.pid for p in processes]
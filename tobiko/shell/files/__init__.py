@@ -17,6 +17,7 @@ from __future__ import absolute_import
 
 from tobiko.shell.files import _files
 from tobiko.shell.files import _logs
+from tobiko.shell.files import _window
 
 
 get_homedir = _files.get_homedir
@@ -27,3 +28,16 @@ remove_old_logfile = _files.remove_old_logfile
 LogFileDigger = _logs.LogFileDigger
 JournalLogDigger = _logs.JournalLogDigger
 MultihostLogFileDigger = _logs.MultihostLogFileDigger
+
+LogFileReader = _window.LogFileReader
+ShellLogFileReader = _window.ShellLogFileReader
+StreamLogFileReader = _window.StreamLogFileReader
+filter_log_window = _window.filter_log_window
+find_log_time_offset = _window.find_log_time_offset
+grep_log_file_window = _window.grep_log_file_window
+iter_log_lines = _window.iter_log_lines
+log_timestamp_parser = _window.log_timestamp_parser
+open_log_file = _window.open_log_file
+read_log_file_window = _window.read_log_file_window
+read_log_window = _window.read_log_window
+seek_log_time = _window.seek_log_time
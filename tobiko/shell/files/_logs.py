@@ -16,6 +16,7 @@
 from __future__ import absolute_import
 
 import collections
+import math
 import os
 import shlex
 import typing
@@ -25,6 +26,7 @@ from oslo_log import log
 import tobiko
 from tobiko.shell import grep
 from tobiko.shell import find
+from tobiko.shell.files import _window
 from tobiko.shell import sh
 from tobiko.shell import ssh
 
@@ -35,31 +37,54 @@ LOG = log.getLogger(__name__)
 class LogFileDigger(tobiko.SharedFixture):
 
     found: typing.MutableMapping[str, None]
+    found_patterns: typing.Dict[str, typing.MutableMapping[str, None]]
 
     def __init__(self, filename: str,
                  pattern: typing.Optional[str] = None,
+                 patterns: typing.Optional[grep.PatternsType] = None,
+                 datetime_pattern: typing.Optional[str] = None,
                  **execute_params):
         super(LogFileDigger, self).__init__()
         self.filename = filename
         self.pattern = pattern
+        self.patterns = dict(patterns) if patterns else None
+        self.get_timestamp = _window.log_timestamp_parser(datetime_pattern)
         self.execute_params = execute_params
         self.found = collections.OrderedDict()
+        self.found_patterns = collections.OrderedDict()
 
     def setup_fixture(self):
         if self.pattern is not None:
             self.find_lines()
+        if self.patterns:
+            self.find_patterns_lines()
 
     def cleanup_fixture(self):
         self.found.clear()
+        self.found_patterns.clear()
 
     @property
     def found_lines(self) -> typing.List[str]:
         return list(self.found)
 
+    @property
+    def found_patterns_lines(self) -> typing.Dict[str, typing.List[str]]:
+        return {name: list(found)
+                for name, found in self.found_patterns.items()}
+
     def find_lines(self,
                    pattern: str = None,
-                   new_lines=False) \
+                   new_lines=False,
+                   since: tobiko.Seconds = None,
+                   until: tobiko.Seconds = None) \
             -> typing.List[str]:
+        """Look for lines matching a pattern
+
+        :param since: when given only lines logged since this time are
+            looked for
+        :param until: when given only lines logged until this time are
+            looked for
+        """
         if pattern is None:
             pattern = self.pattern
             if pattern is None:
@@ -68,8 +93,14 @@ class LogFileDigger(tobiko.SharedFixture):
             raise NotImplementedError(
                 "Combining patterns is not supported")
         try:
-            lines = self.grep_lines(pattern,
-                                    new_lines=new_lines)
+            if since is None and until is None:
+                lines = self.grep_lines(pattern,
+                                        new_lines=new_lines)
+            else:
+                lines = self.grep_lines(pattern,
+                                        new_lines=new_lines,
+                                        since=since,
+                                        until=until)
         except grep.NoMatchingLinesFound:
             lines = []
         else:
@@ -90,20 +121,112 @@ class LogFileDigger(tobiko.SharedFixture):
             return list(self.found)
 
     def find_new_lines(self,
-                       pattern: str = None) \
+                       pattern: str = None,
+                       since: tobiko.Seconds = None,
+                       until: tobiko.Seconds = None) \
             -> typing.List[str]:
         return self.find_lines(pattern=pattern,
-                               new_lines=True)
+                               new_lines=True,
+                               since=since,
+                               until=until)
 
     def grep_lines(self,
                    pattern: str,
-                   new_lines: bool = False) \
+                   new_lines: bool = False,
+                   since: tobiko.Seconds = None,
+                   until: tobiko.Seconds = None) \
             -> typing.List[str]:
         # pylint: disable=unused-argument
         log_files = self.list_log_files()
-        return grep.grep_files(pattern=pattern,
-                               files=log_files,
-                               **self.execute_params)
+        if since is None and until is None:
+            return grep.grep_files(pattern=pattern,
+                                   files=log_files,
+                                   **self.execute_params)
+
+        lines: typing.List[str] = []
+        for log_file in log_files:
+            if log_file.endswith('.gz'):
+                # compressed files can't be sought: grep them and then
+                # filter lines by time
+                try:
+                    found = grep.grep_files(pattern=pattern,
+                                            files=[log_file],
+                                            **self.execute_params)
+                except grep.NoMatchingLinesFound:
+                    continue
+                lines.extend(line
+                             for line in found
+                             if self._is_in_window(line, since, until))
+            else:
+                # look for the window offset, then grep the file from there
+                lines.extend(_window.grep_log_file_window(
+                    log_file, pattern=pattern, start_time=since,
+                    end_time=until, get_timestamp=self.get_timestamp,
+                    **self.execute_params))
+        if lines:
+            return lines
+        ssh_client = self.execute_params.get('ssh_client')
+        raise grep.NoMatchingLinesFound(
+            pattern=pattern,
+            files=log_files,
+            login=ssh_client and ssh_client.login or None)
+
+    def _is_in_window(self,
+                      line: str,
+                      since: tobiko.Seconds,
+                      until: tobiko.Seconds) -> bool:
+        timestamp = self.get_timestamp(line)
+        if timestamp is None:
+            return True
+        if since is not None and timestamp < since:
+            return False
+        if until is not None and timestamp > until:
+            return False
+        return True
+
+    def find_patterns_lines(self,
+                            patterns: grep.PatternsType = None,
+                            new_lines=False) \
+            -> typing.Dict[str, typing.List[str]]:
+        """Look for many patterns with a single pass over log files
+
+        :returns: lines indexed by the name of the pattern they match
+        """
+        if patterns is None:
+            patterns = self.patterns
+            if not patterns:
+                raise ValueError(f"Invalid patterns: {patterns}")
+        tagged_lines = self.grep_patterns_lines(patterns,
+                                                new_lines=new_lines)
+        result: typing.Dict[str, typing.List[str]] = {}
+        for name, lines in tagged_lines.items():
+            found = self.found_patterns.setdefault(
+                name, collections.OrderedDict())
+            lines = [line
+                     for line in dict.fromkeys(lines)
+                     if line not in found]
+            found.update((line, None) for line in lines)
+            if new_lines:
+                if lines:
+                    lines_text = '\n\t'.join(lines)
+                    LOG.debug(f"Found new lines for pattern '{name}':\n"
+                              f"\t{lines_text}")
+                result[name] = lines
+            else:
+                result[name] = list(found)
+        return result
+
+    def grep_patterns_lines(self,
+                            patterns: grep.PatternsType,
+                            new_lines: bool = False) \
+            -> typing.Dict[str, typing.List[str]]:
+        # pylint: disable=unused-argument
+        log_files = self.list_log_files()
+        if not log_files:
+            return {name: [] for name in patterns}
+        return grep.grep_files_patterns(patterns=patterns,
+                                        files=log_files,
+                                        **self.execute_params)
 
     def list_log_files(self):
         file_path, file_name = os.path.split(self.filename)
@@ -116,15 +239,21 @@ class JournalLogDigger(LogFileDigger):
 
     def grep_lines(self,
                    pattern: str,
-                   new_lines: bool = False) \
+                   new_lines: bool = False,
+                   since: tobiko.Seconds = None,
+                   until: tobiko.Seconds = None) \
             -> typing.List[str]:
+        command = ["journalctl", '--no-pager',
+                   "--unit", shlex.quote(self.filename),
+                   '--output', 'short-iso']
+        # journal is indexed by time: let it select the time window
+        if since is not None:
+            command += ['--since', f'@{math.floor(since)}']
+        if until is not None:
+            command += ['--until', f'@{math.ceil(until)}']
+        command += ['--grep', shlex.quote(pattern)]
         try:
-            result = sh.execute(["journalctl", '--no-pager',
-                                 "--unit", shlex.quote(self.filename),
-                                 # "--since", "30 minutes ago",
-                                 '--output', 'short-iso',
-                                 '--grep', shlex.quote(pattern)],
-                                **self.execute_params)
+            result = sh.execute(command, **self.execute_params)
         except sh.ShellCommandFailed as ex:
             if ex.stdout.endswith('-- No entries --\n'):
                 ssh_client = self.execute_params.get('ssh_client')
@@ -141,6 +270,19 @@ class JournalLogDigger(LogFileDigger):
                      if not line.startswith('-- ')]
             return lines
 
+    def grep_patterns_lines(self,
+                            patterns: grep.PatternsType,
+                            new_lines: bool = False) \
+            -> typing.Dict[str, typing.List[str]]:
+        # journalctl accepts a single pattern: look for any of them and
+        # then tag found lines
+        pattern = '|'.join(f'({pattern})' for pattern in patterns.values())
+        try:
+            lines = self.grep_lines(pattern, new_lines=new_lines)
+        except grep.NoMatchingLinesFound:
+            lines = []
+        return grep.tag_lines(patterns, lines)
+
 
 class MultihostLogFileDigger(tobiko.SharedFixture):
 
@@ -152,12 +294,14 @@ class MultihostLogFileDigger(tobiko.SharedFixture):
             ssh_clients: typing.Iterable[ssh.SSHClientType] = None,
             file_digger_class: typing.Type[LogFileDigger] = LogFileDigger,
             pattern: str = None,
+            patterns: grep.PatternsType = None,
             **execute_params):
         super(MultihostLogFileDigger, self).__init__()
         self.file_digger_class = file_digger_class
         self.filename = filename
         self.execute_params = execute_params
         self.pattern = pattern
+        self.patterns = dict(patterns) if patterns else None
         self.ssh_clients: typing.List[ssh.SSHClientType] = []
         if ssh_clients is not None:
             self.ssh_clients.extend(ssh_clients)
@@ -185,6 +329,7 @@ class MultihostLogFileDigger(tobiko.SharedFixture):
                 filename=self.filename,
                 ssh_client=ssh_client,
                 pattern=self.pattern,
+                patterns=self.patterns,
                 **self.execute_params)
         return digger
 
@@ -202,7 +347,9 @@ class MultihostLogFileDigger(tobiko.SharedFixture):
 
     def find_lines(self,
                    pattern: str = None,
-                   new_lines: bool = False) \
+                   new_lines: bool = False,
+                   since: tobiko.Seconds = None,
+                   until: tobiko.Seconds = None) \
             -> typing.List[typing.Tuple[str, str]]:
         # ensure diggers are ready before looking for lines
         tobiko.setup_fixture(self)
@@ -210,15 +357,57 @@ class MultihostLogFileDigger(tobiko.SharedFixture):
         if self.diggers is not None:
             for hostname, digger in self.diggers.items():
                 for line in digger.find_lines(pattern=pattern,
-                                              new_lines=new_lines):
+                                              new_lines=new_lines,
+                                              since=since,
+                                              until=until):
                     lines.append((hostname, line))
         return lines
 
+    @property
+    def found_patterns_lines(self) \
+            -> typing.Dict[str, typing.List[typing.Tuple[str, str]]]:
+        # ensure diggers are ready before looking for lines
+        tobiko.setup_fixture(self)
+        lines: typing.Dict[str, typing.List[typing.Tuple[str, str]]] = \
+            collections.OrderedDict((name, []) for name in self.patterns or [])
+        if self.diggers is not None:
+            for hostname, digger in self.diggers.items():
+                for name, found in digger.found_patterns_lines.items():
+                    lines.setdefault(name, []).extend(
+                        (hostname, line) for line in found)
+        return lines
+
+    def find_patterns_lines(self,
+                            patterns: grep.PatternsType = None,
+                            new_lines: bool = False) \
+            -> typing.Dict[str, typing.List[typing.Tuple[str, str]]]:
+        """Look for many patterns with a single pass over every host logs
+
+        :param patterns: extended regular expressions indexed by name. By
+            default the patterns given to the constructor are used
+        :returns: (hostname, line) pairs indexed by pattern name
+        """
+        # ensure diggers are ready before looking for lines
+        tobiko.setup_fixture(self)
+        patterns = patterns or self.patterns
+        if not patterns:
+            raise ValueError(f"Invalid patterns: {patterns}")
+        lines: typing.Dict[str, typing.List[typing.Tuple[str, str]]] = \
+            collections.OrderedDict((name, []) for name in patterns)
+        if self.diggers is not None:
+            for hostname, digger in self.diggers.items():
+                for name, found in digger.find_patterns_lines(
+                        patterns=patterns, new_lines=new_lines).items():
+                    lines[name].extend((hostname, line) for line in found)
+        return lines
+
     def find_new_lines(self,
                        pattern: str = None,
                        retry_count: int = None,
                        retry_timeout: tobiko.Seconds = 60.,
-                       retry_interval: tobiko.Seconds = None) \
+                       retry_interval: tobiko.Seconds = None,
+                       since: tobiko.Seconds = None,
+                       until: tobiko.Seconds = None) \
             -> typing.List[typing.Tuple[str, str]]:
         for _ in tobiko.retry(count=retry_count,
                               timeout=retry_timeout,
@@ -226,7 +415,9 @@ class MultihostLogFileDigger(tobiko.SharedFixture):
                               default_interval=1.,
                               default_timeout=60.):
             new_lines = self.find_lines(pattern=pattern,
-                                        new_lines=True)
+                                        new_lines=True,
+                                        since=since,
+                                        until=until)
             if new_lines:
                 break
         else:
@@ -0,0 +1,340 @@
+# Copyright (c) 2026 Red Hat
+# All Rights Reserved.
+#
+#    Licensed under the Apache License, Version 2.0 (the "License"); you may
+#    not use this file except in compliance with the License. You may obtain
+#    a copy of the License at
+#
+#         http://www.apache.org/licenses/LICENSE-2.0
+#
+#    Unless required by applicable law or agreed to in writing, software
+#    distributed under the License is distributed on an "AS IS" BASIS, WITHOUT
+#    WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied. See the
+#    License for the specific language governing permissions and limitations
+#    under the License.
+from __future__ import absolute_import
+
+import base64
+import datetime
+import re
+import shlex
+import typing
+
+from oslo_log import log
+
+import tobiko
+from tobiko.shell import grep
+from tobiko.shell import sh
+from tobiko.shell import ssh
+
+
+LOG = log.getLogger(__name__)
+
+# bytes read when looking for a timestamp in the middle of a file
+PROBE_BLOCK_SIZE = 4096
+# maximum bytes read at once when reading lines in sequence
+MAX_BLOCK_SIZE = 1024 * 1024
+
+DEFAULT_DATETIME_PATTERN = r"(\d{4}-\d{2}-\d{2} [0-9:.]+) .+"
+DEFAULT_DATETIME_FORMAT = "%Y-%m-%d %H:%M:%S.%f"
+
+TimestampParser = typing.Callable[[str], typing.Optional[float]]
+
+
+def log_timestamp_parser(
+        datetime_pattern: typing.Union[str, typing.Pattern] = None,
+        datetime_format: str = None) -> TimestampParser:
+    """Make a function that gets the timestamp of a log line
+
+    The function returns None for lines without a timestamp (like
+    traceback lines).
+    """
+    if datetime_pattern is None:
+        datetime_pattern = DEFAULT_DATETIME_PATTERN
+    pattern = re.compile(datetime_pattern)
+    time_format: str = datetime_format or DEFAULT_DATETIME_FORMAT
+
+    def get_timestamp(line: str) -> typing.Optional[float]:
+        found = pattern.match(line)
+        if not found:
+            return None
+        try:
+            return datetime.datetime.strptime(
+                found.group(1), time_format).timestamp()
+        except ValueError:
+            return None
+
+    return get_timestamp
+
+
+class LogFileReader(object):
+    """Reads a file at given byte offsets"""
+
+    def __init__(self, filename: str):
+        self.filename = filename
+
+    @property
+    def size(self) -> int:
+        raise NotImplementedError
+
+    def read_at(self, offset: int, size: int) -> bytes:
+        raise NotImplementedError
+
+    def close(self):
+        pass
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *args):
+        self.close()
+
+
+class StreamLogFileReader(LogFileReader):
+    """Reads a seekable file object (like a local or an SFTP file)"""
+
+    def __init__(self, filename: str, stream: typing.BinaryIO, size: int):
+        super(StreamLogFileReader, self).__init__(filename)
+        self.stream = stream
+        self._size = size
+
+    @property
+    def size(self) -> int:
+        return self._size
+
+    def read_at(self, offset: int, size: int) -> bytes:
+        self.stream.seek(offset)
+        return self.stream.read(size)
+
+    def close(self):
+        self.stream.close()
+
+
+class ShellLogFileReader(LogFileReader):
+    """Reads a file by executing a command for every block
+
+    It is used when the file can only be read as a privileged user.
+    """
+
+    def __init__(self, filename: str, **execute_params):
+        super(ShellLogFileReader, self).__init__(filename)
+        self.execute_params = execute_params
+
+    @tobiko.cached
+    def size(self) -> int:
+        return int(sh.execute(f'stat -L -c %s {shlex.quote(self.filename)}',
+                              **self.execute_params).stdout.strip())
+
+    def read_at(self, offset: int, size: int) -> bytes:
+        # tail seeks on regular files before reading
+        output = sh.execute(f'tail -c +{offset + 1} '
+                            f'{shlex.quote(self.filename)} | '
+                            f'head -c {size} | base64 -w 0',
+                            **self.execute_params).stdout
+        return base64.b64decode(output.strip())
+
+
+def open_log_file(filename: str,
+                  ssh_client: ssh.SSHClientType = None,
+                  sudo=False,
+                  **execute_params) -> LogFileReader:
+    """Open a log file to be read at given byte offsets
+
+    Files are read via SFTP (or directly when local) unless sudo is
+    required.
+    """
+    if sudo:
+        return ShellLogFileReader(filename, ssh_client=ssh_client,
+                                  sudo=sudo, **execute_params)
+    ssh_client = ssh.ssh_client_fixture(ssh_client)
+    if ssh_client is None:
+        stream: typing.Any = open(filename, 'rb')
+        stream.seek(0, 2)
+        return StreamLogFileReader(filename, stream, size=stream.tell())
+    sftp = ssh_client.connect().open_sftp()
+    size = sftp.stat(filename).st_size
+    return StreamLogFileReader(filename, sftp.open(filename, 'rb'),
+                               size=size)
+
+
+def iter_log_lines(reader: LogFileReader,
+                   offset: int = 0,
+                   block_size: int = PROBE_BLOCK_SIZE) -> \
+        typing.Iterator[typing.Tuple[int, bytes]]:
+    """Iterate over (offset, line) pairs of lines starting from offset
+
+    When offset is in the middle of a line, that line is skipped.
+    """
+    skip = offset > 0
+    # read from previous byte to tell if offset is at the start of a line
+    line_offset = read_offset = max(0, offset - 1)
+    buffer = b''
+    while True:
+        chunk = reader.read_at(read_offset, block_size)
+        read_offset += len(chunk)
+        buffer += chunk
+        while True:
+            end = buffer.find(b'\n')
+            if end < 0:
+                break
+            line, buffer = buffer[:end + 1], buffer[end + 1:]
+            if skip:
+                skip = False
+            else:
+                yield line_offset, line
+            line_offset += len(line)
+        if not chunk:
+            if buffer and not skip:
+                yield line_offset, buffer
+            return
+        block_size = min(block_size * 2, MAX_BLOCK_SIZE)
+
+
+def _first_timestamp(reader: LogFileReader,
+                     offset: int,
+                     get_timestamp: TimestampParser) -> \
+        typing.Optional[float]:
+    for _, line in iter_log_lines(reader, offset):
+        timestamp = get_timestamp(line.decode(errors='replace'))
+        if timestamp is not None:
+            return timestamp
+    return None
+
+
+def seek_log_time(reader: LogFileReader,
+                  start_time: float,
+                  get_timestamp: TimestampParser,
+                  block_size: int = PROBE_BLOCK_SIZE) -> int:
+    """Binary search the file offset from which lines are not older than
+    start_time
+
+    It requires lines to be sorted by time. The returned offset could
+    precede the first line of the window by up to block_size bytes.
+    """
+    low, high = 0, reader.size
+    while high - low > block_size:
+        middle = (low + high) // 2
+        timestamp = _first_timestamp(reader, middle, get_timestamp)
+        if timestamp is None or timestamp >= start_time:
+            high = middle
+        else:
+            low = middle
+    return low
+
+
+def find_log_time_offset(reader: LogFileReader,
+                         start_time: float,
+                         get_timestamp: TimestampParser) -> int:
+    """Get the offset of the first line logged since start_time"""
+    offset = seek_log_time(reader, start_time=start_time,
+                           get_timestamp=get_timestamp)
+    for line_offset, line in iter_log_lines(reader, offset):
+        timestamp = get_timestamp(line.decode(errors='replace'))
+        if timestamp is not None and timestamp >= start_time:
+            return line_offset
+    return reader.size
+
+
+def filter_log_window(lines: typing.Iterable[str],
+                      start_time: tobiko.Seconds = None,
+                      end_time: tobiko.Seconds = None,
+                      get_timestamp: TimestampParser = None) -> \
+        typing.Iterator[str]:
+    """Iterate over given lines logged between start_time and end_time
+
+    Lines without a timestamp are considered as part of the previous line
+    log record.
+    """
+    if get_timestamp is None:
+        get_timestamp = log_timestamp_parser()
+    started = start_time is None
+    for line in lines:
+        timestamp = get_timestamp(line)
+        if timestamp is not None:
+            if not started:
+                if start_time is not None and timestamp < start_time:
+                    continue
+                started = True
+            if end_time is not None and timestamp > end_time:
+                break
+        elif not started:
+            continue
+        yield line
+
+
+def read_log_window(reader: LogFileReader,
+                    start_time: tobiko.Seconds = None,
+                    end_time: tobiko.Seconds = None,
+                    get_timestamp: TimestampParser = None) -> \
+        typing.Iterator[str]:
+    """Iterate over lines logged between start_time and end_time
+
+    Only the part of the file inside the window (plus a few blocks to look
+    for it) is read. Lines without a timestamp are considered as part of the
+    previous line log record.
+    """
+    if get_timestamp is None:
+        get_timestamp = log_timestamp_parser()
+    offset = 0
+    if start_time is not None:
+        offset = seek_log_time(reader, start_time=start_time,
+                               get_timestamp=get_timestamp)
+    lines = (line.decode(errors='replace').rstrip('\n')
+             for _, line in iter_log_lines(reader, offset))
+    return filter_log_window(lines,
+                             start_time=start_time,
+                             end_time=end_time,
+                             get_timestamp=get_timestamp)
+
+
+def read_log_file_window(filename: str,
+                         start_time: tobiko.Seconds = None,
+                         end_time: tobiko.Seconds = None,
+                         get_timestamp: TimestampParser = None,
+                         **open_params) -> typing.List[str]:
+    with open_log_file(filename, **open_params) as reader:
+        lines = list(read_log_window(reader,
+                                     start_time=start_time,
+                                     end_time=end_time,
+                                     get_timestamp=get_timestamp))
+    LOG.debug(f"Read {len(lines)} lines from {filename} between "
+              f"{start_time} and {end_time}")
+    return lines
+
+
+def grep_log_file_window(filename: str,
+                         pattern: str,
+                         start_time: tobiko.Seconds = None,
+                         end_time: tobiko.Seconds = None,
+                         get_timestamp: TimestampParser = None,
+                         **open_params) -> typing.List[str]:
+    """Look for lines matching a pattern logged between start_time and
+    end_time
+
+    The file offset of the window is looked for by reading a few blocks,
+    then lines are looked for by grep on the host the file is on, so that
+    only matching lines are transferred. Lines logged after end_time are
+    discarded locally.
+    """
+    if get_timestamp is None:
+        get_timestamp = log_timestamp_parser()
+    offset = 0
+    if start_time is not None:
+        with open_log_file(filename, **open_params) as reader:
+            offset = find_log_time_offset(reader, start_time=start_time,
+                                          get_timestamp=get_timestamp)
+            if offset >= reader.size:
+                return []
+    try:
+        found = grep.grep_lines(pattern=pattern,
+                                command=['tail', '-c', f'+{offset + 1}',
+                                         filename],
+                                **open_params)
+    except grep.NoMatchingLinesFound:
+        return []
+    lines = list(filter_log_window(found,
+                                   end_time=end_time,
+                                   get_timestamp=get_timestamp))
+    LOG.debug(f"Found {len(lines)} lines matching '{pattern}' in {filename} "
+              f"between {start_time} and {end_time}")
+    return lines
@@ -15,14 +15,20 @@
 #    under the License.
 from __future__ import absolute_import
 
+import re
 import typing
 
+from oslo_log import log
+
 import tobiko
 from tobiko.shell import sh
 from tobiko.shell import ssh
 from tobiko.shell.sh import _command
 
 
+LOG = log.getLogger(__name__)
+
+
 class NoMatchingLinesFound(tobiko.TobikoException):
     message = ("No matching lines found in files (pattern='{pattern}',"
                " files={files}, login={login})")
@@ -81,3 +87,104 @@ def grep_lines(pattern: str,
                command: _command.ShellCommandType,
                **grep_params) -> typing.List[str]:
     return grep(pattern=pattern, command=command, **grep_params)
+
+
+PatternsType = typing.Mapping[str, str]
+
+
+def grep_patterns(patterns: PatternsType,
+                  command: typing.Optional[_command.ShellCommandType] = None,
+                  grep_command: _command.ShellCommandType = 'zgrep -Eh',
+                  files: typing.Optional[typing.List[str]] = None,
+                  ssh_client: ssh.SSHClientFixture = None,
+                  **execute_params) -> typing.Dict[str, typing.List[str]]:
+    """Look for many patterns with a single pass over the same files
+
+    All patterns are given to a single grep command, then matching lines
+    are tagged with the name of every pattern they match.
+
+    :param patterns: extended regular expressions indexed by name
+    :returns: matching lines indexed by pattern name
+    """
+    if not patterns or not all(patterns.values()):
+        raise ValueError(f"Invalid patterns: {patterns!r}")
+    options: typing.List[str] = []
+    for pattern in patterns.values():
+        options += ['-e', pattern]
+    if command:
+        if files:
+            raise ValueError("File list must be empty when command is given")
+        command_line = sh.shell_command(command) + ['|'] + grep_command + \
+            options
+    elif files:
+        command_line = sh.shell_command(grep_command) + options + files
+    else:
+        raise ValueError("command and files can't be both empty or None")
+
+    try:
+        stdout = sh.execute(command_line,
+                            ssh_client=ssh_client,
+                            **execute_params).stdout
+    except sh.ShellCommandFailed as ex:
+        if ex.exit_status > 1:
+            # Some unknown problem occurred
+            raise
+        stdout = ex.stdout
+    return tag_lines(patterns, stdout.splitlines())
+
+
+# POSIX character classes (only valid inside brackets) as understood by
+# Python regular expressions
+POSIX_CHARACTER_CLASSES = {
+    '[:alnum:]': r'0-9A-Za-z',
+    '[:alpha:]': r'A-Za-z',
+    '[:blank:]': r' \t',
+    '[:digit:]': r'0-9',
+    '[:lower:]': r'a-z',
+    '[:space:]': r'\s',
+    '[:upper:]': r'A-Z',
+    '[:xdigit:]': r'0-9A-Fa-f'}
+
+
+def compile_extended_regex(pattern: str) -> typing.Pattern[str]:
+    """Compile a grep extended regular expression as a Python one
+
+    Apart from POSIX character classes listed above, patterns have to be
+    written with syntax shared by POSIX extended and Python regular
+    expressions.
+    """
+    for posix_class, python_class in POSIX_CHARACTER_CLASSES.items():
+        pattern = pattern.replace(posix_class, python_class)
+    return re.compile(pattern)
+
+
+def tag_lines(patterns: PatternsType,
+              lines: typing.Iterable[str]) -> \
+        typing.Dict[str, typing.List[str]]:
+    """Index lines by the name of every pattern they match
+
+    Lines matching none of the patterns (for example because grep
+    understands some pattern in a different way) are logged.
+    """
+    compiled = {name: compile_extended_regex(pattern)
+                for name, pattern in patterns.items()}
+    tagged: typing.Dict[str, typing.List[str]] = {
+        name: [] for name in patterns}
+    for line in lines:
+        if not line.strip():
+            continue
+        matched = False
+        for name, pattern in compiled.items():
+            if pattern.search(line):
+                tagged[name].append(line)
+                matched = True
+        if not matched:
+            LOG.warning(f"Line doesn't match any of patterns "
+                        f"{list(patterns.values())}: {line!r}")
+    return tagged
+
+
+def grep_files_patterns(patterns: PatternsType,
+                        files: typing.List[str],
+                        **grep_params) -> typing.Dict[str, typing.List[str]]:
+    return grep_patterns(patterns=patterns, files=files, **grep_params)
@@ -19,6 +19,7 @@ from tobiko.shell.iperf3 import _assert
 from tobiko.shell.iperf3 import _execute
 from tobiko.shell.iperf3 import _interface
 from tobiko.shell.iperf3 import _parameters
+from tobiko.shell.iperf3 import _stream
 
 
 assert_has_bandwith_limits = _assert.assert_has_bandwith_limits
@@ -30,8 +31,16 @@ iperf3_client_alive = _execute.iperf3_client_alive
 stop_iperf3_client = _execute.stop_iperf3_client
 start_iperf3_server = _execute.start_iperf3_server
 parse_json_stream_output = _execute.parse_json_stream_output
+get_iperf3_client_pid = _execute.get_iperf3_client_pid
+start_iperf3_client_monitor = _execute.start_iperf3_client_monitor
+get_iperf3_client_monitor = _execute.get_iperf3_client_monitor
+get_iperf3_client_stats = _execute.get_iperf3_client_stats
+stop_iperf3_client_monitor = _execute.stop_iperf3_client_monitor
 
 get_iperf3_client_command = _interface.get_iperf3_client_command
 
 Iperf3ClientParameters = _parameters.Iperf3ClientParameters
 iperf3_client_parameters = _parameters.iperf3_client_parameters
+
+Iperf3BreakStats = _stream.Iperf3BreakStats
+Iperf3StreamMonitor = _stream.Iperf3StreamMonitor
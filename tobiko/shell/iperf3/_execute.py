@@ -28,6 +28,7 @@ from tobiko import config
 from tobiko.shell import files
 from tobiko.shell.iperf3 import _interface
 from tobiko.shell.iperf3 import _parameters
+from tobiko.shell.iperf3 import _stream
 from tobiko.shell import sh
 from tobiko.shell import ssh
 
@@ -126,7 +127,16 @@ def execute_iperf3_client_in_background(
         ssh_client: ssh.SSHClientType = None,
         iperf3_server_ssh_client: ssh.SSHClientType = None,
         output_dir: str = 'tobiko_iperf_results',
+        live_monitor: bool = False,
         **kwargs) -> None:
+    """Start iperf3 client process in background
+
+    :param live_monitor: follow client output while it runs, so that
+        break statistics can be got at any time with
+        get_iperf3_client_stats and are not computed by downloading the
+        whole log file when client results are checked. It requires the
+        client to be executed on a remote host (with --json-stream option)
+    """
     output_path = get_iperf3_logs_filepath(address, output_dir, ssh_client)
     LOG.info(f'starting iperf3 client process to > {address} , '
              f'output file is : {output_path}')
@@ -168,6 +178,14 @@ def execute_iperf3_client_in_background(
         logfile=output_path,
         run_in_background=True)
 
+    if live_monitor:
+        if ssh_client is None:
+            LOG.warning('iperf3 live monitor requires a remote client')
+        else:
+            start_iperf3_client_monitor(address=address,
+                                        output_dir=output_dir,
+                                        ssh_client=ssh_client)
+
 
 def _get_iperf3_pid(
         address: typing.Union[str, netaddr.IPAddress, None] = None,
@@ -184,7 +202,8 @@ def _get_iperf3_pid(
 
     for iperf_command in iperf_commands:
         iperf_processes = sh.list_processes(command_line=iperf_command,
-                                            ssh_client=ssh_client)
+                                            ssh_client=ssh_client,
+                                            remote_filter=True)
         if iperf_processes:
             return iperf_processes.unique.pid
     LOG.debug('no iperf3 processes were found')
@@ -254,6 +273,15 @@ def check_iperf3_client_results(address: typing.Union[str, netaddr.IPAddress],
                                 ssh_client: ssh.SSHClientType = None,
                                 **kwargs):  # noqa; pylint: disable=W0613
     logfile = get_iperf3_logs_filepath(address, output_dir, ssh_client)
+    stats = stop_iperf3_client_monitor(address=address,
+                                       ssh_client=ssh_client)
+    if stats is not None:
+        # Output has already been consumed while the client was running
+        LOG.debug(f'iperf3 client statistics: {stats}')
+        files.truncate_client_logfile(logfile, ssh_client)
+        stats.check()
+        return
+
     iperf_log_raw = _get_iperf3_log_raw(logfile, ssh_client)
     if not iperf_log_raw and not config.is_prevent_create():
         LOG.debug('empty iperf log file is ok when TOBIKO_PREVENT_CREATE is '
@@ -264,30 +292,15 @@ def check_iperf3_client_results(address: typing.Union[str, netaddr.IPAddress],
         iperf_log = json.loads(iperf_log_raw)
     except json.JSONDecodeError:
         iperf_log = parse_json_stream_output(iperf_log_raw)
-    longest_break = 0  # seconds
-    breaks_total = 0  # seconds
-    current_break = 0  # seconds
     intervals = iperf_log.get("intervals")
     if not intervals:
         tobiko.fail(f"No intervals data found in {logfile}")
+    stats = _stream.Iperf3BreakStats()
     for interval in intervals:
-        if interval["sum"]["bytes"] == 0:
-            interval_duration = (
-                interval["sum"]["end"] - interval["sum"]["start"])
-            current_break += interval_duration
-            if current_break > longest_break:
-                longest_break = current_break
-            breaks_total += interval_duration
-        else:
-            current_break = 0
+        stats.add_interval(interval)
 
     files.truncate_client_logfile(logfile, ssh_client)
-
-    testcase = tobiko.get_test_case()
-    testcase.assertLessEqual(longest_break,
-                             CONF.tobiko.rhosp.max_traffic_break_allowed)
-    testcase.assertLessEqual(breaks_total,
-                             CONF.tobiko.rhosp.max_total_breaks_allowed)
+    stats.check()
 
 
 def remove_log_lines_end_json_str(json_str: str) -> str:
@@ -302,6 +315,12 @@ def remove_log_lines_end_json_str(json_str: str) -> str:
     return "\n".join(lines)
 
 
+def get_iperf3_client_pid(
+        address: typing.Union[str, netaddr.IPAddress],
+        ssh_client: ssh.SSHClientType = None) -> typing.Optional[int]:
+    return _get_iperf3_pid(address=address, ssh_client=ssh_client)
+
+
 def iperf3_client_alive(address: typing.Union[str, netaddr.IPAddress],  # noqa; pylint: disable=W0613
                         ssh_client: ssh.SSHClientType = None,
                         **kwargs) -> bool:
@@ -357,3 +376,68 @@ def _stop_iperf3_server(
                               sleep_interval=5,
                               ssh_client=ssh_client,
                               pid=pid)
+
+
+_monitors: typing.Dict[typing.Tuple[str, typing.Any],
+                       _stream.Iperf3StreamMonitor] = {}
+
+
+def start_iperf3_client_monitor(
+        address: typing.Union[str, netaddr.IPAddress],
+        output_dir: str = 'tobiko_iperf_results',
+        ssh_client: ssh.SSHClientType = None,
+        **kwargs) -> _stream.Iperf3StreamMonitor:  # noqa; pylint: disable=W0613
+    """Follow the log file of a background iperf3 client while it runs
+
+    The log file must be written by iperf3 with --json-stream option.
+    """
+    key = (str(address), ssh_client)
+    monitor = _monitors.get(key)
+    if monitor is not None and monitor.is_running:
+        return monitor
+    logfile = get_iperf3_logs_filepath(address, output_dir, ssh_client)
+    command = sh.shell_command(['tail', '-n', '+1', '-F'])
+    pid = get_iperf3_client_pid(address=address, ssh_client=ssh_client)
+    if pid:
+        # make tail terminate as soon as the client process ends
+        command += [f'--pid={pid}']
+    command += [logfile]
+    LOG.info(f'Following iperf3 client log file {logfile}')
+    monitor = _monitors[key] = _stream.Iperf3StreamMonitor(
+        command=command, ssh_client=ssh_client).start()
+    return monitor
+
+
+def get_iperf3_client_monitor(
+        address: typing.Union[str, netaddr.IPAddress],
+        ssh_client: ssh.SSHClientType = None) -> \
+        typing.Optional[_stream.Iperf3StreamMonitor]:
+    return _monitors.get((str(address), ssh_client))
+
+
+def get_iperf3_client_stats(
+        address: typing.Union[str, netaddr.IPAddress],
+        ssh_client: ssh.SSHClientType = None,
+        **kwargs) -> _stream.Iperf3BreakStats:
+    """Get break statistics of a background iperf3 client run so far"""
+    monitor = get_iperf3_client_monitor(address=address,
+                                        ssh_client=ssh_client)
+    if monitor is None:
+        monitor = start_iperf3_client_monitor(address=address,
+                                              ssh_client=ssh_client,
+                                              **kwargs)
+    return monitor.stats
+
+
+def stop_iperf3_client_monitor(
+        address: typing.Union[str, netaddr.IPAddress],
+        ssh_client: ssh.SSHClientType = None) -> \
+        typing.Optional[_stream.Iperf3BreakStats]:
+    """Stop following iperf3 client output and get its final statistics"""
+    monitor = _monitors.pop((str(address), ssh_client), None)
+    if monitor is None:
+        return None
+    try:
+        return monitor.wait_for_end()
+    finally:
+        monitor.stop()
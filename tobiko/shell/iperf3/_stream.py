@@ -0,0 +1,182 @@
+# Copyright (c) 2026 Red Hat
+# All Rights Reserved.
+#
+#    Licensed under the Apache License, Version 2.0 (the "License"); you may
+#    not use this file except in compliance with the License. You may obtain
+#    a copy of the License at
+#
+#         http://www.apache.org/licenses/LICENSE-2.0
+#
+#    Unless required by applicable law or agreed to in writing, software
+#    distributed under the License is distributed on an "AS IS" BASIS, WITHOUT
+#    WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied. See the
+#    License for the specific language governing permissions and limitations
+#    under the License.
+from __future__ import absolute_import
+from __future__ import division
+
+import copy
+import json
+import threading
+import typing
+
+from oslo_log import log
+
+import tobiko
+from tobiko import config
+from tobiko.shell import sh
+from tobiko.shell import ssh
+
+
+CONF = config.CONF
+LOG = log.getLogger(__name__)
+
+
+class Iperf3BreakStats(object):
+    """Rolling traffic break statistics of an iperf3 client run
+
+    Intervals are accounted as soon as they are received and then
+    discarded, so that statistics of long runs are kept in constant memory.
+    """
+
+    def __init__(self):
+        self.intervals_count = 0
+        self.bytes_total = 0
+        self.current_break = 0.  # seconds
+        self.longest_break = 0.  # seconds
+        self.breaks_total = 0.  # seconds
+        self.errors: typing.List[str] = []
+        self.ended = False
+
+    def add_interval(self, interval: typing.Dict[str, typing.Any]):
+        interval_sum = interval["sum"]
+        self.intervals_count += 1
+        self.bytes_total += interval_sum["bytes"]
+        if interval_sum["bytes"] == 0:
+            interval_duration = interval_sum["end"] - interval_sum["start"]
+            self.current_break += interval_duration
+            self.longest_break = max(self.longest_break, self.current_break)
+            self.breaks_total += interval_duration
+        else:
+            self.current_break = 0.
+
+    def add_event(self, event: typing.Dict[str, typing.Any]):
+        """Account an event got from iperf3 --json-stream output"""
+        name = event.get('event')
+        if name == 'interval':
+            self.add_interval(event['data'])
+        elif name == 'error':
+            # keep only the last errors to avoid growing without limits
+            self.errors = self.errors[-9:] + [str(event.get('data'))]
+        elif name == 'end':
+            self.ended = True
+
+    def add_line(self, line: typing.Union[str, bytes]):
+        if isinstance(line, bytes):
+            line = line.decode(errors='replace')
+        line = line.strip()
+        if not line:
+            return
+        try:
+            event = json.loads(line)
+        except json.JSONDecodeError:
+            LOG.debug(f'Ignore invalid iperf3 JSON stream line: {line!r}')
+        else:
+            if isinstance(event, dict):
+                self.add_event(event)
+
+    def check(self):
+        if self.intervals_count == 0:
+            tobiko.fail("No intervals data found in iperf3 output")
+        testcase = tobiko.get_test_case()
+        testcase.assertLessEqual(self.longest_break,
+                                 CONF.tobiko.rhosp.max_traffic_break_allowed)
+        testcase.assertLessEqual(self.breaks_total,
+                                 CONF.tobiko.rhosp.max_total_breaks_allowed)
+
+    def __repr__(self):
+        return (f"{type(self).__name__}("
+                f"intervals_count={self.intervals_count}, "
+                f"longest_break={self.longest_break}, "
+                f"breaks_total={self.breaks_total}, "
+                f"ended={self.ended})")
+
+
+class Iperf3StreamMonitor(object):
+    """Consumes iperf3 --json-stream output while it is being produced
+
+    The given command (for example a 'tail -F' of the client log file or
+    an 'oc logs -f' of the client pod) is executed in background and every
+    line it writes is accounted to break statistics by a reader thread.
+    """
+
+    def __init__(self,
+                 command: sh.ShellCommandType,
+                 ssh_client: ssh.SSHClientType = None):
+        self.command = sh.shell_command(command)
+        self.ssh_client = ssh_client
+        self.process: typing.Optional[sh.ShellProcessFixture] = None
+        self._stats = Iperf3BreakStats()
+        self._lock = threading.Lock()
+        self._thread: typing.Optional[threading.Thread] = None
+
+    @property
+    def stats(self) -> Iperf3BreakStats:
+        """Snapshot of statistics accounted so far"""
+        with self._lock:
+            return copy.deepcopy(self._stats)
+
+    @property
+    def is_running(self) -> bool:
+        return self._thread is not None and self._thread.is_alive()
+
+    def start(self) -> 'Iperf3StreamMonitor':
+        if self.process is None:
+            self.process = sh.process(self.command,
+                                      ssh_client=self.ssh_client,
+                                      stdin=False,
+                                      stderr=False)
+            self.process.execute()
+            self._thread = threading.Thread(target=self._read_lines,
+                                            name='tobiko-iperf3-monitor',
+                                            daemon=True)
+            self._thread.start()
+        return self
+
+    def _read_lines(self):
+        # Lines are read from the underlying stream to avoid the process
+        # fixture keeping a copy of the whole output
+        stdout = self.process.stdout
+        stream = getattr(stdout, 'delegate', stdout)
+        try:
+            for line in iter(stream.readline, b''):
+                if not line:
+                    break
+                with self._lock:
+                    self._stats.add_line(line)
+        except Exception:
+            if self.process is not None:
+                LOG.exception(f'Error reading output of {self.command}')
+        LOG.debug(f'Stopped reading output of {self.command}')
+
+    def wait_for_end(self, timeout: tobiko.Seconds = 10.) -> \
+            Iperf3BreakStats:
+        """Wait until iperf3 reports the end of the run or output ends"""
+        for attempt in tobiko.retry(timeout=timeout,
+                                    interval=.5,
+                                    default_timeout=10.):
+            stats = self.stats
+            if stats.ended or not self.is_running:
+                return stats
+            if attempt.is_last:
+                LOG.warning(f'iperf3 end event not received from command '
+                            f'{self.command} after {timeout} seconds')
+                return stats
+        raise RuntimeError('Broken retry loop')
+
+    def stop(self, timeout: tobiko.Seconds = 5.):
+        process, self.process = self.process, None
+        if process is not None:
+            process.kill()
+        if self._thread is not None:
+            self._thread.join(timeout=tobiko.to_seconds_float(timeout))
@@ -522,7 +522,8 @@ def _get_ping_pid(
     if address is not None:
         ping_command += f' .*{address}'
     ping_processes = sh.list_processes(command_line=ping_command,
-                                       ssh_client=ssh_client)
+                                       ssh_client=ssh_client,
+                                       remote_filter=True)
     if not ping_processes:
         LOG.debug('no ping processes were found')
         return None
@@ -30,8 +30,10 @@ from tobiko.shell.sh import _path
 from tobiko.shell.sh import _process
 from tobiko.shell.sh import _ps
 from tobiko.shell.sh import _reboot
+from tobiko.shell.sh import _recovery
 from tobiko.shell.sh import _ssh
 from tobiko.shell.sh import _systemctl
+from tobiko.shell.sh import _table
 from tobiko.shell.sh import _uptime
 from tobiko.shell.sh import _wc
 from tobiko.shell.sh import _which
@@ -102,11 +104,14 @@ str_from_stream = _process.str_from_stream
 ShellProcessFixture = _process.ShellProcessFixture
 
 PsError = _ps.PsError
+PgrepProcess = _ps.PgrepProcess
 PsProcess = _ps.PsProcess
 PsWaitTimeout = _ps.PsWaitTimeout
 list_all_processes = _ps.list_all_processes
 list_kernel_processes = _ps.list_kernel_processes
 list_processes = _ps.list_processes
+list_processes_table = _ps.list_processes_table
+pgrep_processes = _ps.pgrep_processes
 wait_for_processes = _ps.wait_for_processes
 
 reboot_host = _reboot.reboot_host
@@ -118,6 +123,12 @@ crash_method = RebootHostMethod.CRASH
 hard_reset_method = RebootHostMethod.HARD
 soft_reset_method = RebootHostMethod.SOFT
 
+HostRecovery = _recovery.HostRecovery
+HostsRecoveryTimeoutError = _recovery.HostsRecoveryTimeoutError
+probe_icmp = _recovery.probe_icmp
+probe_tcp_port = _recovery.probe_tcp_port
+wait_for_hosts_recovery = _recovery.wait_for_hosts_recovery
+
 ssh_process = _ssh.ssh_process
 ssh_execute = _ssh.ssh_execute
 SSHShellProcessFixture = _ssh.SSHShellProcessFixture
@@ -125,11 +136,16 @@ SSHShellProcessFixture = _ssh.SSHShellProcessFixture
 SystemdUnit = _systemctl.SystemdUnit
 match_unit_state = _systemctl.match_unit_state
 list_systemd_units = _systemctl.list_systemd_units
+show_systemd_units = _systemctl.show_systemd_units
 stop_systemd_units = _systemctl.stop_systemd_units
 start_systemd_units = _systemctl.start_systemd_units
 wait_for_active_systemd_units = _systemctl.wait_for_active_systemd_units
 wait_for_systemd_units_state = _systemctl.wait_for_systemd_units_state
 
+parse_table_columns = _table.parse_table_columns
+
+BootIdError = _uptime.BootIdError
+get_boot_id = _uptime.get_boot_id
 get_uptime = _uptime.get_uptime
 UptimeError = _uptime.UptimeError
 
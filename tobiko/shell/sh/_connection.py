@@ -16,10 +16,12 @@
 from __future__ import absolute_import
 
 import getpass
+import hashlib
 import io
 import os.path
 import shutil
 import socket
+import tarfile
 import tempfile
 import typing
 
@@ -94,9 +96,11 @@ def put_file(local_file: str,
 
 def put_files(*local_files: str,
               remote_dir: str,
+              archive: bool = None,
               connection: ShellConnectionType = None):
     return shell_connection(connection).put_files(*local_files,
-                                                  remote_dir=remote_dir)
+                                                  remote_dir=remote_dir,
+                                                  archive=archive)
 
 
 def make_temp_file(auto_clean=True,
@@ -260,28 +264,34 @@ class ShellConnection(tobiko.SharedFixture):
     def put_file(self, local_file: str, remote_file: str):
         raise NotImplementedError
 
+    #: Whether put_files sends files inside a single archive by default
+    put_archive = False
+
     def put_files(self,
                   *local_files: str,
                   remote_dir: str,
-                  make_dirs=True):
+                  make_dirs=True,
+                  archive: bool = None):
+        """Copy local files and directory trees to a remote directory
+
+        :param make_dirs: create missing remote directories. When false
+            remote_dir has to exist already (sub-directories are still
+            created when extracting an archive)
+        :param archive: send all files inside a single compressed tar
+            archive instead of copying them one by one. By default it
+            depends on the connection type
+        """
         # pylint: disable=redefined-outer-name
         remote_dir = os.path.normpath(remote_dir)
-        put_files = {}
-        for local_file in local_files:
-            local_file = os.path.normpath(local_file)
-            if os.path.isdir(local_file):
-                top_dir = os.path.dirname(local_file)
-                for local_dir, _, files in os.walk(local_file):
-                    for filename in files:
-                        local_file = os.path.join(local_dir, filename)
-                        remote_file = os.path.join(
-                            remote_dir,
-                            os.path.relpath(local_file, start=top_dir))
-                        put_files[os.path.realpath(local_file)] = remote_file
-            else:
-                remote_file = os.path.join(
-                    remote_dir, os.path.basename(local_file))
-                put_files[os.path.realpath(local_file)] = remote_file
+        put_files = list_put_files(*local_files, remote_dir=remote_dir)
+        if archive is None:
+            archive = self.put_archive
+        if archive:
+            if put_files:
+                self.put_archive_files(put_files,
+                                       remote_dir=remote_dir,
+                                       make_dirs=make_dirs)
+            return
         remote_dirs = set()
         for local_file, remote_file in sorted(put_files.items()):
             if make_dirs:
@@ -291,6 +301,12 @@ class ShellConnection(tobiko.SharedFixture):
                     remote_dirs.add(remote_dir)
             self.put_file(local_file, remote_file)
 
+    def put_archive_files(self,
+                          put_files: typing.Dict[str, str],
+                          remote_dir: str,
+                          make_dirs=True):
+        raise NotImplementedError
+
     def get_file(self, remote_file: str, local_file: str):
         raise NotImplementedError
 
@@ -472,6 +488,51 @@ class SSHShellConnection(ShellConnection):
                   f"'{remote_file}'...")
         self.sftp_client.put(local_file, remote_file)
 
+    put_archive = True
+
+    #: Remote directory where sent archives are kept by content digest
+    archives_dir = '~/.cache/tobiko/archives'
+
+    #: Days after which archives that haven't been used are removed
+    archives_max_age = 7
+
+    def put_archive_files(self,
+                          put_files: typing.Dict[str, str],
+                          remote_dir: str,
+                          make_dirs=True):
+        digest = put_files_digest(put_files, remote_dir=remote_dir)
+        archives_dir = self.get_config_path(self.archives_dir)
+        archive_file = os.path.join(archives_dir, f'{digest}.tar.gz')
+        extract = (f'tar -xzf {_command.quote(archive_file)} '
+                   f'-C {_command.quote(remote_dir)}')
+        if make_dirs:
+            extract = f'mkdir -p {_command.quote(remote_dir)} && {extract}'
+        # Files are sent only when the same content wasn't sent before.
+        # Cached archives are touched when used so that they aren't pruned
+        result = self.execute(
+            ['sh', '-c', f'mkdir -p {_command.quote(archives_dir)} && '
+                         f'test -f {_command.quote(archive_file)} && '
+                         f'touch {_command.quote(archive_file)} && '
+                         f'{extract}'],
+            expect_exit_status=None)
+        if result.exit_status == 0:
+            LOG.debug(f"Extracted cached archive as {self.login}: "
+                      f"'{archive_file}' -> '{remote_dir}'")
+            return
+
+        archive = make_tar_archive(put_files, remote_dir=remote_dir)
+        LOG.debug(f"Put remote archive as {self.login}: {len(put_files)} "
+                  f"files ({len(archive)} bytes) -> '{remote_dir}'...")
+        temp_file = f'{archive_file}.{os.getpid()}'
+        self.sftp_client.putfo(io.BytesIO(archive), temp_file)
+        self.execute(
+            ['sh', '-c', f'mv -f {_command.quote(temp_file)} '
+                         f'{_command.quote(archive_file)} && '
+                         f'{extract} && '
+                         f'find {_command.quote(archives_dir)} -type f '
+                         f'-mtime +{int(self.archives_max_age)} '
+                         '-name "*.tar.gz*" -delete'])
+
     def open_file(self,
                   filename: typing.Union[str, bytes],
                   mode: str,
@@ -558,6 +619,60 @@ class SSHShellConnection(ShellConnection):
         return path
 
 
+def list_put_files(*local_files: str,
+                   remote_dir: str) -> typing.Dict[str, str]:
+    """Map local files (or files found in local directories) to remote ones
+    """
+    remote_dir = os.path.normpath(remote_dir)
+    put_files = {}
+    for local_file in local_files:
+        local_file = os.path.normpath(local_file)
+        if os.path.isdir(local_file):
+            top_dir = os.path.dirname(local_file)
+            for local_dir, _, files in os.walk(local_file):
+                for filename in files:
+                    local_file = os.path.join(local_dir, filename)
+                    remote_file = os.path.join(
+                        remote_dir,
+                        os.path.relpath(local_file, start=top_dir))
+                    put_files[os.path.realpath(local_file)] = remote_file
+        else:
+            remote_file = os.path.join(
+                remote_dir, os.path.basename(local_file))
+            put_files[os.path.realpath(local_file)] = remote_file
+    return put_files
+
+
+def put_files_digest(put_files: typing.Dict[str, str],
+                     remote_dir: str) -> str:
+    """Get a digest that changes when any file name, mode or content does
+    """
+    digest = hashlib.sha256()
+    for local_file, remote_file in sorted(put_files.items(),
+                                          key=lambda item: item[1]):
+        digest.update(os.path.relpath(remote_file, remote_dir).encode())
+        digest.update(oct(os.stat(local_file).st_mode).encode())
+        with io.open(local_file, 'rb') as fd:
+            for chunk in iter(lambda: fd.read(io.DEFAULT_BUFFER_SIZE), b''):
+                digest.update(chunk)
+        digest.update(b'\0')
+    return digest.hexdigest()
+
+
+def make_tar_archive(put_files: typing.Dict[str, str],
+                     remote_dir: str) -> bytes:
+    """Make a gzip compressed tar archive to be extracted in remote_dir
+    """
+    data = io.BytesIO()
+    with tarfile.open(fileobj=data, mode='w:gz') as archive:
+        for local_file, remote_file in sorted(put_files.items(),
+                                              key=lambda item: item[1]):
+            archive.add(local_file,
+                        arcname=os.path.relpath(remote_file, remote_dir),
+                        recursive=False)
+    return data.getvalue()
+
+
 def _parse_env_line(line: str) -> typing.Tuple[str, str]:
     name, value = line.split('=', 1)
     return name.strip(), value.strip()
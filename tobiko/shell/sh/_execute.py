@@ -21,6 +21,7 @@ import enum
 from oslo_log import log
 
 import tobiko
+from tobiko.shell.sh import _command
 from tobiko.shell.sh import _exception
 from tobiko.shell.sh import _process
 
@@ -154,12 +155,23 @@ def execute(command, environment=None, timeout=None, shell=None,
                                ssh_client=ssh_client,
                                **kwargs)
     login = getattr(ssh_client, 'login', None)
-    return execute_process(process=process,
-                           stdin=stdin,
-                           login=login,
-                           expect_exit_status=expect_exit_status,
-                           decode_streams=decode_streams,
-                           timeout=timeout)
+    with tobiko.measure_timing(tobiko.SHELL_TIMING,
+                               name=get_command_name(command),
+                               host=getattr(ssh_client, 'hostname', None) or
+                               'localhost'):
+        return execute_process(process=process,
+                               stdin=stdin,
+                               login=login,
+                               expect_exit_status=expect_exit_status,
+                               decode_streams=decode_streams,
+                               timeout=timeout)
+
+
+def get_command_name(command) -> str:
+    """Get the name of the program executed by given command"""
+    words = [word for word in _command.shell_command(command)
+             if word != 'sudo']
+    return words[0].rsplit('/', 1)[-1] if words else ''
 
 
 def execute_process(process: _process.ShellProcessFixture,
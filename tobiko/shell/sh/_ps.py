@@ -15,6 +15,7 @@
 #    under the License.
 from __future__ import absolute_import
 
+import os
 import re
 import typing
 
@@ -25,6 +26,7 @@ from tobiko.shell.sh import _cmdline
 from tobiko.shell.sh import _command
 from tobiko.shell.sh import _execute
 from tobiko.shell.sh import _hostname
+from tobiko.shell.sh import _table
 from tobiko.shell import ssh
 
 
@@ -100,6 +102,20 @@ class PsProcess(PsProcessTuple, PsProcessBase):
     pass
 
 
+class PgrepProcessTuple(typing.NamedTuple):
+    """Process listed by pgrep command together with its command line
+    """
+    command: str
+    pid: int
+    ssh_client: ssh.SSHClientType
+    is_cirros: typing.Optional[bool] = None
+    command_line: typing.Optional[_command.ShellCommand] = None
+
+
+class PgrepProcess(PgrepProcessTuple, PsProcessBase):
+    pass
+
+
 P = typing.TypeVar('P', bound=PsProcessBase)
 
 
@@ -153,10 +169,28 @@ def list_processes(
         ssh_client: ssh.SSHClientType = None,
         command_line: _command.ShellCommandType = None,
         is_cirros: bool = None,
+        remote_filter: bool = False,
         **execute_params) -> tobiko.Selection[PsProcess]:
     """Returns list of running process
 
+    :param remote_filter: when true and command or command_line are
+        given, processes are pre-filtered on the host by pgrep, so that
+        only matching processes (with their command line) are
+        transferred and parsed instead of the whole process table
     """
+    if remote_filter and (command or command_line) and not is_cirros:
+        pgrep_result = pgrep_processes(command=command,
+                                       command_line=command_line,
+                                       ssh_client=ssh_client,
+                                       is_cirros=is_cirros,
+                                       **execute_params)
+        if pgrep_result is not None:
+            return select_processes(pgrep_result,
+                                    pid=pid,
+                                    command=command,
+                                    is_kernel=is_kernel,
+                                    command_line=command_line)
+
     ps_command = _command.shell_command('ps')
     if pid is None or is_cirros in [True, None]:
         ps_command += '-A'
@@ -186,6 +220,89 @@ def list_processes(
                             command_line=command_line)
 
 
+PS_COLUMN_CONVERTERS: typing.Dict[str, _table.ColumnConverter] = {
+    'pid': int,
+    'ppid': int,
+    'pgid': int,
+    'uid': int,
+    'rss': int,
+    'vsz': int,
+    '%cpu': float,
+    '%mem': float,
+}
+
+
+def list_processes_table(
+        fields: typing.Sequence[str] = ('pid', 'ppid', 'comm'),
+        ssh_client: ssh.SSHClientType = None,
+        **execute_params) -> tobiko.TableData:
+    """List all running processes as a table with given ps fields
+
+    ps is asked for the given fields without any header, so that its
+    output can be parsed by columns. Only the last field can contain
+    spaces (like 'args').
+    """
+    fields = list(fields)
+    ps_command = _command.shell_command('ps -A')
+    for field in fields:
+        ps_command += ['-o', f'{field}=']
+    output = _execute.execute(ps_command,
+                              ssh_client=ssh_client,
+                              **execute_params).stdout
+    return _table.parse_table_columns(output,
+                                      columns=fields,
+                                      converters=PS_COLUMN_CONVERTERS)
+
+
+def pgrep_processes(command: str = None,
+                    command_line: _command.ShellCommandType = None,
+                    ssh_client: ssh.SSHClientType = None,
+                    is_cirros: bool = None,
+                    **execute_params) \
+        -> typing.Optional[tobiko.Selection[PgrepProcess]]:
+    """List processes matching given patterns using pgrep on the host
+
+    Patterns are matched with pgrep extended regular expressions (by
+    searching command name, or full command line when command_line is
+    given), so that returned processes are a superset of what
+    select_processes would return with the same patterns.
+
+    :returns: None when pgrep doesn't support listing command lines
+        (for example busybox version)
+    """
+    pgrep_command = _command.shell_command('pgrep -a')
+    if command_line is not None:
+        pgrep_command += ['-f', '--', str(command_line)]
+    else:
+        pgrep_command += ['--', str(command)]
+    result = _execute.execute(pgrep_command,
+                              expect_exit_status=None,
+                              ssh_client=ssh_client,
+                              **execute_params)
+    processes = tobiko.Selection[PgrepProcess]()
+    if result.exit_status == 1:
+        # No process matched
+        return processes
+    if result.exit_status != 0:
+        LOG.debug(f"Unable to list processes with '{pgrep_command}': "
+                  f"{result.stderr}")
+        return None
+
+    for line in result.stdout.splitlines():
+        fields = line.split()
+        if len(fields) < 2:
+            continue
+        args = _command.ShellCommand(fields[1:])
+        processes.append(PgrepProcess(
+            # process name as reported by ps is truncated to 15 characters
+            command=os.path.basename(args[0])[:15],
+            pid=int(fields[0]),
+            ssh_client=ssh_client,
+            is_cirros=is_cirros,
+            command_line=args))
+    return processes
+
+
 def wait_for_processes(timeout: tobiko.Seconds = None,
                        sleep_interval: tobiko.Seconds = None,
                        ssh_client: ssh.SSHClientType = None,
@@ -14,12 +14,14 @@
 from __future__ import absolute_import
 
 import enum
+import typing
 
 from oslo_log import log
 
 import tobiko
 from tobiko.shell import ping
 from tobiko.shell.sh import _command
+from tobiko.shell.sh import _recovery
 from tobiko.shell.sh import _uptime
 from tobiko.shell import ssh
 
@@ -84,11 +86,15 @@ class RebootHostOperation(tobiko.Operation):
         self.method = method
         self.ssh_client = ssh_client
         self.start_time: tobiko.Seconds = None
+        self.boot_id: typing.Optional[str] = None
+        self.recovery: typing.Optional[_recovery.HostRecovery] = None
         self.timeout = tobiko.to_seconds(timeout)
 
     def run_operation(self):
         self.is_rebooted = False
         self.start_time = None
+        self.boot_id = None
+        self.recovery = None
         for attempt in tobiko.retry(
                 timeout=self.timeout,
                 default_timeout=self.default_wait_timeout,
@@ -98,6 +104,7 @@ class RebootHostOperation(tobiko.Operation):
                 channel = self.ssh_client.connect(
                     connection_timeout=attempt.time_left,
                     retry_count=1)
+                self.boot_id = self._get_boot_id()
                 LOG.info("Executing reboot command on host "
                          f"'{self.hostname}' (command='{self.command}')... ")
                 self.start_time = tobiko.time()
@@ -122,6 +129,17 @@ class RebootHostOperation(tobiko.Operation):
     def cleanup_fixture(self):
         self.is_rebooted = False
         self.start_time = None
+        self.boot_id = None
+        self.recovery = None
+
+    def _get_boot_id(self) -> typing.Optional[str]:
+        try:
+            return _uptime.get_boot_id(ssh_client=self.ssh_client,
+                                       timeout=30.)
+        except Exception:
+            LOG.debug("Unable to get boot ID from host "
+                      f"'{self.hostname}'", exc_info=1)
+            return None
 
     @property
     def command(self) -> _command.ShellCommand:
@@ -149,43 +167,29 @@ class RebootHostOperation(tobiko.Operation):
     def wait_for_operation(self, timeout: tobiko.Seconds = None):
         if self.is_rebooted:
             return
+        # SSH connection is only attempted when host port accepts
+        # connections, so we don't wait for SSH connect timeouts while
+        # the host is down
+        recovery = _recovery.HostRecovery(ssh_client=self.ssh_client,
+                                          start_time=self.start_time,
+                                          boot_id=self.boot_id)
         try:
             for attempt in tobiko.retry(
                     timeout=tobiko.min_seconds(timeout, self.time_left),
                     default_timeout=self.default_wait_timeout,
                     default_count=self.default_wait_count,
                     default_interval=self.default_wait_interval):
-                # ensure SSH connection is closed before retrying connecting
-                tobiko.cleanup_fixture(self.ssh_client)
-                assert self.ssh_client.client is None
-                LOG.debug(f"Getting uptime after reboot '{self.hostname}' "
-                          "after reboot... ")
-                try:
-                    up_time = _uptime.get_uptime(ssh_client=self.ssh_client,
-                                                 timeout=30.)
-
-                except Exception:
-                    # if disconnected while getting up time we assume the VM is
-                    # just rebooting. These are good news!
-                    LOG.debug("Unable to get uptime from host "
-                              f"'{self.hostname}'", exc_info=1)
-                    attempt.check_limits()
-                else:
-                    # verify that reboot actually happened by comparing elapsed
-                    # time with up_time
-                    elapsed_time = self.elapsed_time
-                    if up_time < elapsed_time:
-                        assert self.ssh_client.client is not None
-                        self.is_rebooted = True
-                        LOG.debug(f"Host '{self.hostname}' restarted "
-                                  f"{elapsed_time} seconds after "
-                                  f"reboot operation (up_time={up_time})")
-                        break
-                    else:
-                        LOG.debug(f"Host '{self.hostname}' still not "
-                                  f"restarted {elapsed_time} seconds after "
-                                  f"reboot operation (up_time={up_time!r})")
-                        attempt.check_limits()
+                LOG.debug(f"Waiting for host '{self.hostname}' to be "
+                          "rebooted... ")
+                if recovery.poll():
+                    assert self.ssh_client.client is not None
+                    self.is_rebooted = True
+                    self.recovery = recovery
+                    LOG.debug(f"Host '{self.hostname}' restarted "
+                              f"{self.elapsed_time} seconds after "
+                              f"reboot operation ({recovery})")
+                    break
+                attempt.check_limits()
         finally:
             if not self.is_rebooted:
                 self.ssh_client.close()
@@ -0,0 +1,234 @@
+# Copyright (c) 2026 Red Hat
+# All Rights Reserved.
+#
+#    Licensed under the Apache License, Version 2.0 (the "License"); you may
+#    not use this file except in compliance with the License. You may obtain
+#    a copy of the License at
+#
+#         http://www.apache.org/licenses/LICENSE-2.0
+#
+#    Unless required by applicable law or agreed to in writing, software
+#    distributed under the License is distributed on an "AS IS" BASIS, WITHOUT
+#    WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied. See the
+#    License for the specific language governing permissions and limitations
+#    under the License.
+from __future__ import absolute_import
+
+import socket
+import typing
+
+from oslo_log import log
+
+import tobiko
+from tobiko.shell import ping
+from tobiko.shell.sh import _execute
+from tobiko.shell.sh import _uptime
+from tobiko.shell import ssh
+
+
+LOG = log.getLogger(__name__)
+
+
+class HostsRecoveryTimeoutError(tobiko.TobikoException):
+    message = ("hosts {hostnames!r} not recovered after {timeout!s} "
+               "seconds")
+
+
+def probe_tcp_port(ssh_client: ssh.SSHClientFixture,
+                   timeout: tobiko.Seconds = 2.) -> typing.Optional[bool]:
+    """Tells if the SSH server port of a host accepts TCP connections
+
+    When the host is reached via a proxy host the port is probed from there.
+    It returns None when it is not possible to tell.
+    """
+    parameters = ssh_client.setup_connect_parameters()
+    hostname = parameters['hostname']
+    port = parameters.get('port') or 22
+    timeout = tobiko.to_seconds_float(timeout)
+    if ssh_client.proxy_client is not None:
+        try:
+            result = _execute.execute(
+                f'nc -z -w {max(1, int(timeout))} {hostname} {port}',
+                ssh_client=ssh_client.proxy_client,
+                expect_exit_status=None,
+                timeout=timeout + 10.)
+        except Exception:
+            LOG.debug(f"Unable to probe port {port} of host {hostname!r} "
+                      "from proxy host", exc_info=1)
+            return None
+        return result.exit_status == 0
+    elif parameters.get('proxy_command'):
+        return None
+    try:
+        with socket.create_connection((hostname, port), timeout=timeout):
+            return True
+    except OSError:
+        return False
+
+
+def probe_icmp(ssh_client: ssh.SSHClientFixture,
+               timeout: tobiko.Seconds = 1.) -> bool:
+    """Tells if the host replies to ICMP echo requests"""
+    try:
+        statistics = ping.ping(ssh_client.hostname,
+                               count=1,
+                               deadline=max(1, int(timeout or 1)),
+                               check=False,
+                               ssh_client=ssh_client.proxy_client)
+    except Exception:
+        LOG.debug(f"Unable to ping host {ssh_client.hostname!r}",
+                  exc_info=True)
+        return False
+    return bool(statistics.received)
+
+
+class HostRecovery(object):
+    """Follows a host while it reboots until it is reachable again via SSH
+
+    At every poll it probes SSH server TCP port (and ICMP replies while
+    it is closed), and only tries connecting via SSH when the port answers.
+    The host is recovered when its boot ID changes or, when the boot ID is
+    unknown, when its uptime is lower than the time elapsed since
+    start_time.
+    """
+
+    def __init__(self,
+                 ssh_client: ssh.SSHClientFixture,
+                 start_time: tobiko.Seconds = None,
+                 boot_id: str = None,
+                 icmp=True,
+                 probe_timeout: tobiko.Seconds = 2.,
+                 ssh_timeout: tobiko.Seconds = 30.):
+        self.ssh_client = ssh_client
+        self.start_time: float = (tobiko.time() if start_time is None
+                                  else start_time)
+        self.boot_id = boot_id
+        self.icmp = icmp
+        self.probe_timeout = probe_timeout
+        self.ssh_timeout = ssh_timeout
+        # First time the port was found closed
+        self.down_time: typing.Optional[float] = None
+        # First time ICMP echo requests were replied after going down
+        self.ping_time: typing.Optional[float] = None
+        # First time the port was found open after going down
+        self.port_time: typing.Optional[float] = None
+        # When the SSH connection confirmed the host has been rebooted
+        self.ssh_time: typing.Optional[float] = None
+        self.ssh_attempts = 0
+
+    @property
+    def hostname(self) -> str:
+        return self.ssh_client.hostname
+
+    @property
+    def recovered(self) -> bool:
+        return self.ssh_time is not None
+
+    @property
+    def downtime(self) -> tobiko.Seconds:
+        """Time elapsed while SSH server port was closed"""
+        if self.down_time is None or self.port_time is None:
+            return None
+        return self.port_time - self.down_time
+
+    @property
+    def time_to_ssh(self) -> tobiko.Seconds:
+        """Time elapsed since start_time before SSH server was back"""
+        if self.ssh_time is None:
+            return None
+        return self.ssh_time - self.start_time
+
+    def poll(self) -> bool:
+        if self.recovered:
+            return True
+
+        now = tobiko.time()
+        port_open = probe_tcp_port(self.ssh_client,
+                                   timeout=self.probe_timeout)
+        if port_open is False:
+            if self.down_time is None:
+                LOG.debug(f"Host {self.hostname!r} is down")
+                self.down_time = now
+            self.port_time = None
+            if self.icmp and self.ping_time is None and probe_icmp(
+                    self.ssh_client, timeout=self.probe_timeout):
+                LOG.debug(f"Host {self.hostname!r} replies to ping again")
+                self.ping_time = now
+            return False
+
+        if port_open and self.down_time is not None and \
+                self.port_time is None:
+            self.port_time = now
+        return self._check_rebooted()
+
+    def _check_rebooted(self) -> bool:
+        # ensure SSH connection is closed before connecting again
+        tobiko.cleanup_fixture(self.ssh_client)
+        self.ssh_attempts += 1
+        try:
+            self.ssh_client.connect(connection_timeout=self.ssh_timeout,
+                                    connection_attempts=1,
+                                    retry_count=1)
+            if self.boot_id is None:
+                up_time = _uptime.get_uptime(ssh_client=self.ssh_client,
+                                             timeout=self.ssh_timeout)
+                rebooted = up_time < tobiko.time() - self.start_time
+            else:
+                boot_id = _uptime.get_boot_id(ssh_client=self.ssh_client,
+                                              timeout=self.ssh_timeout)
+                rebooted = boot_id != self.boot_id
+        except Exception:
+            # if disconnected while checking we assume the host is just
+            # rebooting
+            LOG.debug(f"Unable to check host {self.hostname!r} has been "
+                      "rebooted", exc_info=True)
+            self.ssh_client.close()
+            return False
+
+        if rebooted:
+            self.ssh_time = tobiko.time()
+            LOG.info(f"Host {self.hostname!r} recovered: {self}")
+        else:
+            LOG.debug(f"Host {self.hostname!r} still not rebooted "
+                      f"{tobiko.time() - self.start_time} seconds after "
+                      "start time")
+        return rebooted
+
+    def __repr__(self):
+        return (f"{type(self).__name__}({self.hostname!r}, "
+                f"downtime={self.downtime}, "
+                f"time_to_ssh={self.time_to_ssh}, "
+                f"ssh_attempts={self.ssh_attempts})")
+
+
+def wait_for_hosts_recovery(recoveries: typing.Iterable[HostRecovery],
+                            timeout: tobiko.Seconds = None,
+                            interval: tobiko.Seconds = None) -> \
+        typing.List[HostRecovery]:
+    """Poll many rebooting hosts at once until all of them are recovered
+
+    :raises HostsRecoveryTimeoutError: if any host is not recovered before
+        the timeout expires
+    """
+    recoveries = list(recoveries)
+    pending = list(recoveries)
+    for attempt in tobiko.retry(timeout=timeout,
+                                interval=interval,
+                                default_timeout=600.,
+                                default_interval=5.):
+        calls = tobiko.run_concurrently(
+            {recovery: recovery.poll for recovery in pending},
+            synchronized=False)
+        pending = [recovery
+                   for recovery, call in calls.items()
+                   if not (call.succeeded and call.result)]
+        if not pending:
+            break
+        LOG.debug("Waiting for hosts to recover: "
+                  f"{[recovery.hostname for recovery in pending]} "
+                  f"(attempt={attempt})")
+        if attempt.is_last:
+            raise HostsRecoveryTimeoutError(
+                hostnames=[recovery.hostname for recovery in pending],
+                timeout=attempt.timeout)
+    return recoveries
@@ -16,6 +16,7 @@
 from __future__ import absolute_import
 
 import collections
+import json
 import re
 import typing
 
@@ -64,7 +65,9 @@ def systemctl_command(command: str,
                       no_pager: bool = None,
                       plain: bool = None,
                       state: str = None,
-                      type: str = None) \
+                      type: str = None,
+                      output: str = None,
+                      properties: typing.Iterable[str] = None) \
         -> _command.ShellCommand:
     command_line = _command.shell_command('systemctl') + command
     if all:
@@ -77,6 +80,10 @@ def systemctl_command(command: str,
         command_line += f'"--state={state}"'
     if type is not None:
         command_line += f'-t "{type}"'
+    if output is not None:
+        command_line += f'--output={output}'
+    if properties is not None:
+        command_line += ['-p', ','.join(properties)]
     if units:
         command_line += get_systemd_unit_names(*units)
     return command_line
@@ -89,12 +96,35 @@ def list_systemd_units(*units: SystemdUnitType,
                        ssh_client: ssh.SSHClientType = None,
                        sudo: bool = None) \
         -> tobiko.Selection[SystemdUnit]:
+    # systemd >= 246 can produce JSON output, while older versions
+    # silently ignore this option and produce a text table
     command = systemctl_command('list-units', *units, all=all,
                                 no_pager=True, plain=True, state=state,
-                                type=type)
+                                type=type, output='json')
     output = _execute.execute(command,
                               ssh_client=ssh_client,
                               sudo=sudo).stdout
+    if output.lstrip().startswith('['):
+        return parse_systemd_units_json(output)
+    return parse_systemd_units_table(output, command=command)
+
+
+def parse_systemd_units_json(output: str) \
+        -> tobiko.Selection[SystemdUnit]:
+    result = tobiko.Selection[SystemdUnit]()
+    for data in json.loads(output):
+        result.append(SystemdUnit(unit=data.get('unit', ''),
+                                  load=data.get('load', ''),
+                                  active=data.get('active', ''),
+                                  sub=data.get('sub', ''),
+                                  description=data.get('description', ''),
+                                  data=data))
+    return result
+
+
+def parse_systemd_units_table(output: str,
+                              command: _command.ShellCommandType = None) \
+        -> tobiko.Selection[SystemdUnit]:
     result = tobiko.Selection[SystemdUnit]()
     if output.startswith('0 loaded units listed.'):
         return result
@@ -134,6 +164,46 @@ def list_systemd_units(*units: SystemdUnitType,
     return result
 
 
+SYSTEMD_UNIT_PROPERTIES = ('Id', 'LoadState', 'ActiveState', 'SubState',
+                           'MainPID')
+
+
+def show_systemd_units(*units: SystemdUnitType,
+                       properties: typing.Iterable[str] = None,
+                       ssh_client: ssh.SSHClientType = None,
+                       sudo: bool = None) -> tobiko.TableData:
+    """Get properties of given units as a table (one row per unit)
+
+    It uses 'systemctl show', whose 'Name=value' output is stable across
+    systemd versions and doesn't need to be parsed by columns position.
+    """
+    if properties is None:
+        properties = SYSTEMD_UNIT_PROPERTIES
+    properties = list(properties)
+    command = systemctl_command('show', *units, no_pager=True,
+                                properties=properties)
+    output = _execute.execute(command,
+                              ssh_client=ssh_client,
+                              sudo=sudo).stdout
+    return parse_systemctl_show(output, properties=properties)
+
+
+def parse_systemctl_show(output: str,
+                         properties: typing.Iterable[str]) \
+        -> tobiko.TableData:
+    properties = list(properties)
+    rows = []
+    # Units properties are separated by an empty line
+    for block in output.strip().split('\n\n'):
+        values = dict.fromkeys(properties, '')
+        for line in block.splitlines():
+            name, _, value = line.partition('=')
+            if name in values:
+                values[name] = value
+        rows.append(tuple(values[name] for name in properties))
+    return tobiko.TableData(rows, columns=properties)
+
+
 def stop_systemd_units(*units: SystemdUnitType,
                        ssh_client: ssh.SSHClientType = None):
     command = systemctl_command('stop', *units)
@@ -0,0 +1,72 @@
+# Copyright (c) 2026 Red Hat
+# All Rights Reserved.
+#
+#    Licensed under the Apache License, Version 2.0 (the "License"); you may
+#    not use this file except in compliance with the License. You may obtain
+#    a copy of the License at
+#
+#         http://www.apache.org/licenses/LICENSE-2.0
+#
+#    Unless required by applicable law or agreed to in writing, software
+#    distributed under the License is distributed on an "AS IS" BASIS, WITHOUT
+#    WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied. See the
+#    License for the specific language governing permissions and limitations
+#    under the License.
+from __future__ import absolute_import
+
+import typing
+
+from oslo_log import log
+
+import tobiko
+
+
+LOG = log.getLogger(__name__)
+
+
+ColumnConverter = typing.Callable[[str], typing.Any]
+
+
+def parse_table_columns(
+        output: typing.Union[str, typing.Iterable[str]],
+        columns: typing.Sequence[str],
+        sep: str = None,
+        converters: typing.Mapping[str, ColumnConverter] = None,
+        skip_lines: int = 0) -> tobiko.TableData:
+    """Parse headless table output of a command having fixed columns
+
+    Every line is split in at most len(columns) fields, so that only the
+    last column can contain separators (like a process command line).
+    Values are then converted column by column instead of row by row.
+    Lines that have less fields than expected are logged and skipped.
+
+    :param sep: fields separator. By default any sequence of white spaces
+    :param converters: functions used to convert string values of some
+        columns, indexed by column name
+    """
+    if isinstance(output, str):
+        output = output.splitlines()
+    lines = list(output)[skip_lines:]
+    columns = list(columns)
+    maxsplit = len(columns) - 1
+    rows = []
+    for line in lines:
+        if sep is None:
+            row = line.split(None, maxsplit)
+        else:
+            row = line.rstrip('\r\n').split(sep, maxsplit)
+        if len(row) == len(columns):
+            rows.append(row)
+        elif line.strip():
+            LOG.debug(f'Skip table line with unexpected format: {line!r}')
+    if not rows:
+        return tobiko.TableData()
+
+    values: typing.List[typing.List[typing.Any]]
+    values = [list(column_values) for column_values in zip(*rows)]
+    for position, name in enumerate(columns):
+        converter = converters.get(name) if converters else None
+        if converter is not None:
+            values[position] = [converter(value)
+                                for value in values[position]]
+    return tobiko.TableData.from_columns(columns, values)
@@ -40,3 +40,22 @@ def get_uptime(**execute_params):
     uptime_line = output.splitlines()[0]
     uptime_string = uptime_line.split()[0]
     return float(uptime_string)
+
+
+class BootIdError(tobiko.TobikoException):
+    message = "Unable to get boot ID from host: {error}"
+
+
+def get_boot_id(**execute_params) -> str:
+    """Returns a random UUID generated by the kernel on every host boot
+
+    Differently from uptime it doesn't need to be compared with the time the
+    host has been rebooted to tell a reboot happened.
+    """
+    result = _execute.execute('cat /proc/sys/kernel/random/boot_id',
+                              stdin=False, stdout=True, stderr=True,
+                              expect_exit_status=None, **execute_params)
+    output = result.stdout and result.stdout.strip()
+    if result.exit_status or not output:
+        raise BootIdError(error=result.stderr)
+    return output.splitlines()[0].strip()
@@ -314,6 +314,55 @@ def tcp_connected(src_address: str = '',
                **exec_params)
 
 
+#: columns printed by "ss -Hn -t" (or -u). A single socket type means
+#: there is no Netid column
+SS_TCP_COLUMNS = ('state', 'recv_q', 'send_q', 'local', 'remote')
+
+#: columns printed by "ss -Hn -x". Unix sockets have many types (u_str,
+#: u_dgr, ...), therefore the Netid column is printed
+SS_UNIX_COLUMNS = ('netid', 'state', 'recv_q', 'send_q', 'local_addr',
+                   'local_port', 'remote_addr', 'remote_port')
+
+
+def get_sockets_columns(params: str) -> typing.Sequence[str]:
+    if {'-x', '--unix'}.intersection(params.split()):
+        return SS_UNIX_COLUMNS
+    return SS_TCP_COLUMNS
+
+
+def list_sockets(params: str = '-t',
+                 columns: typing.Sequence[str] = None,
+                 ssh_client: ssh.SSHClientFixture = None,
+                 **execute_params) -> tobiko.TableData:
+    """List sockets as a table of raw string values
+
+    Unlike tcp_listening or unix_listening, processes owning the sockets
+    are not looked up (which is the most expensive part of ss execution)
+    and lines are parsed by columns.
+
+    :param params: ss parameters selecting a single socket type, like
+        '-t', '-u' or '-x'
+    :param columns: names of the fields printed by ss with the given
+        parameters. By default SS_UNIX_COLUMNS are used for unix sockets
+        and SS_TCP_COLUMNS for any other ones. They have to be given
+        when ss omits some column (like State when a state filter
+        selects a single state)
+    """
+    if columns is None:
+        columns = get_sockets_columns(params)
+    execute_params.setdefault('sudo', True)
+    command_line = f"ss -Hn {params}"
+    try:
+        stdout = sh.execute(command_line,
+                            ssh_client=ssh_client,
+                            **execute_params).stdout
+    except sh.ShellCommandFailed as ex:
+        if ex.stdout.startswith('Error'):
+            raise SocketLookupError(cmd=command_line, err=ex.stderr) from ex
+        raise
+    return sh.parse_table_columns(stdout, columns=columns)
+
+
 def unix_listening(file_name: str = '',
                    **exec_params) -> typing.List[SockData]:
     """List of unix sockets in listening state
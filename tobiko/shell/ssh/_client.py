@@ -653,7 +653,8 @@ def ssh_connect(hostname, username=None, port=None, connection_interval=None,
                                 interval=connection_interval,
                                 default_count=60,
                                 default_timeout=300.,
-                                default_interval=5.):
+                                default_interval=5.,
+                                default_backoff='exponential'):
         LOG.debug(f"Logging in to '{login}'...\n"
                   f"  - parameters: {parameters}\n"
                   f"  - attempt: {attempt.details}\n")
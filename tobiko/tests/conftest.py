@@ -32,6 +32,11 @@ REPORT_NAME = (
     os.environ.get('TOX_REPORT_NAME') or
     'tobiko_results')
 
+# Timing columns added to the HTML report
+TIMING_COLUMNS = {tobiko.API_TIMING: 'API time',
+                  tobiko.SHELL_TIMING: 'Shell time',
+                  tobiko.SLEEP_TIMING: 'Sleep time'}
+
 
 @pytest.hookimpl
 def pytest_configure(config):
@@ -143,12 +148,19 @@ def pytest_html_results_table_header(cells):
     cells.insert(
         1, '<th class="sortable time" data-column-type="time">Time</th>')
     cells.pop()
+    for kind, title in TIMING_COLUMNS.items():
+        cells.append(f'<th class="sortable" data-column-type="{kind}">'
+                     f'{title}</th>')
 
 
 def pytest_html_results_table_row(report, cells):
     cells.insert(2, f'<td>{getattr(report, "description", "")}</td>')
     cells.insert(1, f'<td class="col-time">{datetime.utcnow()}</td>')
     cells.pop()
+    timings = getattr(report, 'timings', {})
+    for kind in TIMING_COLUMNS:
+        cells.append(f'<td class="col-{kind}">'
+                     f'{timings.get(kind, 0.):.3f}</td>')
 
 
 @pytest.hookimpl(hookwrapper=True)
@@ -157,6 +169,40 @@ def pytest_runtest_makereport(item, call):
     outcome = yield
     report = outcome.get_result()
     report.description = getattr(item.function, '__doc__', '')
+    report.timings = tobiko.get_timing_recorder().get_totals(
+        test_id=item.nodeid)
+
+
+@pytest.hookimpl(hookwrapper=True)
+def pytest_runtest_protocol(item, nextitem):
+    # pylint: disable=unused-argument
+    # Timing samples are recorded by test case
+    recorder = tobiko.get_timing_recorder()
+    recorder.test_id = item.nodeid
+    try:
+        yield
+    finally:
+        recorder.test_id = None
+
+
+def pytest_sessionfinish(session):
+    write_timing_stats(session.config)
+
+
+def write_timing_stats(config):
+    """Write timing stats as JSON next to the HTML report"""
+    html_path = getattr(config.option, 'htmlpath', None)
+    recorder = tobiko.get_timing_recorder()
+    if not html_path or not recorder.list_test_ids():
+        return
+    # every xdist worker writes its own stats
+    worker_id = os.environ.get('PYTEST_XDIST_WORKER')
+    suffix = f'_{worker_id}' if worker_id else ''
+    path = f'{os.path.splitext(html_path)[0]}_timings{suffix}.json'
+    try:
+        recorder.dump_json(path)
+    except OSError:
+        LOG.exception(f"Unable to write timing stats to '{path}'")
 
 
 def pytest_html_report_title(report):
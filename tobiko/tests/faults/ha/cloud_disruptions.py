@@ -133,18 +133,9 @@ def disrupt_node(node_name, disrupt_method=network_disruption):
 
 
 def check_overcloud_node_uptime(ssh_client, start_time):
-    for attempt in tobiko.retry(timeout=600., interval=10.):
-        try:
-            uptime = sh.get_uptime(ssh_client=ssh_client, timeout=15.)
-        except sh.UptimeError:
-            LOG.exception('uptime command failed')
-            uptime = None
-
-        if uptime and uptime < (tobiko.time() - start_time):
-            LOG.debug('Reboot has been completed')
-            break
-        else:
-            attempt.check_limits()
+    recovery = sh.HostRecovery(ssh_client=ssh_client, start_time=start_time)
+    sh.wait_for_hosts_recovery([recovery], timeout=600., interval=10.)
+    LOG.debug(f'Reboot has been completed: {recovery}')
 
 
 def reboot_node(node_name, wait=True, reboot_method=sh.hard_reset_method):
@@ -208,11 +199,15 @@ def disrupt_all_controller_nodes(disrupt_method=sh.hard_reset_method,
     if exclude_list:
         nodes = [node for node in nodes if node.name not in exclude_list]
 
+    if not sequentially:
+        disrupt_nodes_concurrently(nodes, disrupt_method=disrupt_method)
+        return
+
     start_time = {}
     for controller in nodes:
         start_time[controller.name] = tobiko.time()
         if isinstance(disrupt_method, sh.RebootHostMethod):
-            reboot_node(controller.name, wait=sequentially,
+            reboot_node(controller.name, wait=True,
                         reboot_method=disrupt_method)
         else:
             # using ssh_client.connect we use a fire and forget reboot method
@@ -220,20 +215,51 @@ def disrupt_all_controller_nodes(disrupt_method=sh.hard_reset_method,
             LOG.info('disrupt exec: {} on server: {}'.format(disrupt_method,
                                                              controller.name))
             tobiko.cleanup_fixture(controller.ssh_client)
-            if sequentially and is_network_disruption(disrupt_method):
+            if is_network_disruption(disrupt_method):
                 check_overcloud_node_uptime(
                     controller.ssh_client, start_time[controller.name])
-        if sequentially:
-            check_overcloud_node_responsive(controller)
+        check_overcloud_node_responsive(controller)
 
-    if not sequentially:
-        for controller in nodes:
-            if isinstance(disrupt_method, sh.RebootHostMethod) \
-                    or is_network_disruption(disrupt_method):
-                check_overcloud_node_uptime(
-                    controller.ssh_client, start_time[controller.name])
-            else:
-                check_overcloud_node_responsive(controller)
+
+def disrupt_nodes_concurrently(nodes, disrupt_method=sh.hard_reset_method):
+    """Disrupt all given nodes at the same time and wait for them
+
+    Recovery of every node is checked against the time its own disruption
+    started.
+    """
+
+    def disrupt(node):
+        boot_id = None
+        if isinstance(disrupt_method, sh.RebootHostMethod):
+            boot_id = sh.reboot_host(ssh_client=node.ssh_client, wait=False,
+                                     method=disrupt_method).boot_id
+        else:
+            # using ssh_client.connect we use a fire and forget reboot method
+            node.ssh_client.connect().exec_command(disrupt_method)
+        LOG.info('disrupt exec: {} on server: {}'.format(disrupt_method,
+                                                         node.name))
+        tobiko.cleanup_fixture(node.ssh_client)
+        return boot_id
+
+    def check_responsive(node, disruption_call):
+        check_overcloud_node_responsive(node)
+
+    disruption = topology.disrupt_nodes(nodes, disrupt)
+    if isinstance(disrupt_method, sh.RebootHostMethod) \
+            or is_network_disruption(disrupt_method):
+        # all nodes are probed at once, each one against the time its
+        # own disruption started
+        recoveries = [
+            sh.HostRecovery(ssh_client=node.ssh_client,
+                            start_time=disruption.calls[node.name].start_time,
+                            boot_id=disruption.calls[node.name].result)
+            for node in nodes]
+        sh.wait_for_hosts_recovery(recoveries, timeout=600., interval=10.)
+        for recovery in recoveries:
+            LOG.info(f'Reboot has been completed: {recovery}')
+    else:
+        topology.wait_for_nodes_recovery(disruption, check_responsive)
+    return disruption
 
 
 def reboot_all_controller_nodes(reboot_method=sh.hard_reset_method,
@@ -252,18 +278,16 @@ def reboot_all_controller_nodes(reboot_method=sh.hard_reset_method,
     if exclude_list:
         nodes = [node for node in nodes if node.name not in exclude_list]
 
-    start_time = {}
+    if not sequentially:
+        disrupt_nodes_concurrently(nodes, disrupt_method=reboot_method)
+        return
+
     for controller in nodes:
-        start_time[controller.name] = tobiko.time()
-        sh.reboot_host(ssh_client=controller.ssh_client, wait=sequentially,
+        sh.reboot_host(ssh_client=controller.ssh_client, wait=True,
                        method=reboot_method)
         LOG.info('reboot exec: {} on server: {}'.format(reboot_method,
                                                         controller.name))
         tobiko.cleanup_fixture(controller.ssh_client)
-    if not sequentially:
-        for controller in nodes:
-            check_overcloud_node_uptime(
-                controller.ssh_client, start_time[controller.name])
 
 
 def is_ipv6addr_main_vip():
@@ -523,24 +547,33 @@ def reset_all_compute_nodes(hard_reset=False, sequentially=False):
         reset_method = sh.soft_reset_method
 
     nodes = topology.list_openstack_nodes(group='compute')
-    compute_reboot_operation_list = []
-    for compute in nodes:
+    if sequentially:
+        for compute in nodes:
+            sh.reboot_host(ssh_client=compute.ssh_client, wait=True,
+                           method=reset_method)
+            LOG.info('reboot exec:  {} on server: {}'.format(reset_method,
+                                                             compute.name))
+        return
+
+    def reboot(compute):
         # using ssh_client.connect we use a fire and forget reboot method
-        # if sequentially, then wait and check uptime has changed
-        # else, do not wait (uptime will be checked later)
+        # uptime will be checked later
         reboot_operation = sh.reboot_host(ssh_client=compute.ssh_client,
-                                          wait=sequentially,
+                                          wait=False,
                                           method=reset_method)
-        compute_reboot_operation_list.append(reboot_operation)
         LOG.info('reboot exec:  {} on server: {}'.format(reset_method,
                                                          compute.name))
+        return reboot_operation
 
-    if not sequentially:
-        for reboot_operation in compute_reboot_operation_list:
-            # checking uptime on each compute - it should have been updated
-            # after the reboot is done
-            reboot_operation.wait_for_operation()
-            LOG.info(f'{reboot_operation.hostname} is up')
+    def wait_for_reboot(compute, reboot_call):
+        # checking uptime on each compute - it should have been updated
+        # after the reboot is done
+        reboot_operation = reboot_call.result
+        reboot_operation.wait_for_operation()
+        LOG.info(f'{reboot_operation.hostname} is up')
+
+    disruption = topology.disrupt_nodes(nodes, reboot)
+    topology.wait_for_nodes_recovery(disruption, wait_for_reboot)
 
 
 def reset_ovndb_pcs_master_resource():
@@ -585,11 +618,17 @@ def restart_service_on_all_nodes(service):
 
 
 def restart_service_on_nodes(service, nodes):
-    for node in nodes:
+    """stop the service on all the nodes at the same time, then start it
+    again on all of them at the same time"""
+    def stop_service(node):
         sh.stop_systemd_units(service, ssh_client=node.ssh_client)
-    for node in nodes:
+
+    def start_service(node):
         sh.start_systemd_units(service, ssh_client=node.ssh_client)
 
+    topology.disrupt_nodes(nodes, stop_service)
+    topology.disrupt_nodes(nodes, start_service)
+
 
 def kill_rabbitmq_service():
     """kill a rabbit process on a random controller,
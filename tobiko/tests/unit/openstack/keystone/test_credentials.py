@@ -21,6 +21,7 @@ import testtools
 import tobiko
 from tobiko import config
 from tobiko.openstack import keystone
+from tobiko.openstack.keystone import _credentials
 from tobiko.tests.unit import openstack
 
 
@@ -253,6 +254,25 @@ class DelegateKeystoneCredentialsFixtureTest(openstack.OpenstackTest):
         self.assertEqual(V3_PARAMS, fixture.credentials.to_dict())
 
 
+class GetKeystoneCloudIdentityTest(openstack.OpenstackTest):
+
+    def test_get_keystone_cloud_identity(self):
+        self.patch(_credentials, 'default_keystone_credentials',
+                   lambda: make_credentials(V3_PARAMS))
+        identity = keystone.get_keystone_cloud_identity()
+        self.assertIn('keystone.auth_url=http://10.0.0.1:5678/v3', identity)
+        self.assertIn('keystone.project_name=demo', identity)
+        self.assertIn(identity, tobiko.get_cloud_identity())
+
+    def test_get_keystone_cloud_identity_with_another_project(self):
+        self.patch(_credentials, 'default_keystone_credentials',
+                   lambda: make_credentials(V3_PARAMS))
+        identity = keystone.get_keystone_cloud_identity()
+        self.patch(_credentials, 'default_keystone_credentials',
+                   lambda: make_credentials(V3_PARAMS, project_name='admin'))
+        self.assertNotEqual(identity, keystone.get_keystone_cloud_identity())
+
+
 class SkipUnlessHasKeystoneCredentialsTest(openstack.OpenstackTest):
 
     def patch_has_keystone_credentials(self, return_value: bool):
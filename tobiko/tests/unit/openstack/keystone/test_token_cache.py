@@ -0,0 +1,121 @@
+# Copyright (c) 2026 Red Hat
+# All Rights Reserved.
+#
+#    Licensed under the Apache License, Version 2.0 (the "License"); you may
+#    not use this file except in compliance with the License. You may obtain
+#    a copy of the License at
+#
+#         http://www.apache.org/licenses/LICENSE-2.0
+#
+#    Unless required by applicable law or agreed to in writing, software
+#    distributed under the License is distributed on an "AS IS" BASIS, WITHOUT
+#    WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied. See the
+#    License for the specific language governing permissions and limitations
+#    under the License.
+from __future__ import absolute_import
+
+import contextlib
+import datetime
+import typing
+
+from keystoneauth1 import access
+from keystoneauth1.identity import v3
+
+import tobiko
+from tobiko.common import _lockutils
+from tobiko.openstack import keystone
+from tobiko.tests.unit import openstack
+from tobiko.tests.unit.openstack.keystone import test_session
+
+
+def make_access(token: str, lifetime: float) -> access.AccessInfo:
+    expires = (datetime.datetime.now(datetime.timezone.utc) +
+               datetime.timedelta(seconds=lifetime))
+    body: typing.Dict[str, typing.Any] = {
+        'token': {'expires_at': expires.strftime('%Y-%m-%dT%H:%M:%SZ'),
+                  'catalog': []}}
+    return access.create(body=body, auth_token=token)
+
+
+class KeystoneTokenCacheTest(openstack.OpenstackTest):
+
+    def setUp(self):
+        super(KeystoneTokenCacheTest, self).setUp()
+        self.patch(_lockutils, 'lock',
+                   lambda name: contextlib.nullcontext())
+        self.cache = tobiko.DiskCache(cache_dir=self.create_tempdir())
+        self.tokens: typing.List[str] = []
+
+    def create_auth(self, lifetime=3600.):
+        token_cache = keystone.KeystoneTokenCache(cache=self.cache,
+                                                  expiry_margin=300.,
+                                                  enabled=True)
+        credentials = test_session.CREDENTIALS
+        auth = v3.Password(auth_url=credentials.auth_url,
+                           username=credentials.username,
+                           password=credentials.password,
+                           project_name=credentials.project_name)
+
+        def get_auth_ref(session, **kwargs):
+            self.tokens.append(f'token-{len(self.tokens)}')
+            return make_access(self.tokens[-1], lifetime=lifetime)
+
+        auth.get_auth_ref = get_auth_ref
+        token_cache.setup_auth(credentials, auth)
+        return auth
+
+    def test_setup_auth(self):
+        auth1 = self.create_auth()
+        self.assertEqual('token-0', auth1.get_token(session=None))
+        auth2 = self.create_auth()
+        self.assertEqual('token-0', auth2.get_token(session=None))
+        self.assertEqual(['token-0'], self.tokens)
+
+    def test_setup_auth_with_expiring_token(self):
+        auth1 = self.create_auth(lifetime=200.)
+        self.assertEqual('token-0', auth1.get_token(session=None))
+        auth2 = self.create_auth(lifetime=200.)
+        self.assertEqual('token-1', auth2.get_token(session=None))
+
+    def test_setup_auth_reauthenticate(self):
+        auth1 = self.create_auth()
+        self.assertEqual('token-0', auth1.get_token(session=None))
+        auth1.auth_ref = make_access('token-0', lifetime=100.)
+        self.assertEqual('token-0', auth1.get_token(session=None))
+        # cached token is still valid
+        self.assertEqual(['token-0'], self.tokens)
+
+    def test_setup_auth_invalidate(self):
+        auth1 = self.create_auth()
+        self.assertEqual('token-0', auth1.get_token(session=None))
+        # token has been rejected: it must not be loaded from cache again
+        auth1.invalidate()
+        self.assertEqual('token-1', auth1.get_token(session=None))
+        auth2 = self.create_auth()
+        self.assertEqual('token-1', auth2.get_token(session=None))
+        self.assertEqual(['token-0', 'token-1'], self.tokens)
+
+    def test_setup_auth_invalidate_keeps_newer_token(self):
+        auth1 = self.create_auth()
+        auth2 = self.create_auth()
+        self.assertEqual('token-0', auth1.get_token(session=None))
+        self.assertEqual('token-0', auth2.get_token(session=None))
+        auth1.invalidate()
+        self.assertEqual('token-1', auth1.get_token(session=None))
+        auth2.invalidate()
+        self.assertEqual('token-1', auth2.get_token(session=None))
+        self.assertEqual(['token-0', 'token-1'], self.tokens)
+
+    def test_setup_auth_disabled(self):
+        token_cache = keystone.KeystoneTokenCache(cache=self.cache,
+                                                  enabled=False)
+        auth = v3.Password(auth_url='http://127.0.0.1/identity/v3',
+                           password='secret')
+        token_cache.setup_auth(test_session.CREDENTIALS, auth)
+        self.assertNotIn('get_access', vars(auth))
+
+    def test_get_key(self):
+        key = keystone.KeystoneTokenCache.get_key(test_session.CREDENTIALS)
+        self.assertNotIn(test_session.CREDENTIALS.password, key)
+        self.assertNotEqual(key, keystone.KeystoneTokenCache.get_key(
+            test_session.DEFAULT_CREDENTIALS))
@@ -158,3 +158,48 @@ class GetOvnControllerContainerPrefixTest(unit.TobikoUnitTest):
 
         result = self._get_prefix()
         self.assertEqual('', result)
+
+
+class SampleOvnDbHostsTest(unit.TobikoUnitTest):
+
+    @mock.patch('tobiko.podified.has_podified_cp', return_value=False)
+    @mock.patch(f'{TOPOLOGY_MODULE}.list_openstack_nodes')
+    @mock.patch(f'{OVN_MODULE}.sh.execute')
+    def test_sample_controllers(self, mock_execute, mock_list_nodes,
+                                _mock_podified):
+        mock_list_nodes.return_value = [
+            mock.MagicMock(hostname=f'controller-{i}') for i in range(3)]
+        mock_execute.side_effect = lambda command, ssh_client, sudo: (
+            mock.MagicMock(stdout=f'Role: follower\n{command}'))
+
+        calls = neutron.sample_ovn_db_hosts('nb', 'cluster/status')
+
+        self.assertEqual(['controller-0', 'controller-1', 'controller-2'],
+                         list(calls))
+        for call in calls.values():
+            self.assertTrue(call.succeeded)
+            self.assertIsNotNone(call.start_time)
+            self.assertEqual('Role: follower\ncluster/status', call.get())
+        self.assertEqual(3, mock_execute.call_count)
+
+    @mock.patch(f'{OVN_MODULE}.sample_ovn_db_hosts')
+    @mock.patch(f'{OVN_MODULE}.find_ovn_db_ctl_files',
+                return_value={'nb': '/ovnnb_db.ctl'})
+    def test_collect_raft_cluster_details(self, _mock_ctl_files,
+                                          mock_sample):
+        calls = {}
+        for host_id, role in [('controller-0', 'leader'),
+                              ('controller-1', 'follower')]:
+            call = mock.MagicMock(start_time=10., elapsed_time=.5)
+            call.get.return_value = f'Role: {role}\n'
+            calls[host_id] = call
+        mock_sample.return_value = calls
+
+        details = neutron.collect_raft_cluster_details('nb')
+
+        self.assertEqual(
+            [{'Role': 'leader', 'host': 'controller-0',
+              'sample_time': 10., 'latency': .5},
+             {'Role': 'follower', 'host': 'controller-1',
+              'sample_time': 10., 'latency': .5}],
+            details)
@@ -0,0 +1,166 @@
+# Copyright (c) 2026 Red Hat
+# All Rights Reserved.
+#
+#    Licensed under the Apache License, Version 2.0 (the "License"); you may
+#    not use this file except in compliance with the License. You may obtain
+#    a copy of the License at
+#
+#         http://www.apache.org/licenses/LICENSE-2.0
+#
+#    Unless required by applicable law or agreed to in writing, software
+#    distributed under the License is distributed on an "AS IS" BASIS, WITHOUT
+#    WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied. See the
+#    License for the specific language governing permissions and limitations
+#    under the License.
+from __future__ import absolute_import
+
+import json
+import socket
+from unittest import mock
+
+from tobiko.openstack import neutron
+from tobiko.openstack.neutron import _ovsdb
+from tobiko.tests import unit
+
+
+class JsonStreamReaderTest(unit.TobikoUnitTest):
+
+    def test_feed_split_messages(self):
+        messages = [{'id': 1, 'result': ['a{', '"b]\\']},
+                    {'method': 'update', 'params': [None, {}]}]
+        data = ''.join(json.dumps(message) for message in messages)
+        reader = _ovsdb.JsonStreamReader()
+        for i in range(len(data)):
+            reader.feed(data[i].encode())
+        self.assertEqual(messages, list(reader.messages))
+
+    def test_feed_multibyte_characters(self):
+        data = json.dumps({'name': 'café'}, ensure_ascii=False).encode()
+        reader = _ovsdb.JsonStreamReader()
+        for i in range(len(data)):
+            reader.feed(data[i:i + 1])
+        self.assertEqual([{'name': 'café'}], list(reader.messages))
+
+
+class OvsdbValueTest(unit.TobikoUnitTest):
+
+    def test_ovsdb_value(self):
+        self.assertEqual('x', _ovsdb.ovsdb_value('x'))
+        self.assertEqual('1234', _ovsdb.ovsdb_value(['uuid', '1234']))
+        self.assertEqual([1, 2], _ovsdb.ovsdb_value(['set', [1, 2]]))
+        self.assertEqual({'a': '1234'},
+                         _ovsdb.ovsdb_value(['map', [['a',
+                                                      ['uuid', '1234']]]]))
+
+
+class OvsdbClientTest(unit.TobikoUnitTest):
+
+    def setUp(self):
+        super(OvsdbClientTest, self).setUp()
+        self.client = neutron.OvsdbClient(address='/ovnnb_db.sock',
+                                          db_name='OVN_Northbound',
+                                          timeout=1.)
+        self.client.socket, self.server = socket.socketpair()
+        self.addCleanup(self.client.close)
+        self.addCleanup(self.server.close)
+
+    def reply(self, *messages):
+        for message in messages:
+            self.server.sendall(json.dumps(message).encode())
+
+    def requests(self):
+        reader = _ovsdb.JsonStreamReader()
+        self.server.settimeout(0.1)
+        try:
+            while True:
+                reader.feed(self.server.recv(65536))
+        except socket.timeout:
+            pass
+        return list(reader.messages)
+
+    def test_transact_select(self):
+        self.reply({'id': 1, 'error': None, 'result': [
+            {'rows': [{'name': 'sw0', 'ports': ['set', []]}]}]})
+        rows = self.client.select('Logical_Switch',
+                                  where=[['name', '==', 'sw0']])
+        self.assertEqual([{'name': 'sw0', 'ports': []}], rows)
+        request, = self.requests()
+        self.assertEqual('transact', request['method'])
+        self.assertEqual('OVN_Northbound', request['params'][0])
+
+    def test_call_error(self):
+        self.reply({'id': 1, 'error': 'unknown database', 'result': None})
+        self.assertRaises(neutron.OvsdbError, self.client.get_schema)
+
+    def test_monitor_and_poll_updates(self):
+        self.reply(
+            {'method': 'echo', 'params': [], 'id': 'echo'},
+            {'id': 1, 'error': None, 'result': {'Logical_Switch': {
+                'u1': {'new': {'name': 'sw1'}},
+                'u2': {'new': {'name': 'sw2'}}}}})
+        rows = self.client.monitor('Logical_Switch')
+        self.assertEqual({'u1': {'_uuid': 'u1', 'name': 'sw1'},
+                          'u2': {'_uuid': 'u2', 'name': 'sw2'}}, rows)
+
+        self.reply({'method': 'update', 'id': None, 'params': [
+            'Logical_Switch', {'Logical_Switch': {
+                'u1': {'old': {'name': 'sw1'}},
+                'u2': {'old': {'name': 'sw2'}, 'new': {'name': 'sw3'}}}}]})
+        rows = self.client.get_table('Logical_Switch')
+        self.assertEqual({'u2': {'_uuid': 'u2', 'name': 'sw3'}}, rows)
+
+        monitor_request, echo_reply = self.requests()
+        self.assertEqual('monitor', monitor_request['method'])
+        self.assertEqual({'id': 'echo', 'result': [], 'error': None},
+                         echo_reply)
+
+    def test_list_ovndb_rows(self):
+        self.client.tables['Logical_Switch'] = {
+            'u1': {'_uuid': 'u1', 'name': 'sw1'},
+            'u2': {'_uuid': 'u2', 'name': 'sw2'}}
+        rows = neutron.list_ovndb_rows(neutron.NBDB, 'Logical_Switch',
+                                       client=self.client, name='sw2')
+        self.assertEqual([{'_uuid': 'u2', 'name': 'sw2'}], rows)
+
+
+class OvsdbClientConnectTest(unit.TobikoUnitTest):
+
+    def setUp(self):
+        super(OvsdbClientConnectTest, self).setUp()
+        self.client = neutron.OvsdbClient(address='/ovnnb_db.sock',
+                                          db_name='OVN_Northbound',
+                                          timeout=1.)
+        sock, self.server = socket.socketpair()
+        self.addCleanup(self.client.close)
+        self.addCleanup(self.server.close)
+        # let the client open its own connection on first request
+        self.mock_socket = mock.Mock(wraps=sock)
+        self.mock_socket.connect = mock.Mock()
+        self.patch(_ovsdb.socket, 'socket', return_value=self.mock_socket)
+
+    def test_monitor_empty_table(self):
+        self.server.sendall(json.dumps(
+            {'id': 1, 'error': None, 'result': {}}).encode())
+        rows = self.client.monitor('Logical_Switch')
+        self.assertEqual({}, rows)
+        self.assertEqual({}, self.client.get_table('Logical_Switch'))
+        self.mock_socket.connect.assert_called_once_with('/ovnnb_db.sock')
+
+
+class ParseOvsdbConnectionTest(unit.TobikoUnitTest):
+
+    def test_parse_tcp_connection(self):
+        self.assertEqual(
+            ('192.168.1.1', 6641),
+            _ovsdb.parse_ovsdb_connection(
+                'tcp:192.168.1.1:6641,tcp:192.168.1.2:6641'))
+
+    def test_parse_ipv6_connection(self):
+        self.assertEqual(
+            ('fd00::1', 6641),
+            _ovsdb.parse_ovsdb_connection('tcp:[fd00::1]:6641'))
+
+    def test_parse_ssl_connection(self):
+        self.assertRaises(neutron.UnsupportedOvsdbConnection,
+                          _ovsdb.parse_ovsdb_connection,
+                          'ssl:192.168.1.1:6641 -p key -c cert -C ca')
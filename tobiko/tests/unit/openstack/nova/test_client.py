@@ -13,11 +13,14 @@
 #    under the License.
 from __future__ import absolute_import
 
+from unittest import mock
+
 import testtools
 
 from tobiko.openstack import keystone
 from tobiko.openstack import nova
 from tobiko.openstack.nova import _client
+from tobiko.tests import unit
 from tobiko.tests.unit import openstack
 from tobiko.tests.unit.openstack import test_client
 
@@ -91,3 +94,63 @@ class IsBootStuckTest(testtools.TestCase):
         output = ('Fedora Linux 42 (Cloud Edition)\n'
                   'localhost login: ')
         self.assertFalse(_client.is_boot_stuck(output))
+
+
+class WaitForServersStatusTest(unit.TobikoUnitTest):
+
+    def setUp(self):
+        super(WaitForServersStatusTest, self).setUp()
+        self.mock_time = self.patch_time()
+        self.client = mock.MagicMock(spec=nova.CLIENT_CLASSES[0])
+        self.client.servers = mock.MagicMock()
+
+    @staticmethod
+    def server(server_id, status, updated='2026-01-01T00:00:00Z'):
+        return mock.Mock(id=server_id, status=status, updated=updated)
+
+    def test_wait_for_servers_status(self):
+        self.client.servers.list.side_effect = [
+            [self.server('a', 'BUILD'), self.server('b', 'ACTIVE'),
+             self.server('c', 'ACTIVE')],
+            [self.server('a', 'ACTIVE', updated='2026-01-01T00:00:05Z')]]
+        servers = nova.wait_for_servers_status(servers=['a', 'b'],
+                                               status='ACTIVE',
+                                               client=self.client)
+        self.assertEqual(['a', 'b'], list(servers))
+        self.assertEqual({'ACTIVE'},
+                         {server.status for server in servers.values()})
+        self.assertEqual(
+            [mock.call(search_opts={}),
+             mock.call(search_opts={
+                 'changes-since': '2026-01-01T00:00:00Z'})],
+            self.client.servers.list.call_args_list)
+
+    def test_wait_for_servers_status_with_error(self):
+        self.client.servers.list.return_value = [
+            self.server('a', 'BUILD'), self.server('b', 'ERROR')]
+        ex = self.assertRaises(nova.WaitForServerStatusError,
+                               nova.wait_for_servers_status,
+                               servers=['a', 'b'],
+                               status='ACTIVE',
+                               client=self.client)
+        self.assertEqual('b', ex.server_id)
+        self.client.servers.list.assert_called_once()
+
+    def test_wait_for_servers_status_with_missing_server(self):
+        self.client.servers.list.return_value = [self.server('a', 'ACTIVE')]
+        self.assertRaises(nova.ServerNotFoundError,
+                          nova.wait_for_servers_status,
+                          servers=['a', 'b'],
+                          status='ACTIVE',
+                          client=self.client)
+
+    def test_wait_for_servers_status_with_timeout(self):
+        self.client.servers.list.return_value = [
+            self.server('a', 'ACTIVE'), self.server('b', 'BUILD')]
+        ex = self.assertRaises(nova.WaitForServersStatusTimeout,
+                               nova.wait_for_servers_status,
+                               servers=['a', 'b'],
+                               status='ACTIVE',
+                               client=self.client,
+                               timeout=10.)
+        self.assertEqual(['b'], ex.server_ids)
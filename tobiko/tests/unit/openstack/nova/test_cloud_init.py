@@ -13,10 +13,17 @@
 #    under the License.
 from __future__ import absolute_import
 
+import functools
+import os
+import time
+from unittest import mock
+
 import testtools
 
 import tobiko
 from tobiko.openstack import nova
+from tobiko.openstack.nova import _cloud_init
+from tobiko.tests import unit
 
 
 class TestUserData(testtools.TestCase):
@@ -56,3 +63,109 @@ class TestCloudConfig(testtools.TestCase):
         self.assertEqual({'runcmd': [['echo', '1'],
                                      ['echo', '2']]},
                          cloud_config)
+
+
+class TestCloudInitLogMonitor(unit.TobikoUnitTest):
+
+    def test_add_line(self):
+        monitor = nova.CloudInitLogMonitor(max_lines=2)
+        monitor.add_line(b'start: modules-config: running modules\n')
+        monitor.add_line('finish: modules-config: SUCCESS: running modules')
+        self.assertFalse(monitor.finished)
+        monitor.add_line('finish: modules-final: FAIL: running modules for '
+                         'final')
+        self.assertTrue(monitor.finished)
+        self.assertEqual('FAIL', monitor.result)
+        self.assertEqual(['finish: modules-config: SUCCESS: running modules',
+                          'finish: modules-final: FAIL: running modules for '
+                          'final'],
+                         monitor.last_lines)
+
+    def test_add_line_with_finished_message(self):
+        monitor = nova.CloudInitLogMonitor()
+        monitor.add_line('Cloud-init v. 23.4 finished at Mon, 19 Oct 2026 '
+                         '10:00:00 +0000. Datasource DataSourceOpenStack.  '
+                         'Up 42.00 seconds')
+        self.assertTrue(monitor.finished)
+        self.assertIsNone(monitor.result)
+
+    def test_follow_log_file(self):
+        filename = self.create_log_file()
+        monitor = nova.CloudInitLogMonitor(ssh_client=False,
+                                           filename=filename).start()
+        self.addCleanup(monitor.stop)
+        self.assertTrue(monitor.is_running)
+        self.assertFalse(monitor.wait_for_finished(timeout=.1))
+        self.finish_cloud_init(filename)
+        self.assertTrue(monitor.wait_for_finished(timeout=10.))
+        self.assertEqual('SUCCESS', monitor.result)
+
+    def test_wait_for_cloud_init_done(self):
+        filename = self.create_log_file()
+        self.patch(_cloud_init, 'CloudInitLogMonitor',
+                   functools.partial(nova.CloudInitLogMonitor,
+                                     filename=filename))
+        statuses = iter(['running', 'done'])
+
+        def get_status(**_kwargs):
+            status = next(statuses)
+            if status == 'running':
+                # cloud-init terminates after its status is checked for the
+                # first time
+                self.finish_cloud_init(filename)
+            return status
+
+        get_cloud_init_status = self.patch(
+            _cloud_init, 'get_cloud_init_status',
+            mock.Mock(side_effect=get_status))
+        start_time = time.time()
+        status = nova.wait_for_cloud_init_done(ssh_client=False,
+                                               timeout=60.,
+                                               sleep_interval=30.,
+                                               follow_log=True)
+        self.assertEqual('done', status)
+        self.assertEqual(2, get_cloud_init_status.call_count)
+        self.assertLess(time.time() - start_time, 20.)
+
+    def test_wait_for_next_status_check_without_timeout(self):
+        mock_time = self.patch_time(time_increment=0.)
+        attempt = tobiko.retry_attempt(number=1, timeout=None)
+        _cloud_init._wait_for_next_status_check(monitor=None,
+                                                attempt=attempt,
+                                                sleep_interval=3.)
+        mock_time.sleep.assert_called_once_with(3.)
+
+    def test_wait_for_next_status_check_with_monitor(self):
+        self.patch_time(time_increment=0.)
+        monitor = mock.Mock(spec=nova.CloudInitLogMonitor,
+                            is_running=True,
+                            last_lines=['start: modules-final'])
+        attempt = tobiko.retry_attempt(number=1, timeout=None)
+        _cloud_init._wait_for_next_status_check(monitor=monitor,
+                                                attempt=attempt,
+                                                sleep_interval=3.)
+        monitor.wait_for_finished.assert_called_once_with(
+            timeout=tobiko.tobiko_config().nova.cloud_init_poll_interval)
+
+    def test_wait_for_next_status_check_without_monitor_lines(self):
+        self.patch_time(time_increment=0.)
+        monitor = mock.Mock(spec=nova.CloudInitLogMonitor,
+                            is_running=True,
+                            last_lines=[])
+        attempt = tobiko.retry_attempt(number=1, timeout=None)
+        _cloud_init._wait_for_next_status_check(monitor=monitor,
+                                                attempt=attempt,
+                                                sleep_interval=3.)
+        monitor.wait_for_finished.assert_called_once_with(timeout=3.)
+
+    def create_log_file(self) -> str:
+        filename = os.path.join(self.create_tempdir(), 'cloud-init.log')
+        with open(filename, 'w') as fd:
+            fd.write('start: modules-final: running modules for final\n')
+        return filename
+
+    @staticmethod
+    def finish_cloud_init(filename: str):
+        with open(filename, 'a') as fd:
+            fd.write('finish: modules-final: SUCCESS: running modules for '
+                     'final\n')
@@ -0,0 +1,179 @@
+# Copyright 2026 Red Hat
+#
+#    Licensed under the Apache License, Version 2.0 (the "License"); you may
+#    not use this file except in compliance with the License. You may obtain
+#    a copy of the License at
+#
+#         http://www.apache.org/licenses/LICENSE-2.0
+#
+#    Unless required by applicable law or agreed to in writing, software
+#    distributed under the License is distributed on an "AS IS" BASIS, WITHOUT
+#    WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied. See the
+#    License for the specific language governing permissions and limitations
+#    under the License.
+from __future__ import absolute_import
+from __future__ import absolute_import
+
+import typing
+from unittest import mock
+
+import tobiko
+from tobiko.openstack import nova
+from tobiko.openstack.nova import _client
+from tobiko.tests import unit
+
+
+class FakeConsole(object):
+
+    def __init__(self, output: str = ''):
+        self.output = output
+        self.lengths: typing.List[int] = []
+
+    def write(self, text: str):
+        self.output += text
+
+    def get_console_output(self, server: str, length: int) -> str:
+        self.lengths.append(length)
+        lines = self.output.split('\n')
+        return '\n'.join(lines[-length - 1:])
+
+
+class ConsoleTestCase(unit.TobikoUnitTest):
+
+    def setUp(self):
+        super().setUp()
+        self.consoles: typing.Dict[str, FakeConsole] = {}
+        client = mock.MagicMock()
+        client.servers.get_console_output.side_effect = (
+            lambda **params: self.get_console_output(**params))
+        self.patch(_client, 'nova_client', return_value=client)
+
+    def get_console_output(self, server: str, length: int) -> str:
+        return self.consoles[server].get_console_output(server=server,
+                                                        length=length)
+
+    def create_console(self, server_id: str, output: str = '') -> FakeConsole:
+        console = self.consoles[server_id] = FakeConsole(output)
+        return console
+
+
+class ConsoleOutputReaderTest(ConsoleTestCase):
+
+    def test_read_lines(self):
+        console = self.create_console('server-1', 'line-1\nline-2\n')
+        reader = nova.ConsoleOutputReader('server-1', min_length=4)
+        self.assertEqual(['line-1', 'line-2'], reader.read_lines())
+        self.assertEqual(2, reader.lines_count)
+        self.assertEqual([], reader.read_lines())
+        console.write('line-3\n')
+        self.assertEqual(['line-3'], reader.read_lines())
+        self.assertEqual(3, reader.lines_count)
+
+    def test_read_lines_requests_tail(self):
+        console = self.create_console(
+            'server-1', ''.join(f'line-{i}\n' for i in range(100)))
+        reader = nova.ConsoleOutputReader('server-1', min_length=8)
+        self.assertEqual(100, len(reader.read_lines()))
+        console.write('line-100\n')
+        self.assertEqual(['line-100'], reader.read_lines())
+        console.write('line-101\n')
+        self.assertEqual(['line-101'], reader.read_lines())
+        self.assertEqual(102, reader.lines_count)
+        self.assertEqual([_client.MAX_SERVER_CONSOLE_OUTPUT_LENGTH, 200, 8],
+                         console.lengths)
+
+    def test_read_lines_grows_length(self):
+        console = self.create_console('server-1', 'line-0\n')
+        reader = nova.ConsoleOutputReader('server-1', min_length=4)
+        self.assertEqual(['line-0'], reader.read_lines())
+        new_lines = [f'line-{i}' for i in range(1, 50)]
+        console.write(''.join(f'{line}\n' for line in new_lines))
+        self.assertEqual(new_lines, reader.read_lines())
+        self.assertEqual(50, reader.lines_count)
+        self.assertGreater(reader.length, 4)
+
+    def test_read_lines_with_partial_line(self):
+        console = self.create_console('server-1', 'line-1\nlog')
+        reader = nova.ConsoleOutputReader('server-1')
+        self.assertEqual(['line-1'], reader.read_lines())
+        self.assertEqual('log', reader.partial_line)
+        console.write('in: ')
+        self.assertEqual([], reader.read_lines())
+        self.assertEqual('login: ', reader.partial_line)
+        console.write('\n')
+        self.assertEqual(['login: '], reader.read_lines())
+        self.assertEqual('', reader.partial_line)
+
+    def test_read_lines_without_output(self):
+        self.create_console('server-1')
+        reader = nova.ConsoleOutputReader('server-1')
+        self.assertEqual([], reader.read_lines())
+        self.assertEqual(0, reader.lines_count)
+
+
+class ConsoleLineMatcherTest(unit.TobikoUnitTest):
+
+    def test_match_any(self):
+        matcher = nova.ConsoleLineMatcher('a', 'b')
+        self.assertFalse(matcher.matched)
+        matcher.add_line('xbx')
+        self.assertTrue(matcher.matched)
+
+    def test_match_all(self):
+        matcher = nova.ConsoleLineMatcher('a', 'b', match_all=True)
+        matcher.add_line('xax')
+        self.assertFalse(matcher.matched)
+        self.assertTrue(matcher.match_line('b'))
+        self.assertFalse(matcher.matched)
+        matcher.add_line('xbx')
+        self.assertTrue(matcher.matched)
+
+    def test_ignore_case(self):
+        matcher = nova.ConsoleLineMatcher('Login:', ignore_case=True)
+        self.assertTrue(matcher.match_line('host LOGIN: '))
+
+
+class WaitForGuestsOsReadyTest(ConsoleTestCase):
+
+    def setUp(self):
+        super().setUp()
+        self.patch_time(time_increment=0.)
+
+    def test_wait_for_guests_os_ready(self):
+        self.create_console('server-1', 'booting\nhost login: ')
+        self.create_console('server-2', 'booting\nhost login:\n')
+        ready_times = nova.wait_for_guests_os_ready(['server-1', 'server-2'])
+        self.assertEqual({'server-1', 'server-2'}, set(ready_times))
+
+    def test_wait_for_guest_os_ready(self):
+        console = self.create_console('server-1', 'booting\n')
+        calls = []
+
+        def get_console_output(server: str, length: int) -> str:
+            calls.append(length)
+            if len(calls) == 3:
+                console.write('host login: ')
+            return console.get_console_output(server=server, length=length)
+
+        self.get_console_output = get_console_output
+        nova.wait_for_guest_os_ready(server_id='server-1', interval=5.)
+        self.assertEqual(3, len(calls))
+
+    def test_wait_for_guests_os_ready_when_boot_stuck(self):
+        self.create_console('server-1', 'host login: ')
+        self.create_console('server-2', (
+            'Buffer I/O error, dev vda1\n'
+            'EXT4-fs (vda1): Remounting filesystem read-only\n'
+            'I/O error, dev vda, sector 123\n'
+            'EXT4-fs: forced readonly\n'))
+        ex = self.assertRaises(nova.BootStuckError,
+                               nova.wait_for_guests_os_ready,
+                               ['server-1', 'server-2'])
+        self.assertIn('server-2', str(ex))
+
+    def test_wait_for_guests_os_ready_timeout(self):
+        self.patch_time(time_increment=1.)
+        self.create_console('server-1', 'booting\n')
+        self.assertRaises(tobiko.RetryTimeLimitError,
+                          nova.wait_for_guests_os_ready,
+                          ['server-1'], timeout=10., interval=5.)
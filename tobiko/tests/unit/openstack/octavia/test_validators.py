@@ -0,0 +1,87 @@
+# Copyright (c) 2026 Red Hat
+# All Rights Reserved.
+#
+#    Licensed under the Apache License, Version 2.0 (the "License"); you may
+#    not use this file except in compliance with the License. You may obtain
+#    a copy of the License at
+#
+#         http://www.apache.org/licenses/LICENSE-2.0
+#
+#    Unless required by applicable law or agreed to in writing, software
+#    distributed under the License is distributed on an "AS IS" BASIS, WITHOUT
+#    WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied. See the
+#    License for the specific language governing permissions and limitations
+#    under the License.
+from __future__ import absolute_import
+
+from tobiko.openstack import octavia
+from tobiko.shell import curl
+from tobiko.tests import unit
+
+
+def make_traffic(*responses):
+    return curl.CurlTraffic(
+        curl.CurlResponse(content=content, http_code=http_code,
+                          exit_status=exit_status, time_total=0.01)
+        for content, http_code, exit_status in responses)
+
+
+class CheckMembersBalancedTest(unit.TobikoUnitTest):
+
+    def setUp(self):
+        super(CheckMembersBalancedTest, self).setUp()
+        self.generate_curl_traffic = self.patch(curl,
+                                                'generate_curl_traffic')
+
+    def check_members_balanced(self, **params):
+        params.setdefault('lb_algorithm', 'ROUND_ROBIN')
+        params.setdefault('interval', None)
+        return octavia.check_members_balanced(ip_address='10.0.0.1',
+                                              protocol='HTTP',
+                                              port=80,
+                                              members_count=2,
+                                              requests_count=2,
+                                              **params)
+
+    def test_check_members_balanced(self):
+        self.generate_curl_traffic.return_value = make_traffic(
+            ('m1', 200, 0), ('m2', 200, 0), ('m1', 200, 0), ('m2', 200, 0))
+        replies = self.check_members_balanced()
+        self.assertEqual({'m1': 2, 'm2': 2}, replies)
+        self.generate_curl_traffic.assert_called_once_with(
+            hostname='10.0.0.1', scheme='HTTP', port=80, path='id',
+            requests_count=4, connect_timeout=10., ssh_client=None)
+
+    def test_check_members_balanced_not_round_robin(self):
+        self.generate_curl_traffic.return_value = make_traffic(
+            ('m1', 200, 0), ('m1', 200, 0), ('m2', 200, 0), ('m2', 200, 0))
+        self.assertRaises(octavia.RoundRobinException,
+                          self.check_members_balanced)
+
+    def test_check_members_balanced_missing_member(self):
+        self.generate_curl_traffic.return_value = make_traffic(
+            ('m1', 200, 0), ('m1', 200, 0), ('m1', 200, 0), ('m1', 200, 0))
+        self.assertRaises(octavia.RoundRobinException,
+                          self.check_members_balanced,
+                          lb_algorithm='SOURCE_IP_PORT')
+
+    def test_check_members_balanced_timeout(self):
+        self.generate_curl_traffic.return_value = make_traffic(
+            ('m1', 200, 0), ('', 0, 28), ('m1', 200, 0), ('m2', 200, 0))
+        self.assertRaises(octavia.TrafficTimeoutError,
+                          self.check_members_balanced)
+
+    def test_check_members_balanced_failure(self):
+        self.generate_curl_traffic.return_value = make_traffic(
+            ('m1', 200, 0), ('m2', 200, 0), ('', 503, 22))
+        self.assertRaises(octavia.RequestException,
+                          self.check_members_balanced)
+
+    def test_check_members_balanced_with_interval(self):
+        execute_curl = self.patch(curl, 'execute_curl',
+                                  side_effect=['m1', 'm2', 'm1', 'm2'])
+        self.patch_time()
+        replies = self.check_members_balanced(interval=1.)
+        self.assertEqual({'m1': 2, 'm2': 2}, replies)
+        self.assertEqual(4, execute_curl.call_count)
+        self.generate_curl_traffic.assert_not_called()
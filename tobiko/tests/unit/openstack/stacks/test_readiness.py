@@ -0,0 +1,93 @@
+# Copyright (c) 2026 Red Hat
+# All Rights Reserved.
+#
+#    Licensed under the Apache License, Version 2.0 (the "License"); you may
+#    not use this file except in compliance with the License. You may obtain
+#    a copy of the License at
+#
+#         http://www.apache.org/licenses/LICENSE-2.0
+#
+#    Unless required by applicable law or agreed to in writing, software
+#    distributed under the License is distributed on an "AS IS" BASIS, WITHOUT
+#    WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied. See the
+#    License for the specific language governing permissions and limitations
+#    under the License.
+from __future__ import absolute_import
+
+import threading
+
+import tobiko
+from tobiko.openstack import stacks
+from tobiko.openstack.stacks import _readiness
+from tobiko.tests import unit
+
+
+class FakeServerFixture(tobiko.SharedFixture):
+
+    def __init__(self, name: str, error: Exception = None):
+        super().__init__()
+        self.name = name
+        self.error = error
+        self.deferred = None
+        self.started = threading.Event()
+        self.release = threading.Event()
+
+    def setup_fixture(self):
+        self.deferred = _readiness.is_server_readiness_deferred(self)
+
+    def wait_for_ready(self, readiness: stacks.ServerReadiness = None):
+        assert readiness is not None
+        with readiness.step('guest_os'):
+            self.started.set()
+            self.release.wait(timeout=10.)
+        if self.error is not None:
+            raise self.error
+
+
+def fake_server(index: int, error: Exception = None) -> FakeServerFixture:
+    # fixtures are identified by their class name
+    cls = type(f'FakeServer{index}Fixture', (FakeServerFixture,), {})
+    return cls(name=f'server-{index}', error=error)
+
+
+class WaitForServersReadyTest(unit.TobikoUnitTest):
+
+    def test_wait_for_servers_ready(self):
+        servers = [fake_server(i) for i in range(3)]
+
+        def release_all():
+            # every server starts waiting before any of them gets ready
+            for server in servers:
+                server.started.wait(timeout=10.)
+            for server in servers:
+                server.release.set()
+
+        thread = threading.Thread(target=release_all)
+        thread.start()
+        readiness = stacks.wait_for_servers_ready(servers)
+        thread.join()
+
+        self.assertEqual([True] * 3,
+                         [server.deferred for server in servers])
+        self.assertFalse(_readiness.is_server_readiness_deferred(servers[0]))
+        self.assertEqual(
+            [tobiko.get_fixture_name(server) for server in servers],
+            list(readiness))
+        self.assertEqual(readiness, readiness.ready)
+        for server_readiness in readiness.values():
+            self.assertIsNotNone(server_readiness.ready_time)
+            self.assertEqual(['guest_os'], list(server_readiness.steps))
+
+    def test_wait_for_servers_ready_with_failure(self):
+        error = RuntimeError('boot failed')
+        servers = [fake_server(0), fake_server(1, error=error)]
+        for server in servers:
+            server.release.set()
+        ex = self.assertRaises(RuntimeError, stacks.wait_for_servers_ready,
+                               servers)
+        self.assertIs(error, ex)
+
+        readiness = stacks.wait_for_servers_ready(servers, check=False)
+        name = tobiko.get_fixture_name(servers[1])
+        self.assertEqual([name], list(readiness.not_ready))
+        self.assertIs(error, readiness[name].exc_info.value)
@@ -0,0 +1,86 @@
+# Copyright (c) 2026 Red Hat
+# All Rights Reserved.
+#
+#    Licensed under the Apache License, Version 2.0 (the "License"); you may
+#    not use this file except in compliance with the License. You may obtain
+#    a copy of the License at
+#
+#         http://www.apache.org/licenses/LICENSE-2.0
+#
+#    Unless required by applicable law or agreed to in writing, software
+#    distributed under the License is distributed on an "AS IS" BASIS, WITHOUT
+#    WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied. See the
+#    License for the specific language governing permissions and limitations
+#    under the License.
+from __future__ import absolute_import
+
+import typing
+
+from tobiko import openstack
+from tobiko.openstack import _cache
+from tobiko.tests import unit
+
+
+class OpenstackApiCacheTest(unit.TobikoUnitTest):
+
+    def setUp(self):
+        super(OpenstackApiCacheTest, self).setUp()
+        self.cache = openstack.OpenstackApiCache(enabled=True, ttl=5.,
+                                                 ttls={'agents': 10.})
+        self.patch(_cache, 'API_CACHE', self.cache)
+        self.patch_time(current_time=100., time_increment=0.)
+        self.calls: typing.List[typing.Any] = []
+
+        @openstack.cached_api_call('servers')
+        def list_servers(**params):
+            self.calls.append(params)
+            return [f'server-{len(self.calls)}']
+
+        @openstack.invalidates_api_cache('servers')
+        def delete_server():
+            pass
+
+        self.list_servers = list_servers
+        self.delete_server = delete_server
+
+    def test_cached_api_call(self):
+        self.assertEqual(['server-1'], self.list_servers())
+        self.assertEqual(['server-1'], self.list_servers())
+        self.assertEqual(['server-2'], self.list_servers(name='a'))
+        self.assertEqual([{}, {'name': 'a'}], self.calls)
+
+    def test_cached_api_call_returns_copy(self):
+        self.list_servers().append('server-x')
+        self.assertEqual(['server-1'], self.list_servers())
+
+    def test_cached_api_call_expired(self):
+        self.list_servers()
+        self.mock_time.patch_time(current_time=104.9)
+        self.assertEqual(['server-1'], self.list_servers())
+        self.mock_time.patch_time(current_time=105.)
+        self.assertEqual(['server-2'], self.list_servers())
+
+    def test_cached_api_call_disabled(self):
+        self.cache.enabled = False
+        self.assertEqual(['server-1'], self.list_servers())
+        self.assertEqual(['server-2'], self.list_servers())
+
+    def test_invalidates_api_cache(self):
+        self.list_servers()
+        self.delete_server()
+        self.assertEqual(['server-2'], self.list_servers())
+
+    def test_invalidate_api_cache(self):
+        self.cache.set('agents', 'key', 'agent')
+        self.cache.set('servers', 'key', 'server')
+        openstack.invalidate_api_cache('servers')
+        self.assertEqual('agent', self.cache.get('agents', 'key'))
+        self.assertIsNone(self.cache.get('servers', 'key'))
+        openstack.invalidate_api_cache()
+        self.assertIsNone(self.cache.get('agents', 'key'))
+
+    def test_get_ttl(self):
+        self.assertEqual(10., self.cache.get_ttl('agents'))
+        self.assertEqual(5., self.cache.get_ttl('servers'))
+        self.assertEqual(2., self.cache.get_ttl('servers', default=2.))
+        self.assertEqual(10., self.cache.get_ttl('agents', default=2.))
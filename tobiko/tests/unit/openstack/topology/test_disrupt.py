@@ -0,0 +1,96 @@
+# Copyright (c) 2026 Red Hat
+# All Rights Reserved.
+#
+#    Licensed under the Apache License, Version 2.0 (the "License"); you may
+#    not use this file except in compliance with the License. You may obtain
+#    a copy of the License at
+#
+#         http://www.apache.org/licenses/LICENSE-2.0
+#
+#    Unless required by applicable law or agreed to in writing, software
+#    distributed under the License is distributed on an "AS IS" BASIS, WITHOUT
+#    WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied. See the
+#    License for the specific language governing permissions and limitations
+#    under the License.
+from __future__ import absolute_import
+
+import threading
+from unittest import mock
+
+from tobiko.openstack import topology
+from tobiko.tests import unit
+
+
+def make_node(name: str):
+    node = mock.Mock()
+    node.name = name
+    return node
+
+
+class DisruptNodesTest(unit.TobikoUnitTest):
+
+    nodes = [make_node('controller-0'),
+             make_node('controller-1'),
+             make_node('controller-2')]
+
+    def test_disrupt_nodes(self):
+        disruption = topology.disrupt_nodes(self.nodes,
+                                            lambda node: node.name.upper())
+        self.assertIsInstance(disruption, topology.NodesDisruption)
+        self.assertEqual(['controller-0', 'controller-1', 'controller-2'],
+                         sorted(disruption.calls))
+        self.assertEqual('CONTROLLER-1',
+                         disruption.calls['controller-1'].get())
+        self.assertEqual([], disruption.failed)
+        for name, start_time in disruption.start_times.items():
+            self.assertLessEqual(start_time, disruption.end_times[name])
+        self.assertLessEqual(disruption.start_time, disruption.end_time)
+        self.assertGreaterEqual(disruption.start_skew, 0.)
+
+    def test_disrupt_nodes_is_simultaneous(self):
+        # every action blocks until all of them are running: it would
+        # deadlock if nodes were disrupted one by one
+        barrier = threading.Barrier(len(self.nodes), timeout=5.)
+        disruption = topology.disrupt_nodes(
+            self.nodes, lambda node: barrier.wait(), timeout=10.)
+        self.assertEqual([], disruption.failed)
+
+    def test_disrupt_nodes_with_failure(self):
+        def action(node):
+            if node.name == 'controller-1':
+                raise RuntimeError('unreachable')
+
+        ex = self.assertRaises(topology.NodesDisruptionError,
+                               topology.disrupt_nodes, self.nodes, action)
+        self.assertEqual(['controller-1'], ex.nodes)
+
+    def test_disrupt_nodes_without_check(self):
+        def action(node):
+            raise RuntimeError('unreachable')
+
+        disruption = topology.disrupt_nodes(self.nodes, action, check=False)
+        self.assertEqual(['controller-0', 'controller-1', 'controller-2'],
+                         sorted(disruption.failed))
+
+    def test_wait_for_nodes_recovery(self):
+        disruption = topology.disrupt_nodes(self.nodes, lambda node: None)
+        checked = {}
+
+        def check(node, call):
+            checked[node.name] = call.start_time
+
+        recovery = topology.wait_for_nodes_recovery(disruption, check)
+        self.assertEqual(disruption.start_times, checked)
+        self.assertEqual([], recovery.failed)
+
+    def test_wait_for_nodes_recovery_with_failure(self):
+        disruption = topology.disrupt_nodes(self.nodes, lambda node: None)
+
+        def check(node, call):
+            if node.name != 'controller-0':
+                raise RuntimeError('not recovered')
+
+        ex = self.assertRaises(topology.NodesDisruptionError,
+                               topology.wait_for_nodes_recovery,
+                               disruption, check)
+        self.assertEqual(['controller-1', 'controller-2'], sorted(ex.nodes))
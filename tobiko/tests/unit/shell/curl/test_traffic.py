@@ -0,0 +1,90 @@
+# Copyright (c) 2026 Red Hat
+# All Rights Reserved.
+#
+#    Licensed under the Apache License, Version 2.0 (the "License"); you may
+#    not use this file except in compliance with the License. You may obtain
+#    a copy of the License at
+#
+#         http://www.apache.org/licenses/LICENSE-2.0
+#
+#    Unless required by applicable law or agreed to in writing, software
+#    distributed under the License is distributed on an "AS IS" BASIS, WITHOUT
+#    WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied. See the
+#    License for the specific language governing permissions and limitations
+#    under the License.
+from __future__ import absolute_import
+
+from unittest import mock
+
+from tobiko.shell import curl
+from tobiko.shell import sh
+from tobiko.tests import unit
+
+
+CURL_OUTPUT = """member-1
+--tobiko-curl-- 200 0 0.010
+member-2
+--tobiko-curl-- 200 0 0.030
+
+--tobiko-curl-- 000 28 10.001
+member-1
+--tobiko-curl-- 200 0 0.020
+"""
+
+
+class ParseCurlTrafficTest(unit.TobikoUnitTest):
+
+    def test_parse_curl_traffic(self):
+        traffic = curl.parse_curl_traffic(CURL_OUTPUT)
+        self.assertEqual(4, len(traffic.responses))
+        self.assertEqual({'member-1': 2, 'member-2': 1}, traffic.replies)
+        self.assertEqual([curl.CurlResponse(content='', http_code=0,
+                                            exit_status=28,
+                                            time_total=10.001)],
+                         traffic.failed)
+
+    def test_latency_percentile(self):
+        traffic = curl.parse_curl_traffic(CURL_OUTPUT)
+        self.assertEqual(0.020, traffic.latency_percentile(50))
+        self.assertEqual(0.030, traffic.latency_percentile(100))
+        self.assertEqual(0.010, traffic.latency_percentile(50,
+                                                           'member-1'))
+        self.assertIsNone(traffic.latency_percentile(50, 'member-3'))
+        self.assertEqual({'member-1': {50: 0.010, 99: 0.020},
+                          'member-2': {50: 0.030, 99: 0.030}},
+                         traffic.latency_percentiles([50, 99]))
+
+    def test_parse_without_exit_code(self):
+        traffic = curl.parse_curl_traffic(
+            "member-1\n--tobiko-curl-- 200 0.010\n"
+            "\n--tobiko-curl-- 503 0.005\n")
+        self.assertEqual({'member-1': 1}, traffic.replies)
+        self.assertEqual(1, len(traffic.failed))
+
+
+class GenerateCurlTrafficTest(unit.TobikoUnitTest):
+
+    def setUp(self):
+        super(GenerateCurlTrafficTest, self).setUp()
+        self.execute = self.patch(sh, 'execute')
+        self.execute.return_value = mock.Mock(stdout=CURL_OUTPUT)
+
+    def test_generate_curl_traffic(self):
+        traffic = curl.generate_curl_traffic(hostname='10.0.0.1',
+                                             port=80,
+                                             path='id',
+                                             requests_count=4,
+                                             connect_timeout=10.)
+        self.assertEqual({'member-1': 2, 'member-2': 1}, traffic.replies)
+        command = self.execute.call_args[0][0]
+        self.assertEqual(4, list(command).count('http://10.0.0.1:80/id'))
+        self.assertIn("-H 'Connection: close'", str(command))
+        self.assertIn('--connect-timeout 10', str(command))
+        self.assertIsNone(self.execute.call_args[1]['expect_exit_status'])
+
+    def test_generate_curl_traffic_with_keep_alive(self):
+        curl.generate_curl_traffic(hostname='10.0.0.1',
+                                   requests_count=2,
+                                   keep_alive=True)
+        command = self.execute.call_args[0][0]
+        self.assertNotIn('Connection: close', str(command))
@@ -0,0 +1,199 @@
+# Copyright (c) 2026 Red Hat
+# All Rights Reserved.
+#
+#    Licensed under the Apache License, Version 2.0 (the "License"); you may
+#    not use this file except in compliance with the License. You may obtain
+#    a copy of the License at
+#
+#         http://www.apache.org/licenses/LICENSE-2.0
+#
+#    Unless required by applicable law or agreed to in writing, software
+#    distributed under the License is distributed on an "AS IS" BASIS, WITHOUT
+#    WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied. See the
+#    License for the specific language governing permissions and limitations
+#    under the License.
+from __future__ import absolute_import
+
+import datetime
+import io
+import os
+import tempfile
+from unittest import mock
+
+from tobiko.shell import files
+from tobiko.shell.files import _logs
+from tobiko.shell.files import _window
+from tobiko.tests import unit
+
+
+START_TIME = datetime.datetime(2026, 10, 19, 10, 0, 0)
+
+
+def timestamp(seconds: float) -> float:
+    return (START_TIME + datetime.timedelta(seconds=seconds)).timestamp()
+
+
+def make_log_lines(count: int):
+    lines = []
+    for i in range(count):
+        logged = START_TIME + datetime.timedelta(seconds=i)
+        lines.append(f"{logged:%Y-%m-%d %H:%M:%S.%f} INFO line {i}")
+        if i % 100 == 0:
+            # records without a timestamp belong to the previous one
+            lines.append(f"Traceback of line {i}")
+    return lines
+
+
+class CountingLogFileReader(files.StreamLogFileReader):
+
+    def __init__(self, data: bytes):
+        super(CountingLogFileReader, self).__init__(
+            'test.log', io.BytesIO(data), size=len(data))
+        self.bytes_read = 0
+
+    def read_at(self, offset, size):
+        data = super(CountingLogFileReader, self).read_at(offset, size)
+        self.bytes_read += len(data)
+        return data
+
+
+class ReadLogWindowTest(unit.TobikoUnitTest):
+
+    lines = make_log_lines(10000)
+    data = ('\n'.join(lines) + '\n').encode()
+
+    def read_window(self, start_time=None, end_time=None):
+        reader = CountingLogFileReader(self.data)
+        lines = list(files.read_log_window(reader,
+                                           start_time=start_time,
+                                           end_time=end_time))
+        return reader, lines
+
+    def test_read_log_window(self):
+        reader, lines = self.read_window(start_time=timestamp(5000),
+                                         end_time=timestamp(5009))
+        first = self.lines.index(lines[0])
+        self.assertTrue(lines[0].endswith('line 5000'))
+        self.assertEqual(self.lines[first:first + 11], lines)
+        self.assertEqual('Traceback of line 5000', lines[1])
+        # only a small part of the file is read
+        self.assertLess(reader.bytes_read, len(self.data) / 10)
+
+    def test_read_log_window_skips_previous_record(self):
+        _, lines = self.read_window(start_time=timestamp(100.5),
+                                    end_time=timestamp(101))
+        self.assertEqual(1, len(lines))
+        self.assertTrue(lines[0].endswith('line 101'))
+
+    def test_read_log_window_from_start(self):
+        _, lines = self.read_window(end_time=timestamp(1))
+        self.assertEqual(self.lines[:3], lines)
+
+    def test_read_log_window_until_end(self):
+        _, lines = self.read_window(start_time=timestamp(9998))
+        self.assertEqual(self.lines[-2:], lines)
+
+    def test_read_log_window_after_end(self):
+        _, lines = self.read_window(start_time=timestamp(20000))
+        self.assertEqual([], lines)
+
+    def test_iter_log_lines_from_middle_of_line(self):
+        reader = CountingLogFileReader(b'first\nsecond\nthird')
+        self.assertEqual([(6, b'second\n'), (13, b'third')],
+                         list(files.iter_log_lines(reader, 2)))
+        self.assertEqual([(6, b'second\n'), (13, b'third')],
+                         list(files.iter_log_lines(reader, 6)))
+
+    def test_log_timestamp_parser(self):
+        get_timestamp = files.log_timestamp_parser()
+        self.assertEqual(timestamp(3), get_timestamp(self.lines[4]))
+        self.assertIsNone(get_timestamp('Traceback'))
+
+
+class LogFileDiggerWindowTest(unit.TobikoUnitTest):
+
+    def setUp(self):
+        super(LogFileDiggerWindowTest, self).setUp()
+        temp_dir = tempfile.TemporaryDirectory()
+        self.addCleanup(temp_dir.cleanup)
+        self.log_file = os.path.join(temp_dir.name, 'neutron.log')
+        with open(self.log_file, 'w') as fd:
+            fd.write('\n'.join(make_log_lines(1000)) + '\n')
+
+    def test_find_lines_since(self):
+        digger = files.LogFileDigger(filename=self.log_file,
+                                     ssh_client=False)
+        lines = digger.find_lines(pattern='line 9[0-9]+$',
+                                  since=timestamp(950))
+        self.assertEqual([f'line {i}' for i in range(950, 1000)],
+                         [line.split(' ', 3)[-1] for line in lines])
+
+    def test_find_lines_in_window(self):
+        digger = files.LogFileDigger(filename=self.log_file,
+                                     ssh_client=False)
+        lines = digger.find_lines(pattern='line',
+                                  since=timestamp(10),
+                                  until=timestamp(12))
+        self.assertEqual(['line 10', 'line 11', 'line 12'],
+                         [line.split(' ', 3)[-1] for line in lines])
+
+    def test_grep_log_file_window(self):
+        lines = files.grep_log_file_window(self.log_file,
+                                           pattern='line (99|100|101)$',
+                                           start_time=timestamp(99.5),
+                                           end_time=timestamp(101),
+                                           ssh_client=False)
+        log_lines = make_log_lines(1000)
+        first = log_lines.index(lines[0])
+        self.assertTrue(lines[0].endswith('line 100'))
+        self.assertEqual(log_lines[first:first + 3], lines)
+        self.assertEqual('Traceback of line 100', lines[1])
+
+    def test_grep_log_file_window_after_end(self):
+        self.assertEqual([], files.grep_log_file_window(
+            self.log_file, pattern='line', start_time=timestamp(2000),
+            ssh_client=False))
+
+    def test_find_lines_since_greps_from_window_offset(self):
+        grep_lines = self.patch(_window.grep, 'grep_lines',
+                                wraps=_window.grep.grep_lines)
+        digger = files.LogFileDigger(filename=self.log_file,
+                                     ssh_client=False)
+        lines = digger.find_lines(pattern='line 99[0-9]$',
+                                  since=timestamp(995))
+        self.assertEqual([f'line {i}' for i in range(995, 1000)],
+                         [line.split(' ', 3)[-1] for line in lines])
+        # only lines logged since the window start are looked for
+        with open(self.log_file, 'rb') as fd:
+            offset = fd.read().index(lines[0].encode())
+        grep_lines.assert_called_once()
+        self.assertEqual(['tail', '-c', f'+{offset + 1}', self.log_file],
+                         grep_lines.call_args.kwargs['command'])
+
+    def test_journal_log_digger_since(self):
+        execute = self.patch(_logs.sh, 'execute',
+                             return_value=mock.Mock(stdout='a\nb\n'))
+        digger = files.JournalLogDigger(filename='ovn-controller',
+                                        ssh_client=False)
+        self.assertEqual(['a', 'b'],
+                         digger.find_lines(pattern='error',
+                                           since=100.5, until=200.5))
+        execute.assert_called_once_with(
+            ['journalctl', '--no-pager', '--unit', 'ovn-controller',
+             '--output', 'short-iso', '--since', '@100', '--until', '@201',
+             '--grep', 'error'],
+            ssh_client=False)
+
+
+class ShellLogFileReaderTest(unit.TobikoUnitTest):
+
+    def test_read_at(self):
+        with tempfile.NamedTemporaryFile() as log_file:
+            log_file.write(b'0123456789\xc3\xa9\n')
+            log_file.flush()
+            reader = files.ShellLogFileReader(log_file.name,
+                                              ssh_client=False)
+            self.assertEqual(13, reader.size)
+            self.assertEqual(b'89\xc3', reader.read_at(8, 3))
+            self.assertEqual(b'\n', reader.read_at(12, 10))
+            self.assertEqual(b'', reader.read_at(13, 10))
@@ -0,0 +1,77 @@
+# Copyright (c) 2026 Red Hat
+# All Rights Reserved.
+#
+#    Licensed under the Apache License, Version 2.0 (the "License"); you may
+#    not use this file except in compliance with the License. You may obtain
+#    a copy of the License at
+#
+#         http://www.apache.org/licenses/LICENSE-2.0
+#
+#    Unless required by applicable law or agreed to in writing, software
+#    distributed under the License is distributed on an "AS IS" BASIS, WITHOUT
+#    WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied. See the
+#    License for the specific language governing permissions and limitations
+#    under the License.
+from __future__ import absolute_import
+
+import json
+import os
+import tempfile
+
+from tobiko.shell import iperf3
+from tobiko.tests import unit
+
+
+def make_interval(start, end, bytes_count):
+    return {'event': 'interval',
+            'data': {'sum': {'start': start, 'end': end,
+                             'bytes': bytes_count}}}
+
+
+EVENTS = [{'event': 'start', 'data': {}},
+          make_interval(0., 1., 100),
+          make_interval(1., 2., 0),
+          make_interval(2., 3., 0),
+          make_interval(3., 4., 100),
+          make_interval(4., 5., 0),
+          {'event': 'end', 'data': {}}]
+
+
+class Iperf3BreakStatsTest(unit.TobikoUnitTest):
+
+    def test_add_line(self):
+        stats = iperf3.Iperf3BreakStats()
+        for event in EVENTS:
+            stats.add_line(json.dumps(event).encode() + b'\n')
+        stats.add_line('iperf3: error - control socket has closed\n')
+        self.assertEqual(5, stats.intervals_count)
+        self.assertEqual(200, stats.bytes_total)
+        self.assertEqual(2., stats.longest_break)
+        self.assertEqual(3., stats.breaks_total)
+        self.assertEqual(1., stats.current_break)
+        self.assertTrue(stats.ended)
+
+    def test_check(self):
+        stats = iperf3.Iperf3BreakStats()
+        stats.add_event(make_interval(0., 1., 100))
+        stats.check()
+
+    def test_check_without_intervals(self):
+        stats = iperf3.Iperf3BreakStats()
+        self.assertRaises(self.failureException, stats.check)
+
+
+class Iperf3StreamMonitorTest(unit.TobikoUnitTest):
+
+    def test_monitor(self):
+        with tempfile.NamedTemporaryFile('w', delete=False) as f:
+            for event in EVENTS:
+                f.write(json.dumps(event) + '\n')
+        self.addCleanup(os.remove, f.name)
+        monitor = iperf3.Iperf3StreamMonitor(command=['cat', f.name],
+                                             ssh_client=False).start()
+        self.addCleanup(monitor.stop)
+        stats = monitor.wait_for_end()
+        self.assertTrue(stats.ended)
+        self.assertEqual(5, stats.intervals_count)
+        self.assertEqual(2., stats.longest_break)
@@ -0,0 +1,136 @@
+# Copyright (c) 2026 Red Hat
+# All Rights Reserved.
+#
+#    Licensed under the Apache License, Version 2.0 (the "License"); you may
+#    not use this file except in compliance with the License. You may obtain
+#    a copy of the License at
+#
+#         http://www.apache.org/licenses/LICENSE-2.0
+#
+#    Unless required by applicable law or agreed to in writing, software
+#    distributed under the License is distributed on an "AS IS" BASIS, WITHOUT
+#    WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied. See the
+#    License for the specific language governing permissions and limitations
+#    under the License.
+from __future__ import absolute_import
+
+import io
+import os
+import tarfile
+import tempfile
+from unittest import mock
+
+from tobiko.shell import sh
+from tobiko.shell.sh import _connection
+from tobiko.tests import unit
+
+
+class PutFilesTest(unit.TobikoUnitTest):
+
+    def setUp(self):
+        super(PutFilesTest, self).setUp()
+        self.local_dir = tempfile.mkdtemp()
+        self.addCleanup(sh.local_shell_connection().remove_files,
+                        self.local_dir)
+        self.role_dir = os.path.join(self.local_dir, 'role')
+        self.write_file('role/tasks/main.yaml', '- debug: {}\n')
+        self.write_file('role/defaults/main.yaml', 'a: 1\n')
+        self.write_file('inventory', '[all]\n')
+
+    def write_file(self, filename: str, content: str):
+        filename = os.path.join(self.local_dir, filename)
+        os.makedirs(os.path.dirname(filename), exist_ok=True)
+        with io.open(filename, 'wt') as fd:
+            fd.write(content)
+        return filename
+
+    def list_put_files(self):
+        return _connection.list_put_files(
+            self.role_dir, os.path.join(self.local_dir, 'inventory'),
+            remote_dir='/tmp/work')
+
+    def test_list_put_files(self):
+        put_files = self.list_put_files()
+        self.assertEqual(['/tmp/work/inventory',
+                          '/tmp/work/role/defaults/main.yaml',
+                          '/tmp/work/role/tasks/main.yaml'],
+                         sorted(put_files.values()))
+
+    def test_put_files_digest(self):
+        digest = _connection.put_files_digest(self.list_put_files(),
+                                              remote_dir='/tmp/work')
+        self.assertEqual(digest, _connection.put_files_digest(
+            self.list_put_files(), remote_dir='/tmp/work'))
+        self.write_file('role/defaults/main.yaml', 'a: 2\n')
+        self.assertNotEqual(digest, _connection.put_files_digest(
+            self.list_put_files(), remote_dir='/tmp/work'))
+
+    def test_make_tar_archive(self):
+        data = _connection.make_tar_archive(self.list_put_files(),
+                                            remote_dir='/tmp/work')
+        with tarfile.open(fileobj=io.BytesIO(data), mode='r:gz') as archive:
+            self.assertEqual(['inventory',
+                              'role/defaults/main.yaml',
+                              'role/tasks/main.yaml'],
+                             sorted(archive.getnames()))
+            self.assertEqual(
+                b'a: 1\n',
+                archive.extractfile('role/defaults/main.yaml').read())
+
+    def test_local_put_files(self):
+        remote_dir = os.path.join(self.local_dir, 'work')
+        sh.local_shell_connection().put_files(self.role_dir,
+                                              remote_dir=remote_dir)
+        self.assertTrue(os.path.isfile(
+            os.path.join(remote_dir, 'role/tasks/main.yaml')))
+
+    def ssh_connection(self, *exit_statuses: int):
+        connection = sh.SSHShellConnection(ssh_client=mock.MagicMock())
+        connection._user_dir = '/home/user'
+        connection._hostname = 'remote-host'
+        execute = self.patch(connection, 'execute')
+        execute.side_effect = [mock.Mock(exit_status=exit_status)
+                               for exit_status in exit_statuses]
+        put_file = self.patch(connection, 'put_file')
+        connection._sftp = mock.MagicMock()
+        return connection, execute, put_file
+
+    def test_ssh_put_files(self):
+        connection, execute, put_file = self.ssh_connection(1, 0)
+        connection.put_files(self.role_dir, remote_dir='/tmp/work')
+        put_file.assert_not_called()
+        self.assertEqual(2, execute.call_count)
+        command = execute.call_args[0][0]
+        self.assertIn('/home/user/.cache/tobiko/archives/', command[-1])
+        self.assertIn('mkdir -p /tmp/work && tar -xzf', command[-1])
+        self.assertIn('-mtime +7', command[-1])
+        self.assertNotIn('stdin', execute.call_args[1])
+        fd, temp_file = connection._sftp.putfo.call_args[0]
+        self.assertTrue(temp_file.startswith(
+            '/home/user/.cache/tobiko/archives/'))
+        with tarfile.open(fileobj=fd, mode='r:gz') as f:
+            self.assertEqual(['role/defaults/main.yaml',
+                              'role/tasks/main.yaml'],
+                             sorted(f.getnames()))
+
+    def test_ssh_put_files_without_make_dirs(self):
+        connection, execute, _ = self.ssh_connection(1, 0)
+        connection.put_files(self.role_dir, remote_dir='/tmp/work',
+                             make_dirs=False)
+        for call in execute.call_args_list:
+            self.assertNotIn('mkdir -p /tmp/work', call[0][0][-1])
+
+    def test_ssh_put_files_when_cached(self):
+        connection, execute, put_file = self.ssh_connection(0)
+        connection.put_files(self.role_dir, remote_dir='/tmp/work')
+        put_file.assert_not_called()
+        execute.assert_called_once()
+        self.assertIn('touch', execute.call_args[0][0][-1])
+        connection._sftp.putfo.assert_not_called()
+
+    def test_ssh_put_files_without_archive(self):
+        connection, execute, put_file = self.ssh_connection(0, 0)
+        connection.put_files(self.role_dir, remote_dir='/tmp/work',
+                             archive=False)
+        self.assertEqual(2, put_file.call_count)
+        self.assertEqual(2, execute.call_count)  # make_dirs
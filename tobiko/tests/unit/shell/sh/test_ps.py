@@ -0,0 +1,79 @@
+# Copyright (c) 2026 Red Hat
+# All Rights Reserved.
+#
+#    Licensed under the Apache License, Version 2.0 (the "License"); you may
+#    not use this file except in compliance with the License. You may obtain
+#    a copy of the License at
+#
+#         http://www.apache.org/licenses/LICENSE-2.0
+#
+#    Unless required by applicable law or agreed to in writing, software
+#    distributed under the License is distributed on an "AS IS" BASIS, WITHOUT
+#    WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied. See the
+#    License for the specific language governing permissions and limitations
+#    under the License.
+from __future__ import absolute_import
+
+from unittest import mock
+
+from tobiko.shell import sh
+from tobiko.shell.sh import _ps
+from tobiko.tests import unit
+
+
+def execute_result(stdout='', exit_status=0, stderr=''):
+    return mock.Mock(stdout=stdout, exit_status=exit_status, stderr=stderr)
+
+
+class ListProcessesRemoteFilterTest(unit.TobikoUnitTest):
+
+    def setUp(self):
+        super(ListProcessesRemoteFilterTest, self).setUp()
+        self.execute = self.patch(_ps._execute, 'execute')
+
+    def test_list_processes(self):
+        self.execute.return_value = execute_result(
+            "1234 ping -c 100 10.0.0.1\n"
+            "1300 bash -c ping -c 100 10.0.0.1\n")
+        processes = sh.list_processes(command_line='ping .*10.0.0.1',
+                                      ssh_client=False,
+                                      remote_filter=True)
+        self.assertEqual([1234], [process.pid for process in processes])
+        process = processes.unique
+        self.assertEqual('ping', process.command)
+        self.assertEqual(['ping', '-c', '100', '10.0.0.1'],
+                         list(process.command_line))
+        self.execute.assert_called_once()
+        self.assertEqual("pgrep -a -f -- 'ping .*10.0.0.1'",
+                         str(self.execute.call_args[0][0]))
+
+    def test_list_processes_by_command(self):
+        self.execute.return_value = execute_result(
+            "1234 ovsdb-server --remote=punix:/run/ovn/ovnnb_db.sock\n")
+        processes = sh.list_processes(command='ovsdb-server',
+                                      ssh_client=False,
+                                      remote_filter=True)
+        self.assertEqual([1234], [process.pid for process in processes])
+        self.assertEqual("pgrep -a -- ovsdb-server",
+                         str(self.execute.call_args[0][0]))
+
+    def test_list_processes_when_none_matches(self):
+        self.execute.return_value = execute_result(exit_status=1)
+        processes = sh.list_processes(command_line='ping .*10.0.0.1',
+                                      ssh_client=False,
+                                      remote_filter=True)
+        self.assertEqual([], list(processes))
+        self.execute.assert_called_once()
+
+    def test_list_processes_fallback_to_ps(self):
+        self.execute.side_effect = [
+            execute_result(exit_status=2,
+                           stderr="pgrep: invalid option -- 'a'"),
+            execute_result("PID TTY TIME CMD\n"
+                           "1 ? 00:00:01 init\n"
+                           "1234 ? 00:00:00 ping\n")]
+        processes = sh.list_processes(command='ping',
+                                      ssh_client=False,
+                                      remote_filter=True)
+        self.assertEqual([1234], [process.pid for process in processes])
+        self.assertEqual('ps -A', str(self.execute.call_args[0][0]))
@@ -0,0 +1,141 @@
+# Copyright (c) 2026 Red Hat
+# All Rights Reserved.
+#
+#    Licensed under the Apache License, Version 2.0 (the "License"); you may
+#    not use this file except in compliance with the License. You may obtain
+#    a copy of the License at
+#
+#         http://www.apache.org/licenses/LICENSE-2.0
+#
+#    Unless required by applicable law or agreed to in writing, software
+#    distributed under the License is distributed on an "AS IS" BASIS, WITHOUT
+#    WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied. See the
+#    License for the specific language governing permissions and limitations
+#    under the License.
+from __future__ import absolute_import
+
+import socket
+from unittest import mock
+
+import tobiko
+from tobiko.shell import sh
+from tobiko.shell.sh import _recovery
+from tobiko.tests import unit
+
+
+def make_ssh_client(hostname='127.0.0.1', port=22, proxy_client=None):
+    ssh_client = mock.Mock(hostname=hostname, proxy_client=proxy_client)
+    ssh_client.setup_connect_parameters.return_value = {'hostname': hostname,
+                                                        'port': port}
+    return ssh_client
+
+
+class ProbeTcpPortTest(unit.TobikoUnitTest):
+
+    def test_probe_tcp_port_when_open(self):
+        server = socket.socket()
+        self.addCleanup(server.close)
+        server.bind(('127.0.0.1', 0))
+        server.listen(1)
+        ssh_client = make_ssh_client(port=server.getsockname()[1])
+        self.assertIs(True, sh.probe_tcp_port(ssh_client, timeout=1.))
+
+    def test_probe_tcp_port_when_closed(self):
+        server = socket.socket()
+        server.bind(('127.0.0.1', 0))
+        port = server.getsockname()[1]
+        server.close()
+        ssh_client = make_ssh_client(port=port)
+        self.assertIs(False, sh.probe_tcp_port(ssh_client, timeout=1.))
+
+    def test_probe_tcp_port_via_proxy(self):
+        execute = self.patch(_recovery._execute, 'execute',
+                             return_value=mock.Mock(exit_status=0))
+        proxy_client = mock.Mock()
+        ssh_client = make_ssh_client(hostname='10.0.0.1',
+                                     proxy_client=proxy_client)
+        self.assertIs(True, sh.probe_tcp_port(ssh_client, timeout=2.))
+        execute.assert_called_once_with('nc -z -w 2 10.0.0.1 22',
+                                        ssh_client=proxy_client,
+                                        expect_exit_status=None,
+                                        timeout=12.)
+
+
+class HostRecoveryTest(unit.TobikoUnitTest):
+
+    def setUp(self):
+        super(HostRecoveryTest, self).setUp()
+        self.patch_time(current_time=100., time_increment=1.)
+        self.patch(tobiko, 'cleanup_fixture')
+        self.probe_tcp_port = self.patch(_recovery, 'probe_tcp_port')
+        self.probe_icmp = self.patch(_recovery, 'probe_icmp',
+                                     return_value=False)
+        self.get_boot_id = self.patch(_recovery._uptime, 'get_boot_id',
+                                      return_value='old-boot-id')
+        self.get_uptime = self.patch(_recovery._uptime, 'get_uptime')
+
+    def test_poll(self):
+        ssh_client = make_ssh_client()
+        recovery = sh.HostRecovery(ssh_client=ssh_client,
+                                   boot_id='old-boot-id')
+        # host hasn't gone down yet
+        self.probe_tcp_port.return_value = True
+        self.assertFalse(recovery.poll())
+        self.assertEqual(1, recovery.ssh_attempts)
+
+        # host is down: SSH is not even tried
+        self.probe_tcp_port.return_value = False
+        self.assertFalse(recovery.poll())
+        self.assertFalse(recovery.poll())
+        self.assertEqual(1, recovery.ssh_attempts)
+        self.assertIsNotNone(recovery.down_time)
+        self.probe_icmp.assert_called_with(ssh_client, timeout=2.)
+
+        # host is up again with a new boot ID
+        self.probe_tcp_port.return_value = True
+        self.get_boot_id.return_value = 'new-boot-id'
+        self.assertTrue(recovery.poll())
+        self.assertTrue(recovery.recovered)
+        self.assertEqual(2, recovery.ssh_attempts)
+        self.assertGreater(recovery.downtime, 0.)
+        self.assertGreater(recovery.time_to_ssh, recovery.downtime)
+        self.get_uptime.assert_not_called()
+
+    def test_poll_without_boot_id(self):
+        recovery = sh.HostRecovery(ssh_client=make_ssh_client(),
+                                   start_time=50.)
+        self.probe_tcp_port.return_value = True
+        self.get_uptime.return_value = 1000.
+        self.assertFalse(recovery.poll())
+        self.get_uptime.return_value = 10.
+        self.assertTrue(recovery.poll())
+        self.assertIsNone(recovery.downtime)
+        self.get_boot_id.assert_not_called()
+
+    def test_poll_when_ssh_fails(self):
+        ssh_client = make_ssh_client()
+        ssh_client.connect.side_effect = RuntimeError('connection refused')
+        recovery = sh.HostRecovery(ssh_client=ssh_client, boot_id='x')
+        self.probe_tcp_port.return_value = True
+        self.assertFalse(recovery.poll())
+        ssh_client.close.assert_called_once_with()
+
+    def test_wait_for_hosts_recovery(self):
+        self.probe_tcp_port.return_value = True
+        self.get_boot_id.return_value = 'new-boot-id'
+        recoveries = [
+            sh.HostRecovery(ssh_client=make_ssh_client(f'10.0.0.{i}'),
+                            boot_id='old-boot-id')
+            for i in range(3)]
+        result = sh.wait_for_hosts_recovery(recoveries, timeout=60.)
+        self.assertEqual(recoveries, result)
+        self.assertTrue(all(recovery.recovered for recovery in recoveries))
+
+    def test_wait_for_hosts_recovery_with_timeout(self):
+        self.probe_tcp_port.return_value = False
+        recoveries = [sh.HostRecovery(ssh_client=make_ssh_client('10.0.0.1'),
+                                      boot_id='old-boot-id')]
+        ex = self.assertRaises(sh.HostsRecoveryTimeoutError,
+                               sh.wait_for_hosts_recovery, recoveries,
+                               timeout=30., interval=5.)
+        self.assertEqual(['10.0.0.1'], ex.hostnames)
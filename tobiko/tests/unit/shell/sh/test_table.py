@@ -0,0 +1,125 @@
+# Copyright (c) 2026 Red Hat
+# All Rights Reserved.
+#
+#    Licensed under the Apache License, Version 2.0 (the "License"); you may
+#    not use this file except in compliance with the License. You may obtain
+#    a copy of the License at
+#
+#         http://www.apache.org/licenses/LICENSE-2.0
+#
+#    Unless required by applicable law or agreed to in writing, software
+#    distributed under the License is distributed on an "AS IS" BASIS, WITHOUT
+#    WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied. See the
+#    License for the specific language governing permissions and limitations
+#    under the License.
+from __future__ import absolute_import
+
+import json
+from unittest import mock
+
+from tobiko.shell import sh
+from tobiko.shell.sh import _ps
+from tobiko.shell.sh import _systemctl
+from tobiko.tests import unit
+
+
+PS_OUTPUT = """\
+      1       0 systemd
+      2       0 kthreadd
+   1234       1 ovsdb-server
+   1300    1234 sleep 3600
+"""
+
+
+class ParseTableColumnsTest(unit.TobikoUnitTest):
+
+    def test_parse_table_columns(self):
+        table = sh.parse_table_columns(PS_OUTPUT,
+                                       columns=['pid', 'ppid', 'args'],
+                                       converters={'pid': int})
+        self.assertEqual(['pid', 'ppid', 'args'], table.columns)
+        self.assertEqual([1, 2, 1234, 1300], [row['pid'] for row in table])
+        self.assertEqual('1234', table[3]['ppid'])
+        self.assertEqual('sleep 3600', table[3]['args'])
+
+    def test_parse_table_columns_with_separator(self):
+        table = sh.parse_table_columns(['a|1|x', 'b|2', 'c|3|y|z'],
+                                       columns=['name', 'value', 'other'],
+                                       sep='|')
+        self.assertEqual([{'name': 'a', 'value': '1', 'other': 'x'},
+                          {'name': 'c', 'value': '3', 'other': 'y|z'}],
+                         list(table))
+
+    def test_parse_table_columns_empty(self):
+        table = sh.parse_table_columns('', columns=['pid'])
+        self.assertTrue(table.empty)
+
+    def test_same_as_ps_parse_table(self):
+        lines = ['PID CMD'] + [line.split(None, 1)[0] + ' ' +
+                               line.split(None, 2)[2]
+                               for line in PS_OUTPUT.splitlines()]
+        expected = list(_ps.parse_table(lines=lines,
+                                        schema=_ps.PS_TABLE_SCHEMA))
+        table = sh.parse_table_columns(lines, columns=['pid', 'command'],
+                                       converters=_ps.PS_COLUMN_CONVERTERS,
+                                       skip_lines=1)
+        self.assertEqual(expected, list(table))
+
+    def test_list_processes_table(self):
+        execute = self.patch(_ps._execute, 'execute',
+                             return_value=mock.Mock(stdout=PS_OUTPUT))
+        table = sh.list_processes_table(ssh_client=False)
+        self.assertEqual([0, 0, 1, 1234], [row['ppid'] for row in table])
+        self.assertEqual('sleep 3600', table[3]['comm'])
+        self.assertEqual("ps -A -o pid= -o ppid= -o comm=",
+                         str(execute.call_args[0][0]))
+
+
+SYSTEMCTL_TEXT_OUTPUT = """\
+UNIT           LOAD   ACTIVE SUB     DESCRIPTION
+sshd.service   loaded active running OpenSSH server daemon
+crond.service  loaded active running Command Scheduler
+
+LOAD   = Reflects whether the unit definition was properly loaded.
+"""
+
+SYSTEMCTL_JSON_OUTPUT = json.dumps([
+    {'unit': 'sshd.service', 'load': 'loaded', 'active': 'active',
+     'sub': 'running', 'description': 'OpenSSH server daemon'},
+    {'unit': 'crond.service', 'load': 'loaded', 'active': 'active',
+     'sub': 'running', 'description': 'Command Scheduler'}])
+
+
+class SystemctlTest(unit.TobikoUnitTest):
+
+    def test_parse_json_same_as_text(self):
+        from_text = _systemctl.parse_systemd_units_table(
+            SYSTEMCTL_TEXT_OUTPUT)
+        from_json = _systemctl.parse_systemd_units_json(
+            SYSTEMCTL_JSON_OUTPUT)
+        self.assertEqual([unit[:5] for unit in from_text],
+                         [unit[:5] for unit in from_json])
+
+    def test_list_systemd_units_fallback_to_text(self):
+        for output in [SYSTEMCTL_TEXT_OUTPUT, SYSTEMCTL_JSON_OUTPUT]:
+            self.patch(_systemctl._execute, 'execute',
+                       return_value=mock.Mock(stdout=output))
+            units = sh.list_systemd_units(ssh_client=False)
+            self.assertEqual(['sshd.service', 'crond.service'],
+                             [unit.unit for unit in units])
+
+    def test_show_systemd_units(self):
+        execute = self.patch(_systemctl._execute, 'execute',
+                             return_value=mock.Mock(stdout=(
+                                 "Id=sshd.service\nActiveState=active\n"
+                                 "SubState=running\n\n"
+                                 "Id=crond.service\nActiveState=failed\n"
+                                 "SubState=failed\n")))
+        table = sh.show_systemd_units(
+            'sshd', 'crond', properties=['Id', 'ActiveState', 'SubState'],
+            ssh_client=False)
+        self.assertEqual(['active', 'failed'],
+                         [row['ActiveState'] for row in table])
+        self.assertEqual(
+            "systemctl show --no-pager -p Id,ActiveState,SubState sshd crond",
+            str(execute.call_args[0][0]))
@@ -0,0 +1,112 @@
+# Copyright (c) 2026 Red Hat
+# All Rights Reserved.
+#
+#    Licensed under the Apache License, Version 2.0 (the "License"); you may
+#    not use this file except in compliance with the License. You may obtain
+#    a copy of the License at
+#
+#         http://www.apache.org/licenses/LICENSE-2.0
+#
+#    Unless required by applicable law or agreed to in writing, software
+#    distributed under the License is distributed on an "AS IS" BASIS, WITHOUT
+#    WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied. See the
+#    License for the specific language governing permissions and limitations
+#    under the License.
+from __future__ import absolute_import
+
+import os
+import tempfile
+
+from tobiko.shell import files
+from tobiko.shell import grep
+from tobiko.tests import unit
+
+
+LOG_LINES = [
+    '2026-10-19 10:00:00.000 ERROR nova Connection refused',
+    '2026-10-19 10:00:01.000 INFO nova Started server',
+    '2026-10-19 10:00:02.000 ERROR nova Timeout waiting for port',
+    '2026-10-19 10:00:03.000 WARNING nova Connection refused again']
+
+PATTERNS = {'refused': 'Connection refused',
+            'error': 'ERROR',
+            'missing': 'not in any line'}
+
+
+class GrepPatternsTest(unit.TobikoUnitTest):
+
+    def setUp(self):
+        super(GrepPatternsTest, self).setUp()
+        temp_dir = tempfile.TemporaryDirectory()
+        self.addCleanup(temp_dir.cleanup)
+        self.log_file = os.path.join(temp_dir.name, 'nova.log')
+        self.write_lines(LOG_LINES)
+
+    def write_lines(self, lines):
+        with open(self.log_file, 'a') as fd:
+            fd.write('\n'.join(lines) + '\n')
+
+    def test_tag_lines(self):
+        self.assertEqual(
+            {'refused': [LOG_LINES[0], LOG_LINES[3]],
+             'error': [LOG_LINES[0], LOG_LINES[2]],
+             'missing': []},
+            grep.tag_lines(PATTERNS, LOG_LINES + ['']))
+
+    def test_tag_lines_with_posix_classes(self):
+        self.assertEqual(
+            {'port': [LOG_LINES[2]], 'time': LOG_LINES},
+            grep.tag_lines({'port': 'for[[:space:]]+port$',
+                            'time': '[[:digit:]]{2}:[[:digit:]]{2}'},
+                           LOG_LINES))
+
+    def test_tag_lines_logs_unmatched_lines(self):
+        with self.assertLogs(grep.LOG.logger, 'WARNING') as logs:
+            tagged = grep.tag_lines({'error': 'ERROR'}, LOG_LINES[:2])
+        self.assertEqual({'error': [LOG_LINES[0]]}, tagged)
+        self.assertIn(LOG_LINES[1], logs.output[0])
+
+    def test_grep_files_patterns(self):
+        result = grep.grep_files_patterns(PATTERNS, files=[self.log_file],
+                                          ssh_client=False)
+        self.assertEqual(grep.tag_lines(PATTERNS, LOG_LINES), result)
+
+    def test_grep_patterns_with_command(self):
+        result = grep.grep_patterns(PATTERNS,
+                                    command=['cat', self.log_file],
+                                    grep_command='grep -E',
+                                    ssh_client=False)
+        self.assertEqual(grep.tag_lines(PATTERNS, LOG_LINES), result)
+
+    def test_grep_patterns_with_invalid_patterns(self):
+        self.assertRaises(ValueError, grep.grep_patterns, {},
+                          files=[self.log_file])
+        self.assertRaises(ValueError, grep.grep_patterns, {'empty': ''},
+                          files=[self.log_file])
+
+    def test_log_file_digger_find_patterns_lines(self):
+        digger = files.LogFileDigger(filename=self.log_file,
+                                     patterns=PATTERNS,
+                                     ssh_client=False)
+        self.useFixture(digger)
+        self.assertEqual(grep.tag_lines(PATTERNS, LOG_LINES),
+                         digger.found_patterns_lines)
+
+        new_line = '2026-10-19 10:00:04.000 ERROR nova Connection refused'
+        self.write_lines([new_line])
+        self.assertEqual({'refused': [new_line],
+                          'error': [new_line],
+                          'missing': []},
+                         digger.find_patterns_lines(new_lines=True))
+        self.assertEqual({'refused': [], 'error': [], 'missing': []},
+                         digger.find_patterns_lines(new_lines=True))
+
+    def test_multihost_log_file_digger_find_patterns_lines(self):
+        digger = files.MultihostLogFileDigger(filename=self.log_file,
+                                              patterns=PATTERNS)
+        digger.add_host(hostname='node-0', ssh_client=False)
+        result = digger.find_patterns_lines()
+        self.assertEqual([('node-0', LOG_LINES[0]), ('node-0', LOG_LINES[3])],
+                         result['refused'])
+        self.assertEqual([], result['missing'])
+        self.assertEqual(result, digger.found_patterns_lines)
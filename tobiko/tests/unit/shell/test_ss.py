@@ -0,0 +1,77 @@
+# Copyright (c) 2026 Red Hat
+# All Rights Reserved.
+#
+#    Licensed under the Apache License, Version 2.0 (the "License"); you may
+#    not use this file except in compliance with the License. You may obtain
+#    a copy of the License at
+#
+#         http://www.apache.org/licenses/LICENSE-2.0
+#
+#    Unless required by applicable law or agreed to in writing, software
+#    distributed under the License is distributed on an "AS IS" BASIS, WITHOUT
+#    WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied. See the
+#    License for the specific language governing permissions and limitations
+#    under the License.
+from __future__ import absolute_import
+
+from unittest import mock
+
+from tobiko.shell import sh
+from tobiko.shell import ss
+from tobiko.tests import unit
+
+
+# ss -Hnt
+SS_TCP_OUTPUT = """\
+ESTAB     0      0          192.168.122.10:22          192.168.122.1:51234
+TIME-WAIT 0      0                   [::1]:6443                [::1]:40012
+"""
+
+# ss -Hnx
+SS_UNIX_OUTPUT = """\
+u_str ESTAB  0      0      /run/systemd/journal/stdout 21805            * 21804
+u_dgr ESTAB  0      0                                * 23456            * 23457
+u_seq LISTEN 0      4096             /run/udev/control 16012            * 0
+"""
+
+
+class ListSocketsTest(unit.TobikoUnitTest):
+
+    def patch_execute(self, stdout: str):
+        return self.patch(sh, 'execute',
+                          return_value=mock.Mock(stdout=stdout))
+
+    def test_list_tcp_sockets(self):
+        execute = self.patch_execute(SS_TCP_OUTPUT)
+        table = ss.list_sockets(ssh_client=False)
+        self.assertEqual('ss -Hn -t', execute.call_args[0][0])
+        self.assertEqual(list(ss.SS_TCP_COLUMNS), table.columns)
+        self.assertEqual(
+            [{'state': 'ESTAB', 'recv_q': '0', 'send_q': '0',
+              'local': '192.168.122.10:22', 'remote': '192.168.122.1:51234'},
+             {'state': 'TIME-WAIT', 'recv_q': '0', 'send_q': '0',
+              'local': '[::1]:6443', 'remote': '[::1]:40012'}],
+            list(table))
+
+    def test_list_unix_sockets(self):
+        execute = self.patch_execute(SS_UNIX_OUTPUT)
+        table = ss.list_sockets(params='-x', ssh_client=False)
+        self.assertEqual('ss -Hn -x', execute.call_args[0][0])
+        self.assertEqual(list(ss.SS_UNIX_COLUMNS), table.columns)
+        self.assertEqual(['u_str', 'u_dgr', 'u_seq'],
+                         [row['netid'] for row in table])
+        self.assertEqual(['ESTAB', 'ESTAB', 'LISTEN'],
+                         [row['state'] for row in table])
+        self.assertEqual({'netid': 'u_str', 'state': 'ESTAB', 'recv_q': '0',
+                          'send_q': '0',
+                          'local_addr': '/run/systemd/journal/stdout',
+                          'local_port': '21805', 'remote_addr': '*',
+                          'remote_port': '21804'}, table[0])
+
+    def test_list_sockets_with_columns(self):
+        self.patch_execute('0 128 0.0.0.0:22 0.0.0.0:*\n')
+        table = ss.list_sockets(params='-t state listening',
+                                columns=['recv_q', 'send_q', 'local',
+                                         'remote'],
+                                ssh_client=False)
+        self.assertEqual(['0.0.0.0:22'], [row['local'] for row in table])
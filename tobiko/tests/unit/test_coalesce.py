@@ -0,0 +1,155 @@
+# Copyright (c) 2026 Red Hat
+# All Rights Reserved.
+#
+#    Licensed under the Apache License, Version 2.0 (the "License"); you may
+#    not use this file except in compliance with the License. You may obtain
+#    a copy of the License at
+#
+#         http://www.apache.org/licenses/LICENSE-2.0
+#
+#    Unless required by applicable law or agreed to in writing, software
+#    distributed under the License is distributed on an "AS IS" BASIS, WITHOUT
+#    WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied. See the
+#    License for the specific language governing permissions and limitations
+#    under the License.
+from __future__ import absolute_import
+
+import threading
+
+import tobiko
+from tobiko.tests import unit
+
+
+class CoalescedTest(unit.TobikoUnitTest):
+
+    def setUp(self):
+        super(CoalescedTest, self).setUp()
+        self.coalescer = tobiko.CallCoalescer()
+        self.release = threading.Event()
+        self.calls = []
+
+    def wait_for(self, object_id, status='ACTIVE', fail=False):
+        self.calls.append((object_id, status))
+        self.release.wait(timeout=10.)
+        if fail:
+            raise RuntimeError(f'{object_id} failed')
+        return f'{object_id} is {status}'
+
+    def coalesced(self, key=None):
+        if key is None:
+            def key(object_id, status='ACTIVE', fail=False):
+                # pylint: disable=unused-argument
+                return object_id, status
+        return tobiko.coalesced(key=key, coalescer=self.coalescer)(
+            self.wait_for)
+
+    def run_threads(self, function, *calls):
+        results = [None] * len(calls)
+
+        def run(index, args):
+            try:
+                results[index] = function(*args)
+            except Exception as ex:
+                results[index] = ex
+
+        threads = [threading.Thread(target=run, args=(index, args))
+                   for index, args in enumerate(calls)]
+        for thread in threads:
+            thread.start()
+        for _ in tobiko.retry(timeout=10., sleep_time=0.01):
+            with self.coalescer._lock:
+                waiters = sum(call.waiters
+                              for call in self.coalescer._calls.values())
+            if waiters >= len(calls):
+                break
+        self.release.set()
+        for thread in threads:
+            thread.join(timeout=10.)
+        return results
+
+    def test_coalesced(self):
+        results = self.run_threads(self.coalesced(),
+                                   ('a',), ('a',), ('a',))
+        self.assertEqual(['a is ACTIVE'] * 3, results)
+        self.assertEqual([('a', 'ACTIVE')], self.calls)
+        self.assertEqual([], self.coalescer.list_keys())
+
+    def test_coalesced_with_different_keys(self):
+        results = self.run_threads(self.coalesced(),
+                                   ('a',), ('b',), ('a', 'ERROR'))
+        self.assertEqual(['a is ACTIVE', 'b is ACTIVE', 'a is ERROR'],
+                         results)
+        self.assertEqual({('a', 'ACTIVE'), ('b', 'ACTIVE'), ('a', 'ERROR')},
+                         set(self.calls))
+
+    def test_coalesced_with_failure(self):
+        results = self.run_threads(self.coalesced(),
+                                   ('a', 'ACTIVE', True),
+                                   ('a', 'ACTIVE', True))
+        self.assertEqual(1, len(self.calls))
+        for result in results:
+            self.assertIsInstance(result, RuntimeError)
+            self.assertEqual('a failed', str(result))
+
+    def test_coalesced_is_not_cached(self):
+        self.release.set()
+        function = self.coalesced()
+        self.assertEqual('a is ACTIVE', function('a'))
+        self.assertEqual('a is ACTIVE', function('a'))
+        self.assertEqual([('a', 'ACTIVE')] * 2, self.calls)
+
+    def test_coalesced_without_key(self):
+        self.release.set()
+        function = self.coalesced(key=lambda *args, **kwargs: None)
+        self.assertEqual('a is ACTIVE', function('a'))
+        self.assertEqual([('a', 'ACTIVE')], self.calls)
+
+    def test_coalesced_with_unhashable_key(self):
+        self.release.set()
+        function = self.coalesced(key=lambda *args, **kwargs: [args])
+        self.assertEqual('a is ACTIVE', function('a'))
+        self.assertEqual([('a', 'ACTIVE')], self.calls)
+
+    def test_coalesced_with_late_caller(self):
+        ready_time = tobiko.time() + 1.25
+        timeouts = []
+
+        def wait_for(object_id, timeout=None):
+            timeouts.append(timeout)
+            for attempt in tobiko.retry(timeout=timeout, interval=0.05):
+                if tobiko.time() >= ready_time:
+                    return f'{object_id} is ready'
+                attempt.check_limits()
+
+        def key(object_id, timeout=None):
+            # pylint: disable=unused-argument
+            return object_id
+
+        def get_timeout(object_id, timeout=None):
+            # pylint: disable=unused-argument
+            return timeout
+
+        function = tobiko.coalesced(key=key,
+                                    timeout=get_timeout,
+                                    coalescer=self.coalescer)(wait_for)
+        results = {}
+
+        def run(name):
+            try:
+                results[name] = function('a', timeout=1.)
+            except Exception as ex:
+                results[name] = ex
+
+        leader = threading.Thread(target=run, args=('leader',))
+        leader.start()
+        tobiko.sleep(0.5)
+        joiner = threading.Thread(target=run, args=('joiner',))
+        joiner.start()
+        leader.join(timeout=10.)
+        joiner.join(timeout=10.)
+
+        self.assertIsInstance(results['leader'], tobiko.RetryTimeLimitError)
+        self.assertEqual('a is ready', results['joiner'])
+        self.assertEqual(2, len(timeouts))
+        self.assertLess(timeouts[1], 1.)
+        self.assertEqual([], self.coalescer.list_keys())
@@ -0,0 +1,62 @@
+# Copyright (c) 2026 Red Hat
+# All Rights Reserved.
+#
+#    Licensed under the Apache License, Version 2.0 (the "License"); you may
+#    not use this file except in compliance with the License. You may obtain
+#    a copy of the License at
+#
+#         http://www.apache.org/licenses/LICENSE-2.0
+#
+#    Unless required by applicable law or agreed to in writing, software
+#    distributed under the License is distributed on an "AS IS" BASIS, WITHOUT
+#    WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied. See the
+#    License for the specific language governing permissions and limitations
+#    under the License.
+from __future__ import absolute_import
+
+import threading
+
+import tobiko
+from tobiko.tests import unit
+
+
+class RunConcurrentlyTest(unit.TobikoUnitTest):
+
+    def test_run_concurrently(self):
+        calls = tobiko.run_concurrently({'a': lambda: 1, 'b': lambda: 2})
+        self.assertIsInstance(calls, tobiko.ConcurrentCalls)
+        self.assertEqual({'a': 1, 'b': 2}, calls.results())
+        for call in calls.values():
+            self.assertTrue(call.succeeded)
+            self.assertGreaterEqual(call.elapsed_time, 0.)
+
+    def test_run_concurrently_with_empty(self):
+        self.assertEqual({}, tobiko.run_concurrently({}))
+
+    def test_run_concurrently_is_synchronized(self):
+        # Every function blocks until all of them are running: it would
+        # deadlock if they were executed one by one
+        started = threading.Barrier(3, timeout=5.)
+        calls = tobiko.run_concurrently(
+            {i: started.wait for i in range(3)}, timeout=10.)
+        self.assertEqual([0, 1, 2], sorted(calls.results().values()))
+
+    def test_run_concurrently_with_failure(self):
+        def fail():
+            raise ValueError('some error')
+
+        calls = tobiko.run_concurrently({'ok': lambda: 'ok', 'ko': fail})
+        self.assertEqual(['ok'], list(calls.succeeded))
+        self.assertEqual(['ko'], list(calls.failed))
+        self.assertRaises(ValueError, calls['ko'].get)
+        self.assertRaises(ValueError, calls.results)
+
+    def test_run_concurrently_with_timeout(self):
+        event = threading.Event()
+        self.addCleanup(event.set)
+        calls = tobiko.run_concurrently({'fast': lambda: 'done',
+                                         'slow': event.wait},
+                                        timeout=.2)
+        self.assertEqual('done', calls['fast'].get())
+        self.assertFalse(calls['slow'].done)
+        self.assertRaises(tobiko.ConcurrentCallTimeout, calls['slow'].get)
@@ -0,0 +1,187 @@
+# Copyright (c) 2026 Red Hat
+# All Rights Reserved.
+#
+#    Licensed under the Apache License, Version 2.0 (the "License"); you may
+#    not use this file except in compliance with the License. You may obtain
+#    a copy of the License at
+#
+#         http://www.apache.org/licenses/LICENSE-2.0
+#
+#    Unless required by applicable law or agreed to in writing, software
+#    distributed under the License is distributed on an "AS IS" BASIS, WITHOUT
+#    WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied. See the
+#    License for the specific language governing permissions and limitations
+#    under the License.
+from __future__ import absolute_import
+
+import contextlib
+import os
+
+import tobiko
+from tobiko.common import _diskcache
+from tobiko.common import _lockutils
+from tobiko.tests import unit
+
+
+class DiskCacheTest(unit.TobikoUnitTest):
+
+    def setUp(self):
+        super(DiskCacheTest, self).setUp()
+        self.cache = tobiko.DiskCache(cache_dir=self.create_tempdir(),
+                                      ttl=60.)
+        self.lock_names = []
+        self.patch(_lockutils, 'lock', self.mock_lock)
+        self.patch_time(current_time=1000., time_increment=0.)
+        self.patch(_diskcache, 'CLOUD_IDENTITY_FUNCTIONS', [])
+
+    def mock_lock(self, name):
+        self.lock_names.append(name)
+        return contextlib.nullcontext()
+
+    def test_get_missing(self):
+        self.assertIsNone(self.cache.get('missing'))
+        self.assertEqual('default', self.cache.get('missing', 'default'))
+
+    def test_set_and_get(self):
+        self.cache.set('key', {'a': 1})
+        self.assertEqual({'a': 1}, self.cache.get('key'))
+        self.assertEqual([os.path.basename(self.cache.get_path('key'))],
+                         os.listdir(self.cache.cache_dir))
+
+    def test_get_expired(self):
+        self.cache.set('key', 'value', ttl=10.)
+        self.mock_time.patch_time(current_time=1009.)
+        self.assertEqual('value', self.cache.get('key'))
+        self.mock_time.patch_time(current_time=1010.)
+        self.assertIsNone(self.cache.get('key'))
+
+    def test_get_corrupted(self):
+        self.cache.set('key', 'value')
+        with open(self.cache.get_path('key'), 'wb') as fd:
+            fd.write(b'corrupted')
+        self.assertIsNone(self.cache.get('key'))
+
+    def test_delete_and_clear(self):
+        self.cache.set('key1', 1)
+        self.cache.set('key2', 2)
+        self.cache.delete('key1')
+        self.cache.delete('key1')
+        self.assertIsNone(self.cache.get('key1'))
+        self.assertEqual(2, self.cache.get('key2'))
+        self.cache.clear()
+        self.assertEqual([], os.listdir(self.cache.cache_dir))
+
+    def test_disk_cached(self):
+        calls = []
+
+        @tobiko.disk_cached(cache=self.cache)
+        def discover(name, suffix=''):
+            calls.append(name)
+            return name + suffix
+
+        self.assertEqual('a!', discover('a', suffix='!'))
+        self.assertEqual('a!', discover('a', suffix='!'))
+        self.assertEqual('b', discover('b'))
+        self.assertEqual(['a', 'b'], calls)
+        self.assertEqual(2, len(self.lock_names))
+
+    def test_disk_cached_with_key(self):
+        calls = []
+
+        @tobiko.disk_cached(key=lambda client: client['hostname'],
+                            cache=self.cache)
+        def discover(client):
+            calls.append(client)
+            return client['hostname']
+
+        discover({'hostname': 'host0', 'session': 1})
+        discover({'hostname': 'host0', 'session': 2})
+        self.assertEqual([{'hostname': 'host0', 'session': 1}], calls)
+
+    def test_disk_cached_expired(self):
+        calls = []
+
+        @tobiko.disk_cached(ttl=5., cache=self.cache)
+        def discover():
+            calls.append(tobiko.time())
+            return len(calls)
+
+        self.assertEqual(1, discover())
+        self.mock_time.patch_time(current_time=1004.)
+        self.assertEqual(1, discover())
+        self.mock_time.patch_time(current_time=1005.)
+        self.assertEqual(2, discover())
+
+    def test_disk_cached_not_caching_failures(self):
+        calls = []
+
+        @tobiko.disk_cached(cache=self.cache)
+        def discover():
+            calls.append(None)
+            if len(calls) == 1:
+                raise RuntimeError('failure')
+            if len(calls) == 2:
+                return None
+            return 'value'
+
+        self.assertRaises(RuntimeError, discover)
+        self.assertIsNone(discover())
+        self.assertEqual('value', discover())
+        self.assertEqual('value', discover())
+        self.assertEqual(3, len(calls))
+
+    def test_disk_cached_disabled(self):
+        cache = tobiko.DiskCache(cache_dir=self.cache.cache_dir, ttl=0.)
+        calls = []
+
+        @tobiko.disk_cached(cache=cache)
+        def discover():
+            calls.append(None)
+            return len(calls)
+
+        self.assertEqual(1, discover())
+        self.assertEqual(2, discover())
+        self.assertEqual([], os.listdir(cache.cache_dir))
+
+    def test_disk_cached_by_cloud_identity(self):
+        calls = []
+
+        @tobiko.disk_cached(cache=self.cache)
+        def discover():
+            calls.append(None)
+            return len(calls)
+
+        self.patch(_diskcache, 'get_cloud_identity', lambda: 'cloud1')
+        self.assertEqual(1, discover())
+        self.patch(_diskcache, 'get_cloud_identity', lambda: 'cloud2')
+        self.assertEqual(2, discover())
+        self.patch(_diskcache, 'get_cloud_identity', lambda: 'cloud1')
+        self.assertEqual(1, discover())
+
+    def test_get_cloud_identity(self):
+        self.patch(os, 'environ', {'OS_CLOUD': 'cloud1'})
+        identity = tobiko.get_cloud_identity()
+        self.assertIn('OS_CLOUD=cloud1', identity)
+        self.patch(os, 'environ', {'OS_CLOUD': 'cloud2'})
+        self.assertNotEqual(identity, tobiko.get_cloud_identity())
+
+    def test_get_cloud_identity_with_registered_function(self):
+        tobiko.register_cloud_identity(lambda: 'keystone.auth_url=url1')
+        self.assertIn('keystone.auth_url=url1', tobiko.get_cloud_identity())
+
+    def test_disk_cached_with_unknown_cloud_identity(self):
+        calls = []
+
+        @tobiko.register_cloud_identity
+        def get_identity():
+            raise RuntimeError('no credentials')
+
+        @tobiko.disk_cached(cache=self.cache)
+        def discover():
+            calls.append(None)
+            return len(calls)
+
+        self.assertIsNone(tobiko.get_cloud_identity())
+        self.assertEqual(1, discover())
+        self.assertEqual(2, discover())
+        self.assertEqual([], os.listdir(self.cache.cache_dir))
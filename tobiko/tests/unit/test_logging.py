@@ -14,9 +14,13 @@
 #    under the License.
 from __future__ import absolute_import
 
+import logging
+import os
+
 from oslo_log import log
 
 import tobiko
+from tobiko.common import _logging
 from tobiko.tests import unit
 
 
@@ -37,3 +41,39 @@ class CapureLogTest(unit.TobikoUnitTest):
             lines = '\n'.join(logged_lines)
             self.fail(f"log line not captured: '{expected}' not in \n"
                       f"{lines}")
+
+
+class CaptureLogHandlerTest(unit.TobikoUnitTest):
+
+    def make_handler(self, max_records: int):
+        handler = _logging.CaptureLogHandler(level=logging.DEBUG,
+                                             max_records=max_records)
+        handler.setFormatter(logging.Formatter('%(message)s'))
+        logger = logging.getLogger(f'{__name__}.{self.id()}')
+        logger.setLevel(logging.DEBUG)
+        logger.addHandler(handler)
+        self.addCleanup(logger.removeHandler, handler)
+        return handler, logger
+
+    def test_format_all(self):
+        handler, logger = self.make_handler(max_records=0)
+        for i in range(10):
+            logger.debug('line %d', i)
+        self.assertEqual(10, len(handler.records))
+        self.assertIsNone(handler.spill_file)
+        self.assertEqual([f'line {i}\n' for i in range(10)],
+                         list(handler.format_all()))
+
+    def test_format_all_with_spill_file(self):
+        handler, logger = self.make_handler(max_records=4)
+        for i in range(10):
+            logger.debug('line %d', i)
+        self.assertLessEqual(len(handler.records), 4)
+        self.assertEqual(10, handler.spilled_records + len(handler.records))
+        self.assertTrue(os.path.isfile(handler.spill_file))
+        self.assertEqual(''.join(f'line {i}\n' for i in range(10)),
+                         ''.join(handler.format_all()))
+        # it can be read again while records are still being captured
+        logger.debug('line 10')
+        self.assertEqual(''.join(f'line {i}\n' for i in range(11)),
+                         ''.join(handler.format_all()))
@@ -370,3 +370,136 @@ class RetryTest(unit.TobikoUnitTest):
                                               timeout=3.).is_last)
         self.assertTrue(tobiko.retry_attempt(elapsed_time=2.,
                                              timeout=2.).is_last)
+
+
+class RetryBackoffTest(unit.TobikoUnitTest):
+
+    def test_get_retry_backoff(self):
+        self.assertIsNone(tobiko.get_retry_backoff(None))
+        self.assertIsNone(tobiko.get_retry_backoff('fixed'))
+        self.assertEqual(
+            tobiko.ExponentialRetryBackoff(interval=2., max_sleep_time=10.),
+            tobiko.get_retry_backoff('exponential', interval=2.))
+        backoff = tobiko.FastFirstRetryBackoff()
+        self.assertIs(backoff, tobiko.get_retry_backoff(backoff))
+
+    def test_get_retry_backoff_with_invalid_name(self):
+        ex = self.assertRaises(tobiko.InvalidRetryBackoff,
+                               tobiko.get_retry_backoff, 'unknown')
+        self.assertEqual(
+            "Invalid retry backoff: 'unknown' (valid values are "
+            "decorrelated_jitter, exponential, fast_first, fixed)", str(ex))
+
+    def test_exponential(self):
+        backoff = tobiko.ExponentialRetryBackoff(interval=1.,
+                                                 max_sleep_time=10.,
+                                                 jitter=0.)
+        sleep_times = [
+            backoff.get_sleep_time(tobiko.retry_attempt(number=number))
+            for number in range(1, 7)]
+        self.assertEqual([1., 2., 4., 8., 10., 10.], sleep_times)
+
+    def test_exponential_with_jitter(self):
+        backoff = tobiko.ExponentialRetryBackoff(interval=4.,
+                                                 max_sleep_time=10.)
+        for _ in range(100):
+            sleep_time = backoff.get_sleep_time(
+                tobiko.retry_attempt(number=1))
+            self.assertGreaterEqual(sleep_time, 3.6)
+            self.assertLessEqual(sleep_time, 4.4)
+
+    def test_decorrelated_jitter(self):
+        backoff = tobiko.DecorrelatedJitterRetryBackoff(interval=1.,
+                                                        max_sleep_time=10.)
+        last_sleep_time = None
+        for number in range(1, 100):
+            sleep_time = backoff.get_sleep_time(
+                tobiko.retry_attempt(number=number),
+                last_sleep_time=last_sleep_time)
+            self.assertGreaterEqual(sleep_time, 1.)
+            self.assertLessEqual(sleep_time,
+                                 min(10., 3. * (last_sleep_time or 1.)))
+            last_sleep_time = sleep_time
+
+    def test_fast_first(self):
+        backoff = tobiko.FastFirstRetryBackoff(interval=5.,
+                                               fast_sleep_time=1.,
+                                               fast_count=2,
+                                               jitter=0.)
+        sleep_times = [
+            backoff.get_sleep_time(tobiko.retry_attempt(number=number))
+            for number in range(1, 5)]
+        self.assertEqual([1., 1., 5., 5.], sleep_times)
+
+    def test_retry_with_backoff(self):
+        mock_time = self.patch_time(time_increment=0.)
+        backoff = tobiko.ExponentialRetryBackoff(interval=1.,
+                                                 max_sleep_time=10.,
+                                                 jitter=0.)
+        attempts = []
+        for attempt in tobiko.retry(count=5, backoff=backoff):
+            attempts.append(attempt)
+            if attempt.is_last:
+                break
+        self.assertEqual(5, len(attempts))
+        mock_time.sleep.assert_has_calls([mock.call(1.),
+                                          mock.call(2.),
+                                          mock.call(4.),
+                                          mock.call(8.)])
+
+    def test_retry_with_backoff_and_timeout(self):
+        mock_time = self.patch_time(time_increment=0.)
+        backoff = tobiko.ExponentialRetryBackoff(interval=2.,
+                                                 max_sleep_time=10.,
+                                                 jitter=0.)
+        attempts = []
+        with testtools.ExpectedException(tobiko.RetryTimeLimitError):
+            for attempt in tobiko.retry(timeout=7., backoff=backoff):
+                attempts.append(attempt)
+        self.assertEqual([0., 2., 6., 7.],
+                         [attempt.elapsed_time for attempt in attempts])
+        mock_time.sleep.assert_has_calls([mock.call(2.),
+                                          mock.call(4.),
+                                          mock.call(1.)])
+
+    def test_retry_with_configured_backoff(self):
+        mock_time = self.patch_time(time_increment=0.)
+        common = tobiko.tobiko_config().common
+        self.patch(common, 'retry_backoff', 'fast_first')
+        for attempt in tobiko.retry(count=3, interval=5.):
+            if attempt.is_last:
+                break
+        self.assertEqual(2, mock_time.sleep.call_count)
+        for call in mock_time.sleep.call_args_list:
+            self.assertLessEqual(call.args[0], 0.55)
+
+    def test_retry_with_configured_backoff_and_sleep_time(self):
+        mock_time = self.patch_time(time_increment=0.)
+        common = tobiko.tobiko_config().common
+        self.patch(common, 'retry_backoff', 'exponential')
+        for attempt in tobiko.retry(count=3, sleep_time=3.):
+            if attempt.is_last:
+                break
+        mock_time.sleep.assert_has_calls([mock.call(3.), mock.call(3.)])
+
+    def test_retry_with_default_backoff(self):
+        mock_time = self.patch_time(time_increment=0.)
+        common = tobiko.tobiko_config().common
+        self.patch(common, 'retry_backoff', None)
+        for attempt in tobiko.retry(count=3, interval=5.,
+                                    default_backoff='fast_first'):
+            if attempt.is_last:
+                break
+        self.assertEqual(2, mock_time.sleep.call_count)
+        for call in mock_time.sleep.call_args_list:
+            self.assertLessEqual(call.args[0], 0.55)
+
+    def test_retry_with_configured_backoff_and_default_backoff(self):
+        mock_time = self.patch_time(time_increment=0.)
+        common = tobiko.tobiko_config().common
+        self.patch(common, 'retry_backoff', 'fixed')
+        for attempt in tobiko.retry(count=3, interval=5.,
+                                    default_backoff='fast_first'):
+            if attempt.is_last:
+                break
+        mock_time.sleep.assert_has_calls([mock.call(5.), mock.call(5.)])
@@ -0,0 +1,97 @@
+# Copyright (c) 2026 Red Hat
+# All Rights Reserved.
+#
+#    Licensed under the Apache License, Version 2.0 (the "License"); you may
+#    not use this file except in compliance with the License. You may obtain
+#    a copy of the License at
+#
+#         http://www.apache.org/licenses/LICENSE-2.0
+#
+#    Unless required by applicable law or agreed to in writing, software
+#    distributed under the License is distributed on an "AS IS" BASIS, WITHOUT
+#    WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied. See the
+#    License for the specific language governing permissions and limitations
+#    under the License.
+from __future__ import absolute_import
+
+import json
+import os
+
+import tobiko
+from tobiko.common import _timing
+from tobiko.tests import unit
+
+
+class TimingRecorderTest(unit.TobikoUnitTest):
+
+    def setUp(self):
+        super(TimingRecorderTest, self).setUp()
+        self.recorder = tobiko.TimingRecorder()
+        self.patch(_timing, 'TIMING_RECORDER', self.recorder)
+
+    def test_record(self):
+        self.recorder.test_id = 'test-1'
+        tobiko.record_timing(tobiko.SHELL_TIMING, 'ls', .2, host='host-0')
+        tobiko.record_timing(tobiko.SHELL_TIMING, 'ls', 2., host='host-0')
+        tobiko.record_timing(tobiko.SLEEP_TIMING, 'wait', 7.)
+        self.recorder.test_id = 'test-2'
+        tobiko.record_timing(tobiko.SHELL_TIMING, 'ls', .4, host='host-0')
+
+        stats = self.recorder.get_stats('test-1')[_timing.TimingKey(
+            kind=tobiko.SHELL_TIMING, name='ls', host='host-0')]
+        self.assertEqual(2, stats.count)
+        self.assertAlmostEqual(2.2, stats.total)
+        self.assertEqual(.2, stats.min)
+        self.assertEqual(2., stats.max)
+        self.assertAlmostEqual(1.1, stats.mean)
+        self.assertEqual([0, 0, 0, 1, 0, 1, 0, 0, 0, 0, 0], stats.histogram)
+
+        session_stats = self.recorder.get_stats()[_timing.TimingKey(
+            kind=tobiko.SHELL_TIMING, name='ls', host='host-0')]
+        self.assertEqual(3, session_stats.count)
+        self.assertAlmostEqual(2.6, session_stats.total)
+
+    def test_get_totals(self):
+        self.recorder.test_id = 'test-1'
+        tobiko.record_timing(tobiko.API_TIMING, 'compute GET /servers', .5)
+        tobiko.record_timing(tobiko.SLEEP_TIMING, 'wait', 5.)
+        self.assertEqual({tobiko.API_TIMING: .5,
+                          tobiko.SHELL_TIMING: 0.,
+                          tobiko.SLEEP_TIMING: 5.},
+                         self.recorder.get_totals('test-1'))
+        self.assertEqual(0., self.recorder.get_totals('test-2')[
+            tobiko.API_TIMING])
+
+    def test_measure_timing(self):
+        self.patch_time(current_time=10., time_increment=0.)
+        self.recorder.test_id = 'test-1'
+        with tobiko.measure_timing(tobiko.SHELL_TIMING, 'ls'):
+            self.mock_time.patch_time(current_time=13.)
+        self.assertEqual(3., self.recorder.get_totals('test-1')[
+            tobiko.SHELL_TIMING])
+
+    def test_retry_sleep(self):
+        self.patch_time(current_time=0., time_increment=0.)
+        self.recorder.test_id = 'test-1'
+        for attempt in tobiko.retry(count=3, interval=2.):
+            if attempt.is_last:
+                break
+        stats = self.recorder.get_stats('test-1')[_timing.TimingKey(
+            kind=tobiko.SLEEP_TIMING, name=f'{__name__}.test_retry_sleep')]
+        self.assertEqual(2, stats.count)
+
+    def test_dump_json(self):
+        self.recorder.test_id = 'test-1'
+        tobiko.record_timing(tobiko.SHELL_TIMING, 'ls', .2, host='host-0')
+        path = os.path.join(self.create_tempdir(), 'timings.json')
+        self.recorder.dump_json(path)
+        with open(path) as fd:
+            data = json.load(fd)
+        self.assertEqual(['test-1'], list(data['tests']))
+        self.assertEqual(1, len(data['session']))
+        self.assertEqual({'kind': 'shell', 'name': 'ls', 'host': 'host-0',
+                          'count': 1, 'total': .2, 'min': .2, 'max': .2,
+                          'mean': .2},
+                         {key: value
+                          for key, value in data['session'][0].items()
+                          if key != 'histogram'})
@@ -0,0 +1,85 @@
+# Copyright (c) 2026 Red Hat
+# All Rights Reserved.
+#
+#    Licensed under the Apache License, Version 2.0 (the "License"); you may
+#    not use this file except in compliance with the License. You may obtain
+#    a copy of the License at
+#
+#         http://www.apache.org/licenses/LICENSE-2.0
+#
+#    Unless required by applicable law or agreed to in writing, software
+#    distributed under the License is distributed on an "AS IS" BASIS, WITHOUT
+#    WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied. See the
+#    License for the specific language governing permissions and limitations
+#    under the License.
+from __future__ import absolute_import
+
+import threading
+import typing
+
+import tobiko
+from tobiko import tripleo
+from tobiko.tripleo import _overcloud
+from tobiko.tests import unit
+
+
+class OvercloudInstance(typing.NamedTuple):
+    name: str
+
+
+class CollectOvercloudNodesTableDataTest(unit.TobikoUnitTest):
+
+    instances = [OvercloudInstance('controller-0'),
+                 OvercloudInstance('compute-0'),
+                 OvercloudInstance('compute-1')]
+
+    def setUp(self):
+        super(CollectOvercloudNodesTableDataTest, self).setUp()
+        self.patch(_overcloud, 'list_overcloud_nodes',
+                   lambda: self.instances)
+        self.patch(_overcloud, 'overcloud_ssh_client',
+                   lambda instance: instance.name)
+        self.threads: typing.List[str] = []
+
+    def get_node_table(self, ssh_client):
+        self.threads.append(threading.current_thread().name)
+        if ssh_client == 'compute-0':
+            raise RuntimeError('unreachable')
+        return tobiko.TableData([{'PROCESS': 'sshd',
+                                  'overcloud_node': ssh_client}])
+
+    def test_collect_overcloud_nodes_tabledata(self):
+        result = tripleo.collect_overcloud_nodes_tabledata(
+            self.get_node_table)
+        self.assertEqual(['compute-0'], result.failed_nodes)
+        self.assertEqual(['controller-0', 'compute-1'],
+                         [row['overcloud_node'] for row in result.table])
+        self.assertEqual(3, len(self.threads))
+        self.assertNotIn(threading.current_thread().name, self.threads)
+
+    def test_get_overcloud_nodes_tabledata(self):
+        ex = self.assertRaises(tripleo.OvercloudNodesTableDataError,
+                               _overcloud.get_overcloud_nodes_tabledata,
+                               self.get_node_table)
+        self.assertEqual(['compute-0'], ex.nodes)
+
+    def test_get_overcloud_nodes_tabledata_without_check(self):
+        table = _overcloud.get_overcloud_nodes_tabledata(
+            self.get_node_table, check=False)
+        self.assertEqual(['controller-0', 'compute-1'],
+                         [row['overcloud_node'] for row in table])
+
+    def test_collect_overcloud_nodes_tabledata_with_timeout(self):
+        event = threading.Event()
+        self.addCleanup(event.set)
+
+        def get_node_table(ssh_client):
+            if ssh_client == 'compute-1':
+                event.wait()
+            return tobiko.TableData([{'overcloud_node': ssh_client}])
+
+        result = tripleo.collect_overcloud_nodes_tabledata(get_node_table,
+                                                           timeout=.5)
+        self.assertEqual(['compute-1'], result.failed_nodes)
+        self.assertEqual(['controller-0', 'compute-0'],
+                         [row['overcloud_node'] for row in result.table])
@@ -0,0 +1,230 @@
+# Copyright (c) 2026 Red Hat
+# All Rights Reserved.
+#
+#    Licensed under the Apache License, Version 2.0 (the "License"); you may
+#    not use this file except in compliance with the License. You may obtain
+#    a copy of the License at
+#
+#         http://www.apache.org/licenses/LICENSE-2.0
+#
+#    Unless required by applicable law or agreed to in writing, software
+#    distributed under the License is distributed on an "AS IS" BASIS, WITHOUT
+#    WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied. See the
+#    License for the specific language governing permissions and limitations
+#    under the License.
+from __future__ import absolute_import
+
+from tobiko.tripleo import pacemaker
+from tobiko.tests import unit
+
+
+CRM_MON_XML = """<?xml version="1.0"?>
+<pacemaker-result api-version="2.25" request="crm_mon --output-as=xml">
+  <nodes>
+    <node name="controller-0" id="1" online="true" type="member"/>
+    <node name="controller-1" id="2" online="true" type="member"/>
+  </nodes>
+  <resources>
+    <bundle id="galera-bundle" type="podman" unique="false" failed="false">
+      <replica id="0">
+        <resource id="galera-bundle-podman-0"
+                  resource_agent="ocf:heartbeat:podman" role="Started"
+                  active="true" failed="false">
+          <node name="controller-0" id="1" cached="true"/>
+        </resource>
+        <resource id="galera" resource_agent="ocf:heartbeat:galera"
+                  role="Promoted" active="true" failed="false">
+          <node name="galera-bundle-0" id="galera-bundle-0" cached="true"/>
+        </resource>
+        <resource id="galera-bundle-0" resource_agent="ocf:pacemaker:remote"
+                  role="Started" active="true" failed="false">
+          <node name="controller-0" id="1" cached="true"/>
+        </resource>
+      </replica>
+      <replica id="1">
+        <resource id="galera-bundle-podman-1"
+                  resource_agent="ocf:heartbeat:podman" role="Started"
+                  active="true" failed="false">
+          <node name="controller-1" id="2" cached="true"/>
+        </resource>
+        <resource id="galera" resource_agent="ocf:heartbeat:galera"
+                  role="Promoted" active="true" failed="true">
+          <node name="galera-bundle-1" id="galera-bundle-1" cached="true"/>
+        </resource>
+        <resource id="galera-bundle-1" resource_agent="ocf:pacemaker:remote"
+                  role="Started" active="true" failed="false">
+          <node name="controller-1" id="2" cached="true"/>
+        </resource>
+      </replica>
+    </bundle>
+    <bundle id="haproxy-bundle" type="podman" unique="false" failed="false">
+      <replica id="0">
+        <resource id="haproxy-bundle-podman-0"
+                  resource_agent="ocf:heartbeat:podman" role="Started"
+                  active="true" failed="false">
+          <node name="controller-0" id="1" cached="true"/>
+        </resource>
+      </replica>
+      <replica id="1">
+        <resource id="haproxy-bundle-podman-1"
+                  resource_agent="ocf:heartbeat:podman" role="Stopped"
+                  active="false" failed="false"/>
+      </replica>
+    </bundle>
+    <resource id="ip-10.0.0.101" resource_agent="ocf:heartbeat:IPaddr2"
+              role="Started" active="true" failed="false">
+      <node name="controller-1" id="2" cached="true"/>
+    </resource>
+    <clone id="stonith-clone" multi_state="false" unique="false">
+      <resource id="stonith-fence_ipmilan-0"
+                resource_agent="stonith:fence_ipmilan" role="Started"
+                active="true" failed="false">
+        <node name="controller-0" id="1" cached="true"/>
+      </resource>
+    </clone>
+  </resources>
+</pacemaker-result>
+"""
+
+PCS_STATUS_RESOURCES = """
+  * galera-bundle-0\t(ocf:heartbeat:galera):\t Promoted controller-0
+  * galera-bundle-1\t(ocf:heartbeat:galera):\t Promoted controller-1
+  * ip-10.0.0.101\t(ocf:heartbeat:IPaddr2):\t Started controller-1
+"""
+
+
+class ParseCrmMonXmlTest(unit.TobikoUnitTest):
+
+    def test_parse_crm_mon_xml(self):
+        resources = pacemaker.parse_crm_mon_xml(CRM_MON_XML)
+        expected = [
+            pacemaker.PcsResource('galera-bundle-0',
+                                  '(ocf:heartbeat:galera):',
+                                  'Promoted', 'controller-0'),
+            pacemaker.PcsResource('galera-bundle-1',
+                                  '(ocf:heartbeat:galera):',
+                                  'FAILED', 'controller-1'),
+            pacemaker.PcsResource('haproxy-bundle-podman-0',
+                                  '(ocf:heartbeat:podman):',
+                                  'Started', 'controller-0'),
+            pacemaker.PcsResource('haproxy-bundle-podman-1',
+                                  '(ocf:heartbeat:podman):',
+                                  'Stopped', None),
+            pacemaker.PcsResource('ip-10.0.0.101',
+                                  '(ocf:heartbeat:IPaddr2):',
+                                  'Started', 'controller-1'),
+            pacemaker.PcsResource('stonith-fence_ipmilan-0',
+                                  '(stonith:fence_ipmilan):',
+                                  'Started', 'controller-0')]
+        self.assertEqual(expected, resources)
+
+    def test_parse_crm_mon_xml_with_legacy_roles(self):
+        output = (CRM_MON_XML.replace('"Promoted"', '"Master"')
+                  .replace('ocf:heartbeat:', 'ocf::heartbeat:'))
+        self.assertEqual(pacemaker.parse_crm_mon_xml(CRM_MON_XML),
+                         pacemaker.parse_crm_mon_xml(output))
+
+    def test_parse_crm_mon_xml_with_legacy_names(self):
+        names = pacemaker.CrmMonNames(ocf_prefix='ocf::',
+                                      promoted='Master',
+                                      unpromoted='Slave')
+        for role in ['Promoted', 'Master']:
+            output = CRM_MON_XML.replace('"Promoted"', f'"{role}"')
+            resource = pacemaker.parse_crm_mon_xml(output, names=names)[0]
+            self.assertEqual(
+                pacemaker.PcsResource('galera-bundle-0',
+                                      '(ocf::heartbeat:galera):',
+                                      'Master', 'controller-0'),
+                resource)
+
+    def test_crm_mon_names_get_state(self):
+        names = pacemaker.CrmMonNames()
+        self.assertEqual(['Promoted', 'Promoted', 'Unpromoted',
+                          'Unpromoted', 'Started'],
+                         [names.get_state(role)
+                          for role in ['Master', 'Promoted', 'Slave',
+                                       'Unpromoted', 'Started']])
+
+    def test_parse_crm_mon_xml_without_resources(self):
+        self.assertRaises(ValueError, pacemaker.parse_crm_mon_xml,
+                          '<pacemaker-result/>')
+
+    def test_parse_pcs_status_resources(self):
+        resources = pacemaker.parse_pcs_status_resources(
+            PCS_STATUS_RESOURCES)
+        self.assertEqual(
+            pacemaker.parse_crm_mon_xml(CRM_MON_XML)[0], resources[0])
+        self.assertEqual(3, len(resources))
+
+
+class PcsResourcesModelTest(unit.TobikoUnitTest):
+
+    model = pacemaker.PcsResourcesModel(
+        pacemaker.parse_crm_mon_xml(CRM_MON_XML))
+
+    def test_count(self):
+        self.assertEqual(2, self.model.count('(ocf:heartbeat:galera):'))
+        self.assertEqual(1, self.model.count('(ocf:heartbeat:galera):',
+                                             'Promoted'))
+        self.assertEqual(0, self.model.count('(ocf:heartbeat:redis):'))
+
+    def test_has_type(self):
+        self.assertTrue(self.model.has_type('(ocf:heartbeat:podman):'))
+        self.assertFalse(self.model.has_type('(ocf:heartbeat:redis):'))
+
+    def test_list_resources(self):
+        self.assertEqual(
+            ['galera-bundle-0', 'haproxy-bundle-podman-0',
+             'stonith-fence_ipmilan-0'],
+            [resource.resource
+             for resource in self.model.list_resources(
+                 overcloud_node='controller-0')])
+        self.assertEqual(
+            ['haproxy-bundle-podman-0'],
+            [resource.resource
+             for resource in self.model.list_resources(
+                 overcloud_node='controller-0',
+                 resource_type='(ocf:heartbeat:podman):',
+                 resource_state=None)])
+        self.assertEqual([], self.model.list_resources(resource='unknown'))
+
+    def test_list_values(self):
+        self.assertEqual(['controller-0', 'controller-1'],
+                         self.model.list_values(
+                             'overcloud_node',
+                             resource_type='(ocf:heartbeat:galera):'))
+
+    def test_to_table(self):
+        table = self.model.to_table()
+        self.assertEqual(pacemaker.PCS_RESOURCE_COLUMNS, table.columns)
+        self.assertEqual(len(self.model.resources), len(table))
+        self.assertEqual(
+            ['ip-10.0.0.101'],
+            table.query('resource_type == "(ocf:heartbeat:IPaddr2):"')[
+                'resource'].tolist())
+
+
+class PacemakerResourcesStatusTest(unit.TobikoUnitTest):
+
+    def setUp(self):
+        super(PacemakerResourcesStatusTest, self).setUp()
+        self.patch_time(current_time=0., time_increment=0.)
+        self.get_pcs_resources_model = self.patch(
+            pacemaker, 'get_pcs_resources_model',
+            side_effect=lambda: pacemaker.PcsResourcesModel(
+                pacemaker.parse_crm_mon_xml(CRM_MON_XML)))
+        self.patch(pacemaker, 'get_pcs_prefix_and_status_values',
+                   return_value=('ocf:', 'Promoted', 'Unpromoted'))
+
+    def test_galera_resource_healthy(self):
+        status = pacemaker.PacemakerResourcesStatus()
+        self.assertFalse(status.galera_resource_healthy())
+        self.assertEqual('podman', status.container_runtime())
+
+    def test_refresh(self):
+        status = pacemaker.PacemakerResourcesStatus()
+        model = status.model
+        self.assertIs(model, status.refresh())
+        self.mock_time.patch_time(current_time=status.poll_interval)
+        self.assertIsNot(model, status.refresh())
+        self.assertEqual(2, self.get_pcs_resources_model.call_count)
@@ -0,0 +1,86 @@
+# Copyright (c) 2026 Red Hat
+# All Rights Reserved.
+#
+#    Licensed under the Apache License, Version 2.0 (the "License"); you may
+#    not use this file except in compliance with the License. You may obtain
+#    a copy of the License at
+#
+#         http://www.apache.org/licenses/LICENSE-2.0
+#
+#    Unless required by applicable law or agreed to in writing, software
+#    distributed under the License is distributed on an "AS IS" BASIS, WITHOUT
+#    WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied. See the
+#    License for the specific language governing permissions and limitations
+#    under the License.
+from __future__ import absolute_import
+
+import tobiko
+from tobiko import tripleo
+from tobiko.tests import unit
+
+
+PROCESSES = [('ovn-controller', 'controller-0.redhat.local'),
+             ('ovn-controller', 'controller-1.redhat.local'),
+             ('ovn-controller', 'compute-0.redhat.local'),
+             ('ovn-northd', 'controller-0.redhat.local'),
+             ('ovn-northd', 'controller-0.redhat.local'),
+             ('sshd', 'compute-0.redhat.local')]
+
+
+class OvercloudNodesSnapshotTest(unit.TobikoUnitTest):
+
+    def setUp(self):
+        super(OvercloudNodesSnapshotTest, self).setUp()
+        table = tobiko.TableData([{'PROCESS': name, 'overcloud_node': node}
+                                  for name, node in PROCESSES])
+        self.snapshot = tripleo.OvercloudNodesSnapshot(
+            table, name_column='PROCESS',
+            node_groups={'controller': ['controller-0', 'controller-1'],
+                         'compute': ['compute-0', 'compute-1']})
+
+    def test_is_running(self):
+        self.assertTrue(self.snapshot.is_running('sshd'))
+        self.assertTrue(self.snapshot.is_running('sshd', node='compute-0'))
+        self.assertFalse(self.snapshot.is_running('sshd',
+                                                  node='controller-0'))
+        self.assertFalse(self.snapshot.is_running('haproxy'))
+
+    def test_list_nodes(self):
+        self.assertEqual(['controller-0.redhat.local',
+                          'controller-1.redhat.local',
+                          'compute-0.redhat.local'],
+                         self.snapshot.list_nodes('ovn-controller'))
+        self.assertEqual(['compute-0.redhat.local'],
+                         self.snapshot.list_nodes('ovn-controller',
+                                                  group='compute'))
+        self.assertEqual([], self.snapshot.list_nodes('haproxy'))
+
+    def test_count(self):
+        self.assertEqual(2, self.snapshot.count('ovn-northd'))
+        self.assertEqual(2, self.snapshot.count('ovn-northd',
+                                                group='controller'))
+        self.assertEqual(0, self.snapshot.count('ovn-northd',
+                                                group='compute'))
+        self.assertEqual(2, self.snapshot.count(
+            'ovn-northd', node='controller-0.redhat.local'))
+        self.assertEqual(1, self.snapshot.count_nodes('ovn-northd'))
+
+    def test_is_running_on_all(self):
+        self.assertTrue(self.snapshot.is_running_on_all('ovn-controller',
+                                                        group='controller'))
+        self.assertFalse(self.snapshot.is_running_on_all('ovn-controller',
+                                                         group='compute'))
+
+    def test_is_running_on_any(self):
+        self.assertTrue(self.snapshot.is_running_on_any('sshd',
+                                                        group='compute'))
+        self.assertFalse(self.snapshot.is_running_on_any('sshd',
+                                                         group='controller'))
+
+    def test_is_running_on_count(self):
+        self.assertTrue(self.snapshot.is_running_on_count('ovn-controller',
+                                                          3))
+        self.assertTrue(self.snapshot.is_running_on_count(
+            'ovn-controller', 1, group='compute'))
+        self.assertFalse(self.snapshot.is_running_on_count(
+            'ovn-northd', 2, group='controller'))
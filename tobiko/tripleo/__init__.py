@@ -15,6 +15,7 @@ from __future__ import absolute_import
 
 from tobiko.tripleo import _ansible
 from tobiko.tripleo import _overcloud as overcloud
+from tobiko.tripleo import _snapshot
 from tobiko.tripleo import _topology as topology
 from tobiko.tripleo import _undercloud as undercloud
 from tobiko.tripleo import containers
@@ -35,9 +36,12 @@ run_playbook_from_undercloud = _ansible.run_playbook_from_undercloud
 
 OvercloudKeystoneCredentialsFixture = \
     overcloud.OvercloudKeystoneCredentialsFixture
+OvercloudNodesTableData = overcloud.OvercloudNodesTableData
+OvercloudNodesTableDataError = overcloud.OvercloudNodesTableDataError
 OvercloudNotFound = overcloud.OvercloudNotFound
 OvercloudVersionMismatch = overcloud.OvercloudVersionMismatch
 check_overcloud = overcloud.check_overcloud
+collect_overcloud_nodes_tabledata = overcloud.collect_overcloud_nodes_tabledata
 find_overcloud_node = overcloud.find_overcloud_node
 has_overcloud = overcloud.has_overcloud
 list_overcloud_nodes = overcloud.list_overcloud_nodes
@@ -56,6 +60,8 @@ get_overcloud_ssh_username = overcloud.get_overcloud_ssh_username
 skip_if_ceph_rgw = containers.skip_if_ceph_rgw
 get_container_runtime_name = containers.get_container_runtime_name
 
+OvercloudNodesSnapshot = _snapshot.OvercloudNodesSnapshot
+
 TripleoTopology = topology.TripleoTopology
 
 UndercloudKeystoneCredentialsFixture = \
@@ -322,25 +322,89 @@ class OvercloudHostConfig(tobiko.SharedFixture):
         return parameters
 
 
+OvercloudNodeTableDataFunction = typing.Callable[[ssh.SSHClientType],
+                                                 typing.Any]
+
+# Maximum time to wait for every node table to be got
+OVERCLOUD_NODE_TABLEDATA_TIMEOUT = 120.
+
+
+class OvercloudNodesTableDataError(tobiko.TobikoException):
+    message = "Unable to get table data from overcloud nodes {nodes!r}"
+
+
+class OvercloudNodesTableData(typing.NamedTuple):
+    table: tobiko.TableData
+    failed_nodes: typing.List[str]
+    calls: tobiko.ConcurrentCalls
+
+    def check(self):
+        if self.failed_nodes:
+            for name in self.failed_nodes:
+                LOG.error("Unable to get table data from overcloud node "
+                          f"{name!r}: {self.calls[name].exc_info}")
+            raise OvercloudNodesTableDataError(nodes=self.failed_nodes)
+
+
+def collect_overcloud_nodes_tabledata(
+        oc_node_td_function: OvercloudNodeTableDataFunction,
+        timeout: tobiko.Seconds = OVERCLOUD_NODE_TABLEDATA_TIMEOUT,
+        instances: typing.Iterable[metalsmith.MetalsmithInstance] = None) \
+        -> OvercloudNodesTableData:
+    """Query all overcloud nodes at the same time
+
+    Nodes failing or not replying within given timeout are reported as
+    failed, while the table is made of the rows got from all other nodes.
+    """
+    if instances is None:
+        instances = list_overcloud_nodes()
+    calls = tobiko.run_concurrently(
+        {instance.name: functools.partial(_get_overcloud_node_tabledata,
+                                          oc_node_td_function, instance)
+         for instance in instances},
+        timeout=timeout,
+        synchronized=False)
+    table = tobiko.concat([call.result
+                           for call in calls.values()
+                           if call.succeeded])
+    failed_nodes = list(calls.failed)
+    if failed_nodes:
+        LOG.warning("Unable to get table data from overcloud nodes "
+                    f"{failed_nodes}")
+    return OvercloudNodesTableData(table=table,
+                                   failed_nodes=failed_nodes,
+                                   calls=calls)
+
+
+def _get_overcloud_node_tabledata(
+        oc_node_td_function: OvercloudNodeTableDataFunction,
+        instance: metalsmith.MetalsmithInstance):
+    ssh_client = overcloud_ssh_client(instance=instance)
+    return oc_node_td_function(ssh_client)
+
+
 def get_overcloud_nodes_tabledata(
-        oc_node_td_function: typing.Callable[[ssh.SSHClientType],
-                                             typing.Any]):
+        oc_node_td_function: OvercloudNodeTableDataFunction,
+        timeout: tobiko.Seconds = OVERCLOUD_NODE_TABLEDATA_TIMEOUT,
+        check=True):
     """
      :param oc_node_td_function : a function that queries a oc node
      using a cli command and returns a TableData with an added
      hostname field.
 
      This function concats oc nodes TableData into a unified overcloud
-     TableData, seperated by hostname field
+     TableData, seperated by hostname field. Nodes are queried
+     concurrently.
 
+    :param check: when true raise OvercloudNodesTableDataError if any node
+     failed, else return the table got from the other nodes
     :return: TableData of all overcloud nodes processes
     """
-    oc_nodes_tds = list()
-    for instance in list_overcloud_nodes():
-        ssh_client = overcloud_ssh_client(instance=instance)
-        oc_nodes_tds.append(oc_node_td_function(ssh_client))
-    oc_procs_td = tobiko.concat(oc_nodes_tds)
-    return oc_procs_td
+    tabledata = collect_overcloud_nodes_tabledata(oc_node_td_function,
+                                                  timeout=timeout)
+    if check:
+        tabledata.check()
+    return tabledata.table
 
 
 def is_redis_expected():
@@ -359,6 +423,7 @@ class InvalidDBServiceModel(tobiko.TobikoException):
 
 
 @functools.lru_cache()
+@tobiko.disk_cached()
 def get_ovn_db_service_model():
     """Show in which mode OVN databases are configured
 
@@ -440,6 +505,7 @@ skip_unless_kexec_tools_installed = tobiko.skip_unless(
     are_kexec_tools_installed)
 
 
+@tobiko.disk_cached()
 def overcloud_version() -> tobiko.Version:
     from tobiko.tripleo import _topology
     node = topology.find_openstack_node(group='overcloud')
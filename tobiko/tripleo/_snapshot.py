@@ -0,0 +1,118 @@
+# Copyright (c) 2026 Red Hat
+# All Rights Reserved.
+#
+#    Licensed under the Apache License, Version 2.0 (the "License"); you may
+#    not use this file except in compliance with the License. You may obtain
+#    a copy of the License at
+#
+#         http://www.apache.org/licenses/LICENSE-2.0
+#
+#    Unless required by applicable law or agreed to in writing, software
+#    distributed under the License is distributed on an "AS IS" BASIS, WITHOUT
+#    WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied. See the
+#    License for the specific language governing permissions and limitations
+#    under the License.
+from __future__ import absolute_import
+
+import collections
+import typing
+
+import tobiko
+
+
+NODE_COLUMN = 'overcloud_node'
+
+
+class OvercloudNodesSnapshot(object):
+    """Processes or units found on overcloud nodes at a given time
+
+    Table rows are indexed by name and node when the snapshot is created,
+    so that checking if something is running on all, any or a given number
+    of nodes doesn't require scanning the whole table.
+
+    :param name_column: table column with the name of the process or unit
+    :param node_groups: short host names of the nodes of every group. When
+        a group is missing its nodes are got from the OpenStack topology
+    """
+
+    def __init__(self,
+                 table: tobiko.TableData,
+                 name_column: str,
+                 node_groups: typing.Dict[str, typing.Iterable[str]] = None,
+                 failed_nodes: typing.Iterable[str] = None,
+                 sample_time: float = None):
+        self.table = table
+        self.name_column = name_column
+        self.node_groups: typing.Dict[str, typing.FrozenSet[str]] = {
+            group: frozenset(tobiko.get_short_hostname(node)
+                             for node in nodes)
+            for group, nodes in (node_groups or {}).items()}
+        self.failed_nodes = list(failed_nodes or [])
+        self.sample_time = (tobiko.time() if sample_time is None
+                            else sample_time)
+        # (name, short node name) -> number of table rows
+        self._counts: typing.Counter[typing.Tuple[str, str]] = (
+            collections.Counter())
+        # name -> {short node name: node name as found in the table}
+        self._nodes: typing.Dict[str, typing.Dict[str, str]] = (
+            collections.defaultdict(dict))
+        for row in table:
+            name = row[name_column]
+            node = row[NODE_COLUMN]
+            short_node = tobiko.get_short_hostname(node)
+            self._counts[name, short_node] += 1
+            self._nodes[name].setdefault(short_node, node)
+
+    def get_group_nodes(self, group: str) -> typing.FrozenSet[str]:
+        nodes = self.node_groups.get(group)
+        if nodes is None:
+            from tobiko.openstack import topology
+            nodes = self.node_groups[group] = frozenset(
+                tobiko.get_short_hostname(node.name)
+                for node in topology.list_openstack_nodes(group=group))
+        return nodes
+
+    def list_nodes(self, name: str, group: str = None) -> typing.List[str]:
+        """List nodes (as found in the table) where name is running"""
+        nodes = self._nodes.get(name, {})
+        if group is None:
+            return list(nodes.values())
+        group_nodes = self.get_group_nodes(group)
+        return [node for short_node, node in nodes.items()
+                if short_node in group_nodes]
+
+    def count(self, name: str, node: str = None, group: str = None) -> int:
+        """Count table rows (for example processes) with given name"""
+        if node is not None:
+            return self._counts[name, tobiko.get_short_hostname(node)]
+        nodes = self._nodes.get(name, {})
+        if group is not None:
+            nodes = {short_node: node for short_node, node in nodes.items()
+                     if short_node in self.get_group_nodes(group)}
+        return sum(self._counts[name, short_node] for short_node in nodes)
+
+    def count_nodes(self, name: str, group: str = None) -> int:
+        return len(self.list_nodes(name, group=group))
+
+    def is_running(self, name: str, node: str = None) -> bool:
+        if node is None:
+            return bool(self._nodes.get(name))
+        return self.count(name, node=node) > 0
+
+    def is_running_on_any(self, name: str, group: str = None) -> bool:
+        return self.count_nodes(name, group=group) > 0
+
+    def is_running_on_all(self, name: str, group: str) -> bool:
+        group_nodes = self.get_group_nodes(group)
+        return group_nodes.issubset(self._nodes.get(name, {}))
+
+    def is_running_on_count(self, name: str, count: int,
+                            group: str = None) -> bool:
+        """Check name is running on exactly count nodes"""
+        return self.count_nodes(name, group=group) == count
+
+    def __repr__(self):
+        return (f"{type(self).__name__}({self.name_column!r}, "
+                f"rows={len(self.table)}, "
+                f"failed_nodes={self.failed_nodes}, "
+                f"sample_time={self.sample_time})")
@@ -1,8 +1,10 @@
 from __future__ import absolute_import
 
+import collections
 import enum
 import io
-import time
+import typing
+from xml.etree import ElementTree
 
 from oslo_log import log
 
@@ -26,38 +28,276 @@ class PcsResourceException(tobiko.TobikoException):
     message = "pcs cluster is not in a healthy state"
 
 
-def get_pcs_resources_table(timeout=720, interval=2) -> tobiko.TableData:
+class PcsResource(typing.NamedTuple):
+    resource: str
+    resource_type: str
+    resource_state: str
+    overcloud_node: typing.Optional[str]
+
+
+PCS_RESOURCE_COLUMNS = list(PcsResource._fields)
+
+
+class PcsResourcesModel(object):
+    """Pacemaker resources sampled at a given time
+
+    Resources are indexed by type, state and node when the model is created,
+    so that counting resources of a type in a given state doesn't require
+    scanning all of them.
     """
-    get pcs status from a controller and parse it
-    to have it's resources states in check
-       returns :
-       rabbitmq-bundle-0    (ocf::heartbeat:rabbitmq-cluster):      Started con
-       troller-0
-     ip-10.0.0.101  (ocf::heartbeat:IPaddr2):       Started controller-1
-       openstack-cinder-volume-podman-0     (ocf::heartbeat:podman):        Sta
-       rted controller-0
 
-    :return: TableData of pcs resources stats table
+    def __init__(self,
+                 resources: typing.Iterable[PcsResource],
+                 sample_time: float = None):
+        self.resources = list(resources)
+        self.sample_time = (tobiko.time() if sample_time is None
+                            else sample_time)
+        self._type_counts = collections.Counter(
+            resource.resource_type for resource in self.resources)
+        self._state_counts = collections.Counter(
+            (resource.resource_type, resource.resource_state)
+            for resource in self.resources)
+        self._indexes: typing.Dict[str, typing.Dict[
+            typing.Any, typing.List[PcsResource]]] = {
+            field: collections.defaultdict(list)
+            for field in PCS_RESOURCE_COLUMNS}
+        for resource in self.resources:
+            for field, index in self._indexes.items():
+                index[getattr(resource, field)].append(resource)
+
+    def count(self, resource_type: str, resource_state: str = None) -> int:
+        if resource_state is None:
+            return self._type_counts[resource_type]
+        return self._state_counts[resource_type, resource_state]
+
+    def has_type(self, resource_type: str) -> bool:
+        return self._type_counts[resource_type] > 0
+
+    def list_resources(self, **filters) -> typing.List[PcsResource]:
+        """List resources matching all given column values
+
+        :param filters: values of resource, resource_type, resource_state
+            and overcloud_node columns. Filters with None value are ignored
+        """
+        filters = {field: value for field, value in filters.items()
+                   if value is not None}
+        if not filters:
+            return list(self.resources)
+        # start from the shortest index entry
+        candidates = min((self._indexes[field].get(value, [])
+                          for field, value in filters.items()), key=len)
+        return [resource for resource in candidates
+                if all(getattr(resource, field) == value
+                       for field, value in filters.items())]
+
+    def list_values(self, field: str, **filters) -> typing.List[typing.Any]:
+        """List unique values of a column for resources matching filters"""
+        return list(dict.fromkeys(getattr(resource, field)
+                                  for resource in self.list_resources(
+                                      **filters)))
+
+    def to_table(self) -> tobiko.TableData:
+        return tobiko.TableData.from_columns(
+            PCS_RESOURCE_COLUMNS,
+            [list(column) for column in zip(*self.resources)] or
+            [[] for _ in PCS_RESOURCE_COLUMNS])
+
+    def __repr__(self):
+        return (f"{type(self).__name__}(resources={len(self.resources)}, "
+                f"sample_time={self.sample_time})")
+
+
+class CrmMonNames(typing.NamedTuple):
+    """Names used for reporting crm_mon resources like 'pcs status' does
+    """
+    ocf_prefix: str = 'ocf:'
+    promoted: str = 'Promoted'
+    unpromoted: str = 'Unpromoted'
+
+    def get_state(self, role: str) -> str:
+        # Pacemaker renamed Master/Slave roles as Promoted/Unpromoted,
+        # but not at the same time in all its output formats
+        if role in ('Master', 'Promoted'):
+            return self.promoted
+        if role in ('Slave', 'Unpromoted'):
+            return self.unpromoted
+        return role
+
+    def get_type(self, agent: str) -> str:
+        if agent.startswith('ocf:'):
+            agent = self.ocf_prefix + agent[4:].lstrip(':')
+        return f"({agent}):"
+
+
+def parse_crm_mon_xml(output: str,
+                      names: CrmMonNames = None) -> typing.List[PcsResource]:
+    """Parse resources from 'crm_mon --output-as=xml' output
+
+    Bundle replicas are reported like 'pcs status' does: when a replica runs
+    a resource inside its container, it is reported with the replica name
+    and the node hosting the container, else the container itself is
+    reported.
+
+    :param names: names used for resource roles and agents, whatever the
+        naming used by crm_mon is
+    """
+    if names is None:
+        names = CrmMonNames()
+    root = ElementTree.fromstring(output)
+    resources_element = root.find('resources')
+    if resources_element is None:
+        raise ValueError("No resources found in crm_mon XML output")
+    resources: typing.List[PcsResource] = []
+    _parse_crm_mon_elements(resources_element, resources, names)
+    return resources
+
+
+def _parse_crm_mon_elements(parent: ElementTree.Element,
+                            resources: typing.List[PcsResource],
+                            names: CrmMonNames):
+    for element in parent:
+        if element.tag == 'resource':
+            resources.append(_parse_crm_mon_resource(element, names))
+        elif element.tag == 'bundle':
+            for replica in element.findall('replica'):
+                resources.append(_parse_crm_mon_replica(element, replica,
+                                                        names))
+        elif element.tag in ('clone', 'group'):
+            _parse_crm_mon_elements(element, resources, names)
+
+
+def _parse_crm_mon_resource(element: ElementTree.Element,
+                            names: CrmMonNames,
+                            name: str = None,
+                            node: str = None) -> PcsResource:
+    if element.get('failed') == 'true':
+        state = 'FAILED'
+    else:
+        state = names.get_state(element.get('role', ''))
+    if node is None:
+        node_element = element.find('node')
+        if node_element is not None:
+            node = node_element.get('name')
+    return PcsResource(
+        resource=name or element.get('id') or '',
+        resource_type=names.get_type(element.get('resource_agent', '')),
+        resource_state=state,
+        overcloud_node=node)
+
+
+def _parse_crm_mon_replica(bundle: ElementTree.Element,
+                           replica: ElementTree.Element,
+                           names: CrmMonNames) -> PcsResource:
+    container = remote = inner = None
+    for element in replica.findall('resource'):
+        agent = element.get('resource_agent', '')
+        if agent.endswith(':pacemaker:remote'):
+            remote = element
+        elif agent.endswith((':heartbeat:podman', ':heartbeat:docker')):
+            container = element
+        else:
+            inner = element
+    host_node = None
+    if container is not None:
+        host = container.find('node')
+        if host is not None:
+            host_node = host.get('name')
+    if inner is not None:
+        if remote is not None:
+            name = remote.get('id')
+        else:
+            name = f"{bundle.get('id')}-{replica.get('id')}"
+        return _parse_crm_mon_resource(inner, names, name=name,
+                                       node=host_node)
+    if container is None:
+        raise ValueError(f"Invalid bundle replica: "
+                         f"{ElementTree.tostring(replica)!r}")
+    return _parse_crm_mon_resource(container, names)
+
+
+def parse_pcs_status_resources(output: str) -> typing.List[PcsResource]:
+    """Parse resources from 'pcs status resources | grep ocf' output
+    """
+    # remove the first column when it only includes '*' characters
+    output = output.replace('*', '').strip()
+    table = tobiko.TableData.read_csv(
+        io.StringIO(output), delim_whitespace=True, header=None)
+    table.columns = PCS_RESOURCE_COLUMNS
+    return [PcsResource(**row) for row in table]
+
+
+CRM_MON_XML_COMMANDS = [sh.shell_command('crm_mon --output-as=xml'),
+                        # pacemaker versions older than 2.0
+                        sh.shell_command('crm_mon --as-xml')]
+
+
+def get_pcs_resources_model(timeout=720, interval=2,
+                            ssh_client: ssh.SSHClientFixture = None) -> \
+        PcsResourcesModel:
+    """Sample pacemaker resources status from a controller
+
+    It parses 'crm_mon' XML output, falling back to 'pcs status resources'
+    text output when XML output can't be got.
     """
     # prevent pcs table read failure while pacemaker is starting
     for attempt in tobiko.retry(timeout=timeout,
                                 interval=interval):
         try:
-            output = run_pcs_status(options=['resources'], grep_str='ocf')
-            # remove the first column when it only includes '*' characters
-            output = output.replace('*', '').strip()
-            stream = io.StringIO(output)
-            table = tobiko.TableData.read_csv(
-                stream, delim_whitespace=True, header=None)
-            table.columns = ['resource', 'resource_type', 'resource_state',
-                             'overcloud_node']
+            resources = _get_crm_mon_resources(ssh_client=ssh_client)
+            if resources is None:
+                output = run_pcs_status(ssh_client=ssh_client,
+                                        options=['resources'],
+                                        grep_str='ocf')
+                resources = parse_pcs_status_resources(output)
         except (ValueError, sh.ShellCommandFailed, sh.ShellTimeoutExpired):
             if attempt.is_last:
                 raise
             LOG.exception('Failed to obtain pcs status table - Retrying...')
         else:
             break
+    else:
+        raise RuntimeError('Broken retry loop')
+
+    model = PcsResourcesModel(resources)
+    LOG.debug("Got pcs status: %r", model)
+    return model
 
+
+def _get_crm_mon_resources(ssh_client: ssh.SSHClientFixture = None) -> \
+        typing.Optional[typing.List[PcsResource]]:
+    if ssh_client is None:
+        ssh_client = topology.find_openstack_node(
+            group='controller').ssh_client
+    names = CrmMonNames(*get_pcs_prefix_and_status_values())
+    for command in CRM_MON_XML_COMMANDS:
+        result = sh.execute(command, ssh_client=ssh_client, sudo=True,
+                            stdin=False, stdout=True, stderr=True,
+                            expect_exit_status=None, timeout=40.)
+        if result.exit_status == 0 and result.stdout.strip():
+            try:
+                return parse_crm_mon_xml(result.stdout, names=names)
+            except (ValueError, ElementTree.ParseError):
+                LOG.exception(f"Unable to parse '{command}' output")
+                return None
+        LOG.debug(f"'{command}' command failed: {result.stderr}")
+    return None
+
+
+def get_pcs_resources_table(timeout=720, interval=2) -> tobiko.TableData:
+    """
+    get pcs status from a controller and parse it
+    to have it's resources states in check
+       returns :
+       rabbitmq-bundle-0    (ocf::heartbeat:rabbitmq-cluster):      Started con
+       troller-0
+     ip-10.0.0.101  (ocf::heartbeat:IPaddr2):       Started controller-1
+       openstack-cinder-volume-podman-0     (ocf::heartbeat:podman):        Sta
+       rted controller-0
+
+    :return: TableData of pcs resources stats table
+    """
+    table = get_pcs_resources_model(timeout=timeout,
+                                    interval=interval).to_table()
     LOG.debug("Got pcs status :\n%s", table)
     return table
 
@@ -78,27 +318,35 @@ class PacemakerResourcesStatus(object):
     """
     class to handle pcs resources checks
     """
+    # minimum time between two pacemaker status samples
+    poll_interval = 2.
+
     def __init__(self):
-        self.pcs_td = get_pcs_resources_table()
+        self.model = get_pcs_resources_model()
         (self.ocf_prefix,
          self.promoted_status_str,
          self.unpromoted_status_str) = get_pcs_prefix_and_status_values()
 
-    def container_runtime(self):
+    @property
+    def pcs_td(self) -> tobiko.TableData:
+        return self.model.to_table()
+
+    def refresh(self, force=False) -> PcsResourcesModel:
+        """Sample pacemaker status again unless it has just been sampled"""
+        if force or (tobiko.time() - self.model.sample_time >=
+                     self.poll_interval):
+            self.model = get_pcs_resources_model()
+        return self.model
 
-        if not self.pcs_td.query(
-                'resource_type == '
-                f'"({self.ocf_prefix}heartbeat:podman):"').empty:
+    def container_runtime(self):
+        if self.model.has_type(f"({self.ocf_prefix}heartbeat:podman):"):
             return 'podman'
 
     def resource_count(self, resource_type):
-        return self.pcs_td.query(
-            f'resource_type == "{resource_type}"')['resource_state'].count()
+        return self.model.count(resource_type)
 
     def resource_count_in_state(self, resource_type, resource_state):
-        return self.pcs_td.query(
-            f'resource_type == "{resource_type}" and '
-            f'resource_state == "{resource_state}"')['resource_state'].count()
+        return self.model.count(resource_type, resource_state)
 
     def rabbitmq_resource_healthy(self):
         rabbitmq_resource_str = \
@@ -131,8 +379,7 @@ class PacemakerResourcesStatus(object):
         if not overcloud.is_redis_expected():
             LOG.info("redis resource not expected on OSP 17 "
                      "and later releases by default")
-            return self.pcs_td.query(
-                f'resource_type == "{redis_resource_str}"').empty
+            return not self.model.has_type(redis_resource_str)
         nodes_num = self.resource_count(redis_resource_str)
         master_num = self.resource_count_in_state(
             redis_resource_str, self.promoted_status_str)
@@ -188,8 +435,7 @@ class PacemakerResourcesStatus(object):
 
     def ovn_resource_healthy(self):
         ovn_resource_str = f"({self.ocf_prefix}ovn:ovndb-servers):"
-        if self.pcs_td.query(
-                f'resource_type == "{ovn_resource_str}"').empty:
+        if not self.model.has_type(ovn_resource_str):
             LOG.info('pcs status check: ovn is not deployed, skipping ovn '
                      'resource check')
             return True
@@ -215,33 +461,28 @@ class PacemakerResourcesStatus(object):
         and return a global healthy status
         :return: Bool
         """
-        for attempt_number in range(360):
-
-            try:
-
-                if all([
-                   self.rabbitmq_resource_healthy(),
-                   self.galera_resource_healthy(),
-                   self.redis_resource_healthy(),
-                   self.vips_resource_healthy(),
-                   self.ha_proxy_cinder_healthy(),
-                   self.ovn_resource_healthy()
-                   ]):
-                    LOG.info("pcs status checks: all resources are"
-                             " in healthy state")
-                    return True
-                else:
-
-                    LOG.info("pcs status check: not all resources are "
-                             "in healthy "
-                             "state")
-                    raise PcsResourceException()
-            except PcsResourceException:
+        for attempt in tobiko.retry(timeout=720.,
+                                    interval=self.poll_interval):
+            if attempt.number > 1:
                 # reread pcs status
-                LOG.info('Retrying pacemaker resource checks attempt '
-                         '{} of 360'.format(attempt_number))
-                time.sleep(1)
-                self.pcs_td = get_pcs_resources_table()
+                LOG.info('Retrying pacemaker resource checks '
+                         f'(attempt={attempt})')
+                self.refresh()
+            if all([
+               self.rabbitmq_resource_healthy(),
+               self.galera_resource_healthy(),
+               self.redis_resource_healthy(),
+               self.vips_resource_healthy(),
+               self.ha_proxy_cinder_healthy(),
+               self.ovn_resource_healthy()
+               ]):
+                LOG.info("pcs status checks: all resources are"
+                         " in healthy state")
+                return True
+            LOG.info("pcs status check: not all resources are "
+                     "in healthy state")
+            if attempt.is_last:
+                break
         # exhausted all retries
         tobiko.fail('pcs cluster is not in a healthy state')
 
@@ -254,24 +495,14 @@ def get_overcloud_nodes_running_pcs_resource(resource=None,
     resource/type/state: exact str of a resource name as seen in pcs status
     :return: list of overcloud nodes
     """
-    # pylint: disable=no-member
-    pcs_td = get_pcs_resources_table()
+    model = get_pcs_resources_model()
     if resource:
-        pcs_td_query_resource = pcs_td.query('resource=="{}"'.format(
-                                        resource))
-        return pcs_td_query_resource['overcloud_node'].unique()
-
-    if resource_type and resource_state:
-        pcs_td_query_resource_type_state = pcs_td.query(
-            'resource_type=="{}" and resource_state=="{}"'.format(
-                resource_type, resource_state))
-        return pcs_td_query_resource_type_state[
-            'overcloud_node'].unique()
+        return model.list_values('overcloud_node', resource=resource)
 
-    if resource_type and not resource_state:
-        pcs_td_query_resource_type = pcs_td.query(
-            'resource_type=="{}"'.format(resource_type))
-        return pcs_td_query_resource_type['overcloud_node'].unique()
+    if resource_type:
+        return model.list_values('overcloud_node',
+                                 resource_type=resource_type,
+                                 resource_state=resource_state)
 
 
 def get_resource_master_node(resource_type=None):
@@ -293,19 +524,10 @@ def get_overcloud_resource(resource_type=None,
     resource/type/state: exact str of a resource name as seen in pcs status
     :return: list of overcloud nodes
     """
-    pcs_td = get_pcs_resources_table()
-
-    if resource_type and resource_state:
-        pcs_td_query_resource_type_state = pcs_td.query(
-            'resource_type=="{}" and resource_state=="{}"'.format(
-                resource_type, resource_state))
-        return pcs_td_query_resource_type_state['resource'].unique()
-
-    if resource_type and not resource_state:
-        # pylint: disable=no-member
-        pcs_td_query_resource_type = pcs_td.query(
-            'resource_type=="{}"'.format(resource_type))
-        return pcs_td_query_resource_type['resource'].unique()
+    if resource_type:
+        return get_pcs_resources_model().list_values(
+            'resource', resource_type=resource_type,
+            resource_state=resource_state)
 
 
 def instanceha_deployed():
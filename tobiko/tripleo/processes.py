@@ -1,7 +1,7 @@
 from __future__ import absolute_import
 
 import io
-import re
+import typing
 
 from oslo_log import log
 
@@ -9,6 +9,7 @@ import tobiko
 from tobiko.openstack import neutron
 from tobiko.openstack import topology
 from tobiko.tripleo import overcloud
+from tobiko.tripleo import _snapshot
 from tobiko.shell import sh
 from tobiko.shell import ssh
 
@@ -93,19 +94,40 @@ class OvercloudProcessesStatus(object):
                                                  'node_group': 'controller',
                                                  'number': num_northd_proc}]
 
-        self.oc_procs_td = overcloud.get_overcloud_nodes_tabledata(
-                                            get_overcloud_node_processes_table)
+        self.oc_procs_td = None
+        self.snapshot: typing.Optional[_snapshot.OvercloudNodesSnapshot] = None
+        self.failed_nodes: typing.List[str] = []
+        self.refresh()
+
+    def refresh(self):
+        """Get processes tables from all overcloud nodes concurrently
+
+        Nodes that can't be reached are recorded in failed_nodes, so that
+        checks can be retried instead of failing on the first node error.
+        """
+        tabledata = overcloud.collect_overcloud_nodes_tabledata(
+            get_overcloud_node_processes_table)
+        self.oc_procs_td = tabledata.table
+        self.failed_nodes = tabledata.failed_nodes
+        self.snapshot = _snapshot.OvercloudNodesSnapshot(
+            tabledata.table, name_column='PROCESS',
+            failed_nodes=tabledata.failed_nodes)
+
+    def _check_failed_nodes(self):
+        if self.failed_nodes:
+            raise OvercloudProcessesException(
+                "unable to get processes from overcloud nodes "
+                f"{self.failed_nodes}")
 
     def _basic_overcloud_process_running(self, process_name):
         # osp16/python3 process is "neutron-server:"
+        snapshot = self.snapshot
         if process_name == 'neutron-server' and \
-                self.oc_procs_td.query('PROCESS=="{}"'.format(
-                process_name)).empty:
+                not snapshot.is_running(process_name):
             process_name = 'neutron-server:'
         # osp17 mysqld process name is mysqld_safe
         if process_name == 'mysqld' and \
-                self.oc_procs_td.query('PROCESS=="{}"'.format(
-                process_name)).empty:
+                not snapshot.is_running(process_name):
             process_name = 'mysqld_safe'
         # redis not deployed on osp17 by default, only if some
         # other services such as designate and octavia are deployed
@@ -113,16 +135,14 @@ class OvercloudProcessesStatus(object):
                 not overcloud.is_redis_expected()):
             redis_message = ("redis-server not expected on OSP 17 "
                              "and later releases by default")
-            if self.oc_procs_td.query(
-                    f'PROCESS=="{process_name}"').empty:
+            if not snapshot.is_running(process_name):
                 LOG.info(redis_message)
                 return
             else:
                 raise OvercloudProcessesException(
                     process_error=redis_message)
 
-        if not self.oc_procs_td.query('PROCESS=="{}"'.format(
-                process_name)).empty:
+        if snapshot.is_running(process_name):
             LOG.info("overcloud processes status checks: "
                      "process {} is  "
                      "in running state".format(process_name))
@@ -143,6 +163,7 @@ class OvercloudProcessesStatus(object):
         """
         for attempt in tobiko.retry(timeout=300., interval=1.):
             try:
+                self._check_failed_nodes()
                 for process_name in self.processes_to_check:
                     self._basic_overcloud_process_running(process_name)
             except OvercloudProcessesException:
@@ -150,47 +171,32 @@ class OvercloudProcessesStatus(object):
                     LOG.error('Not all overcloud processes are running')
                     raise
                 LOG.info('Retrying overcloud processes: %s', attempt.details)
-                self.oc_procs_td = overcloud.get_overcloud_nodes_tabledata(
-                    get_overcloud_node_processes_table)
+                self.refresh()
 
             # if all procs are running we can return true
             return True
 
     def _ovn_overcloud_process_validations(self, process_dict):
-        if not self.oc_procs_td.query('PROCESS=="{}"'.format(
-                process_dict['name'])).empty:
+        snapshot = self.snapshot
+        if snapshot.is_running(process_dict['name']):
             LOG.info("overcloud processes status checks: "
                      f"process {process_dict['name']} is  "
                      "in running state")
 
-            ovn_proc_filtered_td = self.oc_procs_td.query(
-                'PROCESS=="{}"'.format(process_dict['name']))
-
             if (process_dict['node_group'] not in
                     topology.list_openstack_node_groups()):
                 LOG.debug(
                     f"{process_dict['node_group']} is not "
                     "a node group part of this Openstack cloud")
                 return
-            node_list = [node.name
-                         for node in
-                         topology.list_openstack_nodes(
-                            group=process_dict['node_group'])]
-            node_names_re = re.compile(r'|'.join(node_list))
-
-            # Filter based on node names using regex matching
-            filtered_rows = []
-            for row in ovn_proc_filtered_td:
-                if node_names_re.match(row['overcloud_node']):
-                    filtered_rows.append(row)
-
-            ovn_proc_filtered_per_node_td = tobiko.TableData(filtered_rows)
-            total_num_processes = len(ovn_proc_filtered_per_node_td)
+            total_num_processes = snapshot.count(
+                process_dict['name'], group=process_dict['node_group'])
 
             if isinstance(process_dict['number'], int):
                 expected_num_processes = process_dict['number']
             elif process_dict['number'] == 'all':
-                expected_num_processes = len(node_list)
+                expected_num_processes = len(
+                    snapshot.get_group_nodes(process_dict['node_group']))
             else:
                 raise ValueError("Unexpected value:"
                                  f"{process_dict['number']}")
@@ -217,6 +223,7 @@ class OvercloudProcessesStatus(object):
 
         for attempt in tobiko.retry(timeout=300., interval=1.):
             try:
+                self._check_failed_nodes()
                 for process_dict in self.ovn_processes_to_check_per_node:
                     self._ovn_overcloud_process_validations(process_dict)
             except OvercloudProcessesException:
@@ -225,8 +232,7 @@ class OvercloudProcessesStatus(object):
                     raise
                 LOG.info('Retrying OVN overcloud processes: %s',
                          attempt.details)
-                self.oc_procs_td = overcloud.get_overcloud_nodes_tabledata(
-                    get_overcloud_node_processes_table)
+                self.refresh()
 
             # if all procs are running we can return true
             return True
@@ -6,6 +6,7 @@ from oslo_log import log
 
 import tobiko
 from tobiko.tripleo import overcloud
+from tobiko.tripleo import _snapshot
 from tobiko.shell import sh
 from tobiko.shell import ssh
 
@@ -105,10 +106,13 @@ class OvercloudServicesStatus(tobiko.SharedFixture):
         self.services_to_check = services_to_check
 
     oc_services_td: typing.Any
+    snapshot: _snapshot.OvercloudNodesSnapshot
 
     def setup_fixture(self):
         self.oc_services_td = overcloud.get_overcloud_nodes_tabledata(
             get_overcloud_node_services_table)
+        self.snapshot = _snapshot.OvercloudNodesSnapshot(
+            self.oc_services_td, name_column='UNIT')
 
     @property
     def basic_overcloud_services_running(self):
@@ -119,8 +123,7 @@ class OvercloudServicesStatus(tobiko.SharedFixture):
         """
         tobiko.setup_fixture(self)
         for service_name in self.services_to_check:
-            if not self.oc_services_td.query('UNIT=="{}"'.format(
-                    service_name)).empty:
+            if self.snapshot.is_running(service_name):
                 LOG.info("overcloud processes status checks: process {} is  "
                          "in running state".format(service_name))
                 continue